@@ -45,6 +45,9 @@ setup(name='citrine',
           "boto3",
           "botocore"
       ],
+      extras_require={
+          "async": ["aiohttp>=3.5"]
+      },
       cmdclass={
           'install': PostInstallCommand,
           'develop': PostDevelopCommand
@@ -1,2 +1,3 @@
 # TODO: Add a docstring here
-from citrine.citrine import Citrine  # noqa: F401
+from citrine.citrine import Citrine, AsyncCitrine  # noqa: F401
+from citrine._utils.profiling import profiling  # noqa: F401
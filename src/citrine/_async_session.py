@@ -0,0 +1,239 @@
+import asyncio
+import json as json_module
+from logging import getLogger
+from typing import Optional
+
+from citrine._rest.metrics import RequestInfo
+from citrine._rest.retry import RetryPolicy
+from citrine._session import Session
+
+
+DEFAULT_CONNECTION_LIMIT: int = 100
+
+
+class _AsyncResponse:
+    """A fully read response, exposing the parts of requests.Response that Session checks."""
+
+    def __init__(self, status_code: int, headers, content: bytes):
+        self.status_code: int = status_code
+        self.headers = headers
+        self.content: bytes = content
+
+    @property
+    def text(self) -> str:
+        return self.content.decode('utf-8', errors='replace')
+
+    def json(self):
+        return json_module.loads(self.text)
+
+
+class AsyncSession:
+    """
+    An asyncio counterpart of :class:`Session`, built on aiohttp.
+
+    Authentication state, retry policy and status-code handling are shared with a
+    synchronous session, so objects fetched through either can be used interchangeably.
+    The access token is refreshed by the synchronous session, so a refresh is never made
+    twice at once, whether it is needed by a task, a thread or the background timer.
+
+    Connections belong to the event loop that opened them. Close the session before that
+    loop ends, for example with ``async with``; it can then be used again from another loop.
+
+    Parameters
+    ----------
+    session: Session
+        The synchronous session that holds the credentials and configuration.
+    connection_limit: int
+        Maximum number of simultaneously open connections. 0 means no limit.
+
+    """
+
+    def __init__(self, session: Session, connection_limit: int = DEFAULT_CONNECTION_LIMIT):
+        try:
+            import aiohttp  # noqa: F401
+        except ImportError:
+            raise ImportError("The asyncio client requires aiohttp. "
+                              "Install it with `pip install citrine[async]`.")
+        self.logger = getLogger(__name__)
+        self.session: Session = session
+        self.connection_limit: int = connection_limit
+        self._client_session = None
+        self._client_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_client_session(self):
+        """
+        Get the aiohttp session that holds the connections of the running event loop.
+
+        Connections can only be used from the event loop that opened them, so if the session
+        is used from another loop, the connections of the first are abandoned and new ones are
+        opened.
+        """
+        loop = asyncio.get_event_loop()
+        if self._client_session is not None and self._client_session_loop is not loop:
+            # The connections cannot be closed from this loop, and that loop may have ended
+            self._client_session.detach()
+            self._client_session = None
+        if self._client_session is None or self._client_session.closed:
+            import aiohttp
+            connector = aiohttp.TCPConnector(limit=self.connection_limit)
+            self._client_session = aiohttp.ClientSession(
+                connector=connector,
+                headers={'Content-Type': self.session.headers['Content-Type']})
+            self._client_session_loop = loop
+        return self._client_session
+
+    async def close(self) -> None:
+        """Close all open connections."""
+        if self._client_session is not None:
+            await self._client_session.close()
+            self._client_session = None
+            self._client_session_loop = None
+
+    async def __aenter__(self) -> 'AsyncSession':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def _send(self, method: str, url: str, **kwargs) -> _AsyncResponse:
+        """Make a single HTTP request and read its body."""
+        async with self._get_client_session().request(method, url, **kwargs) as response:
+            content = await response.read()
+            return _AsyncResponse(response.status, response.headers, content)
+
+    async def _ensure_access_token(self) -> None:
+        """Refresh the access token if it is about to expire, at most once across tasks."""
+        if self.session._is_access_token_expired():
+            await self._in_thread(self.session._ensure_access_token)
+
+    async def _refresh_rejected_access_token(self, rejected_token: Optional[str]) -> None:
+        await self._in_thread(self.session._refresh_rejected_access_token, rejected_token)
+
+    @staticmethod
+    async def _in_thread(function, *args) -> None:
+        """
+        Call a blocking function of the synchronous session from a worker thread.
+
+        The access token is only ever refreshed by the synchronous session, under its lock,
+        so a refresh made for a task cannot overlap one made for a thread or by the
+        background timer of the session.
+        """
+        await asyncio.get_event_loop().run_in_executor(None, function, *args)
+
+    @staticmethod
+    def _auth_headers(token: Optional[str]) -> dict:
+        return {} if token is None else {'Authorization': 'Bearer {}'.format(token)}
+
+    async def _request_once(self, method: str, uri: str, **kwargs) -> _AsyncResponse:
+        """Make a single request, refreshing the access token if necessary."""
+        await self._ensure_access_token()
+        token = self.session.access_token
+        response = await self._send(method, uri, headers=self._auth_headers(token), **kwargs)
+
+        try:
+            if response.status_code == 401 and response.json().get("reason") == "invalid-token":
+                await self._refresh_rejected_access_token(token)
+                response = await self._send(
+                    method, uri, headers=self._auth_headers(self.session.access_token), **kwargs)
+        except ValueError:
+            # 401 responses do not necessarily have a JSON body
+            pass
+        return response
+
+    async def _observed_request(self, request: RequestInfo, uri: str,
+                                **kwargs) -> _AsyncResponse:
+        """Make a single request, passing it to the request hooks of the session."""
+        if not self.session.request_hooks:
+            return await self._request_once(request.method, uri, **kwargs)
+        self.session._notify('pre_request', request)
+        request.start()
+        try:
+            response = await self._request_once(request.method, uri, **kwargs)
+        except Exception as e:
+            request.finish()
+            self.session._notify('on_error', request, e)
+            raise
+        request.finish(response)
+        self.session._notify('post_response', request, response)
+        return response
+
+    async def _request_with_retries(self, policy: RetryPolicy, method: str, uri: str,
+                                    **kwargs) -> _AsyncResponse:
+        """Make a request, repeating it for as long as the retry policy allows."""
+        import aiohttp
+        stats = self.session.retry_stats
+        base_url = self.session.base_url
+        path = uri[len(base_url):] if uri.startswith(base_url) else uri
+        attempt = 0
+        while True:
+            response = None
+            request = RequestInfo(method, path, attempt)
+            try:
+                response = await self._observed_request(request, uri, **kwargs)
+            except aiohttp.ClientConnectionError as e:
+                if not policy.should_retry(method, attempt, error=e):
+                    if attempt > 0:
+                        stats.record_outcome(succeeded=False)
+                    raise
+                reason = e.__class__.__name__
+            else:
+                if not policy.should_retry(method, attempt, response=response):
+                    if attempt > 0:
+                        stats.record_outcome(succeeded=200 <= response.status_code <= 299)
+                    return response
+                reason = str(response.status_code)
+
+            delay = policy.backoff(attempt, response)
+            stats.record_retry(reason)
+            self.session._notify('on_retry', request, reason, delay)
+            self.logger.warning('%s %s failed with %s, retrying in %.2f seconds (retry %d of %d)',
+                                method, uri, reason, delay, attempt + 1, policy.max_retries)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def checked_request(self, method: str, path: str,
+                              retry_policy: Optional[RetryPolicy] = None,
+                              **kwargs) -> _AsyncResponse:
+        """Make a request and throw an exception if the status code indicates failure."""
+        policy = retry_policy if retry_policy is not None else self.session.retry_policy
+        uri = self.session.base_url + path.lstrip('/')
+        if kwargs.get('params'):
+            kwargs['params'] = _encode_params(kwargs['params'])
+        response = await self._request_with_retries(policy, method, uri, **kwargs)
+        return self.session._check_response(response, method, path)
+
+    async def get_resource(self, path: str, **kwargs) -> dict:
+        """GET a particular resource as JSON."""
+        return (await self.checked_request('GET', path, **kwargs)).json()
+
+    async def post_resource(self, path: str, json: dict, **kwargs) -> dict:
+        """POST to a particular resource as JSON."""
+        return (await self.checked_request('POST', path, json=json, **kwargs)).json()
+
+    async def put_resource(self, path: str, json: dict, **kwargs) -> dict:
+        """PUT data given by some JSON at a particular resource."""
+        return (await self.checked_request('PUT', path, json=json, **kwargs)).json()
+
+    async def delete_resource(self, path: str, **kwargs) -> dict:
+        """DELETE a particular resource as JSON."""
+        return (await self.checked_request('DELETE', path, **kwargs)).json()
+
+
+def _encode_params(params: dict) -> list:
+    """
+    Encode query parameters the way requests does.
+
+    aiohttp only accepts strings and numbers, whereas requests expands lists into repeated
+    keys and renders booleans as 'True'/'False'.
+    """
+    encoded = []
+    for key, value in params.items():
+        values = value if isinstance(value, (list, tuple)) else [value]
+        for element in values:
+            if element is None:
+                continue
+            if isinstance(element, (int, float)) and not isinstance(element, bool):
+                encoded.append((key, element))
+            else:
+                encoded.append((key, str(element)))
+    return encoded
@@ -0,0 +1,197 @@
+from typing import AsyncIterator, Awaitable, Callable, Dict, Generic, List, Optional, Union
+from uuid import UUID
+
+from taurus.entity.bounds.base_bounds import BaseBounds
+from taurus.entity.link_by_uid import LinkByUID
+from taurus.entity.template.attribute_template import AttributeTemplate
+
+from citrine._rest.collection import Collection, ResourceType, CreationType
+from citrine.exceptions import ModuleRegistrationFailedException, NonRetryableException
+from citrine.resources.response import Response
+
+
+class AsyncElements(AsyncIterator[ResourceType]):
+    """
+    The elements of one listing, fetched when first iterated with ``async for``.
+
+    Parameters
+    ----------
+    fetch: Callable[[], Awaitable[List]]
+        Coroutine function that fetches and builds the elements.
+
+    """
+
+    def __init__(self, fetch: Callable[[], Awaitable[List[ResourceType]]]):
+        self._fetch = fetch
+        self._elements = None
+
+    def __aiter__(self) -> 'AsyncElements[ResourceType]':
+        return self
+
+    async def __anext__(self) -> ResourceType:
+        if self._elements is None:
+            self._elements = iter(await self._fetch())
+        try:
+            return next(self._elements)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class AsyncCollection(Generic[ResourceType]):
+    """
+    Awaitable view of a collection of REST resources.
+
+    Paths, serialization and building are delegated to the synchronous collection,
+    so the resources returned are the same as those returned by the collection itself.
+
+    Parameters
+    ----------
+    collection: Collection
+        The synchronous collection.
+    session: AsyncSession
+        The asynchronous session used to make requests.
+
+    """
+
+    def __init__(self, collection: Collection[ResourceType], session):
+        self.collection = collection
+        self.session = session
+
+    async def get(self, uid: Union[UUID, str]) -> ResourceType:
+        """Get a particular element of the collection."""
+        cached = self.collection._get_cached(uid)
+        if cached is not None:
+            return cached
+        data = await self.session.get_resource(self.collection._get_path(uid))
+        return self.collection._cache(
+            self.collection.build(self.collection._extract_individual(data)), uid)
+
+    async def register(self, model: CreationType) -> CreationType:
+        """Create a new element of the collection by registering an existing resource."""
+        try:
+            data = await self.session.post_resource(
+                self.collection._get_path(), self.collection._dump_for_registration(model))
+            registered = self.collection.build(self.collection._extract_individual(data))
+        except NonRetryableException as e:
+            raise ModuleRegistrationFailedException(model.__class__.__name__, e)
+        self.collection._uncache(registered)
+        return registered
+
+    async def update(self, model: CreationType) -> CreationType:
+        """Update an element of the collection."""
+        updated = await self.session.put_resource(
+            self.collection._get_path(model.uid), model.dump())
+        self.collection._uncache(model)
+        return self.collection.build(self.collection._extract_individual(updated))
+
+    async def delete(self, uid: Union[UUID, str]) -> Response:
+        """Delete a particular element of the collection."""
+        data = await self.session.delete_resource(self.collection._get_path(uid))
+        self.collection._uncache(uid=uid)
+        return Response(body=data)
+
+    def list(self,
+             page: Optional[int] = None,
+             per_page: Optional[int] = None,
+             lazy: bool = False) -> AsyncElements[ResourceType]:
+        """
+        List all visible elements in the collection, for use with ``async for``.
+
+        Parameters
+        ---------
+        page: int, optional
+            The "page" of results to list. Default is the first page, which is 1.
+        per_page: int, optional
+            Max number of results to return. Default is 20.
+        lazy: bool
+            Whether to deserialize each field of a resource only when it is first read.
+
+        """
+        async def fetch():
+            data = await self.session.get_resource(
+                self.collection._get_path(), params=self.collection._page_params(page, per_page))
+            return list(self.collection._build_collection_elements(
+                self.collection._extract_collection(data), lazy))
+        return AsyncElements(fetch)
+
+
+class AsyncDataConceptsCollection(AsyncCollection[ResourceType]):
+    """
+    Awaitable view of a collection of one kind of data concepts object.
+
+    Parameters
+    ----------
+    collection: DataConceptsCollection
+        The synchronous collection.
+    session: AsyncSession
+        The asynchronous session used to make requests.
+
+    """
+
+    async def get(self, uid: Union[UUID, str], scope: str = 'id') -> ResourceType:
+        """Get the element of the collection with ID equal to uid."""
+        if self.collection.dataset_id is None:
+            raise RuntimeError("Must specify a dataset in order to get a data model object.")
+        cached = self.collection._get_cached(uid, scope)
+        if cached is not None:
+            return cached
+        data = await self.session.get_resource(self.collection._get_scoped_path(uid, scope))
+        return self.collection._cache(self.collection.build(data), uid, scope)
+
+    async def register(self, model: ResourceType) -> ResourceType:
+        """Create a new element of the collection or update an existing element."""
+        dumped_data = self.collection._dump_for_registration(model)
+        data = await self.session.post_resource(self.collection._get_path(), dumped_data)
+        full_model = self.collection.build(data)
+        model.session = self.collection.session
+        self.collection._uncache(full_model)
+        self.collection._uncache(model)
+        return full_model
+
+    async def delete(self, uid: Union[UUID, str], scope: str = 'id') -> Response:
+        """Delete the element of the collection with ID equal to uid."""
+        await self.session.delete_resource(self.collection._get_scoped_path(uid, scope))
+        self.collection._uncache(uid=uid, scope=scope)
+        return Response(status_code=200)
+
+    def list(self,
+             page: Optional[int] = None,
+             per_page: Optional[int] = None) -> AsyncElements[ResourceType]:
+        """List all visible elements of the collection, for use with ``async for``."""
+        return self.filter_by_tags([], page, per_page)
+
+    def filter_by_tags(self, tags: List[str],
+                       page: Optional[int] = None,
+                       per_page: Optional[int] = None) -> AsyncElements[ResourceType]:
+        """Get all objects in the collection that match any one of a list of tags."""
+        async def fetch():
+            response = await self.session.get_resource(
+                self.collection._get_path(ignore_dataset=True),
+                params=self.collection._filter_by_tags_params(tags, page, per_page))
+            return self.collection._build_page(response["contents"])
+        return AsyncElements(fetch)
+
+    def filter_by_attribute_bounds(
+            self,
+            attribute_bounds: Dict[Union[AttributeTemplate, LinkByUID], BaseBounds],
+            page: Optional[int] = None,
+            per_page: Optional[int] = None) -> AsyncElements[ResourceType]:
+        """Get all objects in the collection with attributes within certain bounds."""
+        async def fetch():
+            response = await self.session.post_resource(
+                self.collection._get_path(ignore_dataset=True) + "/filter-by-attribute-bounds",
+                json=self.collection._attribute_bounds_body(attribute_bounds),
+                params=self.collection._attribute_bounds_params(page, per_page))
+            return self.collection._build_page(response["contents"])
+        return AsyncElements(fetch)
+
+    def filter_by_name(self, name: str, exact: bool = False,
+                       page: Optional[int] = None,
+                       per_page: Optional[int] = None) -> AsyncElements[ResourceType]:
+        """Get all objects with specified name in this dataset."""
+        async def fetch():
+            response = await self.session.get_resource(
+                self.collection._get_path(ignore_dataset=True) + "/filter-by-name",
+                params=self.collection._filter_by_name_params(name, exact, page, per_page))
+            return self.collection._build_page(response["contents"])
+        return AsyncElements(fetch)
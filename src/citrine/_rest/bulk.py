@@ -0,0 +1,151 @@
+"""Concurrent execution of one request per item, with per-item error reporting."""
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from logging import getLogger
+from time import monotonic
+from typing import Callable, Dict, Generic, Iterable, Iterator, List, Optional, TypeVar
+
+from citrine.exceptions import BulkOperationFailedException
+
+
+DEFAULT_MAX_WORKERS: int = 8
+"""Number of requests made at once by bulk operations. Keep it within the connection pool size."""
+
+logger = getLogger(__name__)
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+
+class BulkResult(Generic[R]):
+    """
+    The outcome of a bulk operation, in the order of its inputs.
+
+    A failure of one item does not stop the others. Failed items have no result and
+    their exception is recorded in :attr:`failures` instead.
+
+    Attributes
+    ----------
+    results: List[Optional[R]]
+        The result for each input, or None if the item failed.
+    failures: Dict[int, Exception]
+        The exception raised for each failed item, keyed by its index in the input.
+    elapsed: float
+        Wall-clock duration of the operation, in seconds.
+
+    """
+
+    def __init__(self, operation: str, results: List[Optional[R]],
+                 failures: Dict[int, Exception], elapsed: float):
+        self.operation: str = operation
+        self.results: List[Optional[R]] = results
+        self.failures: Dict[int, Exception] = failures
+        self.elapsed: float = elapsed
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def __iter__(self) -> Iterator[Optional[R]]:
+        return iter(self.results)
+
+    def __getitem__(self, index: int) -> Optional[R]:
+        return self.results[index]
+
+    def __repr__(self):
+        return '<BulkResult {!r}: {} succeeded, {} failed in {:.2f}s>'.format(
+            self.operation, self.num_succeeded, len(self.failures), self.elapsed)
+
+    @property
+    def num_succeeded(self) -> int:
+        """Number of items that succeeded."""
+        return len(self.results) - len(self.failures)
+
+    @property
+    def succeeded(self) -> List[R]:
+        """Results of the items that succeeded, in input order."""
+        return [result for index, result in enumerate(self.results)
+                if index not in self.failures]
+
+    @property
+    def ok(self) -> bool:
+        """Whether every item succeeded."""
+        return not self.failures
+
+    @property
+    def throughput(self) -> float:
+        """Number of items processed per second."""
+        return len(self.results) / self.elapsed if self.elapsed > 0 else float('inf')
+
+    def raise_for_failures(self) -> None:
+        """Raise a :class:`BulkOperationFailedException` if any item failed."""
+        if self.failures:
+            raise BulkOperationFailedException(self.operation, self.failures, len(self.results))
+
+
+def run_concurrently(operation: str,
+                     function: Callable[[T], R],
+                     items: Iterable[T],
+                     max_workers: int = DEFAULT_MAX_WORKERS,
+                     chunk_size: Optional[int] = None) -> BulkResult[R]:
+    """
+    Apply a function to every item using a pool of threads.
+
+    Parameters
+    ----------
+    operation: str
+        Description of the operation, used in reports, such as 'get' or 'register'.
+    function: Callable[[T], R]
+        The function to apply. Exceptions it raises are recorded per item.
+    items: Iterable[T]
+        The inputs. They are consumed one chunk at a time, so a generator is never
+        materialized in full.
+    max_workers: int
+        Maximum number of items processed at once. 1 processes them sequentially
+        in the calling thread.
+    chunk_size: int, optional
+        Number of items submitted to the pool at a time, which bounds the memory held by
+        pending work. Progress is logged after each chunk. Default is a single chunk.
+
+    Returns
+    -------
+    BulkResult[R]
+        The results and failures, in input order.
+
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be positive, instead got {}".format(max_workers))
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError("chunk_size must be positive, instead got {}".format(chunk_size))
+    results: List[Optional[R]] = []
+    failures: Dict[int, Exception] = {}
+
+    def apply(index: int, item: T):
+        try:
+            results[index] = function(item)
+        except Exception as e:
+            failures[index] = e
+
+    start = monotonic()
+    executor = ThreadPoolExecutor(max_workers=max_workers) if max_workers > 1 else None
+    try:
+        iterator = iter(items)
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                break
+            offset = len(results)
+            results.extend([None] * len(chunk))
+            if executor is None or len(chunk) == 1:
+                for index, item in enumerate(chunk, offset):
+                    apply(index, item)
+            else:
+                # apply() never raises, so the futures need not be inspected
+                list(executor.map(apply, range(offset, len(results)), chunk))
+            if chunk_size is not None:
+                elapsed = monotonic() - start
+                logger.info('%s: %d items done, %d failed, %.1f items/s', operation,
+                            len(results), len(failures), len(results) / max(elapsed, 1e-9))
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    return BulkResult(operation, results, dict(sorted(failures.items())), monotonic() - start)
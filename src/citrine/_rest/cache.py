@@ -0,0 +1,145 @@
+"""A bounded cache of the resources fetched through a session, and counters of its use."""
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import Callable, Hashable, Optional
+
+
+DEFAULT_CACHE_SIZE: int = 1024
+"""Number of objects kept by an object cache unless told otherwise."""
+
+
+class CacheStats:
+    """
+    Thread-safe counters describing how an object cache is used.
+
+    Attributes
+    ----------
+    hits: int
+        Number of lookups that found a live entry.
+    misses: int
+        Number of lookups that found no entry, or an expired one.
+    evictions: int
+        Number of entries dropped to make room, least recently used first.
+    expirations: int
+        Number of entries dropped because they outlived the time to live.
+    invalidations: int
+        Number of entries dropped because the object was written through the client.
+
+    """
+
+    _counters = ('hits', 'misses', 'evictions', 'expirations', 'invalidations')
+
+    def __init__(self):
+        self._lock = Lock()
+        self.reset()
+
+    def reset(self):
+        """Set every counter back to zero."""
+        with self._lock:
+            for counter in self._counters:
+                setattr(self, counter, 0)
+
+    def record(self, counter: str, count: int = 1):
+        """Add to one of the counters."""
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + count)
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups that were hits, or 0 if there have been none."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return self.hits / lookups if lookups else 0.0
+
+    def as_dict(self) -> dict:
+        """Return a snapshot of the counters."""
+        with self._lock:
+            return {counter: getattr(self, counter) for counter in self._counters}
+
+
+class ObjectCache:
+    """
+    A thread-safe least-recently-used cache of resources, with an optional time to live.
+
+    Attach one to a :class:`Session <citrine._session.Session>` to have ``get`` calls on
+    collections return an object fetched earlier instead of requesting and building it again.
+    Registering, updating or deleting an object through a collection that uses the same
+    session removes it from the cache. Changes made by other clients are only seen once an
+    entry expires, so set `ttl` if other clients may modify the objects.
+
+    Cached objects are shared by every caller that gets them, so an object should not be
+    modified except to update it on the platform.
+
+    Parameters
+    ----------
+    max_size: int
+        Maximum number of entries. When full, the least recently used entry is evicted.
+    ttl: float, optional
+        Number of seconds after which an entry expires. If None, entries never expire.
+    clock: Callable[[], float]
+        Source of the current time in seconds.
+
+    """
+
+    def __init__(self,
+                 max_size: int = DEFAULT_CACHE_SIZE,
+                 ttl: Optional[float] = None,
+                 clock: Callable[[], float] = monotonic):
+        if max_size < 1:
+            raise ValueError("max_size must be positive, instead got {}".format(max_size))
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive, instead got {}".format(ttl))
+        self.max_size: int = max_size
+        self.ttl: Optional[float] = ttl
+        self.clock = clock
+        self.stats: CacheStats = CacheStats()
+        self._lock = Lock()
+        # Each entry is (value, expiration time), with the most recently used entry last
+        self._entries: OrderedDict = OrderedDict()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, key: Hashable):
+        """Get the value stored for a key, or None if there is no live entry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] is not None and entry[1] <= self.clock():
+                del self._entries[key]
+                self.stats.record('expirations')
+                entry = None
+            if entry is None:
+                self.stats.record('misses')
+                return None
+            self._entries.move_to_end(key)
+        self.stats.record('hits')
+        return entry[0]
+
+    def put(self, key: Hashable, value):
+        """Store a value, evicting the least recently used entry if the cache is full."""
+        expiration = None if self.ttl is None else self.clock() + self.ttl
+        with self._lock:
+            self._entries[key] = (value, expiration)
+            self._entries.move_to_end(key)
+            evicted = 0
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                evicted += 1
+        if evicted:
+            self.stats.record('evictions', evicted)
+
+    def invalidate(self, key: Hashable):
+        """Remove the entry for a key and return its value, or None if there was none."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        if entry is None:
+            return None
+        self.stats.record('invalidations')
+        return entry[0]
+
+    def clear(self):
+        """Remove every entry, without counting them as invalidated."""
+        with self._lock:
+            self._entries.clear()
@@ -1,7 +1,11 @@
 from abc import abstractmethod
-from typing import Optional, Union, Generic, TypeVar, Iterable
+from typing import Optional, Union, Generic, TypeVar, Iterable, Iterator, List, Tuple
 from uuid import UUID
 
+from citrine._rest.cache import ObjectCache
+from citrine._rest.bulk import BulkResult, run_concurrently, DEFAULT_MAX_WORKERS
+from citrine._rest.paginator import Paginator, DEFAULT_PER_PAGE, DEFAULT_READ_AHEAD
+from citrine._utils.profiling import profiled_call, profiled_phase
 from citrine.exceptions import ModuleRegistrationFailedException, NonRetryableException
 from citrine.resources.response import Response
 
@@ -33,29 +37,179 @@ class Collection(Generic[ResourceType]):
             return self._path_template.format(**self.__dict__) + subpath
 
     @abstractmethod
-    def build(self, data: dict):
-        """Build an individual element of the collection."""
+    def build(self, data: dict, lazy: bool = False):
+        """Build an individual element of the collection, lazily if asked."""
 
+    def _extract_individual(self, data: dict) -> dict:
+        """Extract the serialized element from the response to a request for one element."""
+        return data[self._individual_key] if self._individual_key else data
+
+    def _extract_collection(self, data) -> list:
+        """Extract the list of serialized elements from the response to a list request."""
+        # A 'None' collection key implies response has a top-level array
+        # of 'ResourceType'
+        # TODO: Unify backend return values
+        if self._collection_key is None:
+            return data
+        else:
+            return data[self._collection_key]
+
+    def _build_collection_elements(self, collection: list,
+                                   lazy: bool = False) -> Iterator[ResourceType]:
+        """Build each element of a list response, skipping those that cannot be built."""
+        for element in collection:
+            try:
+                yield self.build(element, lazy=lazy)
+            except(KeyError, ValueError):
+                # TODO:  Right now this is a hack.  Clean this up soon.
+                # Module collections are not filtering on module type
+                # properly, so we are filtering client-side.
+                pass
+
+    @staticmethod
+    def _page_params(page: Optional[int] = None, per_page: Optional[int] = None) -> dict:
+        """Construct the query parameters that select a page of results."""
+        params = {}
+        if page is not None:
+            params["page"] = page
+        if per_page is not None:
+            params["per_page"] = per_page
+        return params
+
+    @profiled_call
     def get(self, uid: Union[UUID, str]) -> ResourceType:
         """Get a particular element of the collection."""
+        cached = self._get_cached(uid)
+        if cached is not None:
+            return cached
         path = self._get_path(uid)
         data = self.session.get_resource(path)
-        data = data[self._individual_key] if self._individual_key else data
-        return self.build(data)
+        return self._cache(self.build(self._extract_individual(data)), uid)
+
+    def _object_cache(self) -> Optional[ObjectCache]:
+        """Get the object cache of the session, if it has one."""
+        cache = getattr(self.session, 'object_cache', None)
+        return cache if isinstance(cache, ObjectCache) else None
+
+    def _cache_key(self, uid: Union[UUID, str], scope: str = 'id') -> Tuple[str, str, str, str]:
+        """
+        Get the key of an element in the object cache.
+
+        The key includes the path of the collection, and so every ID that the path is made
+        of, such as those of the project and of a workflow.
+        """
+        return self._get_path(), type(self).__name__, scope.lower(), str(uid)
+
+    def _cache_keys_of(self, model) -> List[Tuple[str, str, str, str]]:
+        """Get every key under which an element might be in the object cache."""
+        uids = getattr(model, 'uids', None)
+        if isinstance(uids, dict):
+            return [self._cache_key(uid, scope) for scope, uid in uids.items()]
+        uid = getattr(model, 'uid', None)
+        return [] if uid is None else [self._cache_key(uid)]
+
+    def _get_cached(self, uid: Union[UUID, str], scope: str = 'id') -> Optional[ResourceType]:
+        """Get an element from the object cache, if it is there."""
+        cache = self._object_cache()
+        return None if cache is None else cache.get(self._cache_key(uid, scope))
+
+    def _cache(self, model: ResourceType, uid: Union[UUID, str],
+               scope: str = 'id') -> ResourceType:
+        """Store a fetched element in the object cache, under each of its IDs."""
+        cache = self._object_cache()
+        if cache is not None:
+            for key in {self._cache_key(uid, scope), *self._cache_keys_of(model)}:
+                cache.put(key, model)
+        return model
+
+    def _uncache(self, model=None, uid: Optional[Union[UUID, str]] = None, scope: str = 'id'):
+        """Remove an element that was written to from the object cache, under each of its IDs."""
+        cache = self._object_cache()
+        if cache is None:
+            return
+        pending = set() if model is None else set(self._cache_keys_of(model))
+        if uid is not None:
+            pending.add(self._cache_key(uid, scope))
+        done = set()
+        while pending:
+            key = pending.pop()
+            done.add(key)
+            cached = cache.invalidate(key)
+            if cached is not None:
+                # The same object may also be cached under its other IDs
+                pending.update(set(self._cache_keys_of(cached)) - done)
+
+    @profiled_call
+    def get_many(self, uids: Iterable[Union[UUID, str]],
+                 max_workers: int = DEFAULT_MAX_WORKERS) -> BulkResult[ResourceType]:
+        """
+        Get several elements of the collection concurrently.
+
+        Parameters
+        ----------
+        uids: Iterable[Union[UUID, str]]
+            The IDs of the elements.
+        max_workers: int
+            Maximum number of requests made at once.
+
+        Returns
+        -------
+        BulkResult[ResourceType]
+            The elements in the order of `uids`. An element that could not be fetched is
+            None, and the exception raised for it is recorded in the failures of the result.
+
+        """
+        return run_concurrently('get', self.get, uids, max_workers)
+
+    @profiled_phase('dump')
+    def _dump_for_registration(self, model: CreationType) -> dict:
+        """Serialize a model into the body of a registration request."""
+        return model.dump()
 
+    @profiled_call
     def register(self, model: CreationType) -> CreationType:
         """Create a new element of the collection by registering an existing resource."""
         path = self._get_path()
         try:
-            data = self.session.post_resource(path, model.dump())
-            data = data[self._individual_key] if self._individual_key else data
-            return self.build(data)
+            data = self.session.post_resource(path, self._dump_for_registration(model))
+            registered = self.build(self._extract_individual(data))
         except NonRetryableException as e:
             raise ModuleRegistrationFailedException(model.__class__.__name__, e)
+        self._uncache(registered)
+        return registered
 
+    @profiled_call
+    def register_all(self, models: Iterable[CreationType],
+                     max_workers: int = DEFAULT_MAX_WORKERS,
+                     chunk_size: Optional[int] = None) -> BulkResult[CreationType]:
+        """
+        Register several resources concurrently.
+
+        Parameters
+        ----------
+        models: Iterable[CreationType]
+            The resources to register, each passed to :meth:`register`.
+        max_workers: int
+            Maximum number of requests made at once.
+        chunk_size: int, optional
+            Number of resources submitted at a time. Set it to bound memory use when
+            registering from a generator; progress is logged after each chunk.
+
+        Returns
+        -------
+        BulkResult[CreationType]
+            The registered resources in the order of `models`. A resource that failed to
+            register is None, and the exception raised for it is recorded in the failures
+            of the result instead of being raised.
+
+        """
+        return run_concurrently('register', self.register, models, max_workers, chunk_size)
+
+    @profiled_call
     def list(self,
              page: Optional[int] = None,
-             per_page: Optional[int] = None) -> Iterable[ResourceType]:
+             per_page: Optional[int] = None,
+             lazy: bool = False) -> Iterable[ResourceType]:
         """
         List all visible elements in the collection.
 
@@ -65,6 +219,11 @@ class Collection(Generic[ResourceType]):
             The "page" of results to list. Default is the first page, which is 1.
         per_page: int, optional
             Max number of results to return. Default is 20.
+        lazy: bool
+            Whether to deserialize each field of a resource only when it is first read (or
+            when the resource is dumped). This is cheaper when only a few fields of each
+            resource are used, and dearer when most of them are read one at a time.
+            An invalid field is only reported when it is read.
 
         Returns
         -------
@@ -73,39 +232,66 @@ class Collection(Generic[ResourceType]):
 
         """
         path = self._get_path()
+        data = self.session.get_resource(path, params=self._page_params(page, per_page))
+        yield from self._build_collection_elements(self._extract_collection(data), lazy)
 
-        params = {}
-        if page is not None:
-            params["page"] = page
-        if per_page is not None:
-            params["per_page"] = per_page
+    @profiled_call
+    def list_all(self,
+                 per_page: int = DEFAULT_PER_PAGE,
+                 read_ahead: int = DEFAULT_READ_AHEAD,
+                 lazy: bool = False) -> Iterator[ResourceType]:
+        """
+        Iterate over every visible element in the collection, walking all pages.
 
-        data = self.session.get_resource(path, params=params)
-        # A 'None' collection key implies response has a top-level array
-        # of 'ResourceType'
-        # TODO: Unify backend return values
-        if self._collection_key is None:
-            collection = data
-        else:
-            collection = data[self._collection_key]
+        The next pages are fetched in the background while the current one is consumed.
 
-        for element in collection:
-            try:
-                yield self.build(element)
-            except(KeyError, ValueError):
-                # TODO:  Right now this is a hack.  Clean this up soon.
-                # Module collections are not filtering on module type
-                # properly, so we are filtering client-side.
-                pass
+        Parameters
+        ---------
+        per_page: int
+            Number of results to request per page.
+        read_ahead: int
+            Maximum number of pages fetched ahead of the one being consumed.
+            0 fetches each page only when it is reached.
+        lazy: bool
+            Whether to deserialize each field of a resource only when it is first read,
+            as for :meth:`list`.
+
+        Returns
+        -------
+        Iterator[ResourceType]
+            Resources in this collection.
+
+        """
+        path = self._get_path()
+
+        def fetch_page(page: int, per_page: int) -> list:
+            data = self.session.get_resource(path, params=self._page_params(page, per_page))
+            return self._extract_collection(data)
+
+        return self._iterate_pages(Paginator(fetch_page, per_page, read_ahead),
+                                   lambda page: self._build_collection_elements(page, lazy))
+
+    @staticmethod
+    def _iterate_pages(paginator: Paginator, build_page) -> Iterator[ResourceType]:
+        """Build the elements of each page of a paginator, stopping it if iteration ends early."""
+        pages = iter(paginator)
+        try:
+            for page in pages:
+                yield from build_page(page)
+        finally:
+            pages.close()
 
+    @profiled_call
     def update(self, model: CreationType) -> CreationType:
         url = self._get_path(model.uid)
         updated = self.session.put_resource(url, model.dump())
-        data = updated[self._individual_key] if self._individual_key else updated
-        return self.build(data)
+        self._uncache(model)
+        return self.build(self._extract_individual(updated))
 
+    @profiled_call
     def delete(self, uid: Union[UUID, str]) -> Response:
         """Delete a particular element of the collection."""
         url = self._get_path(uid)
         data = self.session.delete_resource(url)
+        self._uncache(uid=uid)
         return Response(body=data)
@@ -0,0 +1,171 @@
+"""Streamed downloads of files from storage, resumed with range requests if interrupted."""
+import os
+import re
+from logging import getLogger
+from time import monotonic
+from typing import Callable, Optional
+
+import requests
+from requests.exceptions import ChunkedEncodingError, ConnectionError, Timeout
+
+from citrine._utils.functions import prepare_local_path
+from citrine._utils.profiling import profiled_phase
+
+
+DEFAULT_CHUNK_SIZE: int = 1024 * 1024
+"""Number of bytes read from a download and written to disk at a time."""
+
+DEFAULT_MAX_RESUMES: int = 3
+"""Number of times an interrupted download is resumed before giving up."""
+
+logger = getLogger(__name__)
+
+_CONTENT_RANGE_TOTAL = re.compile(r'bytes \d+-\d+/(\d+)')
+
+
+class DownloadProgress:
+    """
+    The progress of a download, as passed to progress callbacks.
+
+    Attributes
+    ----------
+    url: str
+        The url being downloaded.
+    bytes_downloaded: int
+        Number of bytes written so far.
+    total_bytes: Optional[int]
+        Size of the file, if the server reported it.
+    resumes: int
+        Number of times the download was interrupted and resumed.
+    elapsed: float
+        Seconds since the download started.
+
+    """
+
+    def __init__(self, url: str):
+        self.url: str = url
+        self.bytes_downloaded: int = 0
+        self.total_bytes: Optional[int] = None
+        self.resumes: int = 0
+        self.elapsed: float = 0.0
+
+    def __repr__(self):
+        return '<DownloadProgress {} of {} bytes, {:.0f} bytes/s>'.format(
+            self.bytes_downloaded, self.total_bytes, self.throughput)
+
+    @property
+    def fraction(self) -> Optional[float]:
+        """Fraction of the file downloaded, if its size is known."""
+        if not self.total_bytes:
+            return None
+        return self.bytes_downloaded / self.total_bytes
+
+    @property
+    def throughput(self) -> float:
+        """Number of bytes downloaded per second."""
+        return self.bytes_downloaded / self.elapsed if self.elapsed > 0 else 0.0
+
+
+@profiled_phase('network')
+def download_to_file(url: str,
+                     local_path: str,
+                     chunk_size: int = DEFAULT_CHUNK_SIZE,
+                     max_resumes: int = DEFAULT_MAX_RESUMES,
+                     progress: Optional[Callable[[DownloadProgress], None]] = None,
+                     http=requests) -> DownloadProgress:
+    """
+    Stream the content of a url to a local file, one chunk at a time.
+
+    At most one chunk is held in memory. The content is written to ``local_path + '.part'``,
+    which is renamed to `local_path` once complete, so an existing file is only replaced
+    by a complete download. If the connection drops, the download is resumed from the last
+    byte written with an HTTP ``Range`` request. It starts over if the server does not
+    support ranges, or if the content is compressed in transit.
+
+    Parameters
+    ----------
+    url: str
+        The url to download, such as a pre-signed storage url.
+    local_path: str
+        Path of the file to write. Missing directories are created.
+    chunk_size: int
+        Number of bytes read and written at a time.
+    max_resumes: int
+        Maximum number of times the download is resumed after an interruption.
+    progress: Callable[[DownloadProgress], None], optional
+        Called after each chunk is written.
+    http
+        Makes the requests, through a ``get`` method like that of `requests`.
+
+    Returns
+    -------
+    DownloadProgress
+        The final state of the download.
+
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive, instead got {}".format(chunk_size))
+    prepare_local_path(local_path)
+    partial_path = local_path + '.part'
+    state = DownloadProgress(url)
+    # Opened outside of the try, so that a failure to open it is not hidden by its removal
+    output_file = open(partial_path, 'wb')
+    try:
+        with output_file:
+            _stream(http, output_file, state, chunk_size, max_resumes, progress)
+    except BaseException:
+        os.remove(partial_path)
+        raise
+    os.replace(partial_path, local_path)
+    return state
+
+
+def _stream(http, output_file, state: DownloadProgress, chunk_size: int, max_resumes: int,
+            progress: Optional[Callable[[DownloadProgress], None]]):
+    """Write the content of a url to an open file, resuming until it is complete."""
+    start = monotonic()
+    resumable = True
+    while True:
+        headers = {'Range': 'bytes={}-'.format(state.bytes_downloaded)} \
+            if state.bytes_downloaded and resumable else {}
+        try:
+            with http.get(state.url, headers=headers, stream=True) as response:
+                response.raise_for_status()
+                if state.bytes_downloaded and response.status_code != 206:
+                    # The server ignored the range and is sending the whole file again
+                    output_file.seek(0)
+                    output_file.truncate()
+                    state.bytes_downloaded = 0
+                if response.headers.get('Content-Encoding', 'identity') != 'identity':
+                    # Offsets and lengths refer to the encoded content, not what is written
+                    resumable = False
+                elif state.total_bytes is None:
+                    state.total_bytes = _total_bytes(response)
+                for chunk in response.iter_content(chunk_size):
+                    output_file.write(chunk)
+                    state.bytes_downloaded += len(chunk)
+                    state.elapsed = monotonic() - start
+                    if progress is not None:
+                        progress(state)
+        except (ChunkedEncodingError, ConnectionError, Timeout) as e:
+            error = e
+        else:
+            if state.total_bytes is None or state.bytes_downloaded >= state.total_bytes:
+                state.elapsed = monotonic() - start
+                return
+            error = ConnectionError('Download of {} ended after {} of {} bytes'.format(
+                state.url, state.bytes_downloaded, state.total_bytes))
+        if state.resumes >= max_resumes:
+            raise error
+        state.resumes += 1
+        logger.info('Resuming download of %s after %d bytes: %s',
+                    state.url, state.bytes_downloaded, error)
+
+
+def _total_bytes(response) -> Optional[int]:
+    """Read the size of the whole file from the headers of a response."""
+    if response.status_code == 206:
+        match = _CONTENT_RANGE_TOTAL.match(response.headers.get('Content-Range', ''))
+        return int(match.group(1)) if match else None
+    length = response.headers.get('Content-Length')
+    return int(length) if length and length.isdigit() else None
@@ -0,0 +1,348 @@
+"""Hooks called around the requests of a session, and an in-memory collector of statistics."""
+import math
+import re
+from collections import Counter
+from threading import Lock
+from time import perf_counter
+from typing import Dict, Iterable, Optional
+
+
+DEFAULT_PERCENTILES = (50, 90, 99)
+"""Latency percentiles reported by a :class:`StatsCollector` unless told otherwise."""
+
+DEFAULT_MAX_ROUTES: int = 1000
+"""Number of distinct routes a :class:`StatsCollector` keeps statistics for."""
+
+OTHER_ROUTES = '(other)'
+"""Route under which requests are counted once a collector tracks its maximum number of routes."""
+
+_IDENTIFIER = re.compile(
+    r'^(?:[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}|\d+)$')
+
+
+def route_template(path: str) -> str:
+    """
+    Replace the identifiers in a path with a placeholder, so requests to one route are grouped.
+
+    UUIDs and numbers are replaced with ``{id}``, and the query string is dropped. For
+    instance ``projects/<uuid>/material-runs?page=2`` becomes ``/projects/{id}/material-runs``.
+
+    Parameters
+    ----------
+    path: str
+        The path of a request, relative to the base url of the session.
+
+    Returns
+    -------
+    str
+        The route template.
+
+    """
+    segments = path.split('?', 1)[0].strip('/').split('/')
+    return '/' + '/'.join('{id}' if _IDENTIFIER.match(segment) else segment
+                          for segment in segments)
+
+
+class RequestInfo:
+    """
+    A single attempt at a request made by a session, as passed to request hooks.
+
+    Attributes
+    ----------
+    method: str
+        The HTTP method.
+    path: str
+        The path of the request, relative to the base url of the session.
+    attempt: int
+        The number of times the request was already made and retried, starting at 0.
+    elapsed: float, optional
+        Seconds from sending the request to receiving the whole response or an error,
+        including any refresh of the access token that the request needed. None until then.
+    status_code: int, optional
+        Status code of the response, if one was received.
+    request_bytes: int, optional
+        Size of the request body, if known.
+    response_bytes: int, optional
+        Size of the response body, if known.
+
+    """
+
+    def __init__(self, method: str, path: str, attempt: int = 0):
+        self.method: str = method
+        self.path: str = path
+        self.attempt: int = attempt
+        self.elapsed: Optional[float] = None
+        self.status_code: Optional[int] = None
+        self.request_bytes: Optional[int] = None
+        self.response_bytes: Optional[int] = None
+        self._route: Optional[str] = None
+        self._started: float = perf_counter()
+
+    def __repr__(self):
+        return '<RequestInfo {} {} attempt {}>'.format(self.method, self.path, self.attempt)
+
+    @property
+    def route(self) -> str:
+        """The route template of the path, as given by :func:`route_template`."""
+        if self._route is None:
+            self._route = route_template(self.path)
+        return self._route
+
+    def start(self):
+        """Record that the request is being sent now."""
+        self._started = perf_counter()
+
+    def finish(self, response=None):
+        """Record the time taken and, if one was received, the size and status of the response."""
+        self.elapsed = perf_counter() - self._started
+        if response is None:
+            return
+        self.status_code = response.status_code
+        prepared = getattr(response, 'request', None)
+        self.request_bytes = None if prepared is None else _length(prepared.body)
+        self.response_bytes = _length(getattr(response, 'content', None))
+
+
+def _length(body) -> Optional[int]:
+    """Number of bytes in a body, if it is in memory."""
+    if body is None:
+        return 0
+    if isinstance(body, bytes):
+        return len(body)
+    if isinstance(body, str):
+        return len(body.encode('utf-8'))
+    return None
+
+
+class RequestHook:
+    """
+    Called by a session around the requests it makes.
+
+    Subclass this and override the methods of interest, then add an instance to the
+    ``request_hooks`` of a :class:`Session <citrine._session.Session>`. Each attempt at a
+    request is passed to :meth:`pre_request`, then to either :meth:`post_response` or
+    :meth:`on_error`. Hooks are called on the thread that makes the request, so they must be
+    thread-safe if the session is shared. An exception raised by a hook is logged and does not
+    affect the request.
+    """
+
+    def pre_request(self, request: RequestInfo) -> None:
+        """Called before a request is sent."""
+
+    def post_response(self, request: RequestInfo, response) -> None:
+        """Called when a response is received, whatever its status code."""
+
+    def on_error(self, request: RequestInfo, error: Exception) -> None:
+        """Called when no response is received, for instance because the connection failed."""
+
+    def on_retry(self, request: RequestInfo, reason: str, delay: float) -> None:
+        """Called when a failed request is going to be retried after `delay` seconds."""
+
+    def on_token_refresh(self, elapsed: float, succeeded: bool) -> None:
+        """Called after the session requested a new access token, which took `elapsed` seconds."""
+
+
+class LatencyHistogram:
+    """
+    A histogram of durations with buckets of exponentially increasing width.
+
+    Each bucket is about 19% wider than the previous one, so percentiles are estimated to
+    within that relative error with constant memory, however many durations are recorded.
+    Not thread-safe on its own.
+    """
+
+    _BASE = 1e-4
+    _GROWTH = 2 ** 0.25
+
+    def __init__(self):
+        self.count: int = 0
+        self.total: float = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self._buckets: Counter = Counter()
+
+    def record(self, seconds: float):
+        """Add a duration."""
+        self.count += 1
+        self.total += seconds
+        self.min = seconds if self.min is None else min(self.min, seconds)
+        self.max = seconds if self.max is None else max(self.max, seconds)
+        bucket = 0 if seconds <= self._BASE else \
+            math.ceil(math.log(seconds / self._BASE, self._GROWTH))
+        self._buckets[bucket] += 1
+
+    def percentile(self, percent: float) -> Optional[float]:
+        """Estimate the duration below which `percent` percent of the durations fall."""
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(self.count * percent / 100))
+        seen = 0
+        for bucket in sorted(self._buckets):
+            seen += self._buckets[bucket]
+            if seen >= rank:
+                upper = self._BASE * self._GROWTH ** bucket
+                return min(max(upper, self.min), self.max)
+        return self.max
+
+    def as_dict(self, percentiles: Iterable[float] = DEFAULT_PERCENTILES) -> dict:
+        """Summarize the durations, in seconds."""
+        summary = {
+            'count': self.count,
+            'mean': self.total / self.count if self.count else None,
+            'min': self.min,
+            'max': self.max
+        }
+        for percent in percentiles:
+            summary['p{:g}'.format(percent)] = self.percentile(percent)
+        return summary
+
+
+class RouteStats:
+    """
+    Statistics of the requests made to a single route. Not thread-safe on its own.
+
+    Attributes
+    ----------
+    requests: int
+        Number of attempts, including retries.
+    errors: int
+        Number of attempts that received no response.
+    retries: int
+        Number of attempts that were retried.
+    request_bytes: int
+        Total size of the request bodies.
+    response_bytes: int
+        Total size of the response bodies.
+    statuses: Counter
+        Number of responses by status code.
+    latency: LatencyHistogram
+        Durations of the attempts, whether or not they received a response.
+
+    """
+
+    def __init__(self):
+        self.requests: int = 0
+        self.errors: int = 0
+        self.retries: int = 0
+        self.request_bytes: int = 0
+        self.response_bytes: int = 0
+        self.statuses: Counter = Counter()
+        self.latency: LatencyHistogram = LatencyHistogram()
+
+    def as_dict(self, percentiles: Iterable[float] = DEFAULT_PERCENTILES) -> dict:
+        """Return a snapshot of the statistics."""
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'retries': self.retries,
+            'request_bytes': self.request_bytes,
+            'response_bytes': self.response_bytes,
+            'statuses': dict(self.statuses),
+            'latency': self.latency.as_dict(percentiles)
+        }
+
+
+class StatsCollector(RequestHook):
+    """
+    A request hook that keeps thread-safe statistics of the requests of a session in memory.
+
+    Requests are grouped by method and :func:`route template <route_template>`, such as
+    ``GET /projects/{id}/material-runs``. Every session has one, which is read with
+    :meth:`Session.stats <citrine._session.Session.stats>`.
+
+    Parameters
+    ----------
+    percentiles: Iterable[float]
+        The latency percentiles to report.
+    max_routes: int
+        Maximum number of routes to keep statistics for. Requests to further routes, such as
+        paths with identifiers that are not UUIDs, are counted under :data:`OTHER_ROUTES`.
+
+    """
+
+    def __init__(self,
+                 percentiles: Iterable[float] = DEFAULT_PERCENTILES,
+                 max_routes: int = DEFAULT_MAX_ROUTES):
+        self.percentiles = tuple(percentiles)
+        self.max_routes: int = max_routes
+        self._lock = Lock()
+        self.reset()
+
+    def reset(self):
+        """Discard all statistics."""
+        with self._lock:
+            self._routes: Dict[str, RouteStats] = {}
+            self.token_refreshes: int = 0
+            self.failed_token_refreshes: int = 0
+            self.token_refresh_latency: LatencyHistogram = LatencyHistogram()
+
+    def _route_stats(self, request: RequestInfo) -> RouteStats:
+        key = '{} {}'.format(request.method.upper(), request.route)
+        stats = self._routes.get(key)
+        if stats is None:
+            if len(self._routes) >= self.max_routes:
+                key = '{} {}'.format(request.method.upper(), OTHER_ROUTES)
+                stats = self._routes.get(key)
+            if stats is None:
+                stats = self._routes[key] = RouteStats()
+        return stats
+
+    def post_response(self, request: RequestInfo, response) -> None:
+        """Count a response."""
+        with self._lock:
+            stats = self._route_stats(request)
+            stats.requests += 1
+            stats.statuses[request.status_code] += 1
+            stats.request_bytes += request.request_bytes or 0
+            stats.response_bytes += request.response_bytes or 0
+            stats.latency.record(request.elapsed)
+
+    def on_error(self, request: RequestInfo, error: Exception) -> None:
+        """Count a request that received no response."""
+        with self._lock:
+            stats = self._route_stats(request)
+            stats.requests += 1
+            stats.errors += 1
+            stats.latency.record(request.elapsed)
+
+    def on_retry(self, request: RequestInfo, reason: str, delay: float) -> None:
+        """Count a retry."""
+        with self._lock:
+            self._route_stats(request).retries += 1
+
+    def on_token_refresh(self, elapsed: float, succeeded: bool) -> None:
+        """Count a refresh of the access token."""
+        with self._lock:
+            self.token_refreshes += 1
+            if not succeeded:
+                self.failed_token_refreshes += 1
+            self.token_refresh_latency.record(elapsed)
+
+    def as_dict(self) -> dict:
+        """
+        Return a snapshot of the statistics.
+
+        The ``routes`` entry holds the statistics of each route, as given by
+        :meth:`RouteStats.as_dict`, and the other entries their totals. Latencies are in
+        seconds.
+        """
+        with self._lock:
+            routes = {key: stats.as_dict(self.percentiles)
+                      for key, stats in sorted(self._routes.items())}
+            statuses = Counter()
+            for stats in self._routes.values():
+                statuses.update(stats.statuses)
+            return {
+                'requests': sum(stats.requests for stats in self._routes.values()),
+                'errors': sum(stats.errors for stats in self._routes.values()),
+                'retries': sum(stats.retries for stats in self._routes.values()),
+                'request_bytes': sum(stats.request_bytes for stats in self._routes.values()),
+                'response_bytes': sum(stats.response_bytes for stats in self._routes.values()),
+                'statuses': dict(statuses),
+                'token_refreshes': {
+                    'count': self.token_refreshes,
+                    'failed': self.failed_token_refreshes,
+                    'latency': self.token_refresh_latency.as_dict(self.percentiles)
+                },
+                'routes': routes
+            }
@@ -0,0 +1,115 @@
+"""Iteration over every page of a paged listing, fetching pages ahead of the consumer."""
+from queue import Full, Queue
+from threading import Event, Thread
+from typing import Callable, Generic, Iterator, List, TypeVar
+
+
+DEFAULT_PER_PAGE: int = 100
+"""Number of elements requested per page when walking a whole listing."""
+
+DEFAULT_READ_AHEAD: int = 2
+"""Number of pages fetched ahead of the page being consumed."""
+
+_POLL_INTERVAL: float = 0.1
+
+T = TypeVar('T')
+
+
+class Paginator(Generic[T]):
+    """
+    Walk every page of a paged listing.
+
+    With a positive `read_ahead`, pages are fetched by a background thread, which stays up to
+    `read_ahead` pages ahead of the consumer. While the caller processes one page the next
+    ones are already in flight, so walking a listing is limited by bandwidth rather than by
+    the round trip of each request. With `read_ahead` set to 0 every page is fetched on demand
+    in the calling thread.
+
+    The listing ends with the first empty page. A page shorter than `per_page` does not end
+    it, since the server may cap the number of elements it returns per page below the number
+    requested, so walking a listing costs one request more than it has pages.
+    An exception raised while fetching a page is raised to the consumer when it reaches
+    that page. Abandoning the iteration (closing the iterator or letting it be collected)
+    stops the background thread once its in-flight request completes.
+
+    Parameters
+    ----------
+    fetch_page: Callable[[int, int], List]
+        Function that takes a 1-indexed page number and a page size and returns the
+        elements of that page.
+    per_page: int
+        Number of elements to request per page.
+    read_ahead: int
+        Maximum number of pages fetched but not yet consumed.
+    first_page: int
+        The page to start at.
+
+    """
+
+    def __init__(self,
+                 fetch_page: Callable[[int, int], List[T]],
+                 per_page: int = DEFAULT_PER_PAGE,
+                 read_ahead: int = DEFAULT_READ_AHEAD,
+                 first_page: int = 1):
+        if per_page < 1:
+            raise ValueError("per_page must be positive, instead got {}".format(per_page))
+        if read_ahead < 0:
+            raise ValueError("read_ahead must be non-negative, instead got {}".format(read_ahead))
+        self.fetch_page = fetch_page
+        self.per_page: int = per_page
+        self.read_ahead: int = read_ahead
+        self.first_page: int = first_page
+
+    def __iter__(self) -> Iterator[List[T]]:
+        if self.read_ahead == 0:
+            return self._fetch_on_demand()
+        return self._fetch_ahead()
+
+    def _fetch_on_demand(self) -> Iterator[List[T]]:
+        page = self.first_page
+        while True:
+            contents = self.fetch_page(page, self.per_page)
+            if not contents:
+                return
+            yield contents
+            page += 1
+
+    def _fetch_ahead(self) -> Iterator[List[T]]:
+        pages = Queue(maxsize=self.read_ahead)
+        stop = Event()
+        worker = Thread(target=self._prefetch, args=(pages, stop),
+                        name='citrine-paginator', daemon=True)
+        worker.start()
+        try:
+            while True:
+                contents, error = pages.get()
+                if error is not None:
+                    raise error
+                if not contents:
+                    return
+                yield contents
+        finally:
+            # A worker waiting for room in the queue notices this within one poll interval
+            stop.set()
+
+    def _prefetch(self, pages: Queue, stop: Event):
+        page = self.first_page
+        try:
+            while not stop.is_set():
+                contents = self.fetch_page(page, self.per_page)
+                if not _offer(pages, (contents, None), stop) or not contents:
+                    return
+                page += 1
+        except BaseException as e:
+            _offer(pages, (None, e), stop)
+
+
+def _offer(queue: Queue, item, stop: Event) -> bool:
+    """Put an item in a bounded queue unless the consumer stops. Return whether it was put."""
+    while not stop.is_set():
+        try:
+            queue.put(item, timeout=_POLL_INTERVAL)
+            return True
+        except Full:
+            pass
+    return False
@@ -0,0 +1,241 @@
+"""Waiting for many resources to be done by polling them from a single loop."""
+import heapq
+import random
+from time import monotonic, sleep
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+import requests
+
+from citrine._rest.bulk import run_concurrently
+from citrine._rest.retry import RetryPolicy
+from citrine.exceptions import (
+    ModuleValidationFailedException,
+    PollingTimeoutException,
+    RetryableException
+)
+
+
+T = TypeVar('T')
+S = TypeVar('S')
+
+VALIDATING_STATUSES = frozenset({'CREATED', 'VALIDATING'})
+"""Statuses of a module or workflow whose validation has not finished."""
+
+FAILED_STATUSES = frozenset({'INVALID', 'ERROR'})
+"""Statuses of a module or workflow that failed to validate."""
+
+POLL_RETRY_POLICY = RetryPolicy.none()
+"""
+Retry policy of the requests that poll a resource.
+
+A poll that fails transiently is not repeated by the session, which would sleep in the
+polling loop and hold up every other resource; the resource is polled again on its schedule.
+"""
+
+
+class PollingPolicy:
+    """
+    Decides how long to wait before polling a resource that is not done again.
+
+    Each resource is first polled immediately. The interval between polls starts at
+    `initial_interval` and grows by `backoff_factor` after every poll, up to `max_interval`,
+    so that long-running work is polled less and less often. Each interval is randomized by
+    up to a fraction `jitter` of itself, so resources started together are not polled in
+    lockstep.
+
+    Parameters
+    ----------
+    initial_interval: float
+        Seconds to wait after the first poll.
+    max_interval: float
+        Upper bound in seconds on the interval, before jitter.
+    backoff_factor: float
+        Factor by which the interval grows after each poll. 1 polls at a fixed interval.
+    jitter: float
+        Fraction of the interval by which it is randomized, between 0 (none) and 1.
+
+    """
+
+    def __init__(self,
+                 initial_interval: float = 1.0,
+                 max_interval: float = 30.0,
+                 backoff_factor: float = 1.5,
+                 jitter: float = 0.1):
+        if initial_interval <= 0:
+            raise ValueError("initial_interval must be positive, instead got {}".format(
+                initial_interval))
+        if max_interval < initial_interval:
+            raise ValueError("max_interval must be at least initial_interval, instead got "
+                             "{}".format(max_interval))
+        if backoff_factor < 1:
+            raise ValueError("backoff_factor must be at least 1, instead got {}".format(
+                backoff_factor))
+        if not 0 <= jitter < 1:
+            raise ValueError("jitter must be in [0, 1), instead got {}".format(jitter))
+        self.initial_interval: float = initial_interval
+        self.max_interval: float = max_interval
+        self.backoff_factor: float = backoff_factor
+        self.jitter: float = jitter
+
+    def interval(self, polls: int) -> float:
+        """
+        Compute the number of seconds to wait before the next poll of a resource.
+
+        Parameters
+        ----------
+        polls: int
+            The number of times the resource has been polled, at least 1.
+
+        Returns
+        -------
+        float
+            Seconds to wait.
+
+        """
+        # The exponent is bounded so that resources polled for a very long time do not overflow
+        growth = self.backoff_factor ** min(polls - 1, 256)
+        delay = min(self.max_interval, self.initial_interval * growth)
+        if self.jitter:
+            delay *= random.uniform(1 - self.jitter, 1 + self.jitter)
+        return delay
+
+
+def poll_until_done(items: Iterable[T],
+                    check: Callable[[T], S],
+                    is_done: Callable[[S], bool],
+                    policy: Optional[PollingPolicy] = None,
+                    timeout: Optional[float] = None,
+                    max_workers: int = 1,
+                    clock: Callable[[], float] = monotonic,
+                    sleeper: Callable[[float], None] = sleep) -> Iterator[Tuple[T, S]]:
+    """
+    Poll many resources from one loop, yielding each as soon as it is done.
+
+    Each resource is polled on its own schedule, set by `policy`. The loop sleeps until the
+    next resource is due, and polls every resource that is due at once, so any number of
+    resources is waited for by a single thread, which never sleeps while others are due.
+    A poll that raises a :class:`RetryableException <citrine.exceptions.RetryableException>`
+    (for instance because a workflow is not ready yet) or fails to connect counts as not done.
+    Any other exception is raised. Polls should therefore be sent with
+    :data:`POLL_RETRY_POLICY`, so that the session does not retry them in the loop.
+
+    Parameters
+    ----------
+    items: Iterable[T]
+        The resources to wait for.
+    check: Callable[[T], S]
+        Fetches the current state of a resource, typically with one request.
+    is_done: Callable[[S], bool]
+        Whether a state is terminal.
+    policy: PollingPolicy, optional
+        How often to poll each resource. Default is :class:`PollingPolicy` with its defaults.
+    timeout: float, optional
+        Seconds after which to stop waiting. If None, wait indefinitely.
+    max_workers: int
+        Maximum number of resources polled at once when several are due.
+    clock: Callable[[], float]
+        Source of the current time in seconds.
+    sleeper: Callable[[float], None]
+        Waits for a number of seconds.
+
+    Returns
+    -------
+    Iterator[Tuple[T, S]]
+        Each resource with its terminal state, in the order in which they are found done.
+
+    Raises
+    ------
+    PollingTimeoutException
+        If `timeout` runs out before every resource is done. The resources that are not
+        are listed in its `pending` attribute.
+
+    """
+    policy = policy or PollingPolicy()
+    items = list(items)
+    start = clock()
+    deadline = None if timeout is None else start + timeout
+    # Each entry is (time the resource is due, its index, number of times it was polled)
+    schedule: List[Tuple[float, int, int]] = [(start, index, 0) for index in range(len(items))]
+    while schedule:
+        now = clock()
+        if schedule[0][0] > now:
+            sleeper(schedule[0][0] - now)
+            continue
+        due = []
+        while schedule and schedule[0][0] <= now:
+            due.append(heapq.heappop(schedule))
+        result = run_concurrently('poll', lambda entry: check(items[entry[1]]), due, max_workers)
+
+        now = clock()
+        for position, (_, index, polls) in enumerate(due):
+            error = result.failures.get(position)
+            if error is not None and not isinstance(
+                    error, (RetryableException, requests.exceptions.ConnectionError)):
+                raise error
+            if error is None and is_done(result[position]):
+                yield items[index], result[position]
+                continue
+            due_at = now + policy.interval(polls + 1)
+            if deadline is not None:
+                due_at = min(due_at, deadline)
+            heapq.heappush(schedule, (due_at, index, polls + 1))
+
+        if schedule and deadline is not None and now >= deadline:
+            pending = sorted(index for _, index, _ in schedule)
+            raise PollingTimeoutException(timeout, [items[index] for index in pending])
+
+
+def wait_until_ready(collection,
+                     models: Iterable[T],
+                     timeout: Optional[float] = None,
+                     policy: Optional[PollingPolicy] = None,
+                     max_workers: int = 1) -> List[T]:
+    """
+    Wait until modules or workflows of a collection have finished validating.
+
+    Each model is fetched again until its status is no longer one of
+    :data:`VALIDATING_STATUSES`, bypassing the object cache. The latest version of each is
+    stored in the cache of the session, if it has one.
+
+    Parameters
+    ----------
+    collection: Collection
+        The collection the models belong to.
+    models: Iterable[T]
+        The models to wait for, which must have been registered.
+    timeout: float, optional
+        Seconds after which to stop waiting. If None, wait indefinitely.
+    policy: PollingPolicy, optional
+        How often to fetch each model.
+    max_workers: int
+        Maximum number of models fetched at once when several are due.
+
+    Returns
+    -------
+    List[T]
+        The latest version of each model, in the order of `models`.
+
+    Raises
+    ------
+    ModuleValidationFailedException
+        As soon as a model finishes validating with one of :data:`FAILED_STATUSES`. Its
+        `status_info` is included in the message.
+    PollingTimeoutException
+        If `timeout` runs out before every model has finished validating.
+
+    """
+    def fetch(model: T) -> T:
+        data = collection.session.get_resource(collection._get_path(model.uid),
+                                               retry_policy=POLL_RETRY_POLICY)
+        return collection._cache(collection.build(collection._extract_individual(data)),
+                                 model.uid)
+
+    models = list(models)
+    ready = {}
+    for model, latest in poll_until_done(models, fetch,
+                                         lambda latest: latest.status not in VALIDATING_STATUSES,
+                                         policy=policy, timeout=timeout, max_workers=max_workers):
+        if latest.status in FAILED_STATUSES:
+            raise ModuleValidationFailedException(latest)
+        ready[id(model)] = latest
+    return [ready[id(model)] for model in models]
@@ -0,0 +1,157 @@
+"""HTTP connection pooling with utilization counters."""
+from threading import Lock
+
+from requests.adapters import HTTPAdapter, DEFAULT_POOLSIZE
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+DEFAULT_POOL_CONNECTIONS: int = DEFAULT_POOLSIZE
+"""Number of per-host connection pools that are kept."""
+
+DEFAULT_POOL_MAXSIZE: int = DEFAULT_POOLSIZE
+"""Number of connections kept open to any single host."""
+
+
+class PoolStats:
+    """
+    Thread-safe counters describing how the connection pools of a session are used.
+
+    Attributes
+    ----------
+    checkouts: int
+        Number of times a connection was taken from a pool to make a request.
+    in_use: int
+        Number of connections currently checked out.
+    max_in_use: int
+        Largest number of connections that were checked out at the same time.
+    new_connections: int
+        Number of connections opened, each of which costs a TCP (and TLS) handshake.
+    waits: int
+        Number of checkouts that had to wait for a connection to be returned,
+        which only happens if the pool blocks.
+    overflows: int
+        Number of checkouts that found the pool exhausted and opened a connection
+        beyond its maximum size, which only happens if the pool does not block.
+    discarded: int
+        Number of connections closed on return because the pool was full.
+        These are the "connection pool is full" warnings of urllib3.
+
+    """
+
+    _counters = ('checkouts', 'in_use', 'max_in_use', 'new_connections',
+                 'waits', 'overflows', 'discarded')
+
+    def __init__(self):
+        self._lock = Lock()
+        self.reset()
+
+    def reset(self):
+        """Set every counter back to zero."""
+        with self._lock:
+            for counter in self._counters:
+                setattr(self, counter, 0)
+
+    def record_checkout(self, exhausted: bool, blocking: bool):
+        """Count a connection being taken from a pool."""
+        with self._lock:
+            self.checkouts += 1
+            self.in_use += 1
+            self.max_in_use = max(self.max_in_use, self.in_use)
+            if exhausted:
+                if blocking:
+                    self.waits += 1
+                else:
+                    self.overflows += 1
+
+    def record_return(self, discarded: bool):
+        """Count a connection being returned to a pool."""
+        with self._lock:
+            self.in_use = max(0, self.in_use - 1)
+            if discarded:
+                self.discarded += 1
+
+    def record_new_connection(self):
+        """Count a connection being opened."""
+        with self._lock:
+            self.new_connections += 1
+
+    def as_dict(self) -> dict:
+        """Return a snapshot of the counters."""
+        with self._lock:
+            return {counter: getattr(self, counter) for counter in self._counters}
+
+
+def _instrumented_pool_class(pool_class: type, stats: PoolStats) -> type:
+    """Create a subclass of a urllib3 connection pool that reports to `stats`."""
+
+    class InstrumentedConnection(pool_class.ConnectionCls):
+
+        def connect(self):
+            # A pooled connection object reconnects in place if the server closed it,
+            # so handshakes are counted here rather than when connection objects are created
+            stats.record_new_connection()
+            return super().connect()
+
+    class InstrumentedPool(pool_class):
+
+        ConnectionCls = InstrumentedConnection
+
+        def _get_conn(self, timeout=None):
+            # The queue holds one entry (a connection or a placeholder) per free slot
+            pool = self.pool
+            exhausted = pool is not None and pool.empty()
+            conn = super()._get_conn(timeout=timeout)
+            stats.record_checkout(exhausted, self.block)
+            return conn
+
+        def _put_conn(self, conn):
+            pool = self.pool
+            discarded = pool is not None and pool.full()
+            super()._put_conn(conn)
+            stats.record_return(discarded)
+
+    InstrumentedPool.__name__ = 'Instrumented' + pool_class.__name__
+    return InstrumentedPool
+
+
+class InstrumentedHTTPAdapter(HTTPAdapter):
+    """
+    An HTTPAdapter whose connection pools record their utilization.
+
+    Parameters
+    ----------
+    stats: PoolStats
+        The counters to update.
+    pool_connections: int
+        Number of per-host connection pools to keep.
+    pool_maxsize: int
+        Maximum number of connections kept open to a single host.
+    max_retries: int
+        Number of times urllib3 retries a request that failed to connect, before any
+        data was sent. This is independent of the retry policy of the session.
+    pool_block: bool
+        If True, a request waits for a free connection when all `pool_maxsize` connections
+        to its host are in use. If False, an extra connection is opened and then closed
+        once the request is done.
+
+    """
+
+    def __init__(self,
+                 stats: PoolStats,
+                 pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+                 pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+                 max_retries: int = 0,
+                 pool_block: bool = False):
+        self.stats = stats
+        super().__init__(pool_connections=pool_connections,
+                         pool_maxsize=pool_maxsize,
+                         max_retries=max_retries,
+                         pool_block=pool_block)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        """Create the pool manager, making it use instrumented connection pools."""
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _instrumented_pool_class(HTTPConnectionPool, self.stats),
+            'https': _instrumented_pool_class(HTTPSConnectionPool, self.stats)
+        }
@@ -0,0 +1,421 @@
+"""Recording the HTTP traffic of a session to an archive, and replaying it offline."""
+import base64
+import gzip
+import hashlib
+import json
+import re
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from http.client import responses
+from threading import Lock
+from time import perf_counter, sleep
+from typing import Deque, Dict, Iterator, List, Optional, Tuple, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from citrine.exceptions import NonRetryableException
+
+
+ARCHIVE_FORMAT = 'citrine-traffic'
+ARCHIVE_VERSION = 1
+
+_TOKEN_PATH = '/tokens/refresh'
+# Headers that describe how the body was sent rather than what it is, or that carry secrets
+_DROPPED_HEADERS = frozenset({'content-encoding', 'transfer-encoding', 'content-length',
+                              'connection', 'keep-alive', 'set-cookie'})
+
+SIGNED_URL_PARAMETERS = frozenset({
+    'signature', 'sig', 'googleaccessid', 'x-amz-signature', 'x-amz-credential',
+    'x-amz-security-token', 'x-goog-signature', 'x-goog-credential'})
+"""Query parameters of pre-signed storage urls that grant access, redacted from archives."""
+
+REDACTED = 'REDACTED'
+
+_SIGNED_URL_VALUES = re.compile(
+    r'((?:[?&]|\\u0026)(?:{})=)[^&"\s\\]+'.format(
+        '|'.join(sorted(SIGNED_URL_PARAMETERS, key=len, reverse=True))).encode('ascii'),
+    re.IGNORECASE)
+
+
+class UnrecordedRequest(NonRetryableException):
+    """A replayed session made a request that is not in its archive."""
+
+    pass
+
+
+def request_key(method: str, url: str, body=None) -> Tuple[str, str, Optional[str]]:
+    """
+    Identify a request independently of the host it is sent to.
+
+    The key is made of the method, the path and query of the url, with the query parameters
+    sorted and the values of :data:`SIGNED_URL_PARAMETERS` redacted, and a digest of the body,
+    if any.
+    """
+    parts = urlsplit(url)
+    query = urlencode(sorted(
+        (name, REDACTED if name.lower() in SIGNED_URL_PARAMETERS else value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)))
+    target = parts.path + ('?' + query if query else '')
+    return method.upper(), target, _digest(body)
+
+
+def _digest(body) -> Optional[str]:
+    """Hash a request body that is in memory, so the archive holds no request data."""
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+    if not isinstance(body, bytes) or not body:
+        return None
+    return hashlib.sha256(body).hexdigest()
+
+
+def _redact_signed_urls(content: bytes) -> bytes:
+    """Redact the values of :data:`SIGNED_URL_PARAMETERS` in the urls of a JSON body."""
+    return _SIGNED_URL_VALUES.sub(b'\\1' + REDACTED.encode('ascii'), content)
+
+
+class Exchange:
+    """
+    A request and the response it received.
+
+    Only what is needed to match the request and reproduce the response is kept: request
+    headers, which carry credentials, and request bodies are left out, the latter being
+    replaced with a digest. The signatures of pre-signed storage urls are redacted from
+    request urls and JSON response bodies (see :func:`request_key`), so that a replayed
+    download of a file still matches its recording. Everything else in the response is kept
+    verbatim, including the data of the project.
+
+    Attributes
+    ----------
+    method: str
+        The HTTP method.
+    url: str
+        The path and sorted query of the request.
+    body_digest: str, optional
+        SHA-256 digest of the request body, if it had one.
+    status_code: int
+        Status code of the response.
+    headers: Dict[str, str]
+        Headers of the response.
+    content: bytes
+        Body of the response.
+    elapsed: float
+        Seconds from sending the request to having read the whole response.
+
+    """
+
+    def __init__(self, method: str, url: str, body_digest: Optional[str], status_code: int,
+                 headers: Dict[str, str], content: bytes, elapsed: float):
+        self.method: str = method
+        self.url: str = url
+        self.body_digest: Optional[str] = body_digest
+        self.status_code: int = status_code
+        self.headers: Dict[str, str] = headers
+        self.content: bytes = content
+        self.elapsed: float = elapsed
+
+    def __repr__(self):
+        return '<Exchange {} {} {}>'.format(self.method, self.url, self.status_code)
+
+    @property
+    def key(self) -> Tuple[str, str, Optional[str]]:
+        """The key of the request, as given by :func:`request_key`."""
+        return self.method, self.url, self.body_digest
+
+    @classmethod
+    def record(cls, request: requests.PreparedRequest, response: requests.Response,
+               elapsed: float) -> 'Exchange':
+        """Capture a request and the response it received, reading its whole body."""
+        method, url, body_digest = request_key(request.method, request.url, request.body)
+        headers = {name: value for name, value in response.headers.items()
+                   if name.lower() not in _DROPPED_HEADERS}
+        content = response.content
+        if 'json' in response.headers.get('Content-Type', ''):
+            content = _redact_signed_urls(content)
+        return cls(method, url, body_digest, response.status_code, headers, content, elapsed)
+
+    def to_response(self, request: requests.PreparedRequest) -> requests.Response:
+        """Rebuild the response, as received for `request`."""
+        response = requests.Response()
+        response.status_code = self.status_code
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.headers['Content-Length'] = str(len(self.content))
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = self.content
+        response._content_consumed = True
+        response.raw = None
+        response.reason = responses.get(self.status_code, '')
+        response.url = request.url
+        response.request = request
+        response.elapsed = timedelta(seconds=self.elapsed)
+        return response
+
+    def as_dict(self) -> dict:
+        """Serialize the exchange, keeping a body that is text readable in the archive."""
+        try:
+            content = {'text': self.content.decode('utf-8')}
+        except UnicodeDecodeError:
+            content = {'base64': base64.b64encode(self.content).decode('ascii')}
+        return dict({
+            'method': self.method,
+            'url': self.url,
+            'body_digest': self.body_digest,
+            'status_code': self.status_code,
+            'headers': self.headers,
+            'elapsed': self.elapsed
+        }, **content)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Exchange':
+        """Deserialize an exchange written by :meth:`as_dict`."""
+        if 'text' in data:
+            content = data['text'].encode('utf-8')
+        else:
+            content = base64.b64decode(data['base64'])
+        return cls(data['method'], data['url'], data['body_digest'], data['status_code'],
+                   data['headers'], content, data['elapsed'])
+
+
+class TrafficArchive:
+    """
+    The exchanges recorded from a session, in the order their responses were received.
+
+    Archives are saved as gzipped JSON lines: a header, then one exchange per line.
+
+    Parameters
+    ----------
+    exchanges: List[Exchange], optional
+        The exchanges to start with.
+
+    """
+
+    def __init__(self, exchanges: Optional[List[Exchange]] = None):
+        self.exchanges: List[Exchange] = list(exchanges or [])
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self.exchanges)
+
+    def add(self, exchange: Exchange):
+        """Append an exchange. Thread-safe."""
+        with self._lock:
+            self.exchanges.append(exchange)
+
+    def save(self, path: str):
+        """Write the archive to a file."""
+        with self._lock:
+            exchanges = list(self.exchanges)
+        with gzip.open(path, 'wt', encoding='utf-8') as f:
+            header = {'format': ARCHIVE_FORMAT, 'version': ARCHIVE_VERSION,
+                      'exchanges': len(exchanges)}
+            f.write(json.dumps(header) + '\n')
+            for exchange in exchanges:
+                f.write(json.dumps(exchange.as_dict(), separators=(',', ':')) + '\n')
+
+    @classmethod
+    def load(cls, path: str) -> 'TrafficArchive':
+        """Read an archive written by :meth:`save`."""
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            header = json.loads(f.readline())
+            if header.get('format') != ARCHIVE_FORMAT or header.get('version') != ARCHIVE_VERSION:
+                raise ValueError("{} is not a version {} traffic archive".format(
+                    path, ARCHIVE_VERSION))
+            return cls([Exchange.from_dict(json.loads(line)) for line in f if line.strip()])
+
+
+class RecordingAdapter(BaseAdapter):
+    """
+    Sends requests through another adapter, adding each exchange to an archive.
+
+    Requests for access tokens are sent but not recorded, and pre-signed urls are redacted as
+    described in :class:`Exchange`, so that archives hold no credentials. They do hold the
+    response bodies, and so the data of the project, which should be protected accordingly.
+    Reading the whole response to record it means that streamed responses are held in memory.
+    """
+
+    def __init__(self, adapter: BaseAdapter, archive: TrafficArchive):
+        super().__init__()
+        self.adapter = adapter
+        self.archive = archive
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        """Send a request and record it with its response."""
+        start = perf_counter()
+        response = self.adapter.send(request, **kwargs)
+        if not urlsplit(request.url).path.endswith(_TOKEN_PATH):
+            response.content  # Read the body, which is then served to the caller from memory
+            self.archive.add(Exchange.record(request, response, perf_counter() - start))
+        return response
+
+    def close(self):
+        """Close the adapter that sends the requests."""
+        self.adapter.close()
+
+
+class ReplayAdapter(BaseAdapter):
+    """
+    Answers requests from an archive, without any network access.
+
+    A request is answered with the recorded exchanges of the same method, path, query and
+    body, in the order they were recorded. Once those run out, the last of them is
+    repeated, so a scenario can be replayed many times. Requests for access tokens are
+    answered with a token that does not expire for a day.
+
+    Parameters
+    ----------
+    archive: TrafficArchive
+        The recorded exchanges.
+    time_scale: float
+        Factor applied to the recorded duration of each exchange before answering it:
+        1 reproduces the original timing and 0 answers at once.
+    match_body: bool
+        Whether requests must have the same body as the recorded ones. Turn it off to replay
+        requests whose bodies hold values that change between runs, such as new uids.
+
+    """
+
+    def __init__(self, archive: TrafficArchive, time_scale: float = 1.0,
+                 match_body: bool = True):
+        super().__init__()
+        if time_scale < 0:
+            raise ValueError("time_scale must be non-negative, instead got {}".format(
+                time_scale))
+        self.time_scale: float = time_scale
+        self.match_body: bool = match_body
+        self.replayed: int = 0
+        self._lock = Lock()
+        self._pending: Dict[tuple, Deque[Exchange]] = {}
+        self._last: Dict[tuple, Exchange] = {}
+        for exchange in archive.exchanges:
+            self._pending.setdefault(self._key(*exchange.key), deque()).append(exchange)
+
+    def _key(self, method: str, url: str, body_digest: Optional[str]) -> tuple:
+        return (method, url, body_digest) if self.match_body else (method, url)
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        """Answer a request with the next recorded response to it."""
+        if urlsplit(request.url).path.endswith(_TOKEN_PATH):
+            return self._token_exchange().to_response(request)
+        key = self._key(*request_key(request.method, request.url, request.body))
+        with self._lock:
+            pending = self._pending.get(key)
+            exchange = pending.popleft() if pending else self._last.get(key)
+            if exchange is None:
+                raise UnrecordedRequest('No recorded response to {} {}'.format(*key[:2]))
+            self._last[key] = exchange
+            self.replayed += 1
+        if self.time_scale:
+            sleep(exchange.elapsed * self.time_scale)
+        return exchange.to_response(request)
+
+    @staticmethod
+    def _token_exchange() -> Exchange:
+        # jwt is only needed once a token is issued, so it is not imported with the package
+        import jwt
+        token = jwt.encode({'exp': datetime.utcnow() + timedelta(days=1)}, 'replay')
+        token = token.decode('utf-8') if isinstance(token, bytes) else token
+        content = json.dumps({'access_token': token}).encode('utf-8')
+        return Exchange('POST', _TOKEN_PATH, None, 200, {'Content-Type': 'application/json'},
+                        content, 0.0)
+
+    def close(self):
+        """Nothing to close."""
+
+
+def _swap_adapters(session: requests.Session, make_adapter) -> Dict[str, BaseAdapter]:
+    """Mount an adapter made from each mounted one, returning those previously mounted."""
+    previous = dict(session.adapters)
+    for prefix, adapter in previous.items():
+        session.adapters[prefix] = make_adapter(adapter)
+    return previous
+
+
+def _restore_adapters(session: requests.Session, previous: Dict[str, BaseAdapter]):
+    for prefix, adapter in previous.items():
+        session.adapters[prefix] = adapter
+
+
+@contextmanager
+def recording(session: requests.Session, path: Optional[str] = None) -> Iterator[TrafficArchive]:
+    """
+    Record the requests made by a session and the responses it received.
+
+    Recording wraps the transport of the session, so retries, token refreshes, hooks and
+    statistics work as usual::
+
+        with recording(citrine.session, 'history.jsonl.gz'):
+            dataset.material_runs.get_history('id', uid)
+
+    Pre-signed file and table downloads go through :attr:`Session.storage
+    <citrine._session.Session.storage>`, which can be recorded in the same way.
+
+    Parameters
+    ----------
+    session: requests.Session
+        The session to record, such as ``citrine.session``.
+    path: str, optional
+        File to save the archive to once the context exits.
+
+    Returns
+    -------
+    Iterator[TrafficArchive]
+        The archive, which is complete once the context exits.
+
+    """
+    archive = TrafficArchive()
+    previous = _swap_adapters(session, lambda adapter: RecordingAdapter(adapter, archive))
+    try:
+        yield archive
+    finally:
+        _restore_adapters(session, previous)
+        if path is not None:
+            archive.save(path)
+
+
+@contextmanager
+def replaying(session: requests.Session,
+              archive: Union[TrafficArchive, str],
+              time_scale: float = 1.0,
+              match_body: bool = True) -> Iterator[ReplayAdapter]:
+    """
+    Answer the requests of a session from a recorded archive instead of the network.
+
+    The client runs exactly as it did when recording, from decoding responses to building
+    objects, so its CPU and memory costs can be profiled and benchmarked reproducibly::
+
+        with replaying(citrine.session, 'history.jsonl.gz', time_scale=0):
+            with citrine.profiling() as profile:
+                dataset.material_runs.get_history('id', uid)
+
+    A request that was not recorded raises :class:`UnrecordedRequest`. See
+    :class:`ReplayAdapter` for how requests are matched.
+
+    Parameters
+    ----------
+    session: requests.Session
+        The session to answer the requests of, such as ``citrine.session``.
+    archive: Union[TrafficArchive, str]
+        The archive, or the file it was saved to.
+    time_scale: float
+        1 to wait as long as each original exchange took, 0 to answer at once.
+    match_body: bool
+        Whether requests must have the same body as the recorded ones.
+
+    Returns
+    -------
+    Iterator[ReplayAdapter]
+        The adapter answering the requests.
+
+    """
+    if isinstance(archive, str):
+        archive = TrafficArchive.load(archive)
+    adapter = ReplayAdapter(archive, time_scale, match_body)
+    previous = _swap_adapters(session, lambda _: adapter)
+    try:
+        yield adapter
+    finally:
+        _restore_adapters(session, previous)
@@ -0,0 +1,219 @@
+"""Policies for repeating requests that fail transiently, and counters of the retries made."""
+import random
+from collections import Counter
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from threading import Lock
+from typing import Iterable, Optional
+
+from requests import Response
+
+
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'})
+"""Methods for which repeating a request has the same effect as making it once."""
+
+REJECTED_STATUSES = frozenset({425, 429, 503})
+"""Statuses with which the server declines a request before acting on it."""
+
+DEFAULT_RETRY_STATUSES = frozenset({425, 429, 502, 503, 504})
+
+
+class RetryPolicy:
+    """
+    Decides whether a failed request should be repeated, and how long to wait before doing so.
+
+    A failure is retryable if it is a connection error or if the response status is one of
+    `retry_statuses`. Statuses in which the server declines the request before acting on it
+    (425, 429, 503) are retried for every method. Other failures leave it unknown whether
+    the server acted on the request, so they are only retried for idempotent methods.
+
+    Delays grow exponentially with the number of attempts and are randomized with "full jitter",
+    so that many clients throttled at the same moment do not retry in lockstep.
+    A ``Retry-After`` header sent by the server is honored as a lower bound on the delay.
+
+    Parameters
+    ----------
+    max_retries: int
+        Maximum number of times a single request is repeated. 0 disables retries.
+    backoff_factor: float
+        Base delay in seconds. Before retry number n (counting from 0) the client waits
+        up to ``backoff_factor * 2 ** n`` seconds.
+    max_backoff: float
+        Upper bound in seconds on any single delay, including one requested by the server.
+    jitter: bool
+        Whether to wait a uniformly random time between 0 and the computed delay.
+    retry_statuses: Iterable[int]
+        HTTP status codes that are considered transient.
+    idempotent_methods: Iterable[str]
+        HTTP methods that may be repeated after a failure with an unknown outcome.
+    retry_connection_errors: bool
+        Whether to retry requests that failed to connect or whose connection was reset.
+    respect_retry_after: bool
+        Whether to wait at least as long as the ``Retry-After`` header of a response asks.
+
+    """
+
+    def __init__(self,
+                 max_retries: int = 3,
+                 backoff_factor: float = 0.5,
+                 max_backoff: float = 30.0,
+                 jitter: bool = True,
+                 retry_statuses: Iterable[int] = DEFAULT_RETRY_STATUSES,
+                 idempotent_methods: Iterable[str] = IDEMPOTENT_METHODS,
+                 retry_connection_errors: bool = True,
+                 respect_retry_after: bool = True):
+        if max_retries < 0:
+            raise ValueError("max_retries must be non-negative, instead got {}".format(
+                max_retries))
+        self.max_retries: int = max_retries
+        self.backoff_factor: float = backoff_factor
+        self.max_backoff: float = max_backoff
+        self.jitter: bool = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.idempotent_methods = frozenset(method.upper() for method in idempotent_methods)
+        self.retry_connection_errors: bool = retry_connection_errors
+        self.respect_retry_after: bool = respect_retry_after
+
+    @classmethod
+    def none(cls) -> 'RetryPolicy':
+        """A policy that never retries."""
+        return cls(max_retries=0)
+
+    def should_retry(self,
+                     method: str,
+                     attempt: int,
+                     response: Optional[Response] = None,
+                     error: Optional[Exception] = None) -> bool:
+        """
+        Determine whether a request should be repeated.
+
+        Parameters
+        ----------
+        method: str
+            The HTTP method of the request.
+        attempt: int
+            The number of retries that have already been made for this request.
+        response: Response, optional
+            The response received, if any.
+        error: Exception, optional
+            The connection error raised, if no response was received.
+
+        Returns
+        -------
+        bool
+            Whether the request should be repeated.
+
+        """
+        if attempt >= self.max_retries:
+            return False
+        idempotent = method.upper() in self.idempotent_methods
+        if error is not None:
+            return self.retry_connection_errors and idempotent
+        if response is None or response.status_code not in self.retry_statuses:
+            return False
+        return response.status_code in REJECTED_STATUSES or idempotent
+
+    def backoff(self, attempt: int, response: Optional[Response] = None) -> float:
+        """
+        Compute the number of seconds to wait before the next retry.
+
+        Parameters
+        ----------
+        attempt: int
+            The number of retries that have already been made for this request.
+        response: Response, optional
+            The response that triggered the retry, which might carry a ``Retry-After`` header.
+
+        Returns
+        -------
+        float
+            Seconds to wait.
+
+        """
+        delay = min(self.max_backoff, self.backoff_factor * 2 ** attempt)
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        if self.respect_retry_after and response is not None:
+            retry_after = _parse_retry_after(response)
+            if retry_after is not None:
+                delay = min(self.max_backoff, max(delay, retry_after))
+        return delay
+
+
+def _parse_retry_after(response: Response) -> Optional[float]:
+    """Read the ``Retry-After`` header, given either as seconds or as an HTTP date."""
+    try:
+        value = response.headers.get('Retry-After')
+    except AttributeError:
+        return None
+    if not isinstance(value, str):
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryStats:
+    """
+    Thread-safe counters describing the retries made by a session.
+
+    Attributes
+    ----------
+    retries: int
+        Total number of requests that were repeated.
+    retries_by_reason: Counter
+        Number of retries keyed by the reason, either a status code such as ``'429'``
+        or the name of a connection error.
+    succeeded_after_retry: int
+        Number of requests that succeeded after being retried at least once.
+    failed_after_retry: int
+        Number of requests that were retried at least once and still failed.
+
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self.retries: int = 0
+        self.retries_by_reason: Counter = Counter()
+        self.succeeded_after_retry: int = 0
+        self.failed_after_retry: int = 0
+
+    def record_retry(self, reason: str):
+        """Count one retry."""
+        with self._lock:
+            self.retries += 1
+            self.retries_by_reason[reason] += 1
+
+    def record_outcome(self, succeeded: bool):
+        """Count the final outcome of a request that was retried."""
+        with self._lock:
+            if succeeded:
+                self.succeeded_after_retry += 1
+            else:
+                self.failed_after_retry += 1
+
+    def as_dict(self) -> dict:
+        """Return a snapshot of the counters."""
+        with self._lock:
+            return {
+                'retries': self.retries,
+                'retries_by_reason': dict(self.retries_by_reason),
+                'succeeded_after_retry': self.succeeded_after_retry,
+                'failed_after_retry': self.failed_after_retry
+            }
+
+    def reset(self):
+        """Set every counter back to zero."""
+        with self._lock:
+            self.retries = 0
+            self.retries_by_reason.clear()
+            self.succeeded_after_retry = 0
+            self.failed_after_retry = 0
@@ -0,0 +1,89 @@
+"""A pooled HTTP transport for pre-signed storage urls, separate from the API session."""
+from threading import Lock
+from typing import Optional, Tuple, Union
+
+import requests
+
+from citrine._rest.pooling import (
+    InstrumentedHTTPAdapter, PoolStats, DEFAULT_POOL_CONNECTIONS, DEFAULT_POOL_MAXSIZE)
+
+
+DEFAULT_STORAGE_TIMEOUT: Tuple[float, float] = (10.0, 60.0)
+"""Seconds to wait to connect to storage, and then between bytes of a response."""
+
+
+class StorageTransport(requests.Session):
+    """
+    Makes requests to pre-signed storage urls, such as file and table downloads.
+
+    Connections are pooled and kept alive between transfers, so downloading many small
+    files does not pay for a TCP and TLS handshake each time. It has no credentials and
+    sends no headers of the API session, since pre-signed urls carry their own
+    authorization and go to other hosts.
+
+    Parameters
+    ----------
+    pool_connections: int
+        Number of per-host connection pools to keep.
+    pool_maxsize: int
+        Maximum number of connections kept open to a single host. This should be at least
+        the number of threads that transfer files at once.
+    pool_block: bool
+        Whether a request waits for a free connection when all `pool_maxsize` connections
+        are in use, instead of opening a short-lived extra connection.
+    transport_retries: int
+        Number of times a request that failed to connect is retried, before any data was sent.
+    keep_alive: bool
+        Whether connections are kept open and reused between requests.
+    timeout: Union[float, Tuple[float, float]], optional
+        Default timeout of each request, in seconds, either for connecting and reading or
+        as a (connect, read) pair. The read timeout bounds the wait between bytes, not the
+        duration of a transfer. None waits indefinitely.
+
+    """
+
+    def __init__(self,
+                 pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+                 pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+                 pool_block: bool = False,
+                 transport_retries: int = 0,
+                 keep_alive: bool = True,
+                 timeout: Optional[Union[float, Tuple[float, float]]] = DEFAULT_STORAGE_TIMEOUT):
+        super().__init__()
+        self.timeout = timeout
+        if not keep_alive:
+            self.headers.update({"Connection": "close"})
+        self.pool_stats: PoolStats = PoolStats()
+        adapter = InstrumentedHTTPAdapter(self.pool_stats,
+                                          pool_connections=pool_connections,
+                                          pool_maxsize=pool_maxsize,
+                                          max_retries=transport_retries,
+                                          pool_block=pool_block)
+        self.mount('https://', adapter)
+        self.mount('http://', adapter)
+
+    def request(self, method, url, **kwargs) -> requests.Response:
+        """Make a request, with the default timeout unless one is given."""
+        kwargs.setdefault('timeout', self.timeout)
+        return super().request(method, url, **kwargs)
+
+
+_shared_transport: Optional[StorageTransport] = None
+_shared_transport_lock = Lock()
+
+
+def storage_transport(session=None) -> StorageTransport:
+    """
+    Get the transport to use for storage requests made on behalf of a session.
+
+    This is the ``storage`` transport of the session if it has one, or else a transport
+    shared by the whole process.
+    """
+    transport = getattr(session, 'storage', None)
+    if isinstance(transport, StorageTransport):
+        return transport
+    global _shared_transport
+    with _shared_transport_lock:
+        if _shared_transport is None:
+            _shared_transport = StorageTransport()
+        return _shared_transport
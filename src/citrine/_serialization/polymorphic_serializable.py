@@ -1,6 +1,7 @@
 from typing import Generic, TypeVar, Type
 from abc import abstractmethod
 from citrine._serialization.serializable import Serializable
+from citrine._utils.profiling import profiled_phase
 
 
 SelfType = TypeVar('SelfType', bound='Resource')
@@ -15,7 +16,10 @@ class PolymorphicSerializable(Generic[SelfType]):
         """Get the underlying type based on given data."""
 
     @classmethod
-    def build(cls, data: dict) -> SelfType:
-        """Build the underlying type."""
+    @profiled_phase('build')
+    def build(cls, data: dict, lazy: bool = False) -> SelfType:
+        """Build the underlying type, optionally deserializing each field on first read."""
         subtype = cls.get_type(data)
+        if lazy:
+            return subtype.build(data, lazy=True)
         return subtype.build(data)
@@ -3,13 +3,17 @@ from abc import abstractmethod
 import typing
 from datetime import datetime
 import uuid
-import arrow
 
 from taurus.entity.link_by_uid import LinkByUID
 from taurus.entity.dict_serializable import DictSerializable
 from citrine._serialization.serializable import Serializable
 from citrine._serialization.polymorphic_serializable import PolymorphicSerializable
 
+_UNSET = object()
+
+_SERIALIZED = '_serialized_data'
+"""Attribute of a lazily built object holding the data that its unread fields are decoded from."""
+
 SerializedType = typing.TypeVar('SerializedType')
 DeserializedType = typing.TypeVar('DeserializedType')
 SerializedInteger = typing.TypeVar('SerializedInteger', int, str)
@@ -24,11 +28,38 @@ class Property(typing.Generic[DeserializedType, SerializedType]):
                  deserializable: bool = True,
                  default: typing.Optional[DeserializedType] = None):
         self.serialization_path = serialization_path
-        self._key: str = '__' + str(uuid.uuid4())  # Make this object key human readable
+        # Replaced by a key named after the attribute once the property is bound to a class
+        self._key: str = '__' + str(uuid.uuid4())
+        self._named: bool = False
         self.serializable: bool = serializable
         self.deserializable: bool = deserializable
         self.default: typing.Optional[DeserializedType] = default
 
+    def __set_name__(self, owner: type, name: str):
+        """
+        Store values under a key named after the attribute, such as ``'__name'``.
+
+        Unlike a random key, this is the same in every process (so objects can be pickled) and
+        is human readable. A property bound to several names keeps the key of the first.
+        """
+        if not self._named:
+            self._key = '__' + name
+            self._named = True
+
+    @property
+    def serialization_path(self) -> typing.Optional[str]:
+        """The dot-separated path of this property in the serialized dictionary."""
+        return self._serialization_path
+
+    @serialization_path.setter
+    def serialization_path(self, serialization_path: typing.Optional[str]):
+        self._serialization_path = serialization_path
+        # Base class properties resolved per class of the owner, which depend on the path
+        self._base_properties: typing.Dict[type, typing.Any] = {}
+        # Split once, rather than on every (de)serialization
+        self._path_fields: typing.Optional[typing.Tuple[str, ...]] = \
+            None if serialization_path is None else tuple(serialization_path.split('.'))
+
     @property
     @abstractmethod
     def underlying_types(self) -> typing.Union[DeserializedType, typing.Tuple[DeserializedType]]:
@@ -39,16 +70,33 @@ class Property(typing.Generic[DeserializedType, SerializedType]):
     def serialized_types(self) -> typing.Union[SerializedType, typing.Tuple[SerializedType]]:
         """Return the types used to serialize this property."""
 
+    def _get_underlying_types(self):
+        try:
+            return self._resolved_underlying_types
+        except AttributeError:
+            # Resolved on first use, since containers only know their element types after init
+            self._resolved_underlying_types = self.underlying_types
+            return self._resolved_underlying_types
+
+    def _get_serialized_types(self):
+        try:
+            return self._resolved_serialized_types
+        except AttributeError:
+            self._resolved_serialized_types = self.serialized_types
+            return self._resolved_serialized_types
+
     def serialize(self, value: DeserializedType) -> SerializedType:
-        if not isinstance(value, self.underlying_types):
+        types = self._get_underlying_types()
+        if not isinstance(value, types):
             raise ValueError('{} is not one of valid types: '
-                             '{}!'.format(value, self.underlying_types))
+                             '{}!'.format(value, types))
         return self._serialize(value)
 
     def deserialize(self, value: SerializedType) -> DeserializedType:
-        if not isinstance(value, self.serialized_types):
+        types = self._get_serialized_types()
+        if not isinstance(value, types):
             raise ValueError('{} is not one of valid types: '
-                             '{}!'.format(value, self.serialized_types))
+                             '{}!'.format(value, types))
         return self._deserialize(value)
 
     @abstractmethod
@@ -61,17 +109,16 @@ class Property(typing.Generic[DeserializedType, SerializedType]):
 
     def deserialize_from_dict(self, data: dict) -> DeserializedType:
         value = data
-        fields = self.serialization_path.split('.')
-        for field in fields:
+        for field in self._path_fields:
             value = value.get(field, self.default)
         return self.deserialize(value)
 
     def serialize_to_dict(self, data: dict, value: DeserializedType) -> dict:
-        if self.serialization_path is None:
+        fields = self._path_fields
+        if fields is None:
             raise ValueError('No serialization path set!')
         else:
             _data = data
-            fields = self.serialization_path.split('.')
             for field in fields[:-1]:
                 _data = _data.setdefault(field, {})
             _data[fields[-1]] = self.serialize(value)
@@ -79,45 +126,68 @@ class Property(typing.Generic[DeserializedType, SerializedType]):
 
     def __get__(self, obj, objtype=None) -> DeserializedType:
         """Property getter, deferring to the getter of the parent class, if applicable."""
-        base_class = _get_base_class(obj, self.serialization_path)
-        if base_class is not None:
-            return getattr(base_class, self.serialization_path).fget(obj)
-        else:
-            return getattr(obj, self._key, self.default)
+        try:
+            base_property = self._base_properties[type(obj)]
+        except KeyError:
+            base_property = self._resolve_base_property(type(obj))
+        if base_property is not None:
+            return base_property.fget(obj)
+        value = getattr(obj, self._key, _UNSET)
+        if value is not _UNSET:
+            return value
+        # Not set, or not yet decoded on an object built lazily, which is done here rather
+        # than in Property.deserialize_from_dict to save two calls on every first read
+        data = getattr(obj, _SERIALIZED, None)
+        if data is None or not self.deserializable:
+            return self.default
+        value = data
+        for name in self._path_fields:
+            value = value.get(name, self.default)
+        types = self._get_serialized_types()
+        if not isinstance(value, types):
+            raise ValueError('{} is not one of valid types: {}!'.format(value, types))
+        value = self._deserialize(value)
+        # Only fields without a base class property are deferred, so store it directly.
+        # Another thread may have decoded it at the same time, with the same result.
+        setattr(obj, self._key, value)
+        return value
 
     def __set__(self, obj, value: typing.Union[SerializedType, DeserializedType]):
         """Property setter, deferring to the setter of the parent class, if applicable."""
-        if issubclass(type(value), self.underlying_types):
+        if issubclass(type(value), self._get_underlying_types()):
             value_to_set = value
         else:
             # if value is not an underlying type, set its deserialized version.
             value_to_set = self.deserialize(value)
 
-        base_class = _get_base_class(obj, self.serialization_path)
-        if base_class is not None:
-            getattr(base_class, self.serialization_path).fset(obj, value_to_set)
+        try:
+            base_property = self._base_properties[type(obj)]
+        except KeyError:
+            base_property = self._resolve_base_property(type(obj))
+        if base_property is not None:
+            base_property.fset(obj, value_to_set)
         else:
             setattr(obj, self._key, value_to_set)
 
+    def _resolve_base_property(self, klass: type):
+        """
+        Find the property of the base class of klass that this property defers to, if any.
+
+        That is the attribute named by the serialization path on the single base class that
+        has one. It only depends on the class hierarchy, so it is resolved once per class,
+        which keeps attribute access on resources close to the cost of a plain property.
+        """
+        base_classes = [base_class for base_class in klass.__bases__
+                        if hasattr(base_class, self.serialization_path)]
+        base_property = getattr(base_classes[0], self.serialization_path) \
+            if len(base_classes) == 1 else None
+        self._base_properties[klass] = base_property
+        return base_property
+
     def __str__(self):
         return '<Property {!r}>'.format(self.serialization_path)
 
 
-def _get_base_class(obj: object, key: str) -> type:
-    """
-    Return the base class that has key as an attribute, if it exists.
-
-    If there are no base classes with key as an attribute, OR if there are multiple base classes
-    with key as an attribute, return None.
-    """
-    base_classes = obj.__class__.__bases__  # Tuple of all base classes of obj
-    classes_with_key = [base_class for base_class in base_classes if hasattr(base_class, key)]
-    if len(classes_with_key) == 1:
-        return classes_with_key[0]
-    else:
-        return None
-
-
 class Integer(Property[int, SerializedInteger]):
 
     @property
@@ -262,6 +332,7 @@ class Datetime(Property[datetime, int]):
         return int, str
 
     def _deserialize(self, value) -> datetime:
+        import arrow
         if isinstance(value, str):
             return arrow.get(value).datetime
         if isinstance(value, int):
@@ -270,6 +341,7 @@ class Datetime(Property[datetime, int]):
         raise TypeError("{} must be an int or a string".format(value))
 
     def _serialize(self, value: datetime) -> int:
+        import arrow
         return int(arrow.get(value).float_timestamp * 1000)
 
 
@@ -379,6 +451,20 @@ class Object(Property[typing.Any, dict]):
         # We need to use __dict__ here because other access methods will invoke __get__
         self.fields = {k: v for k, v in self.klass.__dict__.items() if isinstance(v, Property)}
 
+    @classmethod
+    def for_class(cls, klass: typing.Type[typing.Any]) -> 'Object':
+        """
+        Return the Object property that (de)serializes instances of klass at the top level.
+
+        It is created once per class and then reused, since scanning the class for its
+        fields is a significant part of the cost of building or dumping a small object.
+        """
+        plan = _object_plans.get(klass)
+        if plan is None:
+            # Concurrent first uses may each build a plan; they are equivalent
+            plan = _object_plans[klass] = cls(klass)
+        return plan
+
     @property
     def underlying_types(self):
         return self.klass
@@ -397,12 +483,116 @@ class Object(Property[typing.Any, dict]):
                                  " explicitly serializable class".format(self.klass))
 
         instance = self.klass.__new__(self.klass, {})
-        for property_name, field in self.fields.items():
+        stored = vars(instance)
+        for path, default, types, decode, key, setter in self._deserialization_plan():
+            value = data
+            for name in path:
+                value = value.get(name, default)
+            # The check of Property.deserialize, made here to save a call per field
+            if not isinstance(value, types):
+                raise ValueError('{} is not one of valid types: {}!'.format(value, types))
+            if setter is None:
+                stored[key] = decode(value)
+            else:
+                setter(instance, decode(value))
+        return instance
+
+    def _deserialization_plan(self) -> typing.List[tuple]:
+        """
+        Resolve how each deserializable field is read from the data and stored on an instance.
+
+        The field checks and converts the value, so it is stored directly under the key of the
+        field rather than through its ``__set__``, which would check the type again and look up
+        the base class property. Fields that defer to a base class property are stored through
+        the setter of that property. This is resolved once, on first use, when the classes
+        that the base class properties belong to are complete.
+        """
+        try:
+            return self._compiled_deserialization
+        except AttributeError:
+            pass
+        plan = []
+        for name, field in self.fields.items():
             if field.deserializable:
-                value = field.deserialize_from_dict(data)
-                setattr(instance, property_name, value)
+                base_property = field._resolve_base_property(self.klass)
+                plan.append((field._path_fields, field.default, field._get_serialized_types(),
+                             field._deserialize, field._key,
+                             None if base_property is None else base_property.fset))
+        self._compiled_deserialization = plan
+        return plan
+
+    def _serialization_plan(self) -> typing.List[tuple]:
+        """
+        Resolve how each serializable field is read from an instance and written to the data.
+
+        As for :meth:`_deserialization_plan`, values are read from under the key of the field,
+        or through the getter of the base class property that the field defers to.
+        Fields with a single-key path are written directly; others go through the field.
+        """
+        try:
+            return self._compiled_serialization
+        except AttributeError:
+            pass
+        plan = []
+        for name, field in self.fields.items():
+            if field.serializable:
+                base_property = field._resolve_base_property(self.klass)
+                path = field._path_fields
+                plan.append((name, field._key,
+                             None if base_property is None else base_property.fget,
+                             field._get_underlying_types(), field._serialize,
+                             path[0] if path is not None and len(path) == 1 else None, field))
+        self._compiled_serialization = plan
+        return plan
+
+    def deserialize_lazily(self, data: dict) -> typing.Any:
+        """
+        Deserialize an object, deferring the decoding of each field until it is first read.
+
+        The object keeps a reference to `data` until it is dumped, and an invalid value is
+        only reported when its field is read. Fields that are stored by a base class, such as
+        those of taurus objects, and objects of classes without fields are decoded immediately.
+        """
+        if not self.fields:
+            return self.deserialize(data)
+        if not isinstance(data, dict):
+            raise ValueError('{} is not one of valid types: {}!'.format(data, dict))
+
+        try:
+            eager_plan = self._compiled_eager_deserialization
+        except AttributeError:
+            eager_plan = [entry for entry in self._deserialization_plan() if entry[-1] is not None]
+            self._compiled_eager_deserialization = eager_plan
+
+        instance = self.klass.__new__(self.klass, {})
+        for path, default, types, decode, key, setter in eager_plan:
+            value = data
+            for name in path:
+                value = value.get(name, default)
+            if not isinstance(value, types):
+                raise ValueError('{} is not one of valid types: {}!'.format(value, types))
+            setter(instance, decode(value))
+        vars(instance)[_SERIALIZED] = data
         return instance
 
+    def _decode_pending(self, obj: typing.Any, data: dict):
+        """
+        Deserialize every field of an object built lazily that has not been read yet.
+
+        This is the loop of :meth:`_deserialize` over the remaining fields, which is cheaper
+        than reading them one at a time. The object then no longer refers to `data`.
+        """
+        stored = vars(obj)
+        for path, default, types, decode, key, setter in self._deserialization_plan():
+            if setter is None and key not in stored:
+                value = data
+                for name in path:
+                    value = value.get(name, default)
+                if not isinstance(value, types):
+                    raise ValueError('{} is not one of valid types: {}!'.format(value, types))
+                stored[key] = decode(value)
+        stored.pop(_SERIALIZED, None)
+
     def _serialize(self, obj: typing.Any) -> dict:
         serialized = {}
         if not self.fields:
@@ -417,16 +607,40 @@ class Object(Property[typing.Any, dict]):
             except AttributeError:
                 raise AttributeError("Tried to serialize object {!r} of type {}, which has "
                                      "neither fields not a dump() method.".format(obj, type(obj)))
-        for property_name, field in self.fields.items():
-            if field.serializable:
-                value = getattr(obj, property_name)
+        if type(obj) is not self.klass:
+            # A subclass may defer different fields to its base classes
+            for property_name, field in self.fields.items():
+                if field.serializable:
+                    serialized = field.serialize_to_dict(serialized, getattr(obj, property_name))
+            return serialized
+        stored = vars(obj)
+        data = stored.get(_SERIALIZED)
+        if data is not None:
+            self._decode_pending(obj, data)
+        for name, key, getter, types, encode, single_key, field in self._serialization_plan():
+            if getter is not None:
+                value = getter(obj)
+            else:
+                value = stored.get(key, _UNSET)
+                if value is _UNSET:
+                    # Not set, so the default of the field
+                    value = getattr(obj, name)
+            if single_key is None:
                 serialized = field.serialize_to_dict(serialized, value)
+                continue
+            # The check of Property.serialize, made here to save a call per field
+            if not isinstance(value, types):
+                raise ValueError('{} is not one of valid types: {}!'.format(value, types))
+            serialized[single_key] = encode(value)
         return serialized
 
     def __str__(self):
         return '<Object[{}] {!r}>'.format(self.klass.__name__, self.serialization_path)
 
 
+_object_plans: typing.Dict[type, Object] = {}
+
+
 class LinkOrElse(Property[typing.Union[Serializable, LinkByUID], dict]):
     """
     A property that can either be a serializable object with IDs or a LinkByUID object.
@@ -1,5 +1,7 @@
 from typing import Generic, TypeVar
 
+from citrine._utils.profiling import profiled_phase
+
 
 Self = TypeVar('Self', bound='Serializable')
 
@@ -13,16 +15,24 @@ class Serializable(Generic[Self]):
         return data
 
     @classmethod
-    def build(cls, data: dict) -> Self:
-        """Build an instance of this object from given data."""
+    @profiled_phase('build')
+    def build(cls, data: dict, lazy: bool = False) -> Self:
+        """
+        Build an instance of this object from given data.
+
+        With `lazy`, each field is only deserialized when it is first read, so building
+        many objects of which only a few fields are used is cheaper.
+        """
         from citrine._serialization import properties
         pre_built = cls._pre_build(data)
-        return properties.Object(cls).deserialize(pre_built)
+        plan = properties.Object.for_class(cls)
+        return plan.deserialize_lazily(pre_built) if lazy else plan.deserialize(pre_built)
 
+    @profiled_phase('dump')
     def dump(self) -> dict:
         """Dump this instance."""
         from citrine._serialization import properties
-        serialized = properties.Object(type(self)).serialize(self)
+        serialized = properties.Object.for_class(type(self)).serialize(self)
         return self._post_dump(serialized)
 
     def _post_dump(self, data: dict) -> dict:
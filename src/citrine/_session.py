@@ -1,9 +1,12 @@
 from os import environ
-from typing import Optional
+from typing import Iterable, List, Optional
 from logging import getLogger
 from datetime import datetime, timedelta
+from threading import Lock, Timer
+from time import perf_counter, sleep
 
 from requests import Response
+from requests.auth import AuthBase
 
 from citrine.exceptions import (
     NotFound,
@@ -11,9 +14,17 @@ from citrine.exceptions import (
     UnauthorizedRefreshToken,
     WorkflowConflictException,
     WorkflowNotReadyException,
+    TooManyRequests,
+    ServiceUnavailable,
     BadRequest, CitrineException)
+from citrine._rest.pooling import (
+    InstrumentedHTTPAdapter, PoolStats, DEFAULT_POOL_CONNECTIONS, DEFAULT_POOL_MAXSIZE)
+from citrine._rest.retry import RetryPolicy, RetryStats
+from citrine._rest.cache import ObjectCache
+from citrine._rest.metrics import RequestHook, RequestInfo, StatsCollector
+from citrine._rest.storage import StorageTransport
+from citrine._utils.profiling import profiled_phase
 
-import jwt
 import requests
 
 
@@ -21,15 +32,84 @@ import requests
 # expiring during the check for expiration
 EXPIRATION_BUFFER_MILLIS: timedelta = timedelta(milliseconds=5000)
 
+# How long before the expiration buffer a background refresh of the access token starts,
+# so that requests on the hot path never have to wait for authentication
+PROACTIVE_REFRESH_LEAD: timedelta = timedelta(seconds=60)
+
+
+class _BearerAuth(AuthBase):
+    """Attaches an access token to a request."""
+
+    def __init__(self, token: str):
+        self.token = token
+
+    def __call__(self, request):
+        request.headers['Authorization'] = 'Bearer {}'.format(self.token)
+        return request
+
 
 class Session(requests.Session):
-    """Wrapper around requests.Session that is both refresh-token and schema aware."""
+    """
+    Wrapper around requests.Session that is both refresh-token and schema aware.
+
+    Parameters
+    ----------
+    refresh_token: str
+        Refresh token used to authenticate with the platform.
+    scheme: str
+        Networking protocol; usually https.
+    host: str
+        Host URL.
+    port: str, optional
+        Optional networking port.
+    retry_policy: RetryPolicy, optional
+        How requests that fail transiently are retried.
+    proactive_refresh: bool
+        Whether to refresh the access token in the background shortly before it expires.
+    pool_connections: int
+        Number of per-host connection pools to keep.
+    pool_maxsize: int
+        Maximum number of connections kept open to a single host. This should be at least
+        the number of threads that share the session.
+    pool_block: bool
+        Whether a request waits for a free connection when all `pool_maxsize` connections
+        are in use, instead of opening a short-lived extra connection.
+    transport_retries: int
+        Number of times a request that failed to connect is retried by the transport,
+        before any data was sent.
+    keep_alive: bool
+        Whether connections are kept open and reused between requests.
+    object_cache: ObjectCache, optional
+        A cache of the objects fetched through collections that use this session.
+        If None, every ``get`` makes a request.
+    storage: StorageTransport, optional
+        The transport used to download files and tables from their pre-signed urls.
+        If None, one is made with the same pool settings as this session. Pass one to
+        set a different timeout.
+    request_hooks: Iterable[RequestHook], optional
+        Hooks called around every request made by this session, in addition to its
+        :attr:`stats_collector`. More can be appended to :attr:`request_hooks` later.
+    collect_stats: bool
+        Whether to keep statistics of the requests in memory, to be read with :meth:`stats`.
+
+    """
 
     def __init__(self,
                  refresh_token: str = environ.get('CITRINE_API_TOKEN'),
                  scheme: str = 'https',
                  host: str = 'citrine.io',
-                 port: Optional[str] = None):
+                 port: Optional[str] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 proactive_refresh: bool = True,
+                 pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+                 pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+                 pool_block: bool = False,
+                 transport_retries: int = 0,
+                 keep_alive: bool = True,
+                 object_cache: Optional[ObjectCache] = None,
+                 storage: Optional[StorageTransport] = None,
+                 request_hooks: Optional[Iterable[RequestHook]] = None,
+                 collect_stats: bool = True):
         super().__init__()
         self.logger = getLogger(__name__)
         self.scheme: str = scheme
@@ -37,10 +117,39 @@ class Session(requests.Session):
         self.refresh_token: str = refresh_token
         self.access_token: Optional[str] = None
         self.access_token_expiration: datetime = datetime.utcnow()
+        self.proactive_refresh: bool = proactive_refresh
+        # Only one thread at a time may refresh the access token; the others wait for it
+        self._token_lock = Lock()
+        self._refresh_timer: Optional[Timer] = None
+        self.retry_policy: RetryPolicy = \
+            retry_policy if retry_policy is not None else RetryPolicy()
+        self.retry_stats: RetryStats = RetryStats()
+        self.object_cache: Optional[ObjectCache] = object_cache
+        self.stats_collector: Optional[StatsCollector] = \
+            StatsCollector() if collect_stats else None
+        self.request_hooks: List[RequestHook] = \
+            ([self.stats_collector] if collect_stats else []) + list(request_hooks or [])
 
         # Following scheme:[//authority]path[?query][#fragment] (https://en.wikipedia.org/wiki/URL)
         self.base_url = '{}://{}/api/v1/'.format(self.scheme, self.authority)
         self.headers.update({"Content-Type": "application/json"})
+        if not keep_alive:
+            self.headers.update({"Connection": "close"})
+
+        self.pool_stats: PoolStats = PoolStats()
+        adapter = InstrumentedHTTPAdapter(self.pool_stats,
+                                          pool_connections=pool_connections,
+                                          pool_maxsize=pool_maxsize,
+                                          max_retries=transport_retries,
+                                          pool_block=pool_block)
+        self.mount('https://', adapter)
+        self.mount('http://', adapter)
+        self.storage: StorageTransport = storage if storage is not None else StorageTransport(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            transport_retries=transport_retries,
+            keep_alive=keep_alive)
 
     def _is_access_token_expired(self):
         return self.access_token_expiration - EXPIRATION_BUFFER_MILLIS <= datetime.utcnow()
@@ -48,30 +157,115 @@ class Session(requests.Session):
     def _refresh_access_token(self) -> None:
         """Optionally refresh our access token (if the previous one is about to expire)."""
         data = {'refresh_token': self.refresh_token}
-        response = super().request('POST', self.base_url + 'tokens/refresh', json=data)
-        if response.status_code != 200:
-            raise UnauthorizedRefreshToken()
-        self.access_token = response.json()['access_token']
+        start = perf_counter()
+        succeeded = False
+        try:
+            response = super().request('POST', self.base_url + 'tokens/refresh', json=data)
+            if response.status_code != 200:
+                raise UnauthorizedRefreshToken()
+            self._set_access_token(response.json()['access_token'])
+            succeeded = True
+        finally:
+            self._notify('on_token_refresh', perf_counter() - start, succeeded)
+
+    def _set_access_token(self, access_token: str) -> None:
+        """Store a freshly issued access token and its expiration time."""
+        # jwt is only needed once a token is issued, so it is not imported with the package
+        import jwt
+        self.access_token = access_token
         self.access_token_expiration = datetime.utcfromtimestamp(
             jwt.decode(self.access_token, verify=False)['exp']
         )
+        self._schedule_proactive_refresh()
 
-    def checked_request(self, method: str, path: str, *args, **kwargs) -> requests.Response:
-        """Check response status code and throw an exception if relevant."""
+    def _ensure_access_token(self) -> None:
+        """Refresh the access token if it is about to expire, at most once across threads."""
         if self._is_access_token_expired():
-            self._refresh_access_token()
-        uri = self.base_url + path.lstrip('/')
-        response = super().request(method, uri, *args, **kwargs)
+            with self._token_lock:
+                # Another thread may have refreshed the token while this one waited
+                if self._is_access_token_expired():
+                    self._refresh_access_token()
 
-        try:
-            if response.status_code == 401 and response.json().get("reason") == "invalid-token":
+    def _refresh_rejected_access_token(self, rejected_token: Optional[str]) -> None:
+        """Refresh the access token after the server rejected it, unless that already happened."""
+        with self._token_lock:
+            if self.access_token == rejected_token:
                 self._refresh_access_token()
-                response = super().request(method, uri, *args, **kwargs)
-        except ValueError:
-            # Ignore ValueErrors thrown by attempting to decode json bodies. This
-            # might occur if we get a 401 response without a JSON body
-            pass
 
+    def _schedule_proactive_refresh(self) -> None:
+        """Start a timer that refreshes the access token in the background before it expires."""
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+            self._refresh_timer = None
+        if not self.proactive_refresh:
+            return
+        refresh_at = self.access_token_expiration - EXPIRATION_BUFFER_MILLIS - \
+            PROACTIVE_REFRESH_LEAD
+        delay = (refresh_at - datetime.utcnow()).total_seconds()
+        if delay <= 0:
+            # The token expires too soon to refresh it ahead of time
+            return
+        self._refresh_timer = Timer(delay, self._proactive_refresh, args=(self.access_token,))
+        self._refresh_timer.daemon = True
+        self._refresh_timer.start()
+
+    def _proactive_refresh(self, token: str) -> None:
+        """Refresh the access token from the background timer."""
+        try:
+            self._refresh_rejected_access_token(token)
+        except Exception:
+            # The next request will refresh the token on the hot path instead
+            self.logger.warning('Background refresh of the access token failed', exc_info=True)
+
+    def stats(self) -> dict:
+        """
+        Return a snapshot of the statistics of the requests made by this session.
+
+        Latency percentiles, byte counts, status codes and retries are given per route
+        template, such as ``GET /projects/{id}/material-runs``, and in total. Token refreshes
+        are counted too. See :meth:`StatsCollector.as_dict
+        <citrine._rest.metrics.StatsCollector.as_dict>`.
+
+        Returns
+        -------
+        dict
+            The statistics, or an empty dictionary if the session does not collect them.
+
+        """
+        return self.stats_collector.as_dict() if self.stats_collector is not None else {}
+
+    def _notify(self, event: str, *args) -> None:
+        """Call a method of every request hook, logging rather than raising their errors."""
+        for hook in self.request_hooks:
+            try:
+                getattr(hook, event)(*args)
+            except Exception:
+                self.logger.warning('Request hook %r failed in %s', hook, event, exc_info=True)
+
+    def close(self) -> None:
+        """Cancel any scheduled token refresh and close all adapters, including storage."""
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+            self._refresh_timer = None
+        self.storage.close()
+        super().close()
+
+    def checked_request(self, method: str, path: str, *args,
+                        retry_policy: Optional[RetryPolicy] = None,
+                        **kwargs) -> requests.Response:
+        """
+        Check response status code and throw an exception if relevant.
+
+        Transient failures are retried according to `retry_policy`, which defaults
+        to the retry policy of the session.
+        """
+        policy = retry_policy if retry_policy is not None else self.retry_policy
+        uri = self.base_url + path.lstrip('/')
+        response = self._request_with_retries(policy, method, uri, *args, **kwargs)
+        return self._check_response(response, method, path)
+
+    def _check_response(self, response: Response, method: str, path: str) -> Response:
+        """Return the response if it is successful, and otherwise raise the matching exception."""
         # TODO: More substantial/careful error handling
         if 200 <= response.status_code <= 299:
             self.logger.info('%s %s %s', response.status_code, method, path)
@@ -98,10 +292,90 @@ class Session(requests.Session):
                 self.logger.debug('%s %s %s', response.status_code, method, path)
                 msg = 'Cant execute at this time. Try again later. Error: {}'.format(response.text)
                 raise WorkflowNotReadyException(msg)
+            elif response.status_code == 429:
+                self.logger.error('%s %s %s', response.status_code, method, path)
+                raise TooManyRequests(path, response)
+            elif response.status_code in (502, 503, 504):
+                self.logger.error('%s %s %s', response.status_code, method, path)
+                self.logger.error(response.text)
+                raise ServiceUnavailable(path, response)
             else:
                 self.logger.error('%s %s %s', response.status_code, method, path)
                 raise CitrineException(response.text)
 
+    def _request_with_retries(self, policy: RetryPolicy, method: str, uri: str,
+                              *args, **kwargs) -> Response:
+        """Make a request, repeating it for as long as the retry policy allows."""
+        path = uri[len(self.base_url):] if uri.startswith(self.base_url) else uri
+        attempt = 0
+        while True:
+            response = None
+            request = RequestInfo(method, path, attempt)
+            try:
+                response = self._observed_request(request, uri, *args, **kwargs)
+            except requests.exceptions.ConnectionError as e:
+                if not policy.should_retry(method, attempt, error=e):
+                    if attempt > 0:
+                        self.retry_stats.record_outcome(succeeded=False)
+                    raise
+                reason = e.__class__.__name__
+            else:
+                if not policy.should_retry(method, attempt, response=response):
+                    if attempt > 0:
+                        self.retry_stats.record_outcome(
+                            succeeded=200 <= response.status_code <= 299)
+                    return response
+                reason = str(response.status_code)
+
+            delay = policy.backoff(attempt, response)
+            self.retry_stats.record_retry(reason)
+            self._notify('on_retry', request, reason, delay)
+            self.logger.warning('%s %s failed with %s, retrying in %.2f seconds (retry %d of %d)',
+                                method, uri, reason, delay, attempt + 1, policy.max_retries)
+            sleep(delay)
+            attempt += 1
+
+    def _observed_request(self, request: RequestInfo, uri: str, *args, **kwargs) -> Response:
+        """Make a single request, passing it to the request hooks."""
+        if not self.request_hooks:
+            return self._request_once(request.method, uri, *args, **kwargs)
+        self._notify('pre_request', request)
+        request.start()
+        try:
+            response = self._request_once(request.method, uri, *args, **kwargs)
+        except Exception as e:
+            request.finish()
+            self._notify('on_error', request, e)
+            raise
+        request.finish(response)
+        self._notify('post_response', request, response)
+        return response
+
+    @profiled_phase('network')
+    def _request_once(self, method: str, uri: str, *args, **kwargs) -> Response:
+        """Make a single request, refreshing the access token if necessary."""
+        self._ensure_access_token()
+        token = self.access_token
+        response = super().request(method, uri, *args, **self._with_auth(token, kwargs))
+
+        try:
+            if response.status_code == 401 and response.json().get("reason") == "invalid-token":
+                self._refresh_rejected_access_token(token)
+                response = super().request(
+                    method, uri, *args, **self._with_auth(self.access_token, kwargs))
+        except ValueError:
+            # Ignore ValueErrors thrown by attempting to decode json bodies. This
+            # might occur if we get a 401 response without a JSON body
+            pass
+        return response
+
+    @staticmethod
+    def _with_auth(token: Optional[str], kwargs: dict) -> dict:
+        """Attach the access token that a request is sent with, so a rejection can be traced."""
+        if token is None or 'auth' in kwargs:
+            return kwargs
+        return dict(kwargs, auth=_BearerAuth(token))
+
     @staticmethod
     def _extract_response_stacktrace(response: Response) -> Optional[str]:
         try:
@@ -112,21 +386,27 @@ class Session(requests.Session):
             pass
         return None
 
+    @staticmethod
+    @profiled_phase('decode')
+    def _decode(response: Response):
+        """Parse the JSON body of a response."""
+        return response.json()
+
     def get_resource(self, path: str, *args, **kwargs) -> dict:
         """GET a particular resource as JSON."""
-        return self.checked_get(path, *args, **kwargs).json()
+        return self._decode(self.checked_get(path, *args, **kwargs))
 
     def post_resource(self, path: str, json: dict, *args, **kwargs) -> dict:
         """POST to a particular resource as JSON."""
-        return self.checked_post(path, *args, json=json, **kwargs).json()
+        return self._decode(self.checked_post(path, *args, json=json, **kwargs))
 
     def put_resource(self, path: str, json: dict, *args, **kwargs) -> dict:
         """PUT data given by some JSON at a particular resource."""
-        return self.checked_put(path, *args, json=json, **kwargs).json()
+        return self._decode(self.checked_put(path, *args, json=json, **kwargs))
 
-    def delete_resource(self, path: str) -> dict:
+    def delete_resource(self, path: str, **kwargs) -> dict:
         """DELETE a particular resource as JSON."""
-        return self.checked_delete(path).json()
+        return self._decode(self.checked_delete(path, **kwargs))
 
     def checked_post(self, path: str, json: dict, *args, **kwargs) -> Response:
         """Execute a POST request to a URL and utilize error filtering on the response."""
@@ -136,10 +416,29 @@ class Session(requests.Session):
         """Execute a PUT request to a URL and utilize error filtering on the response."""
         return self.checked_request('PUT', path, *args, json=json, **kwargs)
 
-    def checked_delete(self, path: str) -> Response:
+    def checked_delete(self, path: str, **kwargs) -> Response:
         """Execute a DELETE request to a URL and utilize error filtering on the response."""
-        return self.checked_request('DELETE', path)
+        return self.checked_request('DELETE', path, **kwargs)
 
     def checked_get(self, path: str, *args, **kwargs) -> Response:
         """Execute a GET request to a URL and utilize error filtering on the response."""
         return self.checked_request('GET', path, *args, **kwargs)
+
+
+_default_session: Optional[Session] = None
+_default_session_lock = Lock()
+
+
+def default_session() -> Session:
+    """
+    Get the session of objects that are made without one.
+
+    It authenticates with the ``CITRINE_API_TOKEN`` environment variable, and is made the
+    first time it is needed rather than when the package is imported. The same session is
+    returned every time after that.
+    """
+    global _default_session
+    with _default_session_lock:
+        if _default_session is None:
+            _default_session = Session()
+        return _default_session
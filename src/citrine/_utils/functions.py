@@ -148,12 +148,17 @@ def rewrite_s3_links_locally(url: str) -> str:
         return parsed_url._replace(netloc="localhost:9572").geturl()
 
 
-def write_file_locally(content, local_path: str):
-    """Take content from remote and ensure path exists."""
+def prepare_local_path(local_path: str):
+    """Ensure that the directory of a file path exists, and that the path has a filename."""
     directory, filename = os.path.split(local_path)
     if filename == "":
         raise ValueError("A filename must be provided in the path")
     if not os.path.isdir(directory):
         os.makedirs(directory)
+
+
+def write_file_locally(content, local_path: str):
+    """Take content from remote and ensure path exists."""
+    prepare_local_path(local_path)
     with open(local_path, 'wb') as output_file:
         output_file.write(content)
@@ -0,0 +1,150 @@
+"""Traversal and dependency ordering of graphs of taurus objects."""
+from typing import Dict, Iterable, List, Set, Tuple
+from uuid import uuid4
+
+from taurus.entity.base_entity import BaseEntity
+from taurus.entity.dict_serializable import DictSerializable
+from taurus.entity.link_by_uid import LinkByUID
+
+
+def _uid_keys(entity: BaseEntity) -> List[Tuple[str, str]]:
+    return [(scope.lower(), str(uid)) for scope, uid in entity.uids.items()]
+
+
+def _collect_references(value, entities: List[BaseEntity], links: List[Tuple[str, str]],
+                        seen: Set[int]):
+    """Find the objects and links referred to by a field value, without entering objects."""
+    if id(value) in seen:
+        return
+    if isinstance(value, BaseEntity):
+        entities.append(value)
+    elif isinstance(value, LinkByUID):
+        links.append((value.scope.lower(), str(value.id)))
+    elif isinstance(value, (list, tuple)):
+        seen.add(id(value))
+        for element in value:
+            _collect_references(element, entities, links, seen)
+    elif isinstance(value, dict):
+        seen.add(id(value))
+        for element in list(value.keys()) + list(value.values()):
+            _collect_references(element, entities, links, seen)
+    elif isinstance(value, DictSerializable):
+        # Attributes, values and bounds, which can refer to templates
+        seen.add(id(value))
+        for element in vars(value).values():
+            _collect_references(element, entities, links, seen)
+
+
+def _references(entity: BaseEntity, soft: bool) -> Tuple[List[BaseEntity], List[Tuple]]:
+    """
+    Find the objects and links that an object refers to.
+
+    Hard references (`soft` False) are the fields that are serialized, which the object
+    depends on. Soft references (`soft` True) are the fields in `skip`, which point back at
+    objects that depend on this one, such as the measurements of a material.
+    """
+    entities, links = [], []
+    seen = set()
+    for key, value in vars(entity).items():
+        if (key in entity.skip) == soft:
+            _collect_references(value, entities, links, seen)
+    return entities, links
+
+
+def collect_graph(roots: Iterable[BaseEntity]) -> List[BaseEntity]:
+    """
+    Find every object connected to the given objects.
+
+    Both hard links (such as the process of a material) and soft links (such as the
+    ingredients of a process and the measurements of a material) are followed, so the
+    history of a material is found starting from any object in it.
+    Objects without a uid are assigned one, so that other objects can link to them.
+
+    Parameters
+    ----------
+    roots: Iterable[BaseEntity]
+        The objects to start from.
+
+    Returns
+    -------
+    List[BaseEntity]
+        Every distinct object reachable from `roots`, in the order found.
+
+    """
+    found: Dict[int, BaseEntity] = {}
+    pending = list(roots)
+    while pending:
+        entity = pending.pop()
+        if id(entity) in found:
+            continue
+        found[id(entity)] = entity
+        if not entity.uids:
+            entity.add_uid('auto', str(uuid4()))
+        for soft in (False, True):
+            pending.extend(_references(entity, soft)[0])
+    return list(found.values())
+
+
+def link_dependencies(entities: List[BaseEntity]) -> Dict[int, Set[int]]:
+    """
+    Find which of a set of objects each object links to, directly or through a LinkByUID.
+
+    Links to objects outside of `entities` are ignored, as they are assumed to be satisfied.
+
+    Parameters
+    ----------
+    entities: List[BaseEntity]
+        The objects, such as the output of :func:`collect_graph`.
+
+    Returns
+    -------
+    Dict[int, Set[int]]
+        For the ``id()`` of each object, the ``id()`` of the objects it links to.
+
+    """
+    by_uid: Dict[Tuple[str, str], int] = {}
+    for entity in entities:
+        for key in _uid_keys(entity):
+            by_uid[key] = id(entity)
+    known = set(by_uid.values())
+
+    dependencies: Dict[int, Set[int]] = {}
+    for entity in entities:
+        linked, links = _references(entity, soft=False)
+        targets = {id(other) for other in linked if id(other) in known}
+        targets.update(by_uid[link] for link in links if link in by_uid)
+        targets.discard(id(entity))
+        dependencies[id(entity)] = targets
+    return dependencies
+
+
+def dependency_levels(entities: List[BaseEntity],
+                      dependencies: Dict[int, Set[int]]) -> List[List[BaseEntity]]:
+    """
+    Group objects into levels such that every object only links to objects in earlier levels.
+
+    Parameters
+    ----------
+    entities: List[BaseEntity]
+        The objects to sort.
+    dependencies: Dict[int, Set[int]]
+        The links between them, as computed by :func:`link_dependencies`.
+
+    Returns
+    -------
+    List[List[BaseEntity]]
+        The levels, in the order in which they can be registered.
+
+    """
+    levels = []
+    placed: Set[int] = set()
+    remaining = entities
+    while remaining:
+        level = [entity for entity in remaining if dependencies[id(entity)] <= placed]
+        if not level:
+            raise ValueError("Objects cannot be ordered because their links form a cycle: {}"
+                             .format(", ".join(str(entity.name) for entity in remaining)))
+        levels.append(level)
+        placed.update(id(entity) for entity in level)
+        remaining = [entity for entity in remaining if id(entity) not in placed]
+    return levels
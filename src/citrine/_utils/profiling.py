@@ -0,0 +1,323 @@
+"""Sampled profiling of where the client spends its time: network, decoding, building, dumping."""
+import inspect
+import random
+from contextlib import contextmanager
+from functools import wraps
+from threading import Lock, local
+from time import perf_counter
+from typing import Callable, Dict, Iterator, List, Optional
+
+
+PHASES = ('network', 'decode', 'build', 'build_children', 'dump')
+"""
+The phases time is split into:
+
+* ``network``: sending requests and waiting for their responses, including token refreshes
+* ``decode``: parsing the JSON body of responses
+* ``build``: deserializing objects from the decoded responses
+* ``build_children``: building the data concepts objects that other objects link to
+* ``dump``: serializing objects into request bodies
+
+Any other time spent in a call, such as waiting between retries or for pages fetched in the
+background, is counted as ``other``.
+"""
+
+OTHER = 'other'
+
+DEFAULT_MAX_CALLS: int = 1000
+"""Number of calls a profile keeps individually. Every call is counted in its summary."""
+
+
+class CallProfile:
+    """
+    The time taken by one call to a method of a collection, split into phases.
+
+    Attributes
+    ----------
+    name: str
+        The class and method, such as ``MaterialRunCollection.filter_by_tags``.
+    elapsed: float
+        Seconds spent in the call. For a method returning an iterator, this is the time spent
+        producing its elements, not the time the caller spent consuming them.
+    phases: Dict[str, float]
+        Seconds spent in each of :data:`PHASES`, and in ``other``.
+    requests: int
+        Number of requests made.
+
+    """
+
+    def __init__(self, name: str):
+        self.name: str = name
+        self.elapsed: float = 0.0
+        self.phases: Dict[str, float] = {}
+        self.requests: int = 0
+
+    def __repr__(self):
+        return '<CallProfile {} {:.3f}s>'.format(self.name, self.elapsed)
+
+    def as_dict(self) -> dict:
+        """Return the call as a dictionary."""
+        return {'name': self.name, 'elapsed': self.elapsed, 'requests': self.requests,
+                'phases': dict(self.phases)}
+
+
+class Profile:
+    """
+    The time spent by the client while profiling, as returned by :func:`profiling`.
+
+    Only work done while the profile is active is counted, on any thread. Work done within a
+    call to a collection method on the same thread is also attributed to that call. Work done
+    on other threads, such as pages fetched ahead by ``list_all`` or the requests of
+    ``get_many``, is counted in :attr:`totals` and in calls made on those threads, while the
+    calling thread counts the time it waits for it as ``other``.
+
+    Parameters
+    ----------
+    sample_rate: float
+        Fraction of the calls (and of the work done outside calls) that is timed. Sampling
+        a small fraction keeps the overhead negligible in production.
+    max_calls: int
+        Maximum number of calls kept in :attr:`calls`.
+
+    Attributes
+    ----------
+    calls: List[CallProfile]
+        The first `max_calls` calls that were timed.
+    totals: Dict[str, float]
+        Seconds spent in each phase, whether or not in a call.
+
+    """
+
+    def __init__(self, sample_rate: float = 1.0, max_calls: int = DEFAULT_MAX_CALLS):
+        if not 0 <= sample_rate <= 1:
+            raise ValueError("sample_rate must be in [0, 1], instead got {}".format(sample_rate))
+        self.sample_rate: float = sample_rate
+        self.max_calls: int = max_calls
+        self.calls: List[CallProfile] = []
+        self.totals: Dict[str, float] = {}
+        self._summary: Dict[str, dict] = {}
+        self._lock = Lock()
+
+    def _sampled(self) -> bool:
+        return self.sample_rate >= 1 or random.random() < self.sample_rate
+
+    def _record_phase(self, phase: str, seconds: float, call: Optional[CallProfile]):
+        with self._lock:
+            self.totals[phase] = self.totals.get(phase, 0.0) + seconds
+            if call is not None:
+                call.phases[phase] = call.phases.get(phase, 0.0) + seconds
+                if phase == 'network':
+                    call.requests += 1
+
+    def _record_call(self, call: CallProfile):
+        with self._lock:
+            if len(self.calls) < self.max_calls:
+                self.calls.append(call)
+            summary = self._summary.setdefault(
+                call.name, {'count': 0, 'elapsed': 0.0, 'requests': 0, 'phases': {}})
+            summary['count'] += 1
+            summary['elapsed'] += call.elapsed
+            summary['requests'] += call.requests
+            for phase, seconds in call.phases.items():
+                summary['phases'][phase] = summary['phases'].get(phase, 0.0) + seconds
+
+    def summary(self) -> Dict[str, dict]:
+        """
+        Aggregate the timed calls by name.
+
+        Returns
+        -------
+        Dict[str, dict]
+            For each name, the number of calls (``count``), the total seconds spent in them
+            (``elapsed``), the requests they made (``requests``) and the seconds spent in each
+            phase (``phases``), from the slowest name to the fastest.
+
+        """
+        with self._lock:
+            ordered = sorted(self._summary.items(), key=lambda item: -item[1]['elapsed'])
+            return {name: dict(entry, phases=dict(entry['phases'])) for name, entry in ordered}
+
+    def as_dict(self) -> dict:
+        """Return the totals, the summary and each call kept."""
+        summary = self.summary()
+        with self._lock:
+            return {'sample_rate': self.sample_rate, 'totals': dict(self.totals),
+                    'summary': summary, 'calls': [call.as_dict() for call in self.calls]}
+
+    def report(self) -> str:
+        """Format the summary as a table, with the seconds spent in each phase."""
+        columns = PHASES + (OTHER,)
+        row = '{:<48} {:>7} {:>9} {:>9}' + ' {:>14}' * len(columns)
+        lines = [row.format('call', 'count', 'requests', 'total (s)', *columns)]
+        for name, entry in self.summary().items():
+            lines.append(row.format(
+                name, entry['count'], entry['requests'], '{:.3f}'.format(entry['elapsed']),
+                *('{:.3f}'.format(entry['phases'].get(column, 0.0)) for column in columns)))
+        totals = dict(self.totals)
+        lines.append(row.format(
+            'all threads', '', '', '{:.3f}'.format(sum(totals.values())),
+            *('{:.3f}'.format(totals.get(column, 0.0)) for column in columns)))
+        return '\n'.join(lines)
+
+
+_active_profile: Optional[Profile] = None
+
+
+class _ThreadState(local):
+    """The frames being timed on one thread."""
+
+    def __init__(self):
+        # Each frame is [phase, profile, start time, seconds spent in nested frames]
+        self.frames: List[list] = []
+        # The call of the outermost frame, if it is a call
+        self.call: Optional[CallProfile] = None
+        # The depth of nesting within work that was not sampled
+        self.skipped: int = 0
+
+
+_state = _ThreadState()
+
+
+def _enter(profile: Profile, phase: str) -> bool:
+    """Start timing a phase on this thread. Return whether it is timed."""
+    frames = _state.frames
+    if _state.skipped or (not frames and not profile._sampled()):
+        _state.skipped += 1
+        return False
+    if phase == 'build' and frames and frames[-1][0] == 'build_children':
+        # Objects built for a link are part of building the children of the linking object
+        phase = 'build_children'
+    frames.append([phase, profile, perf_counter(), 0.0])
+    return True
+
+
+def _exit(timed: bool) -> float:
+    """Stop timing the innermost phase on this thread. Return the seconds spent in it."""
+    if not timed:
+        _state.skipped -= 1
+        return 0.0
+    frames = _state.frames
+    phase, profile, started, nested = frames.pop()
+    duration = perf_counter() - started
+    if frames:
+        frames[-1][3] += duration
+    profile._record_phase(phase, duration - nested, _state.call)
+    return duration
+
+
+def profiled_phase(phase: str) -> Callable:
+    """Decorate a function so that the time spent in it is counted in a phase while profiling."""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            profile = _active_profile
+            if profile is None:
+                return func(*args, **kwargs)
+            timed = _enter(profile, phase)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _exit(timed)
+        return wrapper
+    return decorator
+
+
+def profiled_call(func: Callable) -> Callable:
+    """
+    Decorate a method of a collection so that each call to it is profiled as a whole.
+
+    Only the outermost call on a thread is profiled, so calls that collection methods make
+    to each other are part of the call that made them. If the method returns an iterator, the
+    time spent producing each element is added to the call, which is recorded once the
+    iterator is exhausted or closed.
+    """
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        profile = _active_profile
+        if profile is None or _state.frames or _state.skipped:
+            return func(self, *args, **kwargs)
+        call = CallProfile('{}.{}'.format(type(self).__name__, func.__name__)) \
+            if profile._sampled() else None
+        result = _in_call(profile, call, func, self, *args, **kwargs)
+        if inspect.isgenerator(result):
+            return _iterate_in_call(profile, call, result)
+        if call is not None:
+            profile._record_call(call)
+        return result
+    return wrapper
+
+
+def _in_call(profile: Profile, call: Optional[CallProfile], func: Callable, *args, **kwargs):
+    """Run a function as the outermost frame on this thread, timed if `call` is sampled."""
+    if call is None:
+        _state.skipped += 1
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _state.skipped -= 1
+    _state.frames.append([OTHER, profile, perf_counter(), 0.0])
+    _state.call = call
+    try:
+        return func(*args, **kwargs)
+    finally:
+        call.elapsed += _exit(True)
+        _state.call = None
+
+
+def _iterate_in_call(profile: Profile, call: Optional[CallProfile],
+                     iterator: Iterator) -> Iterator:
+    """Produce each element of an iterator as part of a call, then record the call."""
+    try:
+        while True:
+            if _state.frames or _state.skipped:
+                # Resumed from within other work that is profiled, or that was not sampled
+                element = next(iterator)
+            else:
+                element = _in_call(profile, call, next, iterator)
+            yield element
+    except StopIteration:
+        return
+    finally:
+        iterator.close()
+        if call is not None:
+            profile._record_call(call)
+
+
+@contextmanager
+def profiling(sample_rate: float = 1.0, max_calls: int = DEFAULT_MAX_CALLS) -> Iterator[Profile]:
+    """
+    Profile the time the client spends in the network, decoding, building and dumping phases.
+
+    Within the context, calls to the methods of collections are timed and split into
+    :data:`PHASES`, both for each call and in aggregate::
+
+        with citrine.profiling() as profile:
+            runs = list(dataset.material_runs.filter_by_tags(['batch-7'], per_page=500))
+        print(profile.report())
+
+    Outside of a profiling context the instrumentation costs one check per instrumented
+    function. Inside it, each timed phase costs about a microsecond, so with a small
+    `sample_rate` profiling can be left on in production. Only the synchronous client is
+    profiled. Contexts may be nested, the innermost one receiving the timings.
+
+    Parameters
+    ----------
+    sample_rate: float
+        Fraction of calls that is timed.
+    max_calls: int
+        Maximum number of calls kept individually in :attr:`Profile.calls`.
+
+    Returns
+    -------
+    Iterator[Profile]
+        The profile, which is complete once the context exits.
+
+    """
+    global _active_profile
+    profile = Profile(sample_rate, max_calls)
+    previous = _active_profile
+    _active_profile = profile
+    try:
+        yield profile
+    finally:
+        _active_profile = previous
@@ -1,7 +1,15 @@
-from typing import Optional
+from typing import Iterable, Optional
 from citrine._session import Session
+from citrine._rest.pooling import DEFAULT_POOL_CONNECTIONS, DEFAULT_POOL_MAXSIZE
+from citrine._rest.retry import RetryPolicy
+from citrine._rest.cache import ObjectCache
+from citrine._rest.metrics import RequestHook
+from citrine._rest.storage import StorageTransport
 from citrine.resources.project import ProjectCollection
+from citrine._rest.collection import Collection
+from citrine.resources.data_concepts import DataConceptsCollection
 from citrine.resources.user import UserCollection
+from citrine.resources.workflow_executions import AsyncWorkflowExecution, WorkflowExecution
 import logging
 
 
@@ -10,15 +18,75 @@ DEFAULT_SCHEME: str = 'https'
 
 
 class Citrine:
-    """The entry point for interacting with the Citrine Platform."""
+    """
+    The entry point for interacting with the Citrine Platform.
+
+    Parameters
+    ----------
+    api_key: str
+        Refresh token used to authenticate with the platform.
+    scheme: str
+        Networking protocol; usually https.
+    host: str
+        Host URL, generally '<your_site>.citrine-platform.com'.
+    port: str, optional
+        Optional networking port.
+    retry_policy: RetryPolicy, optional
+        How requests that fail transiently (throttling, unavailable service, dropped
+        connections) are retried. Defaults to :class:`RetryPolicy` with its default settings.
+    pool_connections: int
+        Number of per-host connection pools to keep.
+    pool_maxsize: int
+        Maximum number of connections kept open to a single host. Set this to at least the
+        number of threads that share the client; utilization is reported by
+        ``session.pool_stats``.
+    pool_block: bool
+        Whether a request waits for a free connection when all `pool_maxsize` connections
+        are in use, instead of opening a short-lived extra connection.
+    transport_retries: int
+        Number of times a request that failed to connect is retried by the transport.
+    keep_alive: bool
+        Whether connections are kept open and reused between requests.
+    object_cache: ObjectCache, optional
+        A cache of fetched objects, consulted by ``get`` before making a request and updated
+        when objects are registered, updated or deleted through this client. Its counters
+        are in ``object_cache.stats``. By default nothing is cached.
+    storage: StorageTransport, optional
+        The transport used to download files and tables. By default, one with the same pool
+        settings as the client and :data:`DEFAULT_STORAGE_TIMEOUT
+        <citrine._rest.storage.DEFAULT_STORAGE_TIMEOUT>`. Its utilization is reported by
+        ``session.storage.pool_stats``.
+    request_hooks: Iterable[RequestHook], optional
+        Hooks called around every request, for instance to export metrics. Statistics of
+        the requests are kept in memory regardless, and read with ``session.stats()``.
+
+    """
 
     def __init__(self,
                  api_key: str,
                  scheme: str = DEFAULT_SCHEME,
                  host: str = DEFAULT_HOST,
-                 port: Optional[str] = None):
+                 port: Optional[str] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+                 pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+                 pool_block: bool = False,
+                 transport_retries: int = 0,
+                 keep_alive: bool = True,
+                 object_cache: Optional[ObjectCache] = None,
+                 storage: Optional[StorageTransport] = None,
+                 request_hooks: Optional[Iterable[RequestHook]] = None):
         self.logger = logging.getLogger(__name__)
-        self.session: Session = Session(api_key, scheme, host, port)
+        self.session: Session = Session(api_key, scheme, host, port,
+                                        retry_policy=retry_policy,
+                                        pool_connections=pool_connections,
+                                        pool_maxsize=pool_maxsize,
+                                        pool_block=pool_block,
+                                        transport_retries=transport_retries,
+                                        keep_alive=keep_alive,
+                                        object_cache=object_cache,
+                                        storage=storage,
+                                        request_hooks=request_hooks)
 
     @property
     def projects(self) -> ProjectCollection:
@@ -29,3 +97,106 @@ class Citrine:
     def users(self) -> UserCollection:
         """Return the collection of all users."""
         return UserCollection(self.session)
+
+
+class AsyncCitrine:
+    """
+    An asyncio entry point for interacting with the Citrine Platform.
+
+    Collections are accessed the same way as with :class:`Citrine`, but their methods are
+    coroutines, so many requests can be in flight at once from a single thread::
+
+        async with AsyncCitrine(api_key) as client:
+            async for project in client.projects.list():
+                print(project.name)
+            datasets = await asyncio.gather(
+                *(client.collection(project.datasets).get(uid) for uid in dataset_ids))
+
+    Resources returned are the same objects returned by :class:`Citrine`, and are bound
+    to the synchronous :attr:`session`, so their own methods can still be called directly.
+    Connections belong to the event loop that opened them: a client used from several event
+    loops in turn should be closed at the end of each.
+    Requires aiohttp, which is installed with ``pip install citrine[async]``.
+
+    Parameters
+    ----------
+    api_key: str
+        Refresh token used to authenticate with the platform.
+    scheme: str
+        Networking protocol; usually https.
+    host: str
+        Host URL, generally '<your_site>.citrine-platform.com'.
+    port: str, optional
+        Optional networking port.
+    retry_policy: RetryPolicy, optional
+        How requests that fail transiently are retried.
+        Defaults to :class:`RetryPolicy` with its default settings.
+    connection_limit: int
+        Maximum number of simultaneously open connections. 0 means no limit.
+    object_cache: ObjectCache, optional
+        A cache of fetched objects, as for :class:`Citrine`.
+    request_hooks: Iterable[RequestHook], optional
+        Hooks called around every request, as for :class:`Citrine`.
+
+    """
+
+    def __init__(self,
+                 api_key: str,
+                 scheme: str = DEFAULT_SCHEME,
+                 host: str = DEFAULT_HOST,
+                 port: Optional[str] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 connection_limit: int = 100,
+                 object_cache: Optional[ObjectCache] = None,
+                 request_hooks: Optional[Iterable[RequestHook]] = None):
+        # aiohttp is an optional dependency, so it is only imported when an async client is made
+        from citrine._async_session import AsyncSession
+        self.logger = logging.getLogger(__name__)
+        self.session: Session = Session(api_key, scheme, host, port, retry_policy=retry_policy,
+                                        object_cache=object_cache, request_hooks=request_hooks)
+        self.async_session: AsyncSession = AsyncSession(self.session, connection_limit)
+
+    async def close(self) -> None:
+        """Close all open connections."""
+        await self.async_session.close()
+        self.session.close()
+
+    async def __aenter__(self) -> 'AsyncCitrine':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def collection(self, collection: Collection):
+        """
+        Get an awaitable view of a collection.
+
+        Parameters
+        ----------
+        collection: Collection
+            Any collection, for example ``project.datasets`` or ``dataset.material_specs``.
+
+        Returns
+        -------
+        AsyncCollection
+            An object with coroutine versions of the methods of the collection.
+
+        """
+        from citrine._rest.async_collection import AsyncCollection, AsyncDataConceptsCollection
+        if isinstance(collection, DataConceptsCollection):
+            return AsyncDataConceptsCollection(collection, self.async_session)
+        return AsyncCollection(collection, self.async_session)
+
+    def execution(self, execution: WorkflowExecution) -> AsyncWorkflowExecution:
+        """Get an awaitable view of a workflow execution, to poll its status and results."""
+        return AsyncWorkflowExecution(execution, self.async_session)
+
+    @property
+    def projects(self):
+        """Return an awaitable view of all visible projects."""
+        return self.collection(ProjectCollection(self.session))
+
+    @property
+    def users(self):
+        """Return an awaitable view of the collection of all users."""
+        return self.collection(UserCollection(self.session))
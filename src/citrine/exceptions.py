@@ -28,8 +28,8 @@ class UnauthorizedRefreshToken(NonRetryableException):
     pass
 
 
-class NonRetryableHttpException(NonRetryableException):
-    """An exception originating from an HTTP error from a Citrine API."""
+class _HttpExceptionMixin:
+    """Records the url, status code, body and parsed API error of a failed HTTP request."""
 
     def __init__(self, path: str, response: Optional[Response] = None):
         super().__init__(path)
@@ -54,6 +54,18 @@ class NonRetryableHttpException(NonRetryableException):
             self.api_error = None
 
 
+class NonRetryableHttpException(_HttpExceptionMixin, NonRetryableException):
+    """An exception originating from an HTTP error from a Citrine API."""
+
+    pass
+
+
+class RetryableHttpException(_HttpExceptionMixin, RetryableException):
+    """A transient HTTP error from a Citrine API; the request may succeed if repeated."""
+
+    pass
+
+
 class NotFound(NonRetryableHttpException):
     """A particular url was not found. (http status 404)."""
 
@@ -84,6 +96,18 @@ class WorkflowNotReadyException(RetryableException):
     pass
 
 
+class TooManyRequests(RetryableHttpException):
+    """The client is being rate limited. (http status 429)."""
+
+    pass
+
+
+class ServiceUnavailable(RetryableHttpException):
+    """The service is temporarily unable to handle the request. (http status 502, 503, 504)."""
+
+    pass
+
+
 class ModuleRegistrationFailedException(NonRetryableException):
     """A module failed to register."""
 
@@ -91,3 +115,36 @@ class ModuleRegistrationFailedException(NonRetryableException):
         err = 'The "{0}" failed to register. {1}: {2}'.format(
             moduleType, exc.__class__.__name__, str(exc))
         super().__init__(err)
+
+
+class BulkOperationFailedException(NonRetryableException):
+    """Some items of a bulk operation failed."""
+
+    def __init__(self, operation: str, failures: dict, total: int):
+        first_index = min(failures)
+        first = failures[first_index]
+        err = '{0} of {1} items failed to {2}. First failure, item {3}: {4}: {5}'.format(
+            len(failures), total, operation, first_index, first.__class__.__name__, str(first))
+        super().__init__(err)
+        self.failures = failures
+
+
+class PollingTimeoutException(RetryableException):
+    """Some resources were not done when the time to wait for them ran out."""
+
+    def __init__(self, timeout: float, pending: list):
+        err = '{0} resources were not done after {1:g} seconds'.format(len(pending), timeout)
+        super().__init__(err)
+        self.timeout = timeout
+        self.pending = pending
+
+
+class ModuleValidationFailedException(NonRetryableException):
+    """A module or workflow finished validating with a failing status."""
+
+    def __init__(self, module):
+        err = 'The "{0}" {1!r} failed to validate with status {2}: {3}'.format(
+            module.__class__.__name__, getattr(module, 'name', None), module.status,
+            '; '.join(getattr(module, 'status_info', None) or []))
+        super().__init__(err)
+        self.module = module
@@ -1,12 +1,12 @@
 """Tools for working with design spaces."""
-from typing import Any, List, Mapping, Type
+from typing import Any, List, Mapping, Optional, Type
 from uuid import UUID
 
 from citrine._rest.resource import Resource
 from citrine._serialization import properties
 from citrine._serialization.polymorphic_serializable import PolymorphicSerializable
 from citrine._serialization.serializable import Serializable
-from citrine._session import Session
+from citrine._session import Session, default_session
 from citrine.informatics.descriptors import Descriptor
 from citrine.informatics.dimensions import Dimension
 from citrine.informatics.modules import Module
@@ -66,11 +66,11 @@ class ProductDesignSpace(Resource['ProductDesignSpace'], DesignSpace):
                  name: str,
                  description: str,
                  dimensions: List[Dimension],
-                 session: Session = Session()):
+                 session: Optional[Session] = None):
         self.name: str = name
         self.description: str = description
         self.dimensions: List[Dimension] = dimensions
-        self.session: Session = session
+        self.session: Session = session if session is not None else default_session()
 
     def _post_dump(self, data: dict) -> dict:
         data['display_name'] = data['config']['name']
@@ -122,12 +122,12 @@ class EnumeratedDesignSpace(Resource['EnumeratedDesignSpace'], DesignSpace):
                  description: str,
                  descriptors: List[Descriptor],
                  data: List[Mapping[str, Any]],
-                 session: Session = Session()):
+                 session: Optional[Session] = None):
         self.name: str = name
         self.description: str = description
         self.descriptors: List[Descriptor] = descriptors
         self.data: List[Mapping[str, Any]] = data
-        self.session: Session = session
+        self.session: Session = session if session is not None else default_session()
 
     def _post_dump(self, data: dict) -> dict:
         data['display_name'] = data['config']['name']
@@ -1,5 +1,6 @@
 """Tools for working with Predictors."""
 from abc import abstractmethod
+from threading import Lock
 from typing import List, Optional, Type
 from uuid import UUID
 
@@ -14,6 +15,12 @@ from citrine.informatics.modules import Module
 
 __all__ = ['Predictor', 'SimpleMLPredictor']
 
+_REPORT_LOCKS = tuple(Lock() for _ in range(32))
+"""
+Locks that keep threads reading the report of the same predictor from each fetching it.
+A predictor uses the lock picked by its id, rather than holding one, so it can be pickled.
+"""
+
 
 class Predictor(Module):
     """Module that describes the ability to compute/predict properties of materials. An abstract type that returns
@@ -109,6 +116,32 @@ class SimpleMLPredictor(Serializable['SimplePredictor'], Predictor):
     def __str__(self):
         return '<SimplePredictor {!r}>'.format(self.name)
 
+    @property
+    def report(self) -> Optional[Report]:
+        """
+        The report of the predictor.
+
+        For a predictor fetched from the platform, it is fetched on first access, using the
+        session of the predictor. Use
+        :meth:`~citrine.resources.predictor.PredictorCollection.fetch_reports` to fetch the
+        reports of many predictors at once. If several threads read the report at once, only
+        one of them fetches it.
+        """
+        report = getattr(self, '_report', None)
+        source = getattr(self, '_report_source', None)
+        if report is None and source is not None and getattr(self, 'session', None) is not None:
+            with _REPORT_LOCKS[id(self) % len(_REPORT_LOCKS)]:
+                report = getattr(self, '_report', None)
+                if report is None:
+                    project_id, module_id = source
+                    report = ReportResource(project_id, self.session).get(module_id)
+                    self._report = report
+        return report
+
+    @report.setter
+    def report(self, report: Optional[Report]):
+        self._report = report
+
     def post_build(self, project_id: UUID, data: dict):
-        """Creates the predictor report object."""
-        self.report = ReportResource(project_id, self.session).get(data['id'])
+        """Records where the predictor report is, so that it can be fetched when first read."""
+        self._report_source = (project_id, data['id'])
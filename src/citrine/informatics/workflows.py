@@ -5,7 +5,7 @@ from uuid import UUID
 from citrine._serialization.polymorphic_serializable import PolymorphicSerializable
 from citrine._serialization import properties
 from citrine._rest.resource import Resource
-from citrine._session import Session
+from citrine._session import Session, default_session
 from citrine.resources.workflow_executions import WorkflowExecutionCollection
 
 __all__ = ['Workflow', 'DesignWorkflow']
@@ -65,13 +65,13 @@ class DesignWorkflow(Resource['DesignWorkflow'], Workflow):
                  processor_id: UUID,
                  predictor_id: UUID,
                  project_id: Optional[UUID] = None,
-                 session: Session = Session()):
+                 session: Optional[Session] = None):
         self.name = name
         self.design_space_id = design_space_id
         self.processor_id = processor_id
         self.predictor_id = predictor_id
         self.project_id = project_id
-        self.session = session
+        self.session = session if session is not None else default_session()
 
     def __str__(self):
         return '<DesignWorkflow {!r}>'.format(self.name)
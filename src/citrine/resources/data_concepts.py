@@ -1,11 +1,16 @@
 """Top-level class for all data concepts objects and collections thereof."""
 from uuid import UUID
-from typing import TypeVar, Type, List, Dict, Union, Optional
+from typing import (
+    TypeVar, Type, List, Dict, Union, Optional, Iterable, Iterator, FrozenSet, Tuple)
+from contextlib import contextmanager
 from copy import deepcopy
+from threading import local
 from abc import abstractmethod
 
 from citrine._session import Session
 from citrine._rest.collection import Collection
+from citrine._rest.bulk import BulkResult, run_concurrently, DEFAULT_MAX_WORKERS
+from citrine._rest.paginator import Paginator, DEFAULT_PER_PAGE, DEFAULT_READ_AHEAD
 from citrine._serialization.polymorphic_serializable import PolymorphicSerializable
 from citrine._serialization.serializable import Serializable
 from citrine._serialization.properties import Property, LinkOrElse, Object
@@ -14,7 +19,10 @@ from citrine._serialization.properties import Optional as PropertyOptional
 from citrine._utils.functions import (
     validate_type, scrub_none,
     replace_objects_with_links, get_object_id)
+from citrine._utils.profiling import profiled_call, profiled_phase
 from taurus.client.json_encoder import loads, dumps, LinkByUID
+# The object hook with which the Taurus JSON encoder decodes each serialized object
+from taurus.client.json_encoder import _loado
 from taurus.entity.dict_serializable import DictSerializable
 from taurus.entity.bounds.base_bounds import BaseBounds
 from taurus.entity.template.attribute_template import AttributeTemplate
@@ -56,12 +64,17 @@ class DataConcepts(PolymorphicSerializable['DataConcepts']):
         self.session = None
 
     @classmethod
+    @profiled_phase('build')
     def build(cls, data: dict, session: Session = None):
         """
         Build a data concepts object from a dictionary or from a Taurus object.
 
         This is an internal method, and should not be called directly by users.
 
+        Dictionaries made up only of JSON types, such as those returned by the server, are
+        built directly. Anything else, such as a Taurus object or a dictionary containing
+        one, is first put through the loads/dumps cycle of the Taurus JSON encoder.
+
         Parameters
         ----------
         data: dict
@@ -79,6 +92,51 @@ class DataConcepts(PolymorphicSerializable['DataConcepts']):
             An object corresponding to a data concepts resource.
 
         """
+        built = getattr(_built_objects, 'by_uid', None)
+        if built is None:
+            # Objects that are referred to more than once are only built once per call
+            with _identity_map():
+                return cls.build(data, session)
+        for key in _uid_keys(data):
+            if isinstance(built.get(key), cls):
+                obj = built[key]
+                if session is not None:
+                    obj.session = session
+                return obj
+
+        if isinstance(data, dict) and _is_json(data):
+            return cls._build_from_json(data, session)
+        return cls._build_round_trip(data, session)
+
+    @classmethod
+    def _build_from_json(cls, data: dict, session: Session = None):
+        """
+        Build a data concepts object from a dictionary of JSON types, without copying it.
+
+        Fields that hold other data concepts objects are built from `data` by
+        :func:`_build_child_objects`, so only the remaining fields (values, bounds, file links
+        and the like) are decoded into Taurus objects. The result is the same as that of
+        :func:`_build_round_trip`.
+        """
+        if data.get('type') == LinkByUID.typ:
+            return _decode_json(data)
+        validate_type(data, cls._response_key)
+
+        child_fields = cls._child_object_fields()
+        data_dict = {key: value if key in child_fields else _decode_json(value)
+                     for key, value in data.items() if key not in cls._local_keys}
+        cls._build_child_objects(data_dict, data)
+
+        data_concepts_object = cls(**data_dict)
+        data_concepts_object.session = session
+        _remember(data_concepts_object)
+
+        cls._build_discarded_objects(data_concepts_object, data, session)
+        return data_concepts_object
+
+    @classmethod
+    def _build_round_trip(cls, data, session: Session = None):
+        """Build a data concepts object from anything the Taurus JSON encoder understands."""
         # Running through a taurus loads/dumps cycle validates all of the fields and ensures
         # the object is now a dictionary with a well-understood structure
         data_copy_dict = loads(dumps(deepcopy(data))).as_dict()
@@ -92,6 +150,7 @@ class DataConcepts(PolymorphicSerializable['DataConcepts']):
 
         data_concepts_object = cls(**data_copy_dict)
         data_concepts_object.session = session
+        _remember(data_concepts_object)
 
         cls._build_discarded_objects(data_concepts_object, data, session)
         return data_concepts_object
@@ -144,6 +203,7 @@ class DataConcepts(PolymorphicSerializable['DataConcepts']):
             return getattr(data, field, None)
 
     @classmethod
+    @profiled_phase('build_children')
     def _build_child_objects(cls, data: dict, data_with_soft_links,
                              session: Session = None) -> dict:
         """
@@ -168,34 +228,32 @@ class DataConcepts(PolymorphicSerializable['DataConcepts']):
             deserialized as DataConcepts objects.
 
         """
-        def _is_dc(prop_type: Property) -> bool:
-            """Determine if a property is a DataConcepts object or LinkByUID."""
-            if isinstance(prop_type, LinkOrElse):
-                return True
-            elif isinstance(prop_type, Object):
-                return issubclass(prop_type.klass, DataConcepts)
-            elif isinstance(prop_type, PropertyOptional):
-                return _is_dc(prop_type.prop)
-            elif isinstance(prop_type, PropertyList):
-                return _is_dc(prop_type.element_type)
-            else:
-                return False
-
-        fields = {k: v for k, v in cls.__dict__.items() if isinstance(v, Property)}
-        for key, field in fields.items():
-            if _is_dc(field):
-                if data.get(key):
-                    if isinstance(data[key], List):
-                        data[key] = [DataConcepts.get_type(elem).build(elem) for
-                                     elem in DataConcepts._get_field(data_with_soft_links, key)]
-                        for elem in data[key]:
-                            if isinstance(elem, DataConcepts):
-                                elem.session = session
-                    else:
-                        elem = DataConcepts._get_field(data_with_soft_links, key)
-                        data[key] = DataConcepts.get_type(elem).build(elem)
-                        if isinstance(data[key], DataConcepts):
-                            data[key].session = session
+        for key in cls._child_object_fields():
+            if data.get(key):
+                if isinstance(data[key], List):
+                    data[key] = [_build_child(elem) for
+                                 elem in DataConcepts._get_field(data_with_soft_links, key)]
+                    children = data[key]
+                else:
+                    elem = DataConcepts._get_field(data_with_soft_links, key)
+                    data[key] = _build_child(elem)
+                    children = [data[key]]
+                if session is not None:
+                    # Children may have been built earlier in the pass, and bound to a session
+                    for elem in children:
+                        if isinstance(elem, DataConcepts):
+                            elem.session = session
+
+    @classmethod
+    def _child_object_fields(cls) -> FrozenSet[str]:
+        """Get the names of the fields that hold data concepts objects or links to them."""
+        try:
+            return _child_object_fields[cls]
+        except KeyError:
+            fields = frozenset(key for key, value in cls.__dict__.items()
+                               if isinstance(value, Property) and _is_dc(value))
+            _child_object_fields[cls] = fields
+            return fields
 
     @classmethod
     def _build_discarded_objects(cls, obj, obj_with_soft_links, session: Session = None):
@@ -351,6 +409,111 @@ class DataConcepts(PolymorphicSerializable['DataConcepts']):
         return self.dump()
 
 
+_built_objects = local()
+"""
+Per thread, the state of the current build pass: the objects built so far by their uids
+(``by_uid``), and one copy of each string decoded (``strings``).
+"""
+
+_child_object_fields: Dict[type, FrozenSet[str]] = {}
+"""The names of the fields of each class that hold data concepts objects, computed on demand."""
+
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+
+@contextmanager
+def _identity_map():
+    """
+    Share the objects built within the block among everything that refers to them.
+
+    While the block runs, building an object whose uid matches one already built returns
+    the existing object instead of a copy, and equal strings decoded into the objects (names,
+    origins, template ids and the like) are shared. Blocks can be nested, in which case the
+    outermost one determines the scope.
+    """
+    if getattr(_built_objects, 'by_uid', None) is not None:
+        yield
+        return
+    _built_objects.by_uid = {}
+    _built_objects.strings = {}
+    try:
+        yield
+    finally:
+        _built_objects.by_uid = None
+        _built_objects.strings = None
+
+
+def _uid_keys(data) -> List[Tuple[str, str]]:
+    """Get the (scope, id) pairs of a serialized or taurus object, if it has uids."""
+    if isinstance(data, dict):
+        uids = data.get('uids')
+    else:
+        uids = getattr(data, 'uids', None)
+    if not isinstance(uids, dict):
+        return []
+    return [(str(scope).lower(), str(uid)) for scope, uid in uids.items()]
+
+
+def _remember(obj: DataConcepts):
+    """Record a newly built object in the current build pass, if there is one."""
+    built = getattr(_built_objects, 'by_uid', None)
+    if built is not None:
+        for key in _uid_keys(obj):
+            built.setdefault(key, obj)
+
+
+def _is_dc(prop_type: Property) -> bool:
+    """Determine if a property is a DataConcepts object or LinkByUID."""
+    if isinstance(prop_type, LinkOrElse):
+        return True
+    elif isinstance(prop_type, Object):
+        return issubclass(prop_type.klass, DataConcepts)
+    elif isinstance(prop_type, PropertyOptional):
+        return _is_dc(prop_type.prop)
+    elif isinstance(prop_type, PropertyList):
+        return _is_dc(prop_type.element_type)
+    else:
+        return False
+
+
+def _is_json(value) -> bool:
+    """Determine if a value is made up only of the types produced by decoding JSON."""
+    if isinstance(value, dict):
+        return all(isinstance(key, str) and _is_json(element) for key, element in value.items())
+    elif isinstance(value, list):
+        return all(_is_json(element) for element in value)
+    else:
+        return isinstance(value, _JSON_SCALARS)
+
+
+def _decode_json(value):
+    """
+    Decode serialized Taurus objects nested in a value, without modifying it.
+
+    This is equivalent to encoding the value as a JSON string and decoding it with the Taurus
+    JSON encoder, except that links are not replaced by the objects they point to, and
+    strings equal to one already decoded in the current build pass are replaced by it.
+    """
+    if isinstance(value, dict):
+        return _loado({key: _decode_json(element) for key, element in value.items()}, {})
+    elif isinstance(value, list):
+        return [_decode_json(element) for element in value]
+    elif isinstance(value, str):
+        strings = getattr(_built_objects, 'strings', None)
+        return value if strings is None else strings.setdefault(value, value)
+    else:
+        return value
+
+
+def _build_child(data):
+    """Build an object held by a field of a data concepts object, which may be a link."""
+    klass = DataConcepts.get_type(data)
+    if klass is LinkByUID and isinstance(data, dict) and _is_json(data):
+        # Decoded directly, rather than through a Taurus loads/dumps round trip
+        return _decode_json(data)
+    return klass.build(data)
+
+
 ResourceType = TypeVar('ResourceType', bound='DataConcepts')
 
 
@@ -403,6 +566,7 @@ class DataConceptsCollection(Collection[ResourceType]):
         data_concepts_object.session = self.session
         return data_concepts_object
 
+    @profiled_call
     def list(self, page: Optional[int] = None, per_page: Optional[int] = None):
         """
         List all visible elements of the collection.
@@ -422,6 +586,32 @@ class DataConceptsCollection(Collection[ResourceType]):
         """
         return self.filter_by_tags([], page, per_page)
 
+    @profiled_call
+    def list_all(self,
+                 per_page: int = DEFAULT_PER_PAGE,
+                 read_ahead: int = DEFAULT_READ_AHEAD) -> Iterator[ResourceType]:
+        """
+        Iterate over every visible element of the collection, walking all pages.
+
+        The next pages are fetched in the background while the current one is consumed.
+
+        Parameters
+        ----------
+        per_page: int
+            The number of results to request per page
+        read_ahead: int
+            The maximum number of pages fetched ahead of the one being consumed.
+            0 fetches each page only when it is reached.
+
+        Returns
+        -------
+        Iterator[DataConcepts]
+            Every object in this collection.
+
+        """
+        return self.filter_by_tags_all([], per_page, read_ahead)
+
+    @profiled_call
     def register(self, model: ResourceType):
         """
         Create a new element of the collection or update an existing element.
@@ -439,10 +629,53 @@ class DataConceptsCollection(Collection[ResourceType]):
         DataConcepts
             A copy of the registered object as it now exists in the database.
 
+        """
+        path = self._get_path()
+        dumped_data = self._dump_for_registration(model)
+        data = self.session.post_resource(path, dumped_data)
+        full_model = self.build(data)
+        model.session = self.session
+        self._uncache(full_model)
+        self._uncache(model)
+        return full_model
+
+    @profiled_call
+    def register_all(self, models: Iterable[ResourceType],
+                     max_workers: int = DEFAULT_MAX_WORKERS,
+                     chunk_size: Optional[int] = None) -> BulkResult[ResourceType]:
+        """
+        Register several objects concurrently.
+
+        Objects are registered independently, so an object that links to another one
+        must be registered after it, in a separate call.
+
+        Parameters
+        ----------
+        models: Iterable[DataConcepts]
+            The DataConcepts objects.
+        max_workers: int
+            The maximum number of requests made at once
+        chunk_size: Optional[int]
+            The number of objects submitted at a time. Set it to bound memory use when
+            registering from a generator; progress is logged after each chunk.
+
+        Returns
+        -------
+        BulkResult[DataConcepts]
+            Copies of the registered objects in the order of `models`. An object that
+            failed to register is None, and the exception raised for it (for example
+            :class:`BadRequest`) is recorded in the failures of the result.
+
         """
         if self.dataset_id is None:
             raise RuntimeError("Must specify a dataset in order to register a data model object.")
-        path = self._get_path()
+        return super().register_all(models, max_workers, chunk_size)
+
+    @profiled_phase('dump')
+    def _dump_for_registration(self, model: ResourceType) -> dict:
+        """Serialize a model into the body of a registration request."""
+        if self.dataset_id is None:
+            raise RuntimeError("Must specify a dataset in order to register a data model object.")
         # How do we prepare a citrine-python object to be the json in a POST request?
         # Right now, that method scrubs out None values and replaces top-level objects with links.
         # Eventually, we want to replace it with the following:
@@ -452,12 +685,9 @@ class DataConceptsCollection(Collection[ResourceType]):
         # how to replace the objects with link-by-uids. loads() converts this string into nested
         # taurus objects, and then the final dumps() converts that to a json-ready string in which
         # all of the object references have been replaced with link-by-uids.
-        dumped_data = replace_objects_with_links(scrub_none(model.dump()))
-        data = self.session.post_resource(path, dumped_data)
-        full_model = self.build(data)
-        model.session = self.session
-        return full_model
+        return replace_objects_with_links(scrub_none(model.dump()))
 
+    @profiled_call
     def get(self, uid: Union[UUID, str], scope: str = 'id') -> ResourceType:
         """
         Get the element of the collection with ID equal to uid.
@@ -477,10 +707,54 @@ class DataConceptsCollection(Collection[ResourceType]):
         """
         if self.dataset_id is None:
             raise RuntimeError("Must specify a dataset in order to get a data model object.")
-        path = self._get_path() + "/{}/{}".format(scope, uid)
-        data = self.session.get_resource(path)
-        return self.build(data)
+        cached = self._get_cached(uid, scope)
+        if cached is not None:
+            return cached
+        data = self.session.get_resource(self._get_scoped_path(uid, scope))
+        return self._cache(self.build(data), uid, scope)
+
+    @profiled_call
+    def get_many(self, uids: Iterable[Union[UUID, str]], scope: str = 'id',
+                 max_workers: int = DEFAULT_MAX_WORKERS) -> BulkResult[ResourceType]:
+        """
+        Get several elements of the collection concurrently.
+
+        Parameters
+        ----------
+        uids: Iterable[Union[UUID, str]]
+            The IDs.
+        scope: str
+            The scope of the uids, defaults to Citrine scope ('id')
+        max_workers: int
+            The maximum number of requests made at once
+
+        Returns
+        -------
+        BulkResult[DataConcepts]
+            The objects in the order of `uids`. An object that could not be fetched
+            (for example because it does not exist) is None, and the exception raised for
+            it is recorded in the failures of the result.
+
+        """
+        if self.dataset_id is None:
+            raise RuntimeError("Must specify a dataset in order to get a data model object.")
+        return run_concurrently('get', lambda uid: self.get(uid, scope), uids, max_workers)
+
+    def _get_scoped_path(self, uid: Union[UUID, str], scope: str) -> str:
+        """Construct the url of the element with a given scope and uid."""
+        return self._get_path() + "/{}/{}".format(scope, uid)
 
+    def _cache_key(self, uid: Union[UUID, str], scope: str = 'id') -> Tuple[str, str, str, str]:
+        """
+        Get the key of an element in the object cache.
+
+        Data concepts objects are keyed by project rather than by the path of the collection,
+        so writing an object through the collection of one dataset also invalidates it where
+        it was fetched through the collection of another.
+        """
+        return str(self.project_id), type(self).__name__, scope.lower(), str(uid)
+
+    @profiled_call
     def filter_by_tags(self, tags: List[str],
                        page: Optional[int] = None, per_page: Optional[int] = None):
         """
@@ -503,6 +777,14 @@ class DataConceptsCollection(Collection[ResourceType]):
             See (insert link) for a discussion of how to match on tags.
 
         """
+        response = self.session.get_resource(
+            self._get_path(ignore_dataset=True),
+            params=self._filter_by_tags_params(tags, page, per_page))
+        return self._build_page(response["contents"])
+
+    def _filter_by_tags_params(self, tags: List[str],
+                               page: Optional[int] = None, per_page: Optional[int] = None):
+        """Construct the query parameters of a search by tags."""
         if type(tags) == str:
             tags = [tags]
         if len(tags) > 1:
@@ -510,16 +792,51 @@ class DataConceptsCollection(Collection[ResourceType]):
         params = {'tags': tags}
         if self.dataset_id is not None:
             params['dataset_id'] = str(self.dataset_id)
-        if page is not None:
-            params['page'] = page
-        if per_page is not None:
-            params['per_page'] = per_page
+        params.update(self._page_params(page, per_page))
+        return params
 
-        response = self.session.get_resource(
-            self._get_path(ignore_dataset=True),
-            params=params)
-        return [self.build(content) for content in response["contents"]]
+    @profiled_call
+    def filter_by_tags_all(self, tags: List[str],
+                           per_page: int = DEFAULT_PER_PAGE,
+                           read_ahead: int = DEFAULT_READ_AHEAD) -> Iterator[ResourceType]:
+        """
+        Iterate over all objects in the collection that match any one of a list of tags.
+
+        Every page of results is walked, the next pages being fetched in the background
+        while the current one is consumed.
+
+        Parameters
+        ----------
+        tags: List[str]
+            A list of strings, each one a tag that an object can match. Currently
+            limited to a length of 1 or 0 (empty list does not filter).
+        per_page: int
+            The number of results to request per page
+        read_ahead: int
+            The maximum number of pages fetched ahead of the one being consumed.
+            0 fetches each page only when it is reached.
+
+        Returns
+        -------
+        Iterator[DataConcepts]
+            Every object in this collection that matches one of the tags.
+
+        """
+        path = self._get_path(ignore_dataset=True)
+        params = self._filter_by_tags_params(tags)
 
+        def fetch_page(page: int, per_page: int) -> list:
+            page_params = dict(params, **self._page_params(page, per_page))
+            return self.session.get_resource(path, params=page_params)["contents"]
+
+        return self._iterate_pages(Paginator(fetch_page, per_page, read_ahead), self._build_page)
+
+    def _build_page(self, contents: List[dict]) -> List[ResourceType]:
+        """Build every object in a page of search results, sharing the objects they refer to."""
+        with _identity_map():
+            return [self.build(content) for content in contents]
+
+    @profiled_call
     def filter_by_attribute_bounds(
             self,
             attribute_bounds: Dict[Union[AttributeTemplate, LinkByUID], BaseBounds],
@@ -554,26 +871,75 @@ class DataConceptsCollection(Collection[ResourceType]):
             and have values within the specified bounds.
 
         """
+        response = self.session.post_resource(
+            self._get_path(ignore_dataset=True) + "/filter-by-attribute-bounds",
+            json=self._attribute_bounds_body(attribute_bounds),
+            params=self._attribute_bounds_params(page, per_page))
+        return self._build_page(response["contents"])
+
+    @profiled_call
+    def filter_by_attribute_bounds_all(
+            self,
+            attribute_bounds: Dict[Union[AttributeTemplate, LinkByUID], BaseBounds],
+            per_page: int = DEFAULT_PER_PAGE,
+            read_ahead: int = DEFAULT_READ_AHEAD) -> Iterator[ResourceType]:
+        """
+        Iterate over all objects in the collection with attributes within certain bounds.
+
+        Every page of results is walked, the next pages being fetched in the background
+        while the current one is consumed.
+
+        Parameters
+        ----------
+        attribute_bounds: Dict[Union[AttributeTemplate, \
+        :py:class:`LinkByUID <taurus.entity.link_by_uid.LinkByUID>`], \
+        :py:class:`BaseBounds <taurus.entity.bounds.base_bounds.BaseBounds>`]
+            A dictionary from attributes to the bounds on that attribute, as in
+            :meth:`filter_by_attribute_bounds`.
+        per_page: int
+            The number of results to request per page
+        read_ahead: int
+            The maximum number of pages fetched ahead of the one being consumed.
+            0 fetches each page only when it is reached.
+
+        Returns
+        -------
+        Iterator[DataConcepts]
+            All objects in this collection that both have the specified attribute
+            and have values within the specified bounds.
+
+        """
+        path = self._get_path(ignore_dataset=True) + "/filter-by-attribute-bounds"
+        body = self._attribute_bounds_body(attribute_bounds)
+
+        def fetch_page(page: int, per_page: int) -> list:
+            return self.session.post_resource(
+                path, json=body, params=self._attribute_bounds_params(page, per_page)
+            )["contents"]
+
+        return self._iterate_pages(Paginator(fetch_page, per_page, read_ahead), self._build_page)
+
+    def _attribute_bounds_params(self, page: Optional[int] = None,
+                                 per_page: Optional[int] = None) -> dict:
+        """Construct the query parameters of a search by attribute bounds."""
+        params = self._page_params(page, per_page)
+        if self.dataset_id is not None:
+            params['dataset_id'] = str(self.dataset_id)
+        return params
+
+    @staticmethod
+    def _attribute_bounds_body(
+            attribute_bounds: Dict[Union[AttributeTemplate, LinkByUID], BaseBounds]) -> dict:
+        """Construct the body of a search by attribute bounds."""
         assert isinstance(attribute_bounds, dict) and len(attribute_bounds) == 1
 
         attribute_bounds_dict = dict()
         for key, value in attribute_bounds.items():
             template_id = get_object_id(key)
             attribute_bounds_dict[template_id] = value.as_dict()
-        body = {'attribute_bounds': attribute_bounds_dict}
-        params = {}
-        if self.dataset_id is not None:
-            params['dataset_id'] = str(self.dataset_id)
-        if page is not None:
-            params['page'] = page
-        if per_page is not None:
-            params['per_page'] = per_page
-
-        response = self.session.post_resource(
-            self._get_path(ignore_dataset=True) + "/filter-by-attribute-bounds",
-            json=body, params=params)
-        return [self.build(content) for content in response["contents"]]
+        return {'attribute_bounds': attribute_bounds_dict}
 
+    @profiled_call
     def filter_by_name(self, name: str, exact: bool = False,
                        page: Optional[int] = None, per_page: Optional[int] = None):
         """
@@ -597,20 +963,61 @@ class DataConceptsCollection(Collection[ResourceType]):
             List of every object in this collection whose `name` matches the search term.
 
         """
-        if self.dataset_id is None:
-            raise RuntimeError("Must specify a dataset to filter by name.")
-        params = {'dataset_id': str(self.dataset_id), 'name': name, 'exact': exact}
-        if page is not None:
-            params['page'] = page
-        if per_page is not None:
-            params['per_page'] = per_page
         response = self.session.get_resource(
             # "Ignoring" dataset because it is in the query params (and required)
             self._get_path(ignore_dataset=True) + "/filter-by-name",
-            params=params,
+            params=self._filter_by_name_params(name, exact, page, per_page),
         )
-        return [self.build(content) for content in response["contents"]]
+        return self._build_page(response["contents"])
+
+    @profiled_call
+    def filter_by_name_all(self, name: str, exact: bool = False,
+                           per_page: int = DEFAULT_PER_PAGE,
+                           read_ahead: int = DEFAULT_READ_AHEAD) -> Iterator[ResourceType]:
+        """
+        Iterate over all objects with specified name in this dataset.
+
+        Every page of results is walked, the next pages being fetched in the background
+        while the current one is consumed.
+
+        Parameters
+        ----------
+        name: str
+            case-insensitive object name prefix to search.
+        exact: bool
+            Set to True to change prefix search to exact search (but still case-insensitive).
+            Default is False.
+        per_page: int
+            The number of results to request per page
+        read_ahead: int
+            The maximum number of pages fetched ahead of the one being consumed.
+            0 fetches each page only when it is reached.
+
+        Returns
+        -------
+        Iterator[DataConcepts]
+            Every object in this collection whose `name` matches the search term.
+
+        """
+        path = self._get_path(ignore_dataset=True) + "/filter-by-name"
+        params = self._filter_by_name_params(name, exact)
+
+        def fetch_page(page: int, per_page: int) -> list:
+            page_params = dict(params, **self._page_params(page, per_page))
+            return self.session.get_resource(path, params=page_params)["contents"]
+
+        return self._iterate_pages(Paginator(fetch_page, per_page, read_ahead), self._build_page)
+
+    def _filter_by_name_params(self, name: str, exact: bool = False,
+                               page: Optional[int] = None, per_page: Optional[int] = None):
+        """Construct the query parameters of a search by name."""
+        if self.dataset_id is None:
+            raise RuntimeError("Must specify a dataset to filter by name.")
+        params = {'dataset_id': str(self.dataset_id), 'name': name, 'exact': exact}
+        params.update(self._page_params(page, per_page))
+        return params
 
+    @profiled_call
     def delete(self, uid: Union[UUID, str], scope: str = 'id'):
         """
         Delete the element of the collection with ID equal to uid.
@@ -623,6 +1030,6 @@ class DataConceptsCollection(Collection[ResourceType]):
             The scope of the uid, defaults to Citrine scope ('id')
 
         """
-        path = self._get_path() + "/{}/{}".format(scope, uid)
-        self.session.delete_resource(path)
+        self.session.delete_resource(self._get_scoped_path(uid, scope))
+        self._uncache(uid=uid, scope=scope)
         return Response(status_code=200)  # delete succeeded
@@ -1,11 +1,32 @@
 """Resources that represent both individual and collections of datasets."""
+from typing import Dict, Iterable, List, Optional, Set, Type, Union
 from uuid import UUID
 
+from taurus.entity.base_entity import BaseEntity
+from taurus.entity.object.ingredient_run import IngredientRun as TaurusIngredientRun
+from taurus.entity.object.ingredient_spec import IngredientSpec as TaurusIngredientSpec
+from taurus.entity.object.material_run import MaterialRun as TaurusMaterialRun
+from taurus.entity.object.material_spec import MaterialSpec as TaurusMaterialSpec
+from taurus.entity.object.measurement_run import MeasurementRun as TaurusMeasurementRun
+from taurus.entity.object.measurement_spec import MeasurementSpec as TaurusMeasurementSpec
+from taurus.entity.object.process_run import ProcessRun as TaurusProcessRun
+from taurus.entity.object.process_spec import ProcessSpec as TaurusProcessSpec
+from taurus.entity.template.condition_template import ConditionTemplate as TaurusConditionTemplate
+from taurus.entity.template.material_template import MaterialTemplate as TaurusMaterialTemplate
+from taurus.entity.template.measurement_template import \
+    MeasurementTemplate as TaurusMeasurementTemplate
+from taurus.entity.template.parameter_template import ParameterTemplate as TaurusParameterTemplate
+from taurus.entity.template.process_template import ProcessTemplate as TaurusProcessTemplate
+from taurus.entity.template.property_template import PropertyTemplate as TaurusPropertyTemplate
+
 from citrine._session import Session
+from citrine._rest.bulk import BulkResult, run_concurrently, DEFAULT_MAX_WORKERS
 from citrine._rest.collection import Collection
 from citrine._rest.resource import Resource
 from citrine._serialization import properties
 from citrine._utils.functions import scrub_none
+from citrine._utils.graph import collect_graph, dependency_levels, link_dependencies
+from citrine._utils.profiling import profiled_call
 from citrine.resources.condition_template import ConditionTemplateCollection
 from citrine.resources.parameter_template import ParameterTemplateCollection
 from citrine.resources.property_template import PropertyTemplateCollection
@@ -21,6 +42,25 @@ from citrine.resources.material_spec import MaterialSpecCollection
 from citrine.resources.ingredient_run import IngredientRunCollection
 from citrine.resources.ingredient_spec import IngredientSpecCollection
 from citrine.resources.file_link import FileCollection
+from citrine.resources.data_concepts import DataConceptsCollection
+
+# The collection that registers each kind of data object, by the taurus class of the object
+_DATA_CONCEPTS_COLLECTIONS: Dict[type, Type[DataConceptsCollection]] = {
+    TaurusPropertyTemplate: PropertyTemplateCollection,
+    TaurusConditionTemplate: ConditionTemplateCollection,
+    TaurusParameterTemplate: ParameterTemplateCollection,
+    TaurusMaterialTemplate: MaterialTemplateCollection,
+    TaurusMeasurementTemplate: MeasurementTemplateCollection,
+    TaurusProcessTemplate: ProcessTemplateCollection,
+    TaurusProcessRun: ProcessRunCollection,
+    TaurusMeasurementRun: MeasurementRunCollection,
+    TaurusMaterialRun: MaterialRunCollection,
+    TaurusIngredientRun: IngredientRunCollection,
+    TaurusProcessSpec: ProcessSpecCollection,
+    TaurusMeasurementSpec: MeasurementSpecCollection,
+    TaurusMaterialSpec: MaterialSpecCollection,
+    TaurusIngredientSpec: IngredientSpecCollection,
+}
 
 
 class Dataset(Resource['Dataset']):
@@ -169,6 +209,86 @@ class Dataset(Resource['Dataset']):
         """Return a resource representing all files in the dataset."""
         return FileCollection(self.project_id, self.uid, self.session)
 
+    def register_graph(self,
+                       root_or_objects: Union[BaseEntity, Iterable[BaseEntity]],
+                       max_workers: int = DEFAULT_MAX_WORKERS) -> BulkResult[BaseEntity]:
+        """
+        Register a graph of data objects, such as the whole history of a material.
+
+        Every object connected to the input is found, including those only reachable through
+        soft links (the ingredients of a process or the measurements of a material).
+        Objects are then registered in waves: each wave contains the objects whose links
+        point only to objects registered in earlier waves, and is registered concurrently.
+        Objects without a uid are assigned one in the 'auto' scope.
+
+        Parameters
+        ----------
+        root_or_objects: Union[BaseEntity, Iterable[BaseEntity]]
+            An object, or objects, from which to find the graph.
+        max_workers: int
+            Maximum number of requests made at once.
+
+        Returns
+        -------
+        BulkResult[BaseEntity]
+            The registered version of each object given, in the order given, followed by
+            that of each other object of the graph, in the order found. An object that failed
+            to register, or that links to an object that failed, is None and its exception is
+            recorded in the failures of the result.
+
+        """
+        roots = [root_or_objects] if isinstance(root_or_objects, BaseEntity) \
+            else list(root_or_objects)
+        objects = collect_graph(roots)
+        collections = {id(obj): _collection_type(obj) for obj in objects}
+        dependencies = link_dependencies(objects)
+
+        given = {id(obj) for obj in roots}
+        ordered = roots + [obj for obj in objects if id(obj) not in given]
+        positions: Dict[int, List[int]] = {}
+        for index, obj in enumerate(ordered):
+            positions.setdefault(id(obj), []).append(index)
+        results: List[Optional[BaseEntity]] = [None] * len(ordered)
+        failures: Dict[int, Exception] = {}
+        failed: Set[int] = set()
+
+        def record(obj: BaseEntity, registered: Optional[BaseEntity], error: Optional[Exception]):
+            for index in positions[id(obj)]:
+                results[index] = registered
+                if error is not None:
+                    failures[index] = error
+            if error is not None:
+                failed.add(id(obj))
+
+        def register(obj: BaseEntity) -> BaseEntity:
+            collection = collections[id(obj)](self.project_id, self.uid, self.session)
+            return collection.register(obj)
+
+        elapsed = 0.0
+        for level in dependency_levels(objects, dependencies):
+            ready = [obj for obj in level if not dependencies[id(obj)] & failed]
+            blocked = [obj for obj in level if dependencies[id(obj)] & failed]
+
+            result = run_concurrently('register', register, ready, max_workers)
+            for index, obj in enumerate(ready):
+                record(obj, result.results[index], result.failures.get(index))
+            elapsed += result.elapsed
+
+            for obj in blocked:
+                record(obj, None, RuntimeError(
+                    "{} was not registered because an object it links to failed to register"
+                    .format(obj.name)))
+        return BulkResult('register', results, failures, elapsed)
+
+
+def _collection_type(obj: BaseEntity) -> Type[DataConceptsCollection]:
+    """Find the type of collection that registers a data object."""
+    for cls in type(obj).__mro__:
+        if cls in _DATA_CONCEPTS_COLLECTIONS:
+            return _DATA_CONCEPTS_COLLECTIONS[cls]
+    raise TypeError("{} is not a kind of data object that a dataset holds".format(
+        type(obj).__name__))
+
 
 class DatasetCollection(Collection[Dataset]):
     """
@@ -191,7 +311,7 @@ class DatasetCollection(Collection[Dataset]):
         self.project_id = project_id
         self.session: Session = session
 
-    def build(self, data: dict) -> Dataset:
+    def build(self, data: dict, lazy: bool = False) -> Dataset:
         """
         Build an individual dataset from a dictionary.
 
@@ -199,6 +319,8 @@ class DatasetCollection(Collection[Dataset]):
         ----------
         data: dict
             A dictionary representing the dataset.
+        lazy: bool
+            Whether to deserialize each field only when it is first read.
 
         Returns
         -------
@@ -206,11 +328,12 @@ class DatasetCollection(Collection[Dataset]):
             The dataset created from data.
 
         """
-        dataset = Dataset.build(data)
+        dataset = Dataset.build(data, lazy=lazy)
         dataset.project_id = self.project_id
         dataset.session = self.session
         return dataset
 
+    @profiled_call
     def register(self, model: Dataset) -> Dataset:
         """
         Create a new element of the collection by registering an existing resource.
@@ -232,9 +355,14 @@ class DatasetCollection(Collection[Dataset]):
 
         """
         path = self._get_path()
-        dumped_dataset = model.dump()
-        dumped_dataset["deleted"] = None
-        data = self.session.post_resource(path, scrub_none(dumped_dataset))
+        data = self.session.post_resource(path, self._dump_for_registration(model))
         full_model = self.build(data)
         full_model.project_id = self.project_id
+        self._uncache(full_model)
         return full_model
+
+    def _dump_for_registration(self, model: Dataset) -> dict:
+        """Serialize a dataset, without its deletion status and None fields."""
+        dumped_dataset = model.dump()
+        dumped_dataset["deleted"] = None
+        return scrub_none(dumped_dataset)
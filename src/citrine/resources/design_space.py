@@ -1,9 +1,9 @@
 """Resources that represent collections of design spaces."""
 from uuid import UUID
-from typing import TypeVar
+from typing import Optional, TypeVar
 
 from citrine._rest.collection import Collection
-from citrine._session import Session
+from citrine._session import Session, default_session
 from citrine.informatics.design_spaces import DesignSpace
 
 CreationType = TypeVar('CreationType', bound=DesignSpace)
@@ -22,12 +22,12 @@ class DesignSpaceCollection(Collection[DesignSpace]):
     _individual_key = None
     _resource = DesignSpace
 
-    def __init__(self, project_id: UUID, session: Session = Session()):
+    def __init__(self, project_id: UUID, session: Optional[Session] = None):
         self.project_id = project_id
-        self.session: Session = session
+        self.session: Session = session if session is not None else default_session()
 
-    def build(self, data: dict) -> DesignSpace:
+    def build(self, data: dict, lazy: bool = False) -> DesignSpace:
         """Build an individual design space."""
-        design_space = DesignSpace.build(data)
+        design_space = DesignSpace.build(data, lazy=lazy)
         design_space.session = self.session
         return design_space
@@ -2,20 +2,25 @@
 from uuid import UUID
 import os
 import mimetypes
-from typing import Iterable, Optional
-from boto3 import client as boto3_client
-import requests
-from botocore.exceptions import ClientError
+from typing import Callable, Iterable, Iterator, Optional
 
 from taurus.entity.file_link import FileLink as TaurusFileLink
 from citrine._serialization.properties import String
 from citrine._rest.collection import Collection
+from citrine._rest.download import DEFAULT_CHUNK_SIZE, DownloadProgress, download_to_file
 from citrine._rest.resource import Resource
+from citrine._rest.storage import storage_transport
 from citrine._session import Session
-from citrine._utils.functions import write_file_locally
+from citrine._utils.profiling import profiled_call
 from citrine.resources.response import Response
 
 
+def boto3_client(*args, **kwargs):
+    """Make a boto3 client, importing boto3 only when a file is first uploaded."""
+    from boto3 import client
+    return client(*args, **kwargs)
+
+
 class _Uploader:
     """Holds the many parameters that are generated and used during file upload."""
 
@@ -71,13 +76,15 @@ class FileCollection(Collection[FileLink]):
         self.dataset_id = dataset_id
         self.session = session
 
-    def build(self, data: dict) -> FileLink:
+    def build(self, data: dict, lazy: bool = False) -> FileLink:
         """Build an instance of FileLink."""
-        return FileLink.build(data)
+        return FileLink.build(data, lazy=lazy)
 
+    @profiled_call
     def list(self,
              page: Optional[int] = None,
-             per_page: Optional[int] = None) -> Iterable[FileLink]:
+             per_page: Optional[int] = None,
+             lazy: bool = False) -> Iterable[FileLink]:
         """
         List all visible files in the collection.
 
@@ -87,6 +94,8 @@ class FileCollection(Collection[FileLink]):
             The "page" number of results to list. Default is the first page, which is 1.
         per_page: int, optional
             Max number of results to return for each call. Default is 20.
+        lazy: bool
+            Whether to deserialize each field of a file link only when it is first read.
 
         Returns
         -------
@@ -94,17 +103,13 @@ class FileCollection(Collection[FileLink]):
             FileLink objects in this collection.
 
         """
-        path = self._get_path()
-        params = {}
-        if page is not None:
-            params["page"] = page
-        if per_page is not None:
-            params["per_page"] = per_page
-
-        response = self.session.get_resource(path=path, params=params)
-        collection = response[self._collection_key]
+        return super().list(page, per_page, lazy)
+
+    def _build_collection_elements(self, collection: list,
+                                   lazy: bool = False) -> Iterator[FileLink]:
+        """Build a FileLink from each file resource in a list response."""
         for file in collection:
-            yield self.build(self._as_dict_from_resource(file))
+            yield self.build(self._as_dict_from_resource(file), lazy=lazy)
 
     def _as_dict_from_resource(self, file: dict):
         """
@@ -147,6 +152,7 @@ class FileCollection(Collection[FileLink]):
         }
         return file_dict
 
+    @profiled_call
     def upload(self, file_path: str, dest_name: str = None) -> FileLink:
         """
         Uploads a file to the dataset.
@@ -251,6 +257,7 @@ class FileCollection(Collection[FileLink]):
             The input uploader object with its s3_version field now populated.
 
         """
+        from botocore.exceptions import ClientError
         s3_client = boto3_client('s3',
                                  region_name=uploader.region_name,
                                  aws_access_key_id=uploader.aws_access_key_id,
@@ -300,10 +307,16 @@ class FileCollection(Collection[FileLink]):
         url = self._get_path(file_id) + '/versions/{}'.format(version)
         return FileLink(filename=dest_name, url=url)
 
-    def download(self, file_link: FileLink, local_path: str):
+    @profiled_call
+    def download(self, file_link: FileLink, local_path: str,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 progress: Optional[Callable[[DownloadProgress], None]] = None):
         """
         Download the file associated with a given FileLink to the local computer.
 
+        The file is streamed to disk one chunk at a time, and the download is resumed if the
+        connection drops. See :func:`citrine._rest.download.download_to_file`.
+
         Parameters
         ----------
         file_link: FileLink
@@ -311,6 +324,10 @@ class FileCollection(Collection[FileLink]):
         local_path: str
             Path to save file on the local computer. If `local_path` is a directory,
             then the filename of this FileLink object will be appended to the path.
+        chunk_size: int
+            Number of bytes read and written at a time.
+        progress: Callable[[DownloadProgress], None], optional
+            Called with the progress of the download after each chunk is written.
 
         """
         directory, filename = os.path.split(local_path)
@@ -322,9 +339,10 @@ class FileCollection(Collection[FileLink]):
         content_link_path = file_link.url + '/content-link'
         content_link_response = self.session.get_resource(content_link_path)
         pre_signed_url = content_link_response['pre_signed_read_link']
-        download_response = requests.get(pre_signed_url)
-        write_file_locally(download_response.content, local_path)
+        download_to_file(pre_signed_url, local_path, chunk_size=chunk_size, progress=progress,
+                         http=storage_transport(self.session))
 
+    @profiled_call
     def delete(self, file_link: FileLink):
         """
         Delete the file associated with a given FileLink from the database.
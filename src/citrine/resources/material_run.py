@@ -6,6 +6,7 @@ import json
 from citrine._utils.functions import set_default_uid
 from citrine._rest.resource import Resource
 from citrine._session import Session
+from citrine._utils.profiling import profiled_call
 from citrine.resources.data_concepts import DataConcepts, DataConceptsCollection
 from citrine._serialization.properties import String, LinkOrElse, Mapping, Object
 from citrine._serialization.properties import List as PropertyList
@@ -134,6 +135,7 @@ class MaterialRunCollection(DataConceptsCollection[MaterialRun]):
         """Return the resource type in the collection."""
         return MaterialRun
 
+    @profiled_call
     def get_history(self, scope, id) -> Type[MaterialRun]:
         """
         Get the history associated with a material.
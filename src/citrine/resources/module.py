@@ -1,8 +1,10 @@
 """Resources that represent collections of design spaces."""
+from typing import Iterable, List, Optional
 from uuid import UUID
 
 from citrine._rest.collection import Collection
-from citrine._session import Session
+from citrine._rest.polling import PollingPolicy, wait_until_ready
+from citrine._session import Session, default_session
 from citrine.informatics.modules import Module
 
 
@@ -19,12 +21,50 @@ class ModuleCollection(Collection[Module]):
     _individual_key = None
     _resource = Module
 
-    def __init__(self, project_id: UUID, session: Session = Session()):
+    def __init__(self, project_id: UUID, session: Optional[Session] = None):
         self.project_id = project_id
-        self.session: Session = session
+        self.session: Session = session if session is not None else default_session()
 
-    def build(self, data: dict) -> Module:
+    def build(self, data: dict, lazy: bool = False) -> Module:
         """Build an individual module."""
-        module = Module.build(data)
+        module = Module.build(data, lazy=lazy)
         module.session = self.session
         return module
+
+    def wait_until_ready(self,
+                         modules: Iterable[Module],
+                         timeout: Optional[float] = None,
+                         policy: Optional[PollingPolicy] = None,
+                         max_workers: int = 1) -> List[Module]:
+        """
+        Wait until several modules have finished validating.
+
+        The modules can be of any type, such as predictors, processors and design spaces.
+        All of them are polled from one loop, each less often the longer it validates. See
+        :func:`citrine._rest.polling.wait_until_ready`.
+
+        Parameters
+        ----------
+        modules: Iterable[Module]
+            The registered modules.
+        timeout: float, optional
+            Seconds after which to stop waiting. If None, wait indefinitely.
+        policy: PollingPolicy, optional
+            How often to fetch each of them.
+        max_workers: int
+            Maximum number of them fetched at once.
+
+        Returns
+        -------
+        List[Module]
+            The latest version of each, in the order given.
+
+        Raises
+        ------
+        ModuleValidationFailedException
+            As soon as one of them fails to validate.
+        PollingTimeoutException
+            If `timeout` runs out first.
+
+        """
+        return wait_until_ready(self, modules, timeout, policy, max_workers)
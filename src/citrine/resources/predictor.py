@@ -1,10 +1,12 @@
 """Resources that represent collections of predictors."""
 from uuid import UUID
-from typing import TypeVar
+from typing import Iterable, Iterator, TypeVar
 
+from citrine._rest.bulk import BulkResult, run_concurrently, DEFAULT_MAX_WORKERS
 from citrine._rest.collection import Collection
 from citrine._session import Session
 from citrine.informatics.predictors import Predictor
+from citrine.informatics.reports import Report
 
 CreationType = TypeVar('CreationType', bound=Predictor)
 
@@ -12,23 +14,66 @@ CreationType = TypeVar('CreationType', bound=Predictor)
 class PredictorCollection(Collection[Predictor]):
     """Represents the collection of all predictors for a project.
 
+    The report of each predictor is fetched when it is first read. Pass
+    `prefetch_reports` to fetch the reports of each page of a listing concurrently
+    instead.
+
     Parameters
     ----------
     project_id: UUID
         the UUID of the project
+    session: Session
+        the Citrine session used to connect to the database
+    prefetch_reports: bool
+        whether listing predictors through this collection also fetches the report of every
+        predictor in each page, concurrently. A report that cannot be fetched is fetched again
+        when it is read.
     """
 
     _path_template = '/projects/{project_id}/modules'
     _individual_key = None
     _resource = Predictor
 
-    def __init__(self, project_id: UUID, session: Session):
+    def __init__(self, project_id: UUID, session: Session, prefetch_reports: bool = False):
         self.project_id = project_id
         self.session: Session = session
+        self.prefetch_reports: bool = prefetch_reports
 
-    def build(self, data: dict) -> Predictor:
+    def build(self, data: dict, lazy: bool = False) -> Predictor:
         """Build an individual Predictor."""
-        predictor: Predictor = Predictor.build(data)
+        predictor: Predictor = Predictor.build(data, lazy=lazy)
         predictor.session = self.session
         predictor.post_build(self.project_id, data)
         return predictor
+
+    def _build_collection_elements(self, collection: list,
+                                   lazy: bool = False) -> Iterator[Predictor]:
+        predictors = list(super()._build_collection_elements(collection, lazy))
+        if self.prefetch_reports:
+            self.fetch_reports(predictors)
+        yield from predictors
+
+    @staticmethod
+    def fetch_reports(predictors: Iterable[Predictor],
+                      max_workers: int = DEFAULT_MAX_WORKERS) -> BulkResult[Report]:
+        """
+        Fetch the reports of several predictors concurrently.
+
+        Each report is stored on its predictor, so reading it later makes no request.
+
+        Parameters
+        ----------
+        predictors: Iterable[Predictor]
+            The predictors, as fetched from the platform.
+        max_workers: int
+            Maximum number of requests made at once.
+
+        Returns
+        -------
+        BulkResult[Report]
+            The reports in the order of `predictors`. A report that could not be fetched is
+            None, and the exception raised for it is recorded in the failures of the result.
+
+        """
+        return run_concurrently('fetch report', lambda predictor: predictor.report,
+                                predictors, max_workers)
@@ -25,8 +25,8 @@ class ProcessorCollection(Collection[Processor]):
         self.project_id = project_id
         self.session: Session = session
 
-    def build(self, data: dict) -> Processor:
+    def build(self, data: dict, lazy: bool = False) -> Processor:
         """Build an individual Processor."""
-        processor = Processor.build(data)
+        processor = Processor.build(data, lazy=lazy)
         processor.session = self.session
         return processor
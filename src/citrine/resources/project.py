@@ -2,7 +2,7 @@
 from typing import Optional, Dict, List, Union
 from uuid import UUID
 
-from citrine._session import Session
+from citrine._session import Session, default_session
 from citrine.resources.module import ModuleCollection
 from citrine.resources.design_space import DesignSpaceCollection
 from citrine.resources.processor import ProcessorCollection
@@ -29,6 +29,7 @@ from citrine.resources.ingredient_spec import IngredientSpecCollection
 from citrine._rest.collection import Collection
 from citrine._rest.resource import Resource
 from citrine._serialization import properties
+from citrine._utils.profiling import profiled_call
 from citrine.resources.table import TableCollection
 from citrine.resources.user import User
 
@@ -71,10 +72,10 @@ class Project(Resource['Project']):
     def __init__(self,
                  name: str,
                  description: Optional[str] = None,
-                 session: Optional[Session] = Session()):
+                 session: Optional[Session] = None):
         self.name: str = name
         self.description: Optional[str] = description
-        self.session: Session = session
+        self.session: Session = session if session is not None else default_session()
 
     def __str__(self):
         return '<Project {!r}>'.format(self.name)
@@ -313,10 +314,10 @@ class ProjectCollection(Collection[Project]):
     _individual_key = 'project'
     _collection_key = 'projects'
 
-    def __init__(self, session: Session = Session()):
-        self.session = session
+    def __init__(self, session: Optional[Session] = None):
+        self.session = session if session is not None else default_session()
 
-    def build(self, data) -> Project:
+    def build(self, data, lazy: bool = False) -> Project:
         """
         Build an individual project from a dictionary.
 
@@ -324,6 +325,8 @@ class ProjectCollection(Collection[Project]):
         ----------
         data: dict
             A dictionary representing the project.
+        lazy: bool
+            Whether to deserialize each field only when it is first read.
 
         Return
         -------
@@ -331,10 +334,11 @@ class ProjectCollection(Collection[Project]):
             The project created from data.
 
         """
-        project = Project.build(data)
+        project = Project.build(data, lazy=lazy)
         project.session = self.session
         return project
 
+    @profiled_call
     def register(self, name: str, description: Optional[str] = None) -> Project:
         """
         Create and upload new project.
@@ -349,6 +353,7 @@ class ProjectCollection(Collection[Project]):
         """
         return super().register(Project(name, description))
 
+    @profiled_call
     def delete(self, uuid):
         """Delete the project with the provided uid."""
         raise NotImplementedError("Delete is not supported for projects")
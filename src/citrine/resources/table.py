@@ -1,13 +1,14 @@
-from typing import Union
-
-import requests
+from typing import Callable, Optional, Union
 
 from citrine._rest.collection import Collection
+from citrine._rest.download import DEFAULT_CHUNK_SIZE, DownloadProgress, download_to_file
 from citrine._rest.resource import Resource
+from citrine._rest.storage import storage_transport
 from citrine._serialization import properties
 from citrine._serialization.properties import UUID
 from citrine._session import Session
-from citrine._utils.functions import rewrite_s3_links_locally, write_file_locally
+from citrine._utils.functions import rewrite_s3_links_locally
+from citrine._utils.profiling import profiled_call
 
 
 class Table(Resource['Table']):
@@ -44,12 +45,29 @@ class Table(Resource['Table']):
         # TODO: Change this to name once that's added to the table model
         return '<Table {!r}>'.format(self.uid)
 
-    def read(self, local_path):
-        """Read the Table file from S3."""
+    def read(self, local_path: str,
+             chunk_size: int = DEFAULT_CHUNK_SIZE,
+             progress: Optional[Callable[[DownloadProgress], None]] = None):
+        """
+        Read the Table file from S3.
+
+        The file is streamed to disk one chunk at a time, and the download is resumed if the
+        connection drops. See :func:`citrine._rest.download.download_to_file`.
+
+        Parameters
+        ----------
+        local_path: str
+            Path to save the file on the local computer.
+        chunk_size: int
+            Number of bytes read and written at a time.
+        progress: Callable[[DownloadProgress], None], optional
+            Called with the progress of the download after each chunk is written.
+
+        """
         data_location = self.download_url
         data_location = rewrite_s3_links_locally(data_location)
-        response = requests.get(data_location)
-        write_file_locally(response.content, local_path)
+        download_to_file(data_location, local_path, chunk_size=chunk_size, progress=progress,
+                         http=storage_transport(getattr(self, 'session', None)))
 
 
 class TableCollection(Collection[Table]):
@@ -61,19 +79,21 @@ class TableCollection(Collection[Table]):
         self.project_id = project_id
         self.session: Session = session
 
+    @profiled_call
     def get(self, uid: Union[UUID, str], version: int) -> Table:
         """Get a Table's metadata."""
         path = self._get_path(uid) + "/versions/{}".format(version)
         data = self.session.get_resource(path)
         return self.build(data)
 
-    def build(self, data: dict) -> Table:
+    def build(self, data: dict, lazy: bool = False) -> Table:
         """Build an individual Table from a dictionary."""
-        table = Table.build(data)
+        table = Table.build(data, lazy=lazy)
         table.project_id = self.project_id
         table.session = self.session
         return table
 
+    @profiled_call
     def register(self, model: Table) -> Table:
         """Tables cannot be created at this time."""
         raise RuntimeError('Creating Tables is not supported at this time.')
@@ -68,7 +68,7 @@ class UserCollection(Collection[User]):
         data = self.session.get_resource('{}/me'.format(self._path_template))
         return self.build(data)
 
-    def build(self, data):
+    def build(self, data, lazy: bool = False):
         """
         Build an individual user from a dictionary.
 
@@ -76,6 +76,8 @@ class UserCollection(Collection[User]):
         ----------
         data: dict
           A dictionary representing the user.
+        lazy: bool
+          Whether to deserialize each field only when it is first read.
 
         Returns
         -------
@@ -83,7 +85,7 @@ class UserCollection(Collection[User]):
           The user created from data.
 
         """
-        user = User.build(data)
+        user = User.build(data, lazy=lazy)
         user.session = self.session
         return user
 
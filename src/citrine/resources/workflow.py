@@ -1,10 +1,11 @@
 """Resources that represent collections of Workflows."""
 from uuid import UUID
-from typing import TypeVar
+from typing import Iterable, List, Optional, TypeVar
 
 from citrine.informatics.workflows import Workflow, DesignWorkflow
 
 from citrine._rest.collection import Collection
+from citrine._rest.polling import PollingPolicy, wait_until_ready
 from citrine._session import Session
 
 CreationType = TypeVar('CreationType', bound=Workflow)
@@ -27,9 +28,46 @@ class WorkflowCollection(Collection[Workflow]):
         self.project_id = project_id
         self.session: Session = session
 
-    def build(self, data: dict) -> Workflow:
+    def build(self, data: dict, lazy: bool = False) -> Workflow:
         """Build an individual Workflow."""
-        workflow = DesignWorkflow.build(data)
+        workflow = DesignWorkflow.build(data, lazy=lazy)
         workflow.session = self.session
         workflow.project_id = self.project_id
         return workflow
+
+    def wait_until_ready(self,
+                         workflows: Iterable[Workflow],
+                         timeout: Optional[float] = None,
+                         policy: Optional[PollingPolicy] = None,
+                         max_workers: int = 1) -> List[Workflow]:
+        """
+        Wait until several workflows have finished validating.
+
+        All of them are polled from one loop, each less often the longer it validates. See
+        :func:`citrine._rest.polling.wait_until_ready`.
+
+        Parameters
+        ----------
+        workflows: Iterable[Workflow]
+            The registered workflows.
+        timeout: float, optional
+            Seconds after which to stop waiting. If None, wait indefinitely.
+        policy: PollingPolicy, optional
+            How often to fetch each of them.
+        max_workers: int
+            Maximum number of them fetched at once.
+
+        Returns
+        -------
+        List[Workflow]
+            The latest version of each, in the order given.
+
+        Raises
+        ------
+        ModuleValidationFailedException
+            As soon as one of them fails to validate.
+        PollingTimeoutException
+            If `timeout` runs out first.
+
+        """
+        return wait_until_ready(self, workflows, timeout, policy, max_workers)
@@ -1,9 +1,11 @@
 """Resources that represent both individual and collections of workflow executions."""
-from typing import Optional
+from typing import Iterable, Iterator, List, Optional, Tuple
 from uuid import UUID
 
 from citrine.informatics.scores import Score
 from citrine._rest.collection import Collection
+from citrine._rest.polling import POLL_RETRY_POLICY, PollingPolicy, poll_until_done
+from citrine._rest.retry import RetryPolicy
 from citrine._rest.resource import Resource
 from citrine._serialization import properties
 from citrine._session import Session
@@ -40,9 +42,18 @@ class WorkflowExecution(Resource['WorkflowExecution']):
             }
         )
 
-    def status(self):
-        """Get the current status of this execution."""
-        response = self.session.get_resource(self._path() + "/status")
+    def status(self, retry_policy: Optional[RetryPolicy] = None):
+        """
+        Get the current status of this execution.
+
+        Parameters
+        ----------
+        retry_policy: RetryPolicy, optional
+            How to retry the request if it fails transiently. Default is the policy of the
+            session.
+
+        """
+        response = self.session.get_resource(self._path() + "/status", retry_policy=retry_policy)
         return WorkflowExecutionStatus.build(response)
 
     def results(self):
@@ -63,9 +74,9 @@ class WorkflowExecutionCollection(Collection[WorkflowExecution]):
         self.workflow_id: UUID = workflow_id
         self.session: Optional[Session] = session
 
-    def build(self, data: dict) -> WorkflowExecution:
+    def build(self, data: dict, lazy: bool = False) -> WorkflowExecution:
         """Build an individual WorkflowExecution."""
-        execution = WorkflowExecution.build(data)
+        execution = WorkflowExecution.build(data, lazy=lazy)
         execution.session = self.session
         execution.project_id = self.project_id
         execution.workflow_id = self.workflow_id
@@ -103,3 +114,100 @@ class WorkflowExecutionStatus(Resource['WorkflowExecutionStatus']):
 
     def __str__(self):
         return '<WorkflowExecutionStatus {!r}>'.format(self.status)
+
+
+def as_completed(executions: Iterable[WorkflowExecution],
+                 timeout: Optional[float] = None,
+                 policy: Optional[PollingPolicy] = None,
+                 max_workers: int = 1
+                 ) -> Iterator[Tuple[WorkflowExecution, WorkflowExecutionStatus]]:
+    """
+    Wait for many workflow executions, yielding each as soon as it is no longer in progress.
+
+    Every execution is polled from the calling thread, each less often the longer it runs.
+    An execution whose workflow is not ready yet (http status 425), or whose status could not
+    be fetched because of a transient failure, is polled again later rather than retried
+    while the others wait.
+
+    Parameters
+    ----------
+    executions: Iterable[WorkflowExecution]
+        The executions to wait for.
+    timeout: float, optional
+        Seconds after which to stop waiting. If None, wait indefinitely.
+    policy: PollingPolicy, optional
+        How often to poll each execution.
+    max_workers: int
+        Maximum number of executions polled at once when several are due.
+
+    Returns
+    -------
+    Iterator[Tuple[WorkflowExecution, WorkflowExecutionStatus]]
+        Each execution with its final status, in the order in which they finish.
+
+    Raises
+    ------
+    PollingTimeoutException
+        If `timeout` runs out before every execution finishes.
+
+    """
+    return poll_until_done(executions,
+                           lambda execution: execution.status(retry_policy=POLL_RETRY_POLICY),
+                           lambda status: not status.in_progress,
+                           policy=policy, timeout=timeout, max_workers=max_workers)
+
+
+def wait_for(executions: Iterable[WorkflowExecution],
+             timeout: Optional[float] = None,
+             policy: Optional[PollingPolicy] = None,
+             max_workers: int = 1) -> List[WorkflowExecutionStatus]:
+    """
+    Wait until none of several workflow executions is in progress.
+
+    Parameters are those of :func:`as_completed`.
+
+    Returns
+    -------
+    List[WorkflowExecutionStatus]
+        The final status of each execution, in the order of `executions`.
+
+    Raises
+    ------
+    PollingTimeoutException
+        If `timeout` runs out before every execution finishes.
+
+    """
+    executions = list(executions)
+    statuses = {id(execution): status for execution, status
+                in as_completed(executions, timeout, policy, max_workers)}
+    return [statuses[id(execution)] for execution in executions]
+
+
+class AsyncWorkflowExecution:
+    """
+    Awaitable view of a workflow execution.
+
+    Parameters
+    ----------
+    execution: WorkflowExecution
+        The execution to poll.
+    session: AsyncSession
+        The asynchronous session used to make requests.
+
+    """
+
+    def __init__(self, execution: WorkflowExecution, session):
+        self.execution: WorkflowExecution = execution
+        self.session = session
+
+    def __str__(self):
+        return '<AsyncWorkflowExecution {!r}>'.format(str(self.execution.uid))
+
+    async def status(self) -> WorkflowExecutionStatus:
+        """Get the current status of this execution."""
+        response = await self.session.get_resource(self.execution._path() + "/status")
+        return WorkflowExecutionStatus.build(response)
+
+    async def results(self) -> dict:
+        """Get the results of this execution."""
+        return await self.session.get_resource(self.execution._path() + "/results")
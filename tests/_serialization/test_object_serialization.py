@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 from typing import Any
 
@@ -42,3 +44,149 @@ def test_bad_object_serde():
 
 def test_object_str_representation():
     assert "<Object[NominalReal] 'foo'>" == str(Object(NominalReal, 'foo'))
+
+
+class NestedPathClass(Serializable):
+    """A class with nested serialization paths and one-way fields."""
+    name = String('config.name')
+    status = Optional(String(), 'status', serializable=False)
+    kind = String('config.kind', default='nested', deserializable=False)
+
+    def __init__(self, name: str):
+        self.name = name
+        self.kind = 'nested'
+
+
+class NestedPathSubclass(NestedPathClass):
+    """Subclasses only see the fields in their own __dict__."""
+    extra = String('extra')
+
+    def __init__(self, name: str, extra: str):
+        super().__init__(name)
+        self.extra = extra
+
+
+def test_plan_is_compiled_once_per_class():
+    plan = Object.for_class(NestedPathClass)
+    assert plan is Object.for_class(NestedPathClass)
+    assert plan is not Object.for_class(NestedPathSubclass)
+    assert {'__name', '__status'} == {entry[4] for entry in plan._deserialization_plan()}
+    assert {'name', 'kind'} == {entry[0] for entry in plan._serialization_plan()}
+    assert {'extra'} == set(Object.for_class(NestedPathSubclass).fields)
+
+
+def test_plan_round_trip():
+    obj = NestedPathClass('foo')
+    obj.status = 'ok'
+    dumped = obj.dump()
+    assert {'config': {'name': 'foo', 'kind': 'nested'}} == dumped
+
+    dumped['status'] = 'VALID'
+    built = NestedPathClass.build(dumped)
+    assert 'foo' == built.name
+    assert 'VALID' == built.status
+
+
+def test_serialization_path_is_split_when_set():
+    prop = String('a.b')
+    assert {'a': {'b': 'x'}} == prop.serialize_to_dict({}, 'x')
+    prop.serialization_path = 'c'
+    assert {'c': 'x'} == prop.serialize_to_dict({}, 'x')
+    assert 'x' == prop.deserialize_from_dict({'c': 'x'})
+    prop.serialization_path = None
+    with pytest.raises(ValueError):
+        prop.serialize_to_dict({}, 'x')
+
+
+def test_values_are_stored_under_the_attribute_name():
+    """Keys are the same in every process, so objects survive a pickle round trip."""
+    obj = SampleClass("Can be pickled", NominalReal(17, ''))
+    assert '__prop_string' in vars(obj)
+
+    copy = pickle.loads(pickle.dumps(obj))
+    assert obj.dump() == copy.dump()
+
+
+def test_lazy_build_decodes_fields_on_first_read():
+    data = {'config': {'name': 'foo'}, 'status': 7}
+    built = NestedPathClass.build(data, lazy=True)
+    assert {'_serialized_data'} == set(vars(built))
+
+    assert 'foo' == built.name
+    assert 'nested' == built.kind
+    assert {'_serialized_data', '__name'} == set(vars(built))
+    # Invalid values are only reported when read
+    with pytest.raises(ValueError):
+        built.status
+    built.status = 'ok'
+    assert 'ok' == built.status
+    assert {'config': {'name': 'foo', 'kind': 'nested'}} == built.dump()
+
+
+def test_dumping_a_lazy_build_decodes_the_remaining_fields():
+    data = {'config': {'name': 'foo'}, 'status': 'ok'}
+    built = NestedPathClass.build(data, lazy=True)
+    assert {'config': {'name': 'foo', 'kind': 'nested'}} == built.dump()
+    # The data is no longer needed
+    assert {'__name', '__status'} == set(vars(built))
+    assert 'ok' == built.status
+
+    with pytest.raises(ValueError):
+        NestedPathClass.build({'config': {'name': 1}}, lazy=True).dump()
+
+
+class _NameBase:
+    """Stands in for a taurus class, which stores its fields in its own properties."""
+
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        self._name = value
+
+
+class _BackedClass(Serializable, _NameBase):
+    name = String('name')
+    note = String('note')
+
+    def __init__(self, name: str, note: str):
+        self.name = name
+        self.note = note
+
+
+def test_lazy_build_decodes_fields_of_base_classes_immediately():
+    built = _BackedClass.build({'name': 'foo', 'note': 'bar'}, lazy=True)
+    assert 'foo' == built._name
+    assert '__note' not in vars(built)
+    assert 'bar' == built.note
+
+
+def test_lazy_build_checks_what_it_decodes_immediately():
+    with pytest.raises(ValueError):
+        _BackedClass.build({'name': 1, 'note': 'bar'}, lazy=True)
+    with pytest.raises(ValueError):
+        Object.for_class(_BackedClass).deserialize_lazily(['not', 'a', 'dict'])
+    # Classes without fields are built as usual
+    value = Object(NominalReal).deserialize_lazily(NominalReal(17, '').as_dict())
+    assert NominalReal(17, '') == value
+
+
+def test_plan_stores_fields_of_base_classes_through_their_setters():
+    built = _BackedClass.build({'name': 'foo', 'note': 'bar'})
+    assert 'foo' == built._name
+    assert {'name': 'foo', 'note': 'bar'} == built.dump()
+
+
+def test_plan_serializes_instances_of_subclasses_field_by_field():
+    obj = NestedPathSubclass('foo', 'extra')
+    assert {'config': {'name': 'foo', 'kind': 'nested'}} == \
+        Object.for_class(NestedPathClass).serialize(obj)
+
+
+def test_plan_checks_the_types_of_what_it_serializes():
+    obj = SampleClass('foo', NominalReal(17, ''))
+    vars(obj)['__prop_string'] = 17
+    with pytest.raises(ValueError):
+        obj.dump()
@@ -2,6 +2,7 @@ import pytest
 import arrow
 import uuid
 
+from citrine._serialization import properties
 from citrine._serialization.properties import (
     Integer,
     String,
@@ -164,3 +165,56 @@ def test_linkorelse_deserialize():
 def test_optional_repr():
     opt = Optional(String)
     assert '<Optional[<String None>] None>' == str(opt)
+
+
+class _NameHolder:
+    def __init__(self):
+        self._name = None
+
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        self._name = value.upper()
+
+
+class _OtherNameHolder:
+    name = 'class attribute'
+
+
+class _Deferring(_NameHolder):
+    name = properties.String('name')
+
+
+class _Ambiguous(_NameHolder, _OtherNameHolder):
+    name = properties.String('name')
+
+
+def test_property_defers_to_single_base_class():
+    obj = _Deferring()
+    obj.name = 'foo'
+    assert 'FOO' == obj.name == obj._name
+    assert _NameHolder.name is _Deferring.__dict__['name']._base_properties[_Deferring]
+
+
+def test_property_stores_value_if_base_class_is_ambiguous():
+    obj = _Ambiguous()
+    obj.name = 'foo'
+    assert 'foo' == obj.name
+    assert obj._name is None
+    assert _Ambiguous.__dict__['name']._base_properties[_Ambiguous] is None
+
+
+def test_base_property_resolution_follows_path():
+    prop = _Deferring.__dict__['name']
+    obj = _Deferring()
+    obj.name = 'foo'
+    prop.serialization_path = 'title'
+    try:
+        obj.name = 'bar'
+        assert 'bar' == obj.name
+        assert 'FOO' == obj._name
+    finally:
+        prop.serialization_path = 'name'
@@ -0,0 +1,69 @@
+import pytest
+from taurus.entity.attribute.condition import Condition
+from taurus.entity.bounds.real_bounds import RealBounds
+from taurus.entity.link_by_uid import LinkByUID
+from taurus.entity.object import MaterialRun as TaurusMaterialRun
+from taurus.entity.value.nominal_real import NominalReal
+
+from citrine._utils.graph import collect_graph, dependency_levels, link_dependencies
+from citrine.resources.condition_template import ConditionTemplate
+from citrine.resources.material_run import MaterialRun
+from citrine.resources.process_run import ProcessRun
+from tests.utils.factories import make_history
+
+
+def names(objects) -> set:
+    return {obj.name for obj in objects}
+
+
+def test_collect_graph_follows_soft_links():
+    objects = collect_graph([make_history()])
+    assert {'cake', 'baking', 'flour ingredient', 'flour', 'mixing', 'mixing spec',
+            'weighing', 'density'} == names(objects)
+    assert len(objects) == len(names(objects))
+
+
+def test_dependency_levels():
+    objects = collect_graph([make_history()])
+    levels = dependency_levels(objects, link_dependencies(objects))
+
+    assert [{'mixing spec', 'density', 'baking'}, {'mixing', 'cake'}, {'flour'},
+            {'weighing', 'flour ingredient'}] == [names(level) for level in levels]
+
+
+def test_links_by_uid_are_dependencies():
+    mixing = ProcessRun('mixing', uids={'lab': 'mix-1'})
+    flour = MaterialRun('flour', process=LinkByUID('LAB', 'mix-1'))
+    external = MaterialRun('external', process=LinkByUID('id', 'unknown'))
+
+    objects = [flour, external, mixing]
+    levels = dependency_levels(objects, link_dependencies(objects))
+    assert [{'external', 'mixing'}, {'flour'}] == [names(level) for level in levels]
+
+
+def test_shared_values_are_visited_once():
+    template = ConditionTemplate('temperature', bounds=RealBounds(0, 100, 'degC'))
+    value = NominalReal(20, 'degC')
+    baking = ProcessRun('baking', conditions=[
+        Condition('oven', value=value, template=template),
+        Condition('room', value=value, template=template)
+    ])
+
+    objects = collect_graph([baking])
+    levels = dependency_levels(objects, link_dependencies(objects))
+    assert [{'temperature'}, {'baking'}] == [names(level) for level in levels]
+
+
+def test_objects_without_uids_get_one():
+    material = TaurusMaterialRun('no uids')
+    collect_graph([material])
+    assert 'auto' in material.uids
+
+
+def test_cycle():
+    first = MaterialRun('first')
+    second = MaterialRun('second')
+    first.spec = LinkByUID('id', second.uids['id'])
+    second.spec = LinkByUID('id', first.uids['id'])
+    with pytest.raises(ValueError, match='cycle'):
+        dependency_levels([first, second], link_dependencies([first, second]))
@@ -0,0 +1,237 @@
+from datetime import datetime, timedelta
+from threading import Thread
+from uuid import uuid4
+
+import mock
+import pytest
+import requests_mock
+
+import citrine
+from citrine._session import Session
+from citrine._utils import profiling as profiling_module
+from citrine._utils.profiling import Profile, profiled_call, profiled_phase, profiling
+from citrine.resources.material_run import MaterialRunCollection
+from citrine.resources.material_spec import MaterialSpec
+from tests.utils.factories import MaterialRunDataFactory
+
+
+class FakeClock:
+    """A perf_counter that only advances when told to."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    clock = FakeClock()
+    with mock.patch.object(profiling_module, 'perf_counter', clock):
+        yield clock
+
+
+class FakeCollection:
+    """Stands in for a collection, with each phase taking a fixed time on the fake clock."""
+
+    def __init__(self, clock: FakeClock):
+        self.clock = clock
+
+    @profiled_phase('network')
+    def request(self):
+        self.clock.advance(1.0)
+        return self.decode()
+
+    @profiled_phase('decode')
+    def decode(self):
+        self.clock.advance(0.5)
+
+    @profiled_phase('build')
+    def build(self, children: int = 0):
+        self.clock.advance(0.25)
+        if children:
+            self.build_children(children)
+
+    @profiled_phase('build_children')
+    def build_children(self, children: int):
+        self.clock.advance(0.125)
+        for _ in range(children):
+            self.build()
+
+    @profiled_call
+    def get(self):
+        self.clock.advance(2.0)
+        self.request()
+        self.build(children=2)
+
+    @profiled_call
+    def get_twice(self):
+        self.get()
+        self.get()
+
+    @profiled_call
+    def list(self, count: int):
+        for _ in range(count):
+            self.request()
+            yield self.build()
+
+    @profiled_call
+    def consume(self, elements):
+        return list(elements)
+
+
+def test_phases_of_a_call(clock):
+    with profiling() as profile:
+        FakeCollection(clock).get()
+
+    [call] = profile.calls
+    assert call.name == 'FakeCollection.get'
+    assert call.requests == 1
+    assert call.elapsed == 4.375
+    assert call.phases == {'other': 2.0, 'network': 1.0, 'decode': 0.5, 'build': 0.25,
+                           'build_children': 0.625}
+    assert profile.totals == call.phases
+
+
+def test_nested_calls_are_part_of_the_outer_call(clock):
+    with profiling() as profile:
+        FakeCollection(clock).get_twice()
+
+    assert [call.name for call in profile.calls] == ['FakeCollection.get_twice']
+    assert profile.calls[0].elapsed == 8.75
+    assert profile.calls[0].requests == 2
+
+
+def test_iterator_call(clock):
+    collection = FakeCollection(clock)
+    with profiling() as profile:
+        elements = collection.list(3)
+        assert profile.calls == []
+        next(elements)
+        clock.advance(100)  # time spent by the caller is not part of the call
+        collection.get()  # a separate call made while the iterator is suspended
+        list(elements)
+
+    assert [call.name for call in profile.calls] == ['FakeCollection.get', 'FakeCollection.list']
+    assert profile.calls[1].elapsed == 5.25
+    assert profile.calls[1].requests == 3
+
+    summary = profile.summary()
+    assert list(summary) == ['FakeCollection.list', 'FakeCollection.get']
+    assert summary['FakeCollection.list']['count'] == 1
+    assert summary['FakeCollection.list']['phases']['build'] == 0.75
+
+
+def test_iterator_consumed_within_another_call(clock):
+    collection = FakeCollection(clock)
+    with profiling() as profile:
+        elements = collection.list(2)
+        collection.consume(elements)
+
+    # The elements are produced as part of the call that consumes them
+    assert [call.name for call in profile.calls] == ['FakeCollection.list',
+                                                     'FakeCollection.consume']
+    assert profile.calls[0].elapsed == 0
+    assert profile.calls[1].elapsed == 3.5
+    assert profile.calls[1].requests == 2
+    assert repr(profile.calls[1]) == '<CallProfile FakeCollection.consume 3.500s>'
+
+
+def test_abandoned_iterator_call_is_recorded(clock):
+    with profiling() as profile:
+        elements = FakeCollection(clock).list(3)
+        next(elements)
+        elements.close()
+
+    assert profile.calls[0].requests == 1
+
+
+def test_work_outside_calls_and_threads(clock):
+    collection = FakeCollection(clock)
+    with profiling() as profile:
+        collection.request()
+        thread = Thread(target=collection.get)
+        thread.start()
+        thread.join()
+
+    assert profile.totals['network'] == 2.0
+    assert profile.totals['decode'] == 1.0
+    assert [call.name for call in profile.calls] == ['FakeCollection.get']
+
+
+def test_summary_keeps_counting_beyond_max_calls(clock):
+    collection = FakeCollection(clock)
+    with profiling(max_calls=2) as profile:
+        for _ in range(5):
+            collection.get()
+
+    assert len(profile.calls) == 2
+    assert profile.summary()['FakeCollection.get']['count'] == 5
+    assert profile.as_dict()['summary']['FakeCollection.get']['requests'] == 5
+
+
+def test_sampling(clock):
+    collection = FakeCollection(clock)
+    with profiling(sample_rate=0) as profile:
+        collection.get()
+        list(collection.list(2))
+        collection.request()
+    assert profile.calls == []
+    assert profile.totals == {}
+
+    with mock.patch.object(profiling_module.random, 'random', side_effect=[0.7, 0.2]):
+        with profiling(sample_rate=0.5) as profile:
+            collection.get()
+            collection.get()
+    assert len(profile.calls) == 1
+
+    with pytest.raises(ValueError):
+        Profile(sample_rate=1.5)
+
+
+def test_nothing_is_recorded_outside_the_context(clock):
+    collection = FakeCollection(clock)
+    with profiling() as outer:
+        with profiling() as inner:
+            collection.get()
+        collection.request()
+    collection.get()
+
+    assert len(inner.calls) == 1
+    assert outer.calls == []
+    assert outer.totals == {'network': 1.0, 'decode': 0.5}
+
+
+def test_report(clock):
+    with profiling() as profile:
+        FakeCollection(clock).get()
+    lines = profile.report().splitlines()
+    assert lines[0].split() == ['call', 'count', 'requests', 'total', '(s)', 'network', 'decode',
+                                'build', 'build_children', 'dump', 'other']
+    assert lines[1].split() == ['FakeCollection.get', '1', '1', '4.375', '1.000', '0.500',
+                                '0.250', '0.625', '0.000', '2.000']
+    assert lines[2].split()[:3] == ['all', 'threads', '4.375']
+
+
+def test_profile_client_calls():
+    session = Session(refresh_token='12345', scheme='http', host='citrine-testing.fake')
+    session.access_token_expiration = datetime.utcnow() + timedelta(minutes=3)
+    collection = MaterialRunCollection(uuid4(), uuid4(), session)
+    spec = MaterialSpec('flour spec', uids={'id': str(uuid4())}).dump()
+    runs = [MaterialRunDataFactory(spec=spec), MaterialRunDataFactory()]
+
+    with requests_mock.Mocker() as m:
+        m.get(requests_mock.ANY, json={'contents': runs})
+        with citrine.profiling() as profile:
+            assert len(collection.filter_by_tags(['color'])) == 2
+    session.close()
+
+    [call] = profile.calls
+    assert call.name == 'MaterialRunCollection.filter_by_tags'
+    assert call.requests == 1
+    assert {'network', 'decode', 'build', 'build_children', 'other'} <= set(call.phases)
+    assert sum(call.phases.values()) == pytest.approx(call.elapsed)
@@ -0,0 +1,46 @@
+"""
+Micro-benchmark of reading and writing fields of taurus-backed resources.
+
+Not collected by pytest. Run from the repository root with::
+
+    PYTHONPATH=src python -m tests.benchmarks.bench_attribute_access
+
+Reads and writes through the citrine descriptors are compared to the same access on the
+plain taurus object, which is a single Python property.
+"""
+import timeit
+
+from taurus.entity.object.material_run import MaterialRun as TaurusMaterialRun
+
+from citrine.resources.material_run import MaterialRun
+
+
+def _best_time(statement, number: int, repeat: int = 5) -> float:
+    return min(timeit.repeat(statement, number=number, repeat=repeat)) / number
+
+
+def main(number: int = 200000):
+    citrine_run = MaterialRun('flour')
+    taurus_run = TaurusMaterialRun('flour')
+
+    def set_citrine():
+        citrine_run.name = 'sugar'
+
+    def set_taurus():
+        taurus_run.name = 'sugar'
+
+    cases = [
+        ('get name', lambda: citrine_run.name, lambda: taurus_run.name),
+        ('set name', set_citrine, set_taurus),
+        ('get sample_type', lambda: citrine_run.sample_type, lambda: taurus_run.sample_type),
+    ]
+    print('{:<18} {:>14} {:>14} {:>8}'.format('access', 'citrine (ns)', 'taurus (ns)', 'ratio'))
+    for name, citrine, taurus in cases:
+        citrine_time = _best_time(citrine, number)
+        taurus_time = _best_time(taurus, number)
+        print('{:<18} {:>14.0f} {:>14.0f} {:>7.2f}x'.format(
+            name, citrine_time * 1e9, taurus_time * 1e9, citrine_time / taurus_time))
+
+
+if __name__ == '__main__':
+    main()
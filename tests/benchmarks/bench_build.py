@@ -0,0 +1,48 @@
+"""
+Micro-benchmark of building data concepts objects from the dictionaries the server returns.
+
+Not collected by pytest. Run from the repository root with::
+
+    PYTHONPATH=src python -m tests.benchmarks.bench_build
+
+Each resource in the history of a cake is dumped, as the server would return it, and built
+both directly from the dictionary and through the Taurus loads/dumps round trip that
+`DataConcepts.build` falls back to for Taurus objects. The two results are checked to be
+equal before they are timed.
+"""
+import timeit
+
+from citrine._utils.graph import collect_graph
+from citrine.resources.data_concepts import DataConcepts
+from tests.utils.factories import make_history
+
+
+def _cases():
+    seen = set()
+    for obj in collect_graph([make_history()]):
+        name = type(obj).__name__
+        if name in seen:
+            continue
+        seen.add(name)
+        data = obj.dump()
+        yield name, DataConcepts.get_type(data), data
+
+
+def _best_time(function, number: int, repeat: int = 5) -> float:
+    return min(timeit.repeat(function, number=number, repeat=repeat)) / number
+
+
+def main(number: int = 500):
+    print('{:<18} {:>16} {:>14} {:>8}'.format('resource', 'round trip (us)', 'direct (us)',
+                                              'speedup'))
+    for name, klass, data in _cases():
+        direct = klass._build_from_json(data)
+        assert direct.dump() == klass._build_round_trip(data).dump(), name
+        before = _best_time(lambda: klass._build_round_trip(data), number)
+        after = _best_time(lambda: klass.build(data), number)
+        print('{:<18} {:>16.1f} {:>14.1f} {:>7.2f}x'.format(
+            name, before * 1e6, after * 1e6, before / after))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,147 @@
+"""
+End-to-end benchmark of the client against the local fake API server.
+
+Not collected by pytest. Run from the repository root with::
+
+    PYTHONPATH=src python -m tests.benchmarks.bench_end_to_end
+    PYTHONPATH=src python -m tests.benchmarks.bench_end_to_end --latency 0.02 --json out.json
+
+Every request goes over HTTP to :class:`tests.utils.fake_server.FakeCitrineServer`, so the
+timings include connection handling, JSON encoding and decoding and building objects, but
+not the work of the real backend. Each scenario reports its throughput and the latency
+percentiles of the request it makes most often, from the statistics of the session. Add latency to
+see the effect of concurrency and read-ahead, and errors to see the cost of retries.
+Compare the JSON output of two versions to catch regressions before a release.
+"""
+import argparse
+import json
+import logging
+import os
+import tempfile
+import time
+from typing import Callable, List
+
+from citrine._rest.retry import RetryPolicy
+from citrine.resources.dataset import Dataset
+from citrine.resources.ingredient_run import IngredientRun
+from citrine.resources.material_run import MaterialRun
+from citrine.resources.measurement_run import MeasurementRun
+from citrine.resources.process_run import ProcessRun
+from tests.utils.fake_server import FakeCitrineServer
+
+
+def _run(name: str, session, operations: int, scenario: Callable[[], None]) -> dict:
+    """Time a scenario, with the latency of the route it requested most often."""
+    session.stats_collector.reset()
+    start = time.perf_counter()
+    scenario()
+    elapsed = time.perf_counter() - start
+    stats = session.stats()
+    latency = {'count': 0}
+    for route in stats['routes'].values():
+        if route['latency']['count'] > latency['count']:
+            latency = route['latency']
+    return {
+        'scenario': name,
+        'operations': operations,
+        'requests': stats['requests'],
+        'retries': stats['retries'],
+        'seconds': elapsed,
+        'operations_per_second': operations / elapsed,
+        'p50_ms': latency.get('p50', 0) * 1e3,
+        'p99_ms': latency.get('p99', 0) * 1e3,
+    }
+
+
+def _history_chain(dataset, depth: int) -> MaterialRun:
+    """Register a chain of materials, each made from the previous one and measured once."""
+    material = None
+    for step in range(depth):
+        process = dataset.process_runs.register(ProcessRun('step {}'.format(step)))
+        if material is not None:
+            dataset.ingredient_runs.register(
+                IngredientRun('ingredient {}'.format(step), material=material, process=process))
+        material = dataset.material_runs.register(
+            MaterialRun('material {}'.format(step), process=process))
+        dataset.measurement_runs.register(
+            MeasurementRun('measurement {}'.format(step), material=material))
+    return material
+
+
+def main(objects: int = 2000,
+         per_page: int = 100,
+         history_depth: int = 20,
+         histories: int = 20,
+         downloads: int = 20,
+         file_size: int = 1024 * 1024,
+         latency: float = 0.0,
+         error_rate: float = 0.0,
+         output: str = None) -> List[dict]:
+    # Retries of injected errors are expected, and would drown out the results
+    logging.getLogger('citrine').setLevel(logging.ERROR)
+    results = []
+    with FakeCitrineServer(latency=latency, error_rate=error_rate, seed=0) as server, \
+            tempfile.TemporaryDirectory() as directory:
+        citrine = server.client(retry_policy=RetryPolicy(backoff_factor=0.01))
+        session = citrine.session
+        project = citrine.projects.register('benchmarks')
+        dataset = project.datasets.register(Dataset('benchmarks', 'summary', 'description'))
+        runs = dataset.material_runs
+        models = [MaterialRun('material {}'.format(i), tags=['benchmark']) for i in range(objects)]
+        uids = [model.uids['id'] for model in models]
+
+        results.append(_run('register_all', session, objects,
+                            lambda: runs.register_all(models).raise_for_failures()))
+        results.append(_run('list_all', session, objects,
+                            lambda: list(runs.list_all(per_page=per_page))))
+        results.append(_run('filter_by_tags_all', session, objects,
+                            lambda: list(runs.filter_by_tags_all(['benchmark'], per_page))))
+        sample = uids[:min(objects, 200)]
+        results.append(_run('get', session, len(sample),
+                            lambda: [runs.get(uid) for uid in sample]))
+        results.append(_run('get_many', session, len(sample),
+                            lambda: runs.get_many(sample).raise_for_failures()))
+
+        root = _history_chain(dataset, history_depth)
+        results.append(_run('get_history (depth {})'.format(history_depth), session, histories,
+                            lambda: [runs.get_history('id', root.uids['id'])
+                                     for _ in range(histories)]))
+
+        source = os.path.join(directory, 'source.bin')
+        with open(source, 'wb') as f:
+            f.write(os.urandom(file_size))
+        with server.fake_s3():
+            link = dataset.files.upload(source, 'source.bin')
+        target = os.path.join(directory, 'target.bin')
+        results.append(_run('download ({} kB)'.format(file_size // 1024), session, downloads,
+                            lambda: [dataset.files.download(link, target)
+                                     for _ in range(downloads)]))
+        session.close()
+
+    row = '{:<26} {:>6} {:>9} {:>8} {:>10} {:>10} {:>9} {:>9}'
+    print(row.format('scenario', 'ops', 'requests', 'retries', 'total (s)', 'ops/s',
+                     'p50 (ms)', 'p99 (ms)'))
+    for result in results:
+        print(row.format(
+            result['scenario'], result['operations'], result['requests'], result['retries'],
+            '{:.3f}'.format(result['seconds']), '{:.1f}'.format(result['operations_per_second']),
+            '{:.2f}'.format(result['p50_ms']), '{:.2f}'.format(result['p99_ms'])))
+    if output:
+        with open(output, 'w') as f:
+            json.dump(results, f, indent=2)
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='End-to-end benchmark against a fake server.')
+    parser.add_argument('--objects', type=int, default=2000)
+    parser.add_argument('--per-page', type=int, default=100)
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help='seconds the server waits before each response')
+    parser.add_argument('--error-rate', type=float, default=0.0,
+                        help='fraction of requests answered with a 503')
+    parser.add_argument('--json', dest='output', default=None,
+                        help='file to write the results to')
+    args = parser.parse_args()
+    main(objects=args.objects, per_page=args.per_page, latency=args.latency,
+         error_rate=args.error_rate, output=args.output)
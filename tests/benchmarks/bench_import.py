@@ -0,0 +1,63 @@
+"""
+Benchmark of the time taken to import the package in a fresh interpreter.
+
+Not collected by pytest. Run from the repository root with::
+
+    PYTHONPATH=src python -m tests.benchmarks.bench_import
+
+Short-lived jobs pay for the import on every start. Each run imports citrine in a new
+interpreter and reports the wall-clock time, as well as the packages that take longest
+according to ``python -X importtime``. The dependencies that are deferred until they are
+needed (see tests/test_import.py) should not appear.
+"""
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+_IMPORT_TIME = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)')
+
+
+def _environment() -> dict:
+    return dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+
+
+def _wall_clock(code: str, runs: int) -> list:
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.check_call([sys.executable, '-c', code], env=_environment())
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def _top_level_packages() -> list:
+    """Cumulative import time in microseconds of each top-level package."""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import citrine'],
+                            env=_environment(), stderr=subprocess.PIPE, check=True)
+    totals = {}
+    for line in result.stderr.decode().splitlines():
+        match = _IMPORT_TIME.match(line)
+        if match is None:
+            continue
+        package = match.group(4).split('.')[0]
+        totals[package] = max(totals.get(package, 0), int(match.group(2)))
+    return sorted(totals.items(), key=lambda item: -item[1])
+
+
+def main(runs: int = 10, top: int = 10):
+    baseline = statistics.median(_wall_clock('pass', runs))
+    times = _wall_clock('import citrine', runs)
+    print('interpreter start (ms): {:.0f}'.format(baseline * 1e3))
+    print('import citrine (ms):    {:.0f} median, {:.0f} min, over {} runs'.format(
+        (statistics.median(times) - baseline) * 1e3, (min(times) - baseline) * 1e3, runs))
+    print()
+    print('{:<24} {:>12}'.format('package', 'cumulative (ms)'))
+    for package, micros in _top_level_packages()[:top]:
+        print('{:<24} {:>12.1f}'.format(package, micros / 1e3))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""
+Micro-benchmark of building a page of resources eagerly and lazily.
+
+Not collected by pytest. Run from the repository root with::
+
+    PYTHONPATH=src python -m tests.benchmarks.bench_lazy_build
+
+A page of datasets is built and then scanned, reading only the name and id of each,
+every field one attribute at a time, or every field at once (by dumping it).
+"""
+import timeit
+import uuid
+
+from citrine.resources.dataset import Dataset
+
+
+_FIELDS = ('uid', 'name', 'summary', 'description', 'deleted', 'created_by', 'updated_by',
+           'deleted_by', 'create_time', 'update_time', 'delete_time')
+
+
+def _page(size: int) -> list:
+    return [{
+        'id': str(uuid.uuid4()), 'name': 'dataset {}'.format(i), 'summary': 'summary',
+        'description': 'description', 'deleted': False, 'created_by': str(uuid.uuid4()),
+        'updated_by': str(uuid.uuid4()), 'deleted_by': None, 'create_time': 1559933807392,
+        'update_time': 1559936207000, 'delete_time': None
+    } for i in range(size)]
+
+
+def _best_times(functions: list, number: int, repeat: int = 20) -> list:
+    """Time each function in turn, `repeat` times, so that they see the same system load."""
+    times = [[] for _ in functions]
+    for _ in range(repeat):
+        for function, samples in zip(functions, times):
+            samples.append(timeit.timeit(function, number=number))
+    return [min(samples) / number for samples in times]
+
+
+def main(size: int = 1000, number: int = 3):
+    page = _page(size)
+    scans = [
+        ('name and id', lambda dataset: (dataset.name, dataset.uid)),
+        ('every attribute', lambda dataset: [getattr(dataset, name) for name in _FIELDS]),
+        ('dump', lambda dataset: dataset.dump()),
+    ]
+    print('{:<16} {:>12} {:>12} {:>8}'.format('read', 'eager (ms)', 'lazy (ms)', 'speedup'))
+    for name, scan in scans:
+        def eager():
+            for data in page:
+                scan(Dataset.build(data))
+
+        def lazy():
+            for data in page:
+                scan(Dataset.build(data, lazy=True))
+
+        before, after = _best_times([eager, lazy], number)
+        print('{:<16} {:>12.1f} {:>12.1f} {:>7.2f}x'.format(
+            name, before * 1e3, after * 1e3, before / after))
+
+
+if __name__ == '__main__':
+    main()
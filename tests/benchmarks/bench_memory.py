@@ -0,0 +1,72 @@
+"""
+Memory benchmark of building a large page of measurements with many property attributes.
+
+Not collected by pytest. Run from the repository root with::
+
+    PYTHONPATH=src python -m tests.benchmarks.bench_memory
+
+The page is decoded from a JSON string, as a response would be, so that every string in it is
+a separate object. It is then built one object at a time, and as a single build pass (as
+collections do), which shares the objects and strings that repeat within the page. The memory
+still held by the built objects once the decoded page is released is reported per property
+attribute.
+"""
+import gc
+import json
+import tracemalloc
+import uuid
+
+from citrine.resources.data_concepts import _identity_map
+from citrine.resources.measurement_run import MeasurementRun
+
+
+def _response(measurements: int, attributes: int) -> str:
+    templates = [str(uuid.uuid4()) for _ in range(attributes)]
+    return json.dumps([{
+        'type': 'measurement_run', 'name': 'measurement {}'.format(i),
+        'uids': {'id': str(uuid.uuid4())}, 'tags': [], 'notes': None,
+        'conditions': [], 'parameters': [], 'file_links': [], 'source': None,
+        'spec': None, 'material': None,
+        'properties': [{
+            'type': 'property', 'name': 'property {}'.format(j), 'notes': None,
+            'origin': 'measured', 'file_links': [],
+            'value': {'type': 'nominal_real', 'nominal': 1.5 * i,
+                      'units': 'gram / centimeter ** 3'},
+            'template': {'type': 'link_by_uid', 'scope': 'id', 'id': templates[j]}
+        } for j in range(attributes)]
+    } for i in range(measurements)])
+
+
+def _retained_bytes(build, response: str) -> int:
+    gc.collect()
+    tracemalloc.start()
+    page = json.loads(response)
+    built = build(page)
+    del page
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del built
+    return retained
+
+
+def _build_separately(page: list) -> list:
+    return [MeasurementRun.build(data) for data in page]
+
+
+def _build_together(page: list) -> list:
+    with _identity_map():
+        return [MeasurementRun.build(data) for data in page]
+
+
+def main(measurements: int = 10000, attributes: int = 10):
+    response = _response(measurements, attributes)
+    count = measurements * attributes
+    print('{:<12} {:>12} {:>16}'.format('build', 'total (MB)', 'per attribute (B)'))
+    for name, build in [('separately', _build_separately), ('together', _build_together)]:
+        retained = _retained_bytes(build, response)
+        print('{:<12} {:>12.1f} {:>16.0f}'.format(name, retained / 1e6, retained / count))
+
+
+if __name__ == '__main__':
+    main()
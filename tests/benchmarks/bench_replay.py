@@ -0,0 +1,88 @@
+"""
+Benchmark of the client-side cost of a page of search results and a material history,
+replayed from recorded traffic.
+
+Not collected by pytest. Run from the repository root with::
+
+    PYTHONPATH=src python -m tests.benchmarks.bench_replay
+
+The traffic is recorded once from :class:`tests.utils.fake_server.FakeCitrineServer`, then
+replayed with no latency, so each run spends its time only in the client: decoding,
+building and the overhead of the session. The same scenario can be recorded against the
+real API with :func:`citrine._rest.replay.recording` to profile production data offline.
+The phases of each replay are reported by :func:`citrine.profiling`, along with the peak
+memory allocated.
+"""
+import os
+import tempfile
+import time
+import tracemalloc
+
+import citrine
+from citrine._rest.replay import recording, replaying
+from citrine.resources.dataset import Dataset
+from citrine.resources.ingredient_run import IngredientRun
+from citrine.resources.material_run import MaterialRun
+from citrine.resources.measurement_run import MeasurementRun
+from citrine.resources.process_run import ProcessRun
+from tests.utils.fake_server import FakeCitrineServer
+
+
+def _populate(dataset, objects: int, history_depth: int) -> str:
+    """Register a page worth of runs and a chain of materials, returning the last one's uid."""
+    dataset.material_runs.register_all(
+        MaterialRun('material {}'.format(i), tags=['page']) for i in range(objects)
+    ).raise_for_failures()
+    material = None
+    for step in range(history_depth):
+        process = dataset.process_runs.register(ProcessRun('step {}'.format(step)))
+        if material is not None:
+            dataset.ingredient_runs.register(
+                IngredientRun('ingredient {}'.format(step), material=material, process=process))
+        material = dataset.material_runs.register(
+            MaterialRun('product {}'.format(step), process=process))
+        dataset.measurement_runs.register(
+            MeasurementRun('measurement {}'.format(step), material=material))
+    return material.uids['id']
+
+
+def main(objects: int = 2000, history_depth: int = 20, runs: int = 3):
+    with tempfile.TemporaryDirectory() as directory:
+        archive = os.path.join(directory, 'traffic.jsonl.gz')
+        with FakeCitrineServer() as server:
+            client = server.client()
+            project = client.projects.register('replay')
+            dataset = project.datasets.register(Dataset('replay', 'summary', 'description'))
+            uid = _populate(dataset, objects, history_depth)
+            scenarios = [
+                ('filter_by_tags ({} runs)'.format(objects),
+                 lambda: dataset.material_runs.filter_by_tags(['page'], per_page=objects)),
+                ('get_history (depth {})'.format(history_depth),
+                 lambda: dataset.material_runs.get_history('id', uid)),
+            ]
+            with recording(client.session, archive):
+                for _, scenario in scenarios:
+                    scenario()
+            client.session.close()
+        print('archive: {:.1f} kB\n'.format(os.path.getsize(archive) / 1024))
+
+        with replaying(client.session, archive, time_scale=0):
+            for name, scenario in scenarios:
+                seconds = []
+                for _ in range(runs):
+                    start = time.perf_counter()
+                    with citrine.profiling() as profile:
+                        scenario()
+                    seconds.append(time.perf_counter() - start)
+                tracemalloc.start()
+                scenario()
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                print('{}: best {:.3f} s, peak {:.1f} MB'.format(
+                    name, min(seconds), peak / 1e6))
+                print(profile.report())
+                print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+"""
+Micro-benchmark of building and dumping resources through their serialization plans.
+
+Not collected by pytest. Run from the repository root with::
+
+    PYTHONPATH=src python -m tests.benchmarks.bench_serialization
+
+Each operation is timed with the compiled per-class plans that build() and dump() use, at
+every level of nesting, and with the plans switched off: the class is scanned for its fields
+on every call and each field goes through its ``__get__``/``__set__`` and its type-checking
+``serialize``/``deserialize``, as before plans were compiled. To compare against an older
+release, run `main` with that release's ``src`` on the path and compare the "after" column.
+"""
+import timeit
+import uuid
+from contextlib import contextmanager
+
+import mock
+from taurus.entity.bounds.real_bounds import RealBounds
+
+from citrine._serialization import properties
+from citrine.informatics.descriptors import RealDescriptor
+from citrine.informatics.predictors import SimpleMLPredictor
+from citrine.resources.material_run import MaterialRun
+from citrine.resources.measurement_template import MeasurementTemplate
+from citrine.resources.process_run import ProcessRun
+from citrine.resources.property_template import PropertyTemplate
+
+
+def _uncompiled_serialize(self, obj) -> dict:
+    """Serialize the fields of an object the way Object did before plans were compiled."""
+    if not self.fields:
+        return obj.dump()
+    serialized = {}
+    for name, field in self.fields.items():
+        if field.serializable:
+            data = serialized
+            path = field.serialization_path.split('.')
+            for key in path[:-1]:
+                data = data.setdefault(key, {})
+            data[path[-1]] = field.serialize(getattr(obj, name))
+    return serialized
+
+
+def _uncompiled_deserialize(self, data: dict):
+    """Deserialize an object the way Object did before plans were compiled."""
+    if not self.fields:
+        return _compiled_deserialize(self, data)
+    instance = self.klass.__new__(self.klass, {})
+    for name, field in self.fields.items():
+        if field.deserializable:
+            value = data
+            for key in field.serialization_path.split('.'):
+                value = value.get(key, field.default)
+            setattr(instance, name, field.deserialize(value))
+    return instance
+
+
+_compiled_deserialize = properties.Object._deserialize
+
+
+@contextmanager
+def _without_plans():
+    """Scan each class on every call and (de)serialize every field through its descriptor."""
+    with mock.patch.object(properties.Object, 'for_class', classmethod(lambda cls, k: cls(k))), \
+            mock.patch.object(properties.Object, '_serialize', _uncompiled_serialize), \
+            mock.patch.object(properties.Object, '_deserialize', _uncompiled_deserialize):
+        yield
+
+
+def _cases():
+    material_run = MaterialRun('flour', process=ProcessRun('mixing'), tags=['a::b'])
+    template = MeasurementTemplate(
+        'density measurement',
+        properties=[[PropertyTemplate('density', bounds=RealBounds(0, 10, 'g/cm^3')),
+                     RealBounds(0, 5, 'g/cm^3')]])
+    predictor = SimpleMLPredictor(
+        name='ML predictor', description='Predicts z from x', training_data='table',
+        inputs=[RealDescriptor('x', 0, 100, '')], outputs=[RealDescriptor('z', 0, 100, '')],
+        latent_variables=[RealDescriptor('y', 0, 100, '')])
+    predictor_data = predictor.dump()
+    predictor_data.update(id=str(uuid.uuid4()), status='VALID', status_info=[])
+
+    return [
+        ('MaterialRun.dump', material_run.dump),
+        ('MeasurementTemplate.dump', template.dump),
+        ('SimpleMLPredictor.dump', predictor.dump),
+        ('SimpleMLPredictor.build', lambda: SimpleMLPredictor.build(predictor_data)),
+    ]
+
+
+def _best_time(function, number: int, repeat: int = 5) -> float:
+    return min(timeit.repeat(function, number=number, repeat=repeat)) / number
+
+
+def main(number: int = 2000):
+    print('{:<26} {:>14} {:>14} {:>8}'.format('operation', 'before (us)', 'after (us)', 'speedup'))
+    for name, operation in _cases():
+        with _without_plans():
+            expected = operation()
+            before = _best_time(operation, number)
+        assert operation() == expected or name.endswith('build')
+        after = _best_time(operation, number)
+        print('{:<26} {:>14.1f} {:>14.1f} {:>7.2f}x'.format(
+            name, before * 1e6, after * 1e6, before / after))
+
+
+if __name__ == '__main__':
+    main()
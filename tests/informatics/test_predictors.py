@@ -44,6 +44,7 @@ def test_simple_post_build(simple_predictor):
     session.get_resource.return_value = dict(status='OK', report=dict(), uid=uuid.uuid4())
     simple_predictor.session = session
     simple_predictor.post_build(uuid.uuid4(), dict(id=uuid.uuid4()))
-    assert session.get_resource.call_count == 1
+    assert session.get_resource.call_count == 0  # The report is fetched on first access
     assert simple_predictor.report is not None
     assert simple_predictor.report.status == 'OK'
+    assert session.get_resource.call_count == 1
@@ -1,8 +1,14 @@
+from threading import Lock
 from uuid import UUID, uuid4
+
+import mock
 import pytest
+from taurus.entity.base_entity import BaseEntity
 
-from citrine.resources.dataset import DatasetCollection
-from tests.utils.factories import DatasetDataFactory, DatasetFactory
+from citrine.exceptions import BadRequest
+from citrine.resources.data_concepts import DataConcepts
+from citrine.resources.dataset import Dataset, DatasetCollection
+from tests.utils.factories import DatasetDataFactory, DatasetFactory, make_history
 from tests.utils.session import FakeSession, FakeCall
 
 
@@ -63,6 +69,23 @@ def test_list_datasets(collection, session):
     assert 5 == len(datasets)
 
 
+def test_list_datasets_lazily(collection, session):
+    # Given
+    datasets_data = DatasetDataFactory.create_batch(3, create_time=1559933807392)
+    session.set_response(datasets_data)
+
+    # When
+    datasets = list(collection.list(lazy=True))
+
+    # Then
+    assert [data['name'] for data in datasets_data] == [dataset.name for dataset in datasets]
+    assert '__create_time' not in vars(datasets[0])
+    assert 2019 == datasets[0].create_time.year
+    assert '__create_time' in vars(datasets[0])
+    assert collection.project_id == datasets[0].project_id
+    assert datasets[1].dump() == Dataset.build(datasets_data[1]).dump()
+
+
 def test_delete_dataset(collection, session, dataset):
     # Given
     uid = str(uuid4())
@@ -139,3 +162,58 @@ def test_ingredient_specs_get_project_id(dataset):
 
 def test_files_get_project_id(dataset):
     assert dataset.project_id == dataset.files.project_id
+
+
+def test_register_graph(dataset):
+    # Given
+    posted = []
+    lock = Lock()
+
+    def post_resource(path, json):
+        with lock:
+            posted.append((path.rsplit('/', 1)[1], json['name']))
+        if json['name'] == 'flour':
+            raise BadRequest(path)
+        return json
+
+    dataset.uid = uuid4()
+    dataset.session = mock.Mock(post_resource=mock.Mock(side_effect=post_resource))
+    cake = make_history()
+
+    # When
+    result = dataset.register_graph(cake, max_workers=4)
+
+    # Then
+    assert {'mixing spec', 'density', 'baking'} == {name for _, name in posted[:3]}
+    assert {'mixing', 'cake'} == {name for _, name in posted[3:5]}
+    assert ('material-runs', 'flour') == posted[5]
+    # Objects linking to the failed material are not attempted
+    assert 6 == len(posted)
+    assert 8 == len(result)
+    assert {'mixing spec', 'density', 'baking', 'mixing', 'cake'} == \
+        {obj.name for obj in result.succeeded}
+    assert {BadRequest, RuntimeError} == {type(e) for e in result.failures.values()}
+    assert 3 == len(result.failures)
+    assert all(isinstance(obj, DataConcepts) for obj in result.succeeded)
+    assert 'cake' == result[0].name
+
+
+def test_register_graph_results_follow_input_order(dataset):
+    dataset.uid = uuid4()
+    dataset.session = mock.Mock(post_resource=mock.Mock(side_effect=lambda path, json: json))
+    cake = make_history()
+    baking = cake.process
+    flour = baking.ingredients[0].material
+
+    result = dataset.register_graph([flour, cake, baking, flour])
+
+    assert ['flour', 'cake', 'baking', 'flour'] == [obj.name for obj in result[:4]]
+    assert 9 == len(result)
+    assert result.ok
+
+
+def test_register_graph_rejects_other_objects(dataset):
+    dataset.session = mock.Mock()
+    with pytest.raises(TypeError):
+        dataset.register_graph([BaseEntity(uids={'id': str(uuid4())}, tags=[])])
+    dataset.session.post_resource.assert_not_called()
@@ -4,10 +4,10 @@ import pytest
 from uuid import uuid4
 
 import requests_mock
-from mock import patch, Mock, call
+from mock import patch, Mock
 from botocore.exceptions import ClientError
 
-from citrine.resources.file_link import FileCollection, FileLink, _Uploader
+from citrine.resources.file_link import FileCollection, FileLink, _Uploader, boto3_client
 from tests.utils.session import FakeSession, FakeS3Client, FakeCall, FakeRequestResponse
 from tests.utils.factories import FileLinkDataFactory, _UploaderFactory
 
@@ -126,6 +126,12 @@ def test_upload(mock_isfile, mock_stat, mock_open, mock_boto3_client, collection
     assert file_link.dump() == FileLink(dest_name, url=url).dump()
 
 
+def test_boto3_client_is_imported_when_used():
+    with patch('boto3.client') as client:
+        assert boto3_client('s3', region_name='us-west-2') is client.return_value
+    client.assert_called_once_with('s3', region_name='us-west-2')
+
+
 def test_upload_missing_file(collection):
     with pytest.raises(ValueError):
         collection.upload('this-file-does-not-exist.xls')
@@ -256,8 +262,7 @@ def test_list_file_links(collection, session, valid_data):
         [file for file in files_iterator]
 
 
-@patch("citrine.resources.file_link.write_file_locally")
-def test_file_download(mock_write_file_locally, collection, session):
+def test_file_download(collection, session, tmp_path):
     """
     Test that downloading a file works as expected.
 
@@ -272,13 +277,15 @@ def test_file_download(mock_write_file_locally, collection, session):
     session.set_response({
         'pre_signed_read_link': pre_signed_url,
     })
-    local_path = 'Users/me/some/new/directory/'
+    local_path = str(tmp_path / 'Users/me/some/new/directory') + '/'
 
     with requests_mock.mock() as mock_get:
         mock_get.get(pre_signed_url, text='0101001')
 
         # When
-        collection.download(file, local_path)
+        progress = []
+        collection.download(file, local_path, chunk_size=4,
+                            progress=lambda state: progress.append(state.bytes_downloaded))
 
         # When
         assert mock_get.call_count == 1
@@ -287,5 +294,6 @@ def test_file_download(mock_write_file_locally, collection, session):
             path=url + '/content-link'
         )
         assert expected_call == session.last_call
-        assert mock_write_file_locally.call_count == 1
-        assert mock_write_file_locally.call_args == call(b'0101001', local_path + file.filename)
+        with open(local_path + file.filename, 'rb') as downloaded:
+            assert b'0101001' == downloaded.read()
+        assert [4, 7] == progress
@@ -1,9 +1,15 @@
-from uuid import UUID
+from uuid import UUID, uuid4
 
+import mock
 import pytest
 from taurus.entity.bounds.integer_bounds import IntegerBounds
 
+from citrine._rest.cache import ObjectCache
+from citrine.exceptions import BadRequest, NotFound
+from citrine.resources.data_concepts import _identity_map
 from citrine.resources.material_run import MaterialRunCollection, MaterialRun
+from citrine.resources.material_spec import MaterialSpec
+from citrine.resources.process_run import ProcessRun, ProcessRunCollection
 from tests.utils.session import FakeSession, FakeCall
 from tests.utils.factories import MaterialRunFactory, MaterialRunDataFactory, LinkByUIDFactory
 
@@ -34,6 +40,31 @@ def test_register_material_run(collection, session):
     assert "<Material run 'Test MR 123'>" == str(registered)
 
 
+def test_register_all_material_runs(collection, session):
+    # Given
+    runs = MaterialRunFactory.create_batch(4)
+    session.post_resource = mock.Mock(side_effect=lambda path, json: MaterialRunDataFactory(
+        uids=json['uids'], name=json['name']) if json['name'] != runs[2].name else _bad_request())
+
+    # When
+    registered = collection.register_all(runs, max_workers=2, chunk_size=3)
+
+    # Then
+    assert 4 == session.post_resource.call_count
+    assert [run.name for i, run in enumerate(runs) if i != 2] == \
+        [run.name for run in registered.succeeded]
+    assert registered[2] is None
+    assert isinstance(registered.failures[2], BadRequest)
+
+    collection.dataset_id = None
+    with pytest.raises(RuntimeError):
+        collection.register_all(runs)
+
+
+def _bad_request():
+    raise BadRequest('projects/material-runs')
+
+
 def test_get_history(collection, session):
     # Given
     session.set_response({
@@ -73,6 +104,82 @@ def test_get_material_run(collection, session):
     assert 'Cake 2' == run.name
 
 
+def test_get_material_run_from_cache(collection, session):
+    # Given
+    session.object_cache = ObjectCache()
+    run_data = MaterialRunDataFactory(name='Cake 2', uids={'id': str(uuid4()), 'lab': 'cake-2'})
+    session.set_response(run_data)
+
+    # When
+    run = collection.get(run_data['uids']['id'])
+
+    # Then
+    assert run is collection.get(run_data['uids']['id'])
+    assert run is collection.get('cake-2', scope='LAB')
+    assert 1 == session.num_calls
+
+    # Registering the run again replaces it under each of its IDs
+    collection.register(run)
+    assert 2 == session.num_calls
+    assert run is not collection.get('cake-2', scope='lab')
+    assert 3 == session.num_calls
+
+    # As does deleting it
+    collection.delete(run_data['uids']['id'])
+    collection.get('cake-2', scope='lab')
+    assert 5 == session.num_calls
+    assert {'hits': 2, 'misses': 3, 'evictions': 0, 'expirations': 0, 'invalidations': 4} == \
+        session.object_cache.stats.as_dict()
+
+
+def test_cache_is_shared_by_the_datasets_of_a_project(collection, session):
+    # Given
+    session.object_cache = ObjectCache()
+    other_dataset = MaterialRunCollection(collection.project_id, uuid4(), session)
+    run_data = MaterialRunDataFactory(name='before', uids={'id': str(uuid4()), 'lab': 'cake'})
+    session.set_responses(run_data, dict(run_data, name='after'), dict(run_data, name='after'))
+
+    # When
+    run = collection.get('cake', scope='lab')
+
+    # Then
+    assert run is other_dataset.get('cake', scope='LAB')
+    assert 1 == session.num_calls
+
+    # Writing it through another dataset invalidates it everywhere
+    other_dataset.register(run)
+    assert 'after' == collection.get('cake', scope='lab').name
+    assert 3 == session.num_calls
+
+
+def test_get_many_material_runs(collection):
+    # Given
+    runs_data = {run['uids']['id']: run for run in MaterialRunDataFactory.create_batch(5)}
+    uids = list(runs_data) + ['missing']
+
+    def get_resource(path, *args, **kwargs):
+        uid = path.rsplit('/', 1)[1]
+        if uid not in runs_data:
+            raise NotFound(path)
+        return runs_data[uid]
+
+    collection.session = mock.Mock(get_resource=mock.Mock(side_effect=get_resource))
+
+    # When
+    runs = collection.get_many(uids, max_workers=3)
+
+    # Then
+    assert 6 == collection.session.get_resource.call_count
+    assert [run['name'] for run in runs_data.values()] == [run.name for run in runs.succeeded]
+    assert runs[5] is None
+    assert [5] == list(runs.failures)
+    assert isinstance(runs.failures[5], NotFound)
+
+    collection.dataset_id = None
+    with pytest.raises(RuntimeError):
+        collection.get_many(uids)
+
+
 def test_list_material_runs(collection, session):
     # Given
     sample_run = MaterialRunDataFactory()
@@ -100,6 +207,39 @@ def test_list_material_runs(collection, session):
     assert sample_run['uids'] == runs[0].uids
 
 
+def test_list_shares_linked_objects(collection, session):
+    # Given
+    spec = MaterialSpec('flour spec', uids={'id': str(uuid4())}).dump()
+    runs = [MaterialRunDataFactory(spec=spec), MaterialRunDataFactory(spec=spec)]
+    session.set_response({'contents': runs})
+
+    # When
+    first = collection.list()
+    second = collection.list()
+
+    # Then
+    assert isinstance(first[0].spec, MaterialSpec)
+    assert first[0].spec is first[1].spec
+    assert first[0].spec is not second[0].spec
+
+
+def test_pages_keep_the_session_of_objects_built_earlier(collection, session):
+    # Given
+    process_data = ProcessRun('mixing', uids={'id': str(uuid4())}).dump()
+    session.set_responses({'contents': [process_data]},
+                          {'contents': [MaterialRunDataFactory(process=process_data)]})
+    processes = ProcessRunCollection(collection.project_id, collection.dataset_id, session)
+
+    # When
+    with _identity_map():
+        [process] = processes.list()
+        [run] = collection.list()
+
+    # Then
+    assert run.process is process
+    assert session is process.session
+
+
 def test_filter_by_tags(collection, session):
     # Given
     sample_run = MaterialRunDataFactory()
@@ -195,6 +335,63 @@ def test_filter_by_attribute_bounds(collection, session):
     assert sample_run['uids'] == runs[0].uids
 
 
+def test_list_all_material_runs(collection, session):
+    # Given
+    session.set_responses({'contents': MaterialRunDataFactory.create_batch(2)},
+                          {'contents': MaterialRunDataFactory.create_batch(2)},
+                          {'contents': []})
+
+    # When
+    runs = list(collection.list_all(per_page=2, read_ahead=1))
+
+    # Then
+    assert 4 == len(runs)
+    assert [FakeCall(
+        method='GET',
+        path='projects/{}/material-runs'.format(collection.project_id),
+        params={
+            'dataset_id': str(collection.dataset_id),
+            'tags': [],
+            'page': page,
+            'per_page': 2
+        }
+    ) for page in (1, 2, 3)] == session.calls
+
+
+def test_filter_all(collection, session):
+    # Given
+    page, end = {'contents': [MaterialRunDataFactory()]}, {'contents': []}
+    session.set_responses(page, end, page, end, page, end)
+    link = LinkByUIDFactory()
+
+    # When
+    by_tags = list(collection.filter_by_tags_all(tags="color", read_ahead=0))
+    by_name = list(collection.filter_by_name_all('test run', exact=True))
+    by_bounds = list(collection.filter_by_attribute_bounds_all({link: IntegerBounds(1, 5)}))
+
+    # Then
+    assert [1, 1, 1] == [len(by_tags), len(by_name), len(by_bounds)]
+    tags_call, _, name_call, _, bounds_call, _ = session.calls
+    assert 2 == session.calls[1].params['page']
+    assert {'dataset_id': str(collection.dataset_id), 'tags': ['color'],
+            'page': 1, 'per_page': 100} == tags_call.params
+    assert 'projects/{}/material-runs/filter-by-name'.format(collection.project_id) == \
+        name_call.path
+    assert {'dataset_id': str(collection.dataset_id), 'name': 'test run', 'exact': True,
+            'page': 1, 'per_page': 100} == name_call.params
+    assert 'POST' == bounds_call.method
+    assert {link.id: {'lower_bound': 1, 'upper_bound': 5, 'type': 'integer_bounds'}} == \
+        bounds_call.json['attribute_bounds']
+
+    # Invalid searches are rejected before any page is requested
+    with pytest.raises(NotImplementedError):
+        collection.filter_by_tags_all(tags=["color", "shape"])
+    collection.dataset_id = None
+    with pytest.raises(RuntimeError):
+        collection.filter_by_name_all('test run')
+    assert 6 == session.num_calls
+
+
 def test_delete_material_run(collection, session):
     # Given
     material_run_uid = '2d3a782f-aee7-41db-853c-36bf4bff0626'
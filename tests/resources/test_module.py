@@ -1,9 +1,15 @@
 """Tests predictor collection"""
 import mock
+import pytest
 import uuid
 
+from citrine._rest.polling import PollingPolicy
+from citrine.exceptions import ModuleValidationFailedException
 from citrine.resources.module import ModuleCollection
 from citrine.informatics.predictors import SimpleMLPredictor
+from tests.utils.session import FakeSession, FakeCall
+
+_FAST = PollingPolicy(initial_interval=0.001, max_interval=0.001, jitter=0)
 
 
 def test_build(valid_simple_ml_predictor_data):
@@ -16,3 +22,30 @@ def test_build(valid_simple_ml_predictor_data):
     collection = ModuleCollection(uuid.uuid4(), session)
     module = collection.build(valid_simple_ml_predictor_data)
     assert type(module) == SimpleMLPredictor
+
+
+def test_wait_until_ready(valid_simple_ml_predictor_data):
+    session = FakeSession()
+    collection = ModuleCollection(uuid.uuid4(), session)
+    module = collection.build(valid_simple_ml_predictor_data)
+    session.set_responses(dict(valid_simple_ml_predictor_data, status='VALIDATING'),
+                          dict(valid_simple_ml_predictor_data, status='VALID'))
+
+    ready, = collection.wait_until_ready([module], policy=_FAST)
+    assert 'VALID' == ready.status
+    assert 2 == session.num_calls
+    assert session.last_call == FakeCall(
+        'GET', '/projects/{}/modules/{}'.format(collection.project_id, module.uid))
+
+
+def test_wait_until_ready_fails_early(valid_simple_ml_predictor_data):
+    session = FakeSession()
+    collection = ModuleCollection(uuid.uuid4(), session)
+    modules = [collection.build(valid_simple_ml_predictor_data) for _ in range(2)]
+    session.set_response(dict(valid_simple_ml_predictor_data, status='INVALID',
+                              status_info=['Training data is missing']))
+
+    with pytest.raises(ModuleValidationFailedException) as e:
+        collection.wait_until_ready(modules, policy=_FAST)
+    assert 'Training data is missing' in str(e.value)
+    assert 'INVALID' == e.value.module.status
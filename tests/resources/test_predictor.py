@@ -1,7 +1,10 @@
 """Tests predictor collection"""
+import time
+import uuid
+from threading import Event, Thread
+
 import mock
 import pytest
-import uuid
 
 from citrine.exceptions import ModuleRegistrationFailedException, NotFound
 from citrine.informatics.predictors import SimpleMLPredictor
@@ -58,9 +61,92 @@ def test_mark_predictor_invalid(valid_simple_ml_predictor_data):
     collection.update(predictor)
 
     # Then
-    assert 2 == session.num_calls, session.calls  # This is a little strange, the report is fetched eagerly
+    assert 1 == session.num_calls, session.calls  # The report is only fetched when read
 
     first_call = session.calls[0]  # First call is the update
     assert first_call.method == 'PUT'
     assert first_call.path == '/projects/{}/modules/{}'.format(collection.project_id, predictor.uid)
     assert not first_call.json['active']
+
+
+def test_list_fetches_reports_lazily(valid_simple_ml_predictor_data):
+    session = FakeSession()
+    collection = PredictorCollection(uuid.uuid4(), session)
+    session.set_responses({'entries': [valid_simple_ml_predictor_data] * 3},
+                          dict(status='OK', report=dict(), uid=str(uuid.uuid4())))
+
+    predictors = list(collection.list())
+    assert 3 == len(predictors)
+    assert 1 == session.num_calls
+
+    assert 'OK' == predictors[0].report.status
+    assert 'OK' == predictors[0].report.status
+    assert 2 == session.num_calls
+    assert session.last_call == FakeCall(
+        'GET', '/projects/{}/modules/{}/report'.format(
+            collection.project_id, valid_simple_ml_predictor_data['id']))
+
+
+def test_list_predictors_lazily(valid_simple_ml_predictor_data):
+    session = FakeSession()
+    collection = PredictorCollection(uuid.uuid4(), session)
+    session.set_response({'entries': [valid_simple_ml_predictor_data]})
+
+    [predictor] = collection.list(lazy=True)
+    assert isinstance(predictor, SimpleMLPredictor)
+    assert '__description' not in vars(predictor)
+    assert predictor.description == 'Predicts z from input x and latent variable y'
+    assert predictor.dump() == collection.build(valid_simple_ml_predictor_data).dump()
+
+
+def test_prefetch_reports(valid_simple_ml_predictor_data):
+    session = FakeSession()
+    collection = PredictorCollection(uuid.uuid4(), session, prefetch_reports=True)
+    session.set_responses({'entries': [valid_simple_ml_predictor_data] * 3},
+                          dict(status='OK', report=dict(), uid=str(uuid.uuid4())))
+
+    predictors = list(collection.list())
+    assert 4 == session.num_calls
+    assert all(predictor.report.status == 'OK' for predictor in predictors)
+    assert 4 == session.num_calls
+
+    # Other collections are not affected
+    session.set_response({'entries': [valid_simple_ml_predictor_data]})
+    list(PredictorCollection(collection.project_id, session).list())
+    assert 5 == session.num_calls
+
+
+def test_report_is_fetched_once_by_concurrent_readers(valid_simple_ml_predictor_data):
+    fetching = Event()
+    release = Event()
+
+    def get_resource(path, *args, **kwargs):
+        fetching.set()
+        release.wait(5)
+        return dict(status='OK', report=dict(), uid=str(uuid.uuid4()))
+
+    session = mock.Mock(get_resource=mock.Mock(side_effect=get_resource))
+    predictor = PredictorCollection(uuid.uuid4(), session).build(valid_simple_ml_predictor_data)
+    readers = [Thread(target=lambda: predictor.report) for _ in range(2)]
+    readers[0].start()
+    fetching.wait(5)
+    readers[1].start()
+    time.sleep(0.05)  # the second reader waits for the first
+    release.set()
+    for reader in readers:
+        reader.join()
+
+    assert 1 == session.get_resource.call_count
+    assert 'OK' == predictor.report.status
+
+
+def test_fetch_reports_records_failures(valid_simple_ml_predictor_data):
+    session = mock.Mock()
+    session.get_resource.side_effect = [
+        dict(status='OK', report=dict(), uid=str(uuid.uuid4())), NotFound('/report')]
+    collection = PredictorCollection(uuid.uuid4(), session)
+    predictors = [collection.build(valid_simple_ml_predictor_data) for _ in range(2)]
+
+    result = collection.fetch_reports(predictors, max_workers=1)
+    assert 'OK' == result[0].status
+    assert isinstance(result.failures[1], NotFound)
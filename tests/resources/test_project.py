@@ -1,7 +1,11 @@
 import uuid
+import mock
 import pytest
 from dateutil.parser import parse
 
+from citrine._rest.cache import ObjectCache
+from citrine.exceptions import (
+    BadRequest, BulkOperationFailedException, ModuleRegistrationFailedException)
 from citrine.resources.project import Project, ProjectCollection
 from citrine.resources.table import TableCollection
 from citrine.resources.project_member import ProjectMember
@@ -222,6 +226,24 @@ def test_get_project(collection, session):
     assert 'single project' == created_project.name
 
 
+def test_get_project_from_cache(collection, session):
+    # Given
+    session.object_cache = ObjectCache()
+    project_data = ProjectDataFactory(name='single project')
+    session.set_response({'project': project_data})
+
+    # When
+    project = collection.get(project_data['id'])
+
+    # Then
+    assert project is collection.get(project_data['id'])
+    assert 1 == session.num_calls
+
+    collection.update(project)
+    assert project is not collection.get(project_data['id'])
+    assert 3 == session.num_calls
+
+
 def test_list_projects(collection, session):
     # Given
     projects_data = ProjectDataFactory.create_batch(5)
@@ -267,6 +289,65 @@ def test_list_projects_with_page_params(collection, session):
     assert expected_call == session.last_call
 
 
+def test_get_many_projects(collection, session):
+    # Given
+    project_data = ProjectDataFactory()
+    session.set_response({'project': project_data})
+
+    # When
+    projects = collection.get_many([project_data['id']] * 3, max_workers=2)
+
+    # Then
+    assert 3 == session.num_calls
+    assert projects.ok
+    assert [project_data['name']] * 3 == [project.name for project in projects]
+
+
+def test_register_all_projects(collection, session):
+    # Given
+    session.post_resource = mock.Mock(
+        side_effect=[{'project': ProjectDataFactory(name='ok')}, BadRequest('/projects')])
+
+    # When
+    result = collection.register_all(['ok', 'bad'], max_workers=1)
+
+    # Then
+    assert ['ok'] == [project.name for project in result.succeeded]
+    assert isinstance(result.failures[1], ModuleRegistrationFailedException)
+    with pytest.raises(BulkOperationFailedException):
+        result.raise_for_failures()
+
+
+def test_list_all_projects(collection, session):
+    # Given
+    session.set_responses({'projects': ProjectDataFactory.create_batch(2)},
+                          {'projects': ProjectDataFactory.create_batch(1)},
+                          {'projects': []})
+
+    # When
+    projects = list(collection.list_all(per_page=2))
+
+    # Then
+    assert 3 == len(projects)
+    assert [FakeCall(method='GET', path='/projects', params={'page': page, 'per_page': 2})
+            for page in (1, 2, 3)] == session.calls
+
+
+def test_list_all_projects_lazily(collection, session):
+    # Given
+    projects_data = ProjectDataFactory.create_batch(3)
+    session.set_responses({'projects': projects_data}, {'projects': []})
+
+    # When
+    projects = list(collection.list_all(lazy=True))
+
+    # Then
+    assert all('__description' not in vars(project) for project in projects)
+    assert [data['description'] for data in projects_data] == \
+        [project.description for project in projects]
+    assert session is projects[0].session
+
+
 def test_delete_project(collection, session):
     # Given
     uid = '151199ec-e9aa-49a1-ac8e-da722aaf74c4'
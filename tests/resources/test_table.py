@@ -2,7 +2,6 @@ from uuid import UUID
 
 import pytest
 import requests_mock
-from mock import patch, call, Mock
 
 from citrine.resources.table import TableCollection, Table
 from tests.utils.factories import TableDataFactory
@@ -29,25 +28,22 @@ def table() -> Table:
     return _table
 
 
-@patch("citrine.resources.table.write_file_locally")
-def test_read_table(mock_write_files_locally,  table):
+def test_read_table(table, tmp_path):
     # When
     with requests_mock.mock() as mock_get:
         remote_url = "http://otherhost:4572/anywhere"
         mock_get.get(remote_url, text='stuff')
-        table(remote_url).read("table.pdf")
+        table(remote_url).read(str(tmp_path / "table.pdf"))
         assert mock_get.call_count == 1
-        assert mock_write_files_locally.call_count == 1
-        assert mock_write_files_locally.call_args == call(b'stuff', "table.pdf")
+        assert b'stuff' == (tmp_path / "table.pdf").read_bytes()
 
     with requests_mock.mock() as mock_get:
         # When
         localstack_url = "http://localstack:4572/anywhere"
         mock_get.get("http://localhost:9572/anywhere", text='stuff')
-        table(localstack_url).read("table2.pdf")
+        table(localstack_url).read(str(tmp_path / "table2.pdf"))
         assert mock_get.call_count == 1
-        assert mock_write_files_locally.call_count == 2
-        assert mock_write_files_locally.call_args == call(b'stuff', "table2.pdf")
+        assert b'stuff' == (tmp_path / "table2.pdf").read_bytes()
 
 
 def test_get_table_metadata(collection, session):
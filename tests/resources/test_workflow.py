@@ -1,6 +1,11 @@
 import uuid
 
+import pytest
+
+from citrine._rest.polling import PollingPolicy
+from citrine.exceptions import PollingTimeoutException
 from citrine.resources.workflow import WorkflowCollection
+from tests.utils.session import FakeSession
 
 
 def test_build_workflow():
@@ -23,3 +28,30 @@ def test_build_workflow():
     # Then
     assert workflow.project_id == workflow_collection.project_id
     assert workflow.session is None
+
+
+def test_wait_until_ready():
+    session = FakeSession()
+    collection = WorkflowCollection(project_id=uuid.uuid4(), session=session)
+    data = {
+        'id': str(uuid.uuid4()),
+        'display_name': 'Test Workflow',
+        'status': 'VALIDATING',
+        'modules': {
+            'design_space_id': str(uuid.uuid4()),
+            'processor_id': str(uuid.uuid4()),
+            'predictor_id': str(uuid.uuid4()),
+        }
+    }
+    workflow = collection.build(data)
+    policy = PollingPolicy(initial_interval=0.001, max_interval=0.001, jitter=0)
+
+    session.set_response(data)
+    with pytest.raises(PollingTimeoutException) as e:
+        collection.wait_until_ready([workflow], timeout=0.01, policy=policy)
+    assert [workflow] == e.value.pending
+
+    session.set_response(dict(data, status='READY'))
+    ready, = collection.wait_until_ready([workflow], policy=policy)
+    assert 'READY' == ready.status
+    assert ready.project_id == collection.project_id
@@ -1,9 +1,15 @@
 import uuid
+from datetime import datetime, timedelta
 
+import mock
 import pytest
+import requests_mock
 
+from citrine._rest.polling import POLL_RETRY_POLICY, PollingPolicy
+from citrine._session import Session
+from citrine.exceptions import PollingTimeoutException, WorkflowNotReadyException
 from citrine.resources.workflow_executions import WorkflowExecutionCollection, WorkflowExecution, \
-    WorkflowExecutionStatus
+    WorkflowExecutionStatus, as_completed, wait_for
 from tests.utils.factories import MLIScoreFactory
 from tests.utils.session import FakeSession, FakeCall
 
@@ -124,3 +130,77 @@ def test_workflow_failed_status():
     assert not status.succeeded
     assert not status.in_progress
     assert status.failed
+
+
+class _StatusSession(FakeSession):
+    """Returns the statuses queued for each execution, repeating the last one."""
+
+    def __init__(self):
+        super().__init__()
+        self.statuses = {}
+        self.retry_policies = []
+
+    def get_resource(self, path: str, *args, **kwargs) -> dict:
+        self.calls.append(FakeCall('GET', path))
+        self.retry_policies.append(kwargs.get('retry_policy'))
+        statuses = self.statuses[path.split('/')[-2]]
+        status = statuses.pop(0) if len(statuses) > 1 else statuses[0]
+        if isinstance(status, Exception):
+            raise status
+        return {'status': status}
+
+    def execution(self, *statuses) -> WorkflowExecution:
+        uid = str(uuid.uuid4())
+        self.statuses[uid] = list(statuses)
+        return WorkflowExecution(uid=uid, project_id=str(uuid.uuid4()),
+                                 workflow_id=str(uuid.uuid4()), session=self)
+
+
+_FAST = PollingPolicy(initial_interval=0.001, max_interval=0.001, jitter=0)
+
+
+def test_as_completed_yields_executions_as_they_finish():
+    session = _StatusSession()
+    slow = session.execution('InProgress', 'InProgress', 'Succeeded')
+    fast = session.execution(WorkflowNotReadyException('not ready'), 'Failed')
+
+    finished = list(as_completed([slow, fast], policy=_FAST))
+    assert [fast, slow] == [execution for execution, _ in finished]
+    assert ['Failed', 'Succeeded'] == [status.status for _, status in finished]
+    assert 5 == session.num_calls
+    assert [POLL_RETRY_POLICY] * 5 == session.retry_policies
+
+
+@mock.patch('citrine._session.sleep')
+def test_as_completed_does_not_wait_for_a_retry_in_the_loop(mock_sleep):
+    session = Session(refresh_token='12345', scheme='http', host='citrine-testing.fake')
+    session.access_token_expiration = datetime.utcnow() + timedelta(minutes=3)
+    executions = [WorkflowExecution(uid=str(uuid.uuid4()), project_id=str(uuid.uuid4()),
+                                    workflow_id=str(uuid.uuid4()), session=session)
+                  for _ in range(2)]
+    not_ready, ready = ('http://citrine-testing.fake/api/v1' + execution._path() + '/status'
+                        for execution in executions)
+
+    with requests_mock.Mocker() as m:
+        m.get(not_ready, [{'status_code': 425, 'text': 'not ready'},
+                          {'json': {'status': 'Succeeded'}}])
+        m.get(ready, json={'status': 'Failed'})
+        finished = list(as_completed(executions, policy=_FAST))
+
+    assert [executions[1], executions[0]] == [execution for execution, _ in finished]
+    # The execution that was not ready was polled again on its schedule, not retried
+    mock_sleep.assert_not_called()
+    assert 3 == m.call_count
+
+
+def test_wait_for_returns_statuses_in_order():
+    session = _StatusSession()
+    executions = [session.execution('InProgress', 'Succeeded'), session.execution('Failed')]
+
+    statuses = wait_for(executions, policy=_FAST)
+    assert ['Succeeded', 'Failed'] == [status.status for status in statuses]
+
+    stuck = session.execution('InProgress')
+    with pytest.raises(PollingTimeoutException) as e:
+        wait_for([stuck], timeout=0.01, policy=_FAST)
+    assert [stuck] == e.value.pending
@@ -0,0 +1,97 @@
+from threading import Barrier, Lock
+
+import pytest
+
+from citrine._rest.bulk import run_concurrently, BulkResult
+from citrine.exceptions import BulkOperationFailedException
+
+
+def square_unless_odd(x: int) -> int:
+    if x % 2:
+        raise ValueError("{} is odd".format(x))
+    return x * x
+
+
+@pytest.mark.parametrize('max_workers', [1, 4])
+def test_results_in_input_order_with_failures(max_workers):
+    result = run_concurrently('square', square_unless_odd, range(10), max_workers=max_workers)
+
+    assert [0, None, 4, None, 16, None, 36, None, 64, None] == list(result)
+    assert [1, 3, 5, 7, 9] == list(result.failures)
+    assert all(isinstance(e, ValueError) for e in result.failures.values())
+    assert [0, 4, 16, 36, 64] == result.succeeded
+    assert 5 == result.num_succeeded
+    assert 10 == len(result)
+    assert 4 == result[2]
+    assert not result.ok
+    assert result.elapsed >= 0
+    assert result.throughput > 0
+    assert "5 succeeded, 5 failed" in repr(result)
+
+
+def test_runs_concurrently():
+    # Every call blocks until all four are in flight, which deadlocks unless they run at once
+    barrier = Barrier(4, timeout=5)
+    result = run_concurrently('wait', lambda x: barrier.wait() is not None, range(4), 4)
+    assert result.ok
+    assert [True] * 4 == result.results
+
+
+def test_max_workers_bounds_concurrency():
+    lock = Lock()
+    in_flight = [0, 0]
+
+    def track(_):
+        with lock:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight[1], in_flight[0])
+        work = sum(range(10000))
+        with lock:
+            in_flight[0] -= 1
+        return work
+
+    run_concurrently('track', track, range(50), max_workers=3)
+    assert in_flight[1] <= 3
+
+
+def test_raise_for_failures():
+    run_concurrently('square', square_unless_odd, [0, 2]).raise_for_failures()
+
+    result = run_concurrently('square', square_unless_odd, [0, 3, 5])
+    with pytest.raises(BulkOperationFailedException, match='2 of 3 items failed to square') as e:
+        result.raise_for_failures()
+    assert 'item 1: ValueError: 3 is odd' in str(e.value)
+    assert result.failures == e.value.failures
+
+
+def test_empty_and_invalid():
+    result = run_concurrently('noop', square_unless_odd, [])
+    assert 0 == len(result)
+    assert result.ok
+    assert isinstance(result, BulkResult)
+    with pytest.raises(ValueError):
+        run_concurrently('noop', square_unless_odd, [1], max_workers=0)
+
+
+def test_chunks_consume_input_lazily(caplog):
+    consumed = []
+
+    def items():
+        for x in range(10):
+            consumed.append(x)
+            yield x
+
+    def check(x):
+        # Items beyond the current chunk have not been drawn from the generator yet
+        assert len(consumed) <= (x // 4 + 1) * 4
+        return x
+
+    with caplog.at_level('INFO', logger='citrine._rest.bulk'):
+        result = run_concurrently('check', check, items(), max_workers=2, chunk_size=4)
+
+    assert result.ok
+    assert list(range(10)) == result.results
+    assert ['check: 4 items done', 'check: 8 items done', 'check: 10 items done'] == \
+        [record.getMessage().split(',')[0] for record in caplog.records]
+    with pytest.raises(ValueError):
+        run_concurrently('check', check, [1], chunk_size=0)
@@ -0,0 +1,62 @@
+"""Tests of the object cache and its counters."""
+import pytest
+
+from citrine._rest.cache import ObjectCache
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ObjectCache(max_size=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert 1 == cache.get('a')
+    cache.put('c', 3)
+
+    assert cache.get('b') is None
+    assert 1 == cache.get('a')
+    assert 3 == cache.get('c')
+    assert 2 == len(cache)
+    assert {'hits': 3, 'misses': 1, 'evictions': 1, 'expirations': 0, 'invalidations': 0} == \
+        cache.stats.as_dict()
+    assert 0.75 == cache.stats.hit_rate
+
+
+def test_entries_expire():
+    clock = _Clock()
+    cache = ObjectCache(ttl=10, clock=clock)
+    cache.put('a', 1)
+    clock.now = 9.9
+    assert 1 == cache.get('a')
+    clock.now = 10
+    assert cache.get('a') is None
+    assert 0 == len(cache)
+    assert 1 == cache.stats.expirations
+
+
+def test_invalidate():
+    cache = ObjectCache()
+    cache.put('a', 1)
+    assert 1 == cache.invalidate('a')
+    assert cache.invalidate('a') is None
+    assert cache.get('a') is None
+    assert 1 == cache.stats.invalidations
+
+    cache.put('b', 2)
+    cache.clear()
+    assert 0 == len(cache)
+    cache.stats.reset()
+    assert 0 == cache.stats.hit_rate
+
+
+def test_invalid_configuration():
+    with pytest.raises(ValueError):
+        ObjectCache(max_size=0)
+    with pytest.raises(ValueError):
+        ObjectCache(ttl=0)
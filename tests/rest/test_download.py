@@ -0,0 +1,180 @@
+"""Tests of streamed downloads that resume after an interruption."""
+import mock
+import pytest
+import requests_mock
+from requests.exceptions import ChunkedEncodingError, HTTPError
+
+from citrine._rest.download import DownloadProgress, download_to_file
+
+CONTENT = b'0123456789abcdef'
+URL = 'https://storage.example.com/bucket/file?signature=secret'
+
+
+class _Response:
+    def __init__(self, body: bytes, status_code: int = 200, headers: dict = None,
+                 fail_after: int = None):
+        self.body = body
+        self.status_code = status_code
+        self.headers = headers if headers is not None else {'Content-Length': str(len(body))}
+        self.fail_after = fail_after
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise HTTPError(str(self.status_code))
+
+    def iter_content(self, chunk_size: int):
+        for start in range(0, len(self.body), chunk_size):
+            if self.fail_after is not None and start >= self.fail_after:
+                raise ChunkedEncodingError('Connection broken')
+            yield self.body[start:start + chunk_size]
+
+
+class _Http:
+    """Serves a file whose connection drops after some bytes, a number of times."""
+
+    def __init__(self, drops: int, supports_range: bool = True):
+        self.drops = drops
+        self.supports_range = supports_range
+        self.requests = []
+
+    def get(self, url: str, headers: dict, stream: bool) -> _Response:
+        assert stream
+        self.requests.append(headers)
+        fail_after = 4 if self.drops else None
+        self.drops -= 1
+        if 'Range' not in headers or not self.supports_range:
+            return _Response(CONTENT, fail_after=fail_after)
+        start = int(headers['Range'][len('bytes='):-1])
+        return _Response(CONTENT[start:], 206, {
+            'Content-Range': 'bytes {}-{}/{}'.format(start, len(CONTENT) - 1, len(CONTENT))
+        }, fail_after)
+
+
+class _Queued:
+    """Sends the responses it was given in order."""
+
+    def __init__(self, *responses: _Response):
+        self.responses = list(responses)
+        self.requests = []
+
+    def get(self, url: str, headers: dict, stream: bool) -> _Response:
+        self.requests.append(headers)
+        return self.responses.pop(0)
+
+
+def test_streams_in_chunks_with_progress(tmp_path):
+    local_path = str(tmp_path / 'new' / 'directory' / 'file.csv')
+    updates = []
+    with requests_mock.mock() as mock:
+        mock.get(URL, content=CONTENT, headers={'Content-Length': str(len(CONTENT))})
+        state = download_to_file(URL, local_path, chunk_size=5,
+                                 progress=lambda p: updates.append(p.bytes_downloaded))
+
+    assert CONTENT == open(local_path, 'rb').read()
+    assert [5, 10, 15, 16] == updates
+    assert len(CONTENT) == state.bytes_downloaded == state.total_bytes
+    assert 1.0 == state.fraction
+    assert 0 == state.resumes
+    assert state.throughput >= 0
+
+
+def test_resumes_with_range_requests(tmp_path):
+    local_path = str(tmp_path / 'file.csv')
+    http = _Http(drops=2)
+    state = download_to_file(URL, local_path, chunk_size=2, http=http)
+
+    assert CONTENT == open(local_path, 'rb').read()
+    assert [{}, {'Range': 'bytes=4-'}, {'Range': 'bytes=8-'}] == http.requests
+    assert 2 == state.resumes
+
+
+def test_starts_over_without_range_support(tmp_path):
+    local_path = str(tmp_path / 'file.csv')
+    http = _Http(drops=1, supports_range=False)
+    download_to_file(URL, local_path, chunk_size=2, http=http)
+    assert CONTENT == open(local_path, 'rb').read()
+
+
+def test_gives_up_after_max_resumes(tmp_path):
+    local_path = tmp_path / 'file.csv'
+    local_path.write_bytes(b'previous version')
+    with pytest.raises(ChunkedEncodingError):
+        download_to_file(URL, str(local_path), chunk_size=2, max_resumes=1, http=_Http(drops=2))
+
+    # The existing file is kept, and no partial file is left behind
+    assert b'previous version' == local_path.read_bytes()
+    assert ['file.csv'] == [path.name for path in tmp_path.iterdir()]
+
+
+def test_http_errors_are_raised(tmp_path):
+    with requests_mock.mock() as mock:
+        mock.get(URL, status_code=403)
+        with pytest.raises(HTTPError):
+            download_to_file(URL, str(tmp_path / 'file.csv'))
+    assert [] == list(tmp_path.iterdir())
+
+    with pytest.raises(ValueError):
+        download_to_file(URL, str(tmp_path / 'file.csv'), chunk_size=0)
+
+
+def test_failure_to_open_the_partial_file_is_raised(tmp_path):
+    with mock.patch('citrine._rest.download.open', create=True,
+                    side_effect=OSError('No space left on device')):
+        with pytest.raises(OSError, match='No space left'):
+            download_to_file(URL, str(tmp_path / 'file.csv'), http=_Queued())
+
+
+def test_resumes_a_response_that_ends_early(tmp_path):
+    local_path = str(tmp_path / 'file.csv')
+    http = _Queued(
+        _Response(CONTENT[:6], headers={'Content-Length': str(len(CONTENT))}),
+        _Response(CONTENT[6:], 206, {'Content-Range': 'bytes 6-15/16'}))
+    state = download_to_file(URL, local_path, http=http)
+
+    assert CONTENT == open(local_path, 'rb').read()
+    assert [{}, {'Range': 'bytes=6-'}] == http.requests
+    assert 1 == state.resumes
+
+
+def test_size_is_read_from_the_content_range_of_a_resumed_response(tmp_path):
+    local_path = str(tmp_path / 'file.csv')
+    http = _Queued(
+        _Response(CONTENT, headers={}, fail_after=4),
+        _Response(CONTENT[4:], 206, {'Content-Range': 'bytes 4-15/16'}))
+    state = download_to_file(URL, local_path, chunk_size=2, http=http)
+
+    assert CONTENT == open(local_path, 'rb').read()
+    assert len(CONTENT) == state.total_bytes
+
+    http = _Queued(
+        _Response(CONTENT, headers={}, fail_after=4),
+        _Response(CONTENT[4:], 206, {'Content-Range': 'bytes */16'}))
+    assert download_to_file(URL, local_path, chunk_size=2, http=http).total_bytes is None
+    assert CONTENT == open(local_path, 'rb').read()
+
+
+def test_compressed_download_starts_over(tmp_path):
+    local_path = str(tmp_path / 'file.csv')
+    http = _Queued(
+        _Response(CONTENT, headers={'Content-Encoding': 'gzip', 'Content-Length': '12'},
+                  fail_after=4),
+        _Response(CONTENT, headers={'Content-Encoding': 'gzip', 'Content-Length': '12'}))
+    state = download_to_file(URL, local_path, chunk_size=2, http=http)
+
+    assert CONTENT == open(local_path, 'rb').read()
+    # The length is that of the compressed content, so it is not used
+    assert state.total_bytes is None
+    assert [{}, {}] == http.requests
+
+
+def test_progress_of_a_download_of_unknown_size():
+    state = DownloadProgress(URL)
+    state.bytes_downloaded = 10
+    assert state.fraction is None
+    assert '<DownloadProgress 10 of None bytes, 0 bytes/s>' == repr(state)
@@ -0,0 +1,146 @@
+import mock
+import pytest
+
+from citrine._rest.metrics import (
+    LatencyHistogram, OTHER_ROUTES, RequestHook, RequestInfo, StatsCollector, route_template)
+
+
+class _Response:
+
+    def __init__(self, status_code: int, content: bytes = b''):
+        self.status_code = status_code
+        self.content = content
+
+
+def _finished(method: str, path: str, elapsed: float, response=None) -> RequestInfo:
+    request = RequestInfo(method, path)
+    request.finish(response)
+    request.elapsed = elapsed
+    return request
+
+
+@pytest.mark.parametrize('path, route', [
+    ('projects', '/projects'),
+    ('/projects/4bbe2b5d-1b2c-4b52-97f0-2e7a1e5ef3c5/', '/projects/{id}'),
+    ('projects/4BBE2B5D-1B2C-4B52-97F0-2E7A1E5EF3C5/material-runs?page=2&per_page=20',
+     '/projects/{id}/material-runs'),
+    ('projects/4bbe2b5d-1b2c-4b52-97f0-2e7a1e5ef3c5/tables/7/versions/12', '/projects/{id}/tables/{id}/versions/{id}'),
+    ('projects/not-a-uuid', '/projects/not-a-uuid'),
+])
+def test_route_template(path, route):
+    assert route_template(path) == route
+
+
+def test_latency_histogram_percentiles():
+    histogram = LatencyHistogram()
+    assert histogram.percentile(50) is None
+    assert histogram.as_dict()['mean'] is None
+
+    for millis in range(1, 101):
+        histogram.record(millis / 1000)
+    assert histogram.count == 100
+    assert histogram.min == 0.001
+    assert histogram.max == 0.1
+    assert histogram.as_dict()['mean'] == pytest.approx(0.0505)
+    # Estimates are within the width of a bucket, and never outside the observed range
+    for percent in (1, 50, 90, 99):
+        assert histogram.percentile(percent) == pytest.approx(percent / 1000, rel=0.2)
+    assert histogram.percentile(100) == 0.1
+    assert histogram.percentile(150) == 0.1
+    assert histogram.percentile(0) == pytest.approx(0.001, rel=0.2)
+
+
+def test_latency_histogram_tiny_durations():
+    histogram = LatencyHistogram()
+    histogram.record(0.0)
+    histogram.record(1e-6)
+    # Both fall in the first bucket, which is reported as the largest duration in it
+    assert histogram.percentile(50) == 1e-6
+    assert histogram.percentile(100) == 1e-6
+
+
+def test_request_info_sizes():
+    request = RequestInfo('GET', 'projects')
+    assert request.elapsed is None
+    request.finish(_Response(200, b'{"projects": []}'))
+    assert request.elapsed >= 0
+    assert request.status_code == 200
+    assert request.request_bytes is None  # the response does not hold the request
+    assert request.response_bytes == 16
+    assert repr(request) == '<RequestInfo GET projects attempt 0>'
+
+
+def test_request_info_sizes_of_request_bodies():
+    response = _Response(200, b'{}')
+    request = RequestInfo('POST', 'projects')
+    response.request = mock.Mock(body='{"name": "caf\u00e9"}')
+    request.finish(response)
+    assert request.request_bytes == 17
+
+    # A streamed body is not in memory, so its size is unknown
+    response.request = mock.Mock(body=iter([b'chunk']))
+    request.finish(response)
+    assert request.request_bytes is None
+
+
+def test_request_info_start_resets_the_timer():
+    request = RequestInfo('GET', 'projects')
+    with mock.patch('citrine._rest.metrics.perf_counter', side_effect=[10.0, 10.5]):
+        request.start()
+        request.finish()
+    assert request.elapsed == 0.5
+
+
+def test_hook_methods_do_nothing_by_default():
+    hook = RequestHook()
+    request = RequestInfo('GET', 'projects')
+    hook.pre_request(request)
+    hook.post_response(request, _Response(200))
+    hook.on_error(request, ValueError())
+    hook.on_retry(request, '503', 1.0)
+    hook.on_token_refresh(0.1, True)
+
+
+def test_collector_groups_by_route():
+    collector = StatsCollector(percentiles=(50,))
+    collector.post_response(_finished('get', 'projects/1', 0.1, _Response(200, b'ab')), None)
+    collector.post_response(_finished('GET', 'projects/2', 0.3, _Response(404, b'abcd')), None)
+    collector.post_response(_finished('POST', 'projects', 0.2, _Response(201)), None)
+    collector.on_error(_finished('GET', 'projects/3', 1.0), ConnectionError())
+    collector.on_retry(RequestInfo('GET', 'projects/3'), 'ConnectionError', 0.5)
+    collector.on_token_refresh(0.05, True)
+    collector.on_token_refresh(0.01, False)
+
+    stats = collector.as_dict()
+    assert stats['requests'] == 4
+    assert stats['errors'] == 1
+    assert stats['retries'] == 1
+    assert stats['response_bytes'] == 6
+    assert stats['statuses'] == {200: 1, 404: 1, 201: 1}
+    assert stats['token_refreshes']['count'] == 2
+    assert stats['token_refreshes']['failed'] == 1
+    assert set(stats['routes']) == {'GET /projects/{id}', 'POST /projects'}
+
+    route = stats['routes']['GET /projects/{id}']
+    assert route['requests'] == 3
+    assert route['errors'] == 1
+    assert route['retries'] == 1
+    assert route['statuses'] == {200: 1, 404: 1}
+    assert route['latency']['count'] == 3
+    assert route['latency']['max'] == 1.0
+    assert route['latency']['p50'] == pytest.approx(0.3, rel=0.2)
+    assert set(route['latency']) == {'count', 'mean', 'min', 'max', 'p50'}
+
+    collector.reset()
+    assert collector.as_dict()['requests'] == 0
+    assert collector.as_dict()['routes'] == {}
+
+
+def test_collector_bounds_routes():
+    collector = StatsCollector(max_routes=2)
+    for name in ('a', 'b', 'c', 'd'):
+        collector.post_response(_finished('GET', name, 0.1, _Response(200)), None)
+    routes = collector.as_dict()['routes']
+    assert routes['GET /a']['requests'] == 1
+    assert routes['GET /b']['requests'] == 1
+    assert routes['GET ' + OTHER_ROUTES]['requests'] == 2
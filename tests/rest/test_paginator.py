@@ -0,0 +1,114 @@
+from threading import Event, Lock
+
+import pytest
+
+from citrine._rest.paginator import Paginator
+from tests.utils.wait import wait_until
+
+
+class PagedListing:
+    """Serves `total` integers in pages of at most `max_per_page`, recording those requested."""
+
+    def __init__(self, total: int, fail_on_page: int = None, max_per_page: int = None):
+        self.total = total
+        self.fail_on_page = fail_on_page
+        self.max_per_page = max_per_page
+        self.requested = []
+        self._lock = Lock()
+
+    def __call__(self, page: int, per_page: int) -> list:
+        with self._lock:
+            self.requested.append(page)
+        if page == self.fail_on_page:
+            raise IOError("page {} is unavailable".format(page))
+        per_page = min(per_page, self.max_per_page or per_page)
+        start = (page - 1) * per_page
+        return list(range(start, min(start + per_page, self.total)))
+
+
+@pytest.mark.parametrize('read_ahead', [0, 1, 3])
+@pytest.mark.parametrize('total', [0, 7, 10, 25])
+def test_walks_every_page(read_ahead, total):
+    listing = PagedListing(total)
+    pages = list(Paginator(listing, per_page=5, read_ahead=read_ahead))
+
+    assert list(range(total)) == [element for page in pages for element in page]
+    assert all(pages)
+    # The listing ends at the first empty page
+    assert list(range(1, -(-total // 5) + 2)) == listing.requested
+
+
+@pytest.mark.parametrize('read_ahead', [0, 2])
+def test_server_caps_page_size(read_ahead):
+    listing = PagedListing(25, max_per_page=10)
+    pages = list(Paginator(listing, per_page=100, read_ahead=read_ahead))
+
+    assert [10, 10, 5] == [len(page) for page in pages]
+    assert list(range(25)) == [element for page in pages for element in page]
+    assert [1, 2, 3, 4] == listing.requested
+
+
+def test_first_page():
+    listing = PagedListing(10)
+    assert [[5, 6, 7, 8, 9]] == list(Paginator(listing, per_page=5, first_page=2))
+
+
+def test_read_ahead_is_bounded():
+    listing = PagedListing(1000)
+    pages = iter(Paginator(listing, per_page=10, read_ahead=2))
+
+    next(pages)
+    # Two pages are queued and one more has been fetched and waits for room in the queue
+    wait_until(lambda: len(listing.requested) == 4)
+    assert [1, 2, 3, 4] == listing.requested
+    pages.close()
+
+
+def test_fetches_ahead_of_consumer():
+    listing = PagedListing(30)
+    consumed = Event()
+
+    def fetch(page, per_page):
+        if page == 1:
+            return listing(page, per_page)
+        # Later pages are only served once the consumer has the first one in hand
+        assert consumed.wait(timeout=5)
+        return listing(page, per_page)
+
+    pages = iter(Paginator(fetch, per_page=10, read_ahead=2))
+    next(pages)
+    consumed.set()
+    assert [[10 + i for i in range(10)], [20 + i for i in range(10)]] == list(pages)
+
+
+@pytest.mark.parametrize('read_ahead', [0, 2])
+def test_errors_reach_consumer_in_order(read_ahead):
+    listing = PagedListing(100, fail_on_page=3)
+    pages = iter(Paginator(listing, per_page=10, read_ahead=read_ahead))
+
+    assert 10 == len(next(pages))
+    assert 10 == len(next(pages))
+    with pytest.raises(IOError, match='page 3'):
+        next(pages)
+    assert 3 == max(listing.requested)
+
+
+def test_abandoning_iteration_stops_prefetching():
+    listing = PagedListing(10 ** 6)
+    pages = iter(Paginator(listing, per_page=1, read_ahead=1))
+    next(pages)
+    pages.close()
+
+    # The worker finishes at most the request it has in flight, then stops
+    Event().wait(0.3)
+    requested = len(listing.requested)
+    assert requested <= 3
+    Event().wait(0.3)
+    assert requested == len(listing.requested)
+
+
+def test_validation():
+    with pytest.raises(ValueError):
+        Paginator(PagedListing(1), per_page=0)
+    with pytest.raises(ValueError):
+        Paginator(PagedListing(1), read_ahead=-1)
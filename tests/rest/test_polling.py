@@ -0,0 +1,106 @@
+"""Tests of waiting for many resources from one polling loop."""
+import pytest
+import requests
+
+from citrine._rest.polling import PollingPolicy, poll_until_done
+from citrine.exceptions import NotFound, PollingTimeoutException, WorkflowNotReadyException
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class _Job:
+    """Done once it has been polled a number of times, recording when it was polled."""
+
+    def __init__(self, polls_needed: int, clock: _Clock, errors=()):
+        self.polls_needed = polls_needed
+        self.clock = clock
+        self.errors = list(errors)
+        self.polled_at = []
+
+    def check(self) -> bool:
+        self.polled_at.append(self.clock.now)
+        if self.errors:
+            raise self.errors.pop(0)
+        return len(self.polled_at) >= self.polls_needed
+
+
+def _poll(jobs, clock, **kwargs):
+    return poll_until_done(jobs, lambda job: job.check(), bool,
+                           clock=clock, sleeper=clock.sleep, **kwargs)
+
+
+def test_intervals_grow_up_to_the_maximum():
+    policy = PollingPolicy(initial_interval=1, max_interval=5, backoff_factor=2, jitter=0)
+    assert [1, 2, 4, 5, 5] == [policy.interval(polls) for polls in range(1, 6)]
+    assert 5 == policy.interval(10 ** 6)
+
+    jittery = PollingPolicy(initial_interval=1, jitter=0.5)
+    assert all(0.5 <= jittery.interval(1) <= 1.5 for _ in range(100))
+
+
+def test_invalid_policy():
+    with pytest.raises(ValueError):
+        PollingPolicy(initial_interval=0)
+    with pytest.raises(ValueError):
+        PollingPolicy(initial_interval=2, max_interval=1)
+    with pytest.raises(ValueError):
+        PollingPolicy(backoff_factor=0.5)
+    with pytest.raises(ValueError):
+        PollingPolicy(jitter=1)
+
+
+def test_resources_are_yielded_as_they_finish():
+    clock = _Clock()
+    policy = PollingPolicy(initial_interval=1, max_interval=8, backoff_factor=2, jitter=0)
+    slow, fast, instant = _Job(4, clock), _Job(2, clock), _Job(1, clock)
+
+    finished = [job for job, _ in _poll([slow, fast, instant], clock, policy=policy)]
+
+    assert [instant, fast, slow] == finished
+    assert [0, 1, 3, 7] == slow.polled_at
+    assert [0, 1] == fast.polled_at
+    assert [1, 2, 4] == clock.sleeps
+
+
+def test_retryable_errors_count_as_not_done():
+    clock = _Clock()
+    policy = PollingPolicy(initial_interval=1, jitter=0)
+    job = _Job(1, clock, errors=[WorkflowNotReadyException('not ready'),
+                                 requests.exceptions.ConnectionError('reset')])
+
+    assert [(job, True)] == list(_poll([job], clock, policy=policy))
+    assert [0, 1, 2.5] == job.polled_at
+
+
+def test_other_errors_are_raised():
+    clock = _Clock()
+    job = _Job(1, clock, errors=[NotFound('/status')])
+    with pytest.raises(NotFound):
+        list(_poll([job], clock))
+
+
+def test_timeout():
+    clock = _Clock()
+    policy = PollingPolicy(initial_interval=4, max_interval=4, jitter=0)
+    done, stuck = _Job(1, clock), _Job(1, clock, errors=[WorkflowNotReadyException('')] * 10)
+
+    finished = []
+    with pytest.raises(PollingTimeoutException) as e:
+        for job, _ in _poll([stuck, done], clock, policy=policy, timeout=10):
+            finished.append(job)
+
+    assert [done] == finished
+    assert [stuck] == e.value.pending
+    # Polled on schedule, then a last time when the timeout runs out
+    assert [0, 4, 8, 10] == stuck.polled_at
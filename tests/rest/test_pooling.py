@@ -0,0 +1,119 @@
+"""Tests of connection pooling, against a local HTTP server."""
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from time import sleep
+
+import pytest
+
+from citrine import Citrine
+from citrine._rest.pooling import PoolStats, InstrumentedHTTPAdapter
+from citrine._session import Session
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    delay = 0.0
+
+    def do_GET(self):
+        sleep(self.delay)
+        body = json.dumps({'path': self.path}).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    httpd.daemon_threads = True
+    thread = Thread(target=httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+    _Handler.delay = 0.0
+
+
+def _session(server, **kwargs) -> Session:
+    session = Session(refresh_token='12345', scheme='http', host='127.0.0.1',
+                      port=str(server.server_address[1]), **kwargs)
+    session.access_token_expiration = datetime.utcnow() + timedelta(minutes=3)
+    return session
+
+
+def test_connections_are_reused(server):
+    session = _session(server)
+    for _ in range(5):
+        assert session.get_resource('/foo') == {'path': '/api/v1/foo'}
+
+    stats = session.pool_stats.as_dict()
+    assert stats['checkouts'] == 5
+    assert stats['new_connections'] == 1
+    assert stats['in_use'] == 0
+    assert stats['max_in_use'] == 1
+    session.close()
+
+
+def test_no_keep_alive(server):
+    session = _session(server, keep_alive=False)
+    for _ in range(3):
+        session.get_resource('/foo')
+    assert session.pool_stats.new_connections == 3
+    session.close()
+
+
+def test_blocking_pool_waits(server):
+    _Handler.delay = 0.1
+    session = _session(server, pool_maxsize=2, pool_block=True)
+    with ThreadPoolExecutor(6) as executor:
+        results = list(executor.map(lambda _: session.get_resource('/foo'), range(6)))
+
+    assert len(results) == 6
+    stats = session.pool_stats
+    assert stats.max_in_use == 2
+    assert stats.new_connections == 2
+    assert stats.waits > 0
+    assert stats.overflows == 0
+    session.close()
+
+
+def test_non_blocking_pool_overflows(server):
+    _Handler.delay = 0.1
+    session = _session(server, pool_maxsize=1)
+    with ThreadPoolExecutor(4) as executor:
+        list(executor.map(lambda _: session.get_resource('/foo'), range(4)))
+
+    stats = session.pool_stats
+    assert stats.max_in_use > 1
+    assert stats.overflows > 0
+    assert stats.discarded > 0
+    session.close()
+
+
+def test_pool_settings_are_passed_to_adapter():
+    citrine = Citrine('foo', pool_connections=3, pool_maxsize=32, pool_block=True,
+                      transport_retries=2)
+    adapter = citrine.session.get_adapter('https://citrine.io')
+    assert isinstance(adapter, InstrumentedHTTPAdapter)
+    assert adapter._pool_connections == 3
+    assert adapter._pool_maxsize == 32
+    assert adapter._pool_block
+    assert adapter.max_retries.total == 2
+    assert adapter.stats is citrine.session.pool_stats
+    assert citrine.session.headers['Connection'] == 'keep-alive'
+
+
+def test_pool_stats_reset():
+    stats = PoolStats()
+    stats.record_checkout(exhausted=True, blocking=True)
+    stats.record_new_connection()
+    stats.reset()
+    assert set(stats.as_dict().values()) == {0}
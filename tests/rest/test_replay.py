@@ -0,0 +1,155 @@
+"""Tests of recording the traffic of a session and replaying it without the server."""
+import gzip
+import json
+import time
+from urllib.parse import parse_qs, urlsplit
+
+import mock
+import pytest
+
+from citrine import Citrine
+from citrine._rest.replay import (
+    Exchange, RecordingAdapter, TrafficArchive, UnrecordedRequest, recording, replaying,
+    request_key)
+from citrine.resources.dataset import Dataset
+from citrine.resources.material_run import MaterialRun
+from citrine.resources.measurement_run import MeasurementRun
+from citrine.resources.process_run import ProcessRun
+from tests.utils.fake_server import FakeCitrineServer
+
+
+@pytest.fixture
+def recorded(tmp_path):
+    """Record a material history and a page of runs from the fake server, then stop it."""
+    path = str(tmp_path / 'traffic.jsonl.gz')
+    with FakeCitrineServer() as server:
+        citrine = server.client()
+        project = citrine.projects.register('replay')
+        dataset = project.datasets.register(Dataset('data', 'summary', 'description'))
+        process = dataset.process_runs.register(ProcessRun('baking'))
+        cake = dataset.material_runs.register(MaterialRun('cake', process=process))
+        dataset.measurement_runs.register(MeasurementRun('tasting', material=cake))
+        uid = cake.uids['id']
+        port = server.port
+
+        server.latency = 0.05
+        with recording(citrine.session, path) as archive:
+            dataset.material_runs.get_history('id', uid)
+            dataset.material_runs.list(per_page=10)
+        citrine.session.close()
+    assert [exchange.status_code for exchange in archive.exchanges] == [200, 200]
+    # A client of the server that has stopped, so any request it sends fails
+    offline = Citrine(server.api_key, scheme='http', host='127.0.0.1', port=str(port))
+    dataset.session = offline.session
+    return path, offline, dataset, uid
+
+
+def test_replay_offline(recorded):
+    path, citrine, dataset, uid = recorded
+    with replaying(citrine.session, path, time_scale=0) as adapter:
+        for _ in range(3):
+            history = dataset.material_runs.get_history('id', uid)
+            assert history.measurements[0].name == 'tasting'
+        assert [run.name for run in dataset.material_runs.list(per_page=10)] == ['cake']
+
+        with pytest.raises(UnrecordedRequest):
+            dataset.material_runs.list(per_page=11)
+    assert adapter.replayed == 4
+    assert citrine.session.stats()['routes']['GET /projects/{id}/material-history/id/{id}'][
+        'requests'] == 3
+    citrine.session.close()
+
+
+def test_replay_with_original_timing(recorded):
+    path, citrine, dataset, uid = recorded
+    with replaying(citrine.session, path, time_scale=1):
+        start = time.perf_counter()
+        dataset.material_runs.get_history('id', uid)
+        assert time.perf_counter() - start >= 0.05
+    citrine.session.close()
+
+
+def test_archive_holds_no_credentials(recorded):
+    path, citrine, _, _ = recorded
+    with gzip.open(path, 'rt') as f:
+        text = f.read()
+    assert citrine.session.refresh_token not in text
+    assert 'tokens/refresh' not in text
+    header = json.loads(text.splitlines()[0])
+    assert header['exchanges'] == 2
+
+
+def test_pre_signed_urls_are_redacted_and_replayed(tmp_path):
+    path = str(tmp_path / 'traffic.jsonl.gz')
+    with FakeCitrineServer() as server:
+        citrine = server.client()
+        project = citrine.projects.register('replay')
+        table_id = server.add_table(str(project.uid), b'a,b\n1,2\n')
+        with recording(citrine.session) as api, recording(citrine.session.storage) as storage:
+            table = project.tables.get(table_id, 1)
+            table.read(str(tmp_path / 'recorded.csv'))
+        port = server.port
+        citrine.session.close()
+    TrafficArchive(api.exchanges + storage.exchanges).save(path)
+
+    with gzip.open(path, 'rt') as f:
+        text = f.read()
+    [signature] = parse_qs(urlsplit(table.download_url).query)['signature']
+    assert signature not in text
+    assert text.count('signature=REDACTED') == 2
+
+    offline = Citrine(server.api_key, scheme='http', host='127.0.0.1', port=str(port))
+    project.session = offline.session
+    with replaying(offline.session, path, time_scale=0), \
+            replaying(offline.session.storage, path, time_scale=0):
+        project.tables.get(table_id, 1).read(str(tmp_path / 'replayed.csv'))
+    assert b'a,b\n1,2\n' == (tmp_path / 'replayed.csv').read_bytes()
+    offline.session.close()
+
+
+def test_exchanges_round_trip(tmp_path):
+    binary = Exchange('GET', '/storage/file', None, 200, {'Content-Type': 'image/png'},
+                      bytes(range(256)), 0.25)
+    text = Exchange('POST', '/projects', 'abc', 201, {}, 'ünïcode'.encode('utf-8'), 0.5)
+    assert '<Exchange POST /projects 201>' == repr(text)
+    archive = TrafficArchive([binary, text])
+    assert 2 == len(archive)
+    archive.save(str(tmp_path / 'archive'))
+
+    loaded = TrafficArchive.load(str(tmp_path / 'archive')).exchanges
+    assert [vars(exchange) for exchange in loaded] == [vars(binary), vars(text)]
+
+    with gzip.open(str(tmp_path / 'other'), 'wt') as f:
+        f.write('{"format": "something else"}\n')
+    with pytest.raises(ValueError):
+        TrafficArchive.load(str(tmp_path / 'other'))
+
+
+def test_recording_adapter_closes_the_adapter_it_wraps():
+    adapter = mock.Mock()
+    RecordingAdapter(adapter, TrafficArchive()).close()
+    adapter.close.assert_called_once_with()
+
+
+def test_request_key():
+    assert request_key('get', 'https://a.io/api/v1/runs?b=2&a=1') == \
+        request_key('GET', 'http://localhost:8080/api/v1/runs?a=1&b=2')
+    assert request_key('POST', '/runs', b'{}') != request_key('POST', '/runs', b'{"a": 1}')
+    assert request_key('POST', '/runs', '{}') == request_key('POST', '/runs', b'{}')
+    assert request_key('GET', 'https://s3.io/key?X-Amz-Signature=abc&part=1') == \
+        ('GET', '/key?X-Amz-Signature=REDACTED&part=1', None)
+
+
+def test_replay_without_matching_bodies():
+    archive = TrafficArchive([Exchange('POST', '/api/v1/runs', 'digest', 200, {}, b'{}', 0)])
+    with pytest.raises(ValueError):
+        replaying(None, archive, time_scale=-1).__enter__()
+
+    with FakeCitrineServer() as server:
+        citrine = server.client()
+    with replaying(citrine.session, archive, time_scale=0, match_body=False):
+        assert citrine.session.post_resource('runs', json={'new': 'uid'}) == {}
+    with replaying(citrine.session, archive, time_scale=0):
+        with pytest.raises(UnrecordedRequest):
+            citrine.session.post_resource('runs', json={'new': 'uid'})
+    citrine.session.close()
@@ -0,0 +1,111 @@
+"""Tests of the retry policy and retry counters."""
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import mock
+import pytest
+import requests
+
+from citrine._rest.retry import RetryPolicy, RetryStats
+
+
+def _response(status_code: int, retry_after: str = None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    if retry_after is not None:
+        response.headers['Retry-After'] = retry_after
+    return response
+
+
+def test_rejected_statuses_are_retried_for_every_method():
+    policy = RetryPolicy()
+    for status in (425, 429, 503):
+        assert policy.should_retry('POST', 0, response=_response(status))
+        assert policy.should_retry('GET', 0, response=_response(status))
+
+
+def test_ambiguous_statuses_are_only_retried_for_idempotent_methods():
+    policy = RetryPolicy()
+    for status in (502, 504):
+        assert policy.should_retry('GET', 0, response=_response(status))
+        assert policy.should_retry('delete', 0, response=_response(status))
+        assert not policy.should_retry('POST', 0, response=_response(status))
+
+
+def test_connection_errors():
+    error = requests.exceptions.ConnectionError('reset')
+    assert RetryPolicy().should_retry('GET', 0, error=error)
+    assert not RetryPolicy().should_retry('POST', 0, error=error)
+    assert not RetryPolicy(retry_connection_errors=False).should_retry('GET', 0, error=error)
+
+
+def test_non_retryable_statuses():
+    policy = RetryPolicy()
+    for status in (200, 400, 401, 404, 409, 500):
+        assert not policy.should_retry('GET', 0, response=_response(status))
+
+
+def test_max_retries():
+    policy = RetryPolicy(max_retries=2)
+    assert policy.should_retry('GET', 1, response=_response(429))
+    assert not policy.should_retry('GET', 2, response=_response(429))
+    assert not RetryPolicy.none().should_retry('GET', 0, response=_response(429))
+    with pytest.raises(ValueError):
+        RetryPolicy(max_retries=-1)
+
+
+def test_exponential_backoff_without_jitter():
+    policy = RetryPolicy(backoff_factor=0.5, max_backoff=3.0, jitter=False)
+    assert [policy.backoff(attempt) for attempt in range(4)] == [0.5, 1.0, 2.0, 3.0]
+
+
+def test_backoff_with_jitter():
+    policy = RetryPolicy(backoff_factor=1.0)
+    with mock.patch('citrine._rest.retry.random.uniform', return_value=0.25) as uniform:
+        assert policy.backoff(2) == 0.25
+    uniform.assert_called_once_with(0, 4.0)
+
+
+def test_retry_after_seconds():
+    policy = RetryPolicy(backoff_factor=0.1, max_backoff=10.0, jitter=False)
+    assert policy.backoff(0, _response(429, '7')) == 7.0
+    assert policy.backoff(0, _response(429, '60')) == 10.0
+    assert policy.backoff(0, _response(429, 'garbage')) == 0.1
+    assert RetryPolicy(backoff_factor=0.1, jitter=False, respect_retry_after=False)\
+        .backoff(0, _response(429, '7')) == 0.1
+
+
+def test_retry_after_http_date():
+    policy = RetryPolicy(backoff_factor=0.1, max_backoff=100.0, jitter=False)
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    delay = policy.backoff(0, _response(503, format_datetime(retry_at, usegmt=True)))
+    assert 25 < delay <= 30
+
+    # A date without a time zone is taken to be in UTC
+    naive = format_datetime(retry_at.replace(tzinfo=None) + timedelta(seconds=30))
+    assert naive.endswith('-0000')
+    assert 55 < policy.backoff(0, _response(503, naive)) <= 60
+
+
+def test_retry_after_is_ignored_without_headers():
+    policy = RetryPolicy(backoff_factor=0.1, jitter=False)
+    assert policy.backoff(0, object()) == 0.1
+    assert policy.backoff(0, mock.Mock(headers={'Retry-After': 7})) == 0.1
+
+
+def test_retry_stats():
+    stats = RetryStats()
+    stats.record_retry('429')
+    stats.record_retry('429')
+    stats.record_retry('ConnectionError')
+    stats.record_outcome(succeeded=True)
+    stats.record_outcome(succeeded=False)
+    assert stats.as_dict() == {
+        'retries': 3,
+        'retries_by_reason': {'429': 2, 'ConnectionError': 1},
+        'succeeded_after_retry': 1,
+        'failed_after_retry': 1
+    }
+    stats.reset()
+    assert stats.retries == 0
+    assert stats.as_dict()['retries_by_reason'] == {}
@@ -0,0 +1,83 @@
+"""Tests of the pooled transport for storage downloads, against a local HTTP server."""
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from time import sleep
+
+import pytest
+from requests.exceptions import Timeout
+
+from citrine import Citrine
+from citrine._rest.download import download_to_file
+from citrine._rest.storage import StorageTransport, storage_transport
+from citrine._session import Session
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    delay = 0.0
+    headers_seen = []
+
+    def do_GET(self):
+        _Handler.headers_seen.append(dict(self.headers))
+        sleep(self.delay)
+        body = self.path.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except BrokenPipeError:
+            pass  # The client timed out
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    httpd.daemon_threads = True
+    thread = Thread(target=httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield 'http://127.0.0.1:{}'.format(httpd.server_address[1])
+    httpd.shutdown()
+    httpd.server_close()
+    _Handler.delay = 0.0
+    _Handler.headers_seen = []
+
+
+def test_downloads_reuse_connections_without_credentials(server_url, tmp_path):
+    session = Session(refresh_token='12345')
+    session.access_token = 'secret'
+    for index in range(5):
+        path = '/bucket/file{}?signature=abc'.format(index)
+        download_to_file(server_url + path, str(tmp_path / 'file{}'.format(index)),
+                         http=storage_transport(session))
+        assert path.encode('utf-8') == (tmp_path / 'file{}'.format(index)).read_bytes()
+
+    stats = session.storage.pool_stats.as_dict()
+    assert 5 == stats['checkouts']
+    assert 1 == stats['new_connections']
+    assert 0 == session.pool_stats.as_dict()['checkouts']
+    assert all('Authorization' not in headers for headers in _Handler.headers_seen)
+    assert all('Content-Type' not in headers for headers in _Handler.headers_seen)
+    session.close()
+
+
+def test_default_timeout(server_url, tmp_path):
+    _Handler.delay = 0.5
+    transport = StorageTransport(timeout=0.1)
+    with pytest.raises(Timeout):
+        download_to_file(server_url + '/slow', str(tmp_path / 'slow'), max_resumes=0,
+                         http=transport)
+    # An explicit timeout takes precedence
+    assert b'/slow' == transport.get(server_url + '/slow', timeout=5).content
+
+
+def test_storage_transport_of_a_session():
+    storage = StorageTransport(pool_maxsize=2)
+    client = Citrine('12345', storage=storage)
+    assert storage_transport(client.session) is storage
+    # Sessions without one share a transport
+    assert storage_transport(None) is storage_transport(object())
+    assert isinstance(storage_transport(None), StorageTransport)
@@ -1,4 +1,6 @@
 """Tests of the Material Run schema."""
+from uuid import uuid4
+
 from citrine.resources.material_run import MaterialRun
 from citrine.resources.material_spec import MaterialSpec
 from citrine.resources.measurement_spec import MeasurementSpec
@@ -140,3 +142,107 @@ def test_measurement_material_connection_rehydration():
     assert isinstance(copy_ingredient.material.measurements[0].spec, MeasurementSpec), \
         "copy of ending_mat should have a process with an ingredient derived from a material " \
         "that has one measurement that has a spec"
+
+
+def test_build_from_json_matches_round_trip():
+    """Building a server dict directly should give the same object as the taurus round trip."""
+    from copy import deepcopy
+    from citrine._utils.graph import collect_graph
+    from citrine.resources.data_concepts import DataConcepts
+    from tests.utils.factories import make_history
+
+    for obj in collect_graph([make_history()]):
+        data = obj.dump()
+        original = deepcopy(data)
+        klass = DataConcepts.get_type(data)
+        built = klass.build(data)
+        assert built.dump() == klass._build_round_trip(data).dump()
+        assert type(built) == type(obj)
+        assert data == original, "build should not modify its input"
+
+
+def test_build_falls_back_for_taurus_objects():
+    """A dict holding taurus objects is not JSON, so it goes through the round trip."""
+    data = MaterialRunDataFactory(name='flour')
+    data['process'] = TaurusProcessRun('mixing', uids={'custom': 'mixing'})
+    material_run = MaterialRun.build(data)
+    assert isinstance(material_run.process, ProcessRun)
+    assert 'mixing' == material_run.process.uids['custom']
+
+
+def test_build_links_either_way():
+    """A link builds into a LinkByUID whether or not it is given as JSON."""
+    for data in (LinkByUID('id', 'flour'), {'type': LinkByUID.typ, 'scope': 'id', 'id': 'flour'}):
+        link = MaterialRun.build(data)
+        assert isinstance(link, LinkByUID)
+        assert ('id', 'flour') == (link.scope, link.id)
+
+
+def test_build_shares_objects_with_the_same_uid():
+    """Objects referred to more than once in one call to build are only built once."""
+    from citrine.attributes.property import Property
+    from citrine.resources.property_template import PropertyTemplate
+    from taurus.entity.bounds.real_bounds import RealBounds
+
+    template = PropertyTemplate('density', uids={'id': str(uuid4())},
+                                bounds=RealBounds(0, 10, 'g/cm^3'))
+    measurement = MeasurementRun('weighing', properties=[
+        Property('density', template=template), Property('mass density', template=template)])
+    data = measurement.dump()
+
+    first, second = [prop.template for prop in MeasurementRun.build(data).properties]
+    assert isinstance(first, PropertyTemplate)
+    assert first is second
+    assert first is not MeasurementRun.build(data).properties[0].template
+
+
+def test_build_shares_equal_strings():
+    """Strings repeated within one call to build are only kept once."""
+    from citrine.attributes.property import Property
+
+    template = LinkByUID('id', str(uuid4()))
+    data = MeasurementRun('weighing', properties=[
+        Property('density', origin='measured', template=template),
+        Property('mass density', origin='measured', template=template)]).dump()
+    # As if each had been decoded separately from a response
+    for prop in data['properties']:
+        prop['origin'] = ''.join(prop['origin'])
+        prop['template'] = dict(prop['template'], id=''.join(prop['template']['id']))
+
+    first, second = MeasurementRun.build(data).properties
+    assert first.origin is second.origin
+    assert isinstance(first.template, LinkByUID)
+    assert first.template is not second.template
+    assert first.template.id is second.template.id
+
+
+def test_build_shares_objects_within_an_enclosing_pass():
+    """Nested passes share the objects built in the outermost one."""
+    from citrine.resources.data_concepts import _identity_map
+
+    spec = MaterialSpec('flour spec', uids={'id': str(uuid4())}).dump()
+    session = object()
+    with _identity_map():
+        first = MaterialRun.build(MaterialRunDataFactory(spec=spec))
+        with _identity_map():
+            second = MaterialRun.build(MaterialRunDataFactory(spec=spec))
+            built_spec = MaterialSpec.build(spec, session)
+
+    assert first.spec is second.spec
+    assert first.spec is built_spec
+    assert session is built_spec.session
+    assert first.spec is not MaterialRun.build(MaterialRunDataFactory(spec=spec)).spec
+
+
+def test_child_objects_are_bound_to_a_given_session():
+    """Children are bound to the session they are built with, and left alone without one."""
+    spec_data = MaterialSpec('flour spec', uids={'id': str(uuid4())}).dump()
+    session = object()
+
+    data = {'spec': spec_data}
+    MaterialRun._build_child_objects(data, data, session)
+    assert session is data['spec'].session
+
+    data = {'spec': spec_data}
+    MaterialRun._build_child_objects(data, data)
+    assert data['spec'].session is None
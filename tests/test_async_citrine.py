@@ -0,0 +1,429 @@
+import asyncio
+import json
+from datetime import datetime, timedelta
+from uuid import UUID, uuid4
+
+import aiohttp
+import jwt
+import mock
+import pytest
+import requests_mock
+from taurus.entity.bounds.real_bounds import RealBounds
+from taurus.entity.link_by_uid import LinkByUID
+
+from citrine import AsyncCitrine
+from citrine._async_session import AsyncSession, _AsyncResponse, _encode_params
+from citrine._rest.async_collection import AsyncCollection, AsyncDataConceptsCollection
+from citrine._rest.cache import ObjectCache
+from citrine._rest.retry import RetryPolicy
+from citrine.exceptions import (
+    NotFound, ModuleRegistrationFailedException, Unauthorized, UnauthorizedRefreshToken)
+from citrine.resources.material_run import MaterialRunCollection
+from citrine.resources.project import Project
+from citrine.resources.workflow_executions import WorkflowExecution
+from tests.utils.factories import MaterialRunDataFactory, MaterialRunFactory, ProjectDataFactory
+from tests.utils.fake_server import FakeCitrineServer
+
+
+class FakeSend:
+    """Stands in for AsyncSession._send, replying to each request with the next response."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    async def __call__(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+def reply(status_code: int = 200, body=None, headers=None) -> _AsyncResponse:
+    return _AsyncResponse(status_code, headers or {}, json.dumps(body).encode('utf-8'))
+
+
+def access_token(lifetime: timedelta = timedelta(hours=1)) -> str:
+    expiration = datetime.utcnow() + lifetime
+    return jwt.encode(payload={'exp': expiration.timestamp()}, key='garbage').decode('utf-8')
+
+
+@pytest.fixture
+def client():
+    client = AsyncCitrine('12345', scheme='http', host='citrine-testing.fake',
+                          retry_policy=RetryPolicy(jitter=False, backoff_factor=0))
+    client.session.proactive_refresh = False
+    client.session.access_token = 'token'
+    client.session.access_token_expiration = datetime.utcnow() + timedelta(minutes=3)
+    yield client
+    run(client.close())
+
+
+@pytest.fixture
+def runs(client) -> MaterialRunCollection:
+    return MaterialRunCollection(
+        project_id=UUID('6b608f78-e341-422c-8076-35adc8828545'),
+        dataset_id=UUID('8da51e93-8b55-4dd3-8489-af8f65d4ad9a'),
+        session=client.session
+    )
+
+
+def run(coroutine):
+    """Run a coroutine on a new event loop, as asyncio.run does from Python 3.7."""
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+
+
+async def collect(iterator) -> list:
+    elements = []
+    async for element in iterator:
+        elements.append(element)
+    return elements
+
+
+def test_async_session_requires_aiohttp(client):
+    with mock.patch.dict('sys.modules', {'aiohttp': None}):
+        with pytest.raises(ImportError, match=r'citrine\[async\]'):
+            AsyncSession(client.session)
+
+
+def test_collection_dispatch(client, runs):
+    assert isinstance(client.projects, AsyncCollection)
+    assert client.projects.collection.session is client.session
+    assert isinstance(client.users, AsyncCollection)
+    assert isinstance(client.collection(runs), AsyncDataConceptsCollection)
+
+
+def test_get_project(client):
+    project_data = ProjectDataFactory()
+    send = client.async_session._send = FakeSend(reply(body={'project': project_data}))
+
+    project = run(client.projects.get(project_data['id']))
+
+    assert isinstance(project, Project)
+    assert project.session is client.session
+    method, url, kwargs = send.calls[0]
+    assert 'GET' == method
+    assert url.endswith('/api/v1/projects/{}'.format(project_data['id']))
+    assert {'Authorization': 'Bearer token'} == kwargs['headers']
+
+
+def test_list_projects(client):
+    projects = [ProjectDataFactory(), ProjectDataFactory()]
+    send = client.async_session._send = FakeSend(reply(body={'projects': projects}))
+
+    listed = run(collect(client.projects.list(page=2, per_page=10)))
+
+    assert [p['name'] for p in projects] == [p.name for p in listed]
+    assert [('page', 2), ('per_page', 10)] == send.calls[0][2]['params']
+
+
+def test_register_failure_is_wrapped(client):
+    client.async_session._send = FakeSend(reply(400, {'message': 'bad'}))
+    project = Project('foo', session=client.session)
+
+    with pytest.raises(ModuleRegistrationFailedException):
+        run(client.projects.register(project))
+
+
+def test_get_not_found(client):
+    client.async_session._send = FakeSend(reply(404, {}))
+
+    with pytest.raises(NotFound):
+        run(client.projects.get(uuid4()))
+
+
+def test_data_concepts(client, runs):
+    run_data = MaterialRunDataFactory(name='Cake')
+    send = client.async_session._send = FakeSend(
+        reply(body=run_data),
+        reply(body=run_data),
+        reply(body={'contents': [run_data]}),
+        reply(body={'contents': [run_data]}),
+        reply(body={}))
+    async_runs = client.collection(runs)
+
+    async def exercise():
+        registered = await async_runs.register(MaterialRunFactory())
+        fetched = await async_runs.get(run_data['uids']['id'])
+        tagged = await collect(async_runs.filter_by_tags(['color'], per_page=5))
+        named = await collect(async_runs.filter_by_name('Cake', exact=True))
+        await async_runs.delete(run_data['uids']['id'])
+        return registered, fetched, tagged, named
+
+    registered, fetched, tagged, named = run(exercise())
+
+    assert ['Cake'] * 4 == [registered.name, fetched.name, tagged[0].name, named[0].name]
+    assert ['POST', 'GET', 'GET', 'GET', 'DELETE'] == [call[0] for call in send.calls]
+    assert ('tags', 'color') in send.calls[2][2]['params']
+    assert ('exact', 'True') in send.calls[3][2]['params']
+    assert send.calls[4][1].endswith('/material-runs/id/{}'.format(run_data['uids']['id']))
+
+
+def test_data_concepts_requires_dataset(client, runs):
+    runs.dataset_id = None
+    with pytest.raises(RuntimeError):
+        run(client.collection(runs).get(uuid4()))
+
+
+def test_execution_status(client):
+    execution = WorkflowExecution(uid=uuid4(), project_id=uuid4(), workflow_id=uuid4(),
+                                  session=client.session)
+    send = client.async_session._send = FakeSend(reply(body={'status': 'Succeeded'}),
+                                                 reply(body={'results': 1}))
+    async_execution = client.execution(execution)
+    assert "<AsyncWorkflowExecution '{}'>".format(execution.uid) == str(async_execution)
+
+    status = run(async_execution.status())
+
+    assert status.succeeded
+    assert {'results': 1} == run(async_execution.results())
+    assert send.calls[0][1].endswith('/executions/{}/status'.format(execution.uid))
+
+
+def test_retries_transient_failures(client):
+    client.async_session._send = FakeSend(
+        reply(503, {}),
+        aiohttp.ClientConnectionError(),
+        reply(body={'project': ProjectDataFactory(name='retried')}))
+
+    assert 'retried' == run(client.projects.get(uuid4())).name
+    assert {'503': 1, 'ClientConnectionError': 1} == \
+        client.session.retry_stats.as_dict()['retries_by_reason']
+
+
+def test_stats_include_async_requests(client):
+    client.async_session._send = FakeSend(
+        aiohttp.ClientConnectionError(),
+        reply(body={'project': ProjectDataFactory()}))
+    run(client.projects.get(uuid4()))
+
+    route = client.session.stats()['routes']['GET /projects/{id}']
+    assert route['requests'] == 2
+    assert route['errors'] == 1
+    assert route['retries'] == 1
+    assert route['statuses'] == {200: 1}
+    assert route['response_bytes'] > 0
+
+
+TOKEN_URL = 'http://citrine-testing.fake/api/v1/tokens/refresh'
+
+
+def test_refreshes_expired_token_once(client):
+    client.session.access_token_expiration = datetime.utcnow() - timedelta(minutes=1)
+    new_token = access_token()
+    projects = [ProjectDataFactory() for _ in range(5)]
+    send = client.async_session._send = FakeSend(
+        *(reply(body={'project': project}) for project in projects))
+
+    async def fetch_all():
+        return await asyncio.gather(*(client.projects.get(p['id']) for p in projects))
+
+    with requests_mock.Mocker() as m:
+        m.post(TOKEN_URL, json={'access_token': new_token})
+        run(fetch_all())
+
+    assert 1 == m.call_count
+    assert client.session.access_token == new_token
+    assert {'Authorization': 'Bearer ' + new_token} == send.calls[-1][2]['headers']
+    assert 1 == client.session.stats()['token_refreshes']['count']
+
+
+def test_refreshes_rejected_token(client):
+    new_token = access_token()
+    client.async_session._send = FakeSend(
+        reply(401, {'reason': 'invalid-token'}),
+        reply(body={'project': ProjectDataFactory()}))
+
+    with requests_mock.Mocker() as m:
+        m.post(TOKEN_URL, json={'access_token': new_token})
+        run(client.projects.get(uuid4()))
+
+    assert client.session.access_token == new_token
+
+
+def test_refresh_waits_for_the_session(client):
+    """A refresh needed by a task waits for one already being made by the session."""
+    client.session.access_token_expiration = datetime.utcnow() - timedelta(minutes=1)
+    new_token = access_token()
+    client.async_session._send = FakeSend(reply(body={'project': ProjectDataFactory()}))
+
+    with requests_mock.Mocker() as m:
+        m.post(TOKEN_URL, json={'access_token': access_token()})
+        client.session._token_lock.acquire()
+        try:
+            async def fetch():
+                request = asyncio.ensure_future(client.projects.get(uuid4()))
+                await asyncio.sleep(0.05)
+                assert not request.done()
+                # Refreshed as if by the timer of the session, while the task waited
+                client.session._set_access_token(new_token)
+                client.session._token_lock.release()
+                return await request
+            run(fetch())
+        finally:
+            if client.session._token_lock.locked():
+                client.session._token_lock.release()
+
+    assert 0 == m.call_count
+    assert client.session.access_token == new_token
+
+
+def test_refresh_failure(client):
+    client.session.access_token_expiration = datetime.utcnow() - timedelta(minutes=1)
+
+    with requests_mock.Mocker() as m:
+        m.post(TOKEN_URL, status_code=401, json={})
+        with pytest.raises(UnauthorizedRefreshToken):
+            run(client.projects.get(uuid4()))
+
+
+def test_unauthorized_without_json_body(client):
+    client.async_session._send = FakeSend(_AsyncResponse(401, {}, b'<html>no</html>'))
+
+    with pytest.raises(Unauthorized):
+        run(client.projects.get(uuid4()))
+
+
+def test_connection_errors(client):
+    client.async_session._send = FakeSend(*(aiohttp.ClientConnectionError() for _ in range(4)))
+
+    with pytest.raises(aiohttp.ClientConnectionError):
+        run(client.projects.get(uuid4()))
+    assert {'retries': 3, 'retries_by_reason': {'ClientConnectionError': 3},
+            'succeeded_after_retry': 0, 'failed_after_retry': 1} == \
+        client.session.retry_stats.as_dict()
+
+    client.async_session._send = FakeSend(aiohttp.ClientConnectionError())
+    with pytest.raises(aiohttp.ClientConnectionError):
+        run(client.async_session.get_resource('projects', retry_policy=RetryPolicy.none()))
+
+
+def test_requests_without_hooks(client):
+    client.session.request_hooks = []
+    client.async_session._send = FakeSend(reply(body={'project': ProjectDataFactory(name='a')}))
+
+    assert 'a' == run(client.projects.get(uuid4())).name
+
+
+def test_encode_params():
+    assert [('tags', 'a'), ('tags', 'b'), ('exact', 'False'), ('page', 1), ('x', 'y')] == \
+        _encode_params({'tags': ['a', 'b'], 'exact': False, 'page': 1, 'none': None, 'x': 'y'})
+
+
+def test_context_manager_closes_connections(client):
+    async def use():
+        async with client as entered:
+            assert entered is client
+            # Opening the client session requires a running event loop
+            client_session = client.async_session._get_client_session()
+        return client_session
+
+    assert run(use()).closed
+
+
+def test_used_from_several_event_loops(client):
+    async def open_connections():
+        return client.async_session._get_client_session()
+
+    first = run(open_connections())
+    second = run(open_connections())
+
+    assert first is not second
+    assert first.closed
+    assert not second.closed
+
+
+def test_cached_get(client, runs):
+    client.session.object_cache = ObjectCache()
+    project_data = ProjectDataFactory()
+    run_data = MaterialRunDataFactory()
+    send = client.async_session._send = FakeSend(reply(body={'project': project_data}),
+                                                 reply(body=run_data))
+    async_runs = client.collection(runs)
+
+    async def get_twice():
+        projects, runs = [], []
+        for _ in range(2):
+            projects.append(await client.projects.get(project_data['id']))
+            runs.append(await async_runs.get(run_data['uids']['id']))
+        return projects, runs
+
+    projects, runs = run(get_twice())
+
+    assert projects[0] is projects[1]
+    assert runs[0] is runs[1]
+    assert 2 == len(send.calls)
+
+
+def test_update_and_delete(client):
+    client.session.object_cache = ObjectCache()
+    project_data = ProjectDataFactory(name='before')
+    send = client.async_session._send = FakeSend(
+        reply(body={'project': project_data}),
+        reply(body={'project': dict(project_data, name='after')}),
+        reply(body={'project': dict(project_data, name='after')}),
+        reply(body={'deleted': True}))
+
+    async def exercise():
+        project = await client.projects.get(project_data['id'])
+        project.name = 'after'
+        updated = await client.projects.update(project)
+        fetched = await client.projects.get(project_data['id'])
+        deleted = await client.projects.delete(project_data['id'])
+        return updated, fetched, deleted
+
+    updated, fetched, deleted = run(exercise())
+
+    assert 'after' == updated.name == fetched.name
+    assert {'deleted': True} == deleted.body
+    assert ['GET', 'PUT', 'GET', 'DELETE'] == [call[0] for call in send.calls]
+
+
+def test_register(client):
+    project_data = ProjectDataFactory()
+    client.async_session._send = FakeSend(reply(body={'project': project_data}))
+
+    registered = run(client.projects.register(Project('foo', session=client.session)))
+
+    assert project_data['name'] == registered.name
+
+
+def test_list_and_filter_by_attribute_bounds(client, runs):
+    run_data = MaterialRunDataFactory()
+    send = client.async_session._send = FakeSend(reply(body={'contents': [run_data]}),
+                                                 reply(body={'contents': [run_data]}))
+    async_runs = client.collection(runs)
+    template = LinkByUID('id', str(uuid4()))
+
+    async def exercise():
+        listed = await collect(async_runs.list(per_page=2))
+        bounded = await collect(async_runs.filter_by_attribute_bounds(
+            {template: RealBounds(0, 1, 'm')}, page=1))
+        return listed, bounded
+
+    listed, bounded = run(exercise())
+
+    assert [run_data['name']] * 2 == [listed[0].name, bounded[0].name]
+    assert ['GET', 'POST'] == [call[0] for call in send.calls]
+    assert send.calls[1][1].endswith('/material-runs/filter-by-attribute-bounds')
+    assert template.id in json.dumps(send.calls[1][2]['json'])
+
+
+def test_against_a_server():
+    with FakeCitrineServer() as server:
+        session = server.client().session
+        session.post_resource('projects', json={'name': 'served'})
+
+        async def list_projects():
+            async with AsyncSession(session) as async_session:
+                return await async_session.get_resource('projects')
+
+        assert ['served'] == [p['name'] for p in run(list_projects())['projects']]
+        session.close()
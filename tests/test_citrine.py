@@ -1,4 +1,6 @@
 from citrine import Citrine
+from citrine._rest.cache import ObjectCache
+from citrine._rest.retry import RetryPolicy
 
 
 def test_citrine_creation():
@@ -13,3 +15,15 @@ def test_citrine_project_session():
 def test_citrine_user_session():
     citrine = Citrine('foo')
     assert citrine.session == citrine.users.session
+
+
+def test_citrine_retry_policy():
+    policy = RetryPolicy(max_retries=7)
+    assert Citrine('foo', retry_policy=policy).session.retry_policy is policy
+    assert Citrine('foo').session.retry_policy.max_retries == 3
+
+
+def test_citrine_object_cache():
+    cache = ObjectCache(max_size=10)
+    assert Citrine('foo', object_cache=cache).session.object_cache is cache
+    assert Citrine('foo').session.object_cache is None
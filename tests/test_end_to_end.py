@@ -0,0 +1,178 @@
+"""Tests of the client against the local fake API server, over real HTTP."""
+from uuid import uuid4
+
+import pytest
+from taurus.entity.bounds.real_bounds import RealBounds
+from taurus.entity.value.nominal_real import NominalReal
+
+from citrine._rest.retry import RetryPolicy
+from citrine.attributes.property import Property
+from citrine.exceptions import NotFound, ServiceUnavailable
+from citrine.informatics.design_spaces import ProductDesignSpace
+from citrine.informatics.workflows import DesignWorkflow
+from citrine.resources.dataset import Dataset
+from citrine.resources.ingredient_run import IngredientRun
+from citrine.resources.material_run import MaterialRun
+from citrine.resources.measurement_run import MeasurementRun
+from citrine.resources.process_run import ProcessRun
+from citrine.resources.property_template import PropertyTemplate
+from tests.utils.factories import MLIScoreFactory
+from tests.utils.fake_server import FakeCitrineServer
+
+
+@pytest.fixture
+def server():
+    with FakeCitrineServer() as server:
+        yield server
+
+
+@pytest.fixture
+def client(server):
+    client = server.client(retry_policy=RetryPolicy(backoff_factor=0, jitter=False))
+    yield client
+    client.session.close()
+
+
+@pytest.fixture
+def project(client):
+    return client.projects.register('end to end', 'a project on the fake server')
+
+
+@pytest.fixture
+def dataset(project):
+    return project.datasets.register(Dataset('data', 'summary', 'description'))
+
+
+def test_projects_and_datasets(client, project, dataset):
+    assert client.projects.get(project.uid).name == 'end to end'
+    assert [p.uid for p in client.projects.list()] == [project.uid]
+    assert [d.uid for d in project.datasets.list()] == [dataset.uid]
+    assert project.datasets.get(dataset.uid).name == 'data'
+
+
+def test_data_concepts(project, dataset):
+    process = dataset.process_runs.register(ProcessRun('mixing', tags=['batch::1']))
+    material = dataset.material_runs.register(MaterialRun('cake', process=process))
+    dataset.material_runs.register_all(MaterialRun('cookie {}'.format(i)) for i in range(30))
+
+    assert dataset.material_runs.get(material.uids['id']).name == 'cake'
+    assert len(list(dataset.material_runs.list_all(per_page=7))) == 31
+    assert len(dataset.material_runs.list(page=2, per_page=20)) == 11
+    assert [run.name for run in project.process_runs.filter_by_tags(['batch::1'])] == ['mixing']
+    assert len(dataset.material_runs.filter_by_name('COOKIE')) == 20
+    assert len(list(dataset.material_runs.filter_by_name_all('cookie 1', exact=True))) == 1
+
+    dataset.material_runs.delete(material.uids['id'])
+    with pytest.raises(NotFound):
+        dataset.material_runs.get(material.uids['id'])
+
+
+def test_server_caps_page_size(server, dataset):
+    server.max_per_page = 10
+    dataset.material_runs.register_all(MaterialRun('run {}'.format(i)) for i in range(25))
+
+    assert len(list(dataset.material_runs.list_all(per_page=100))) == 25
+    assert len(list(dataset.material_runs.filter_by_name_all('run', read_ahead=0))) == 25
+    assert len(dataset.material_runs.list(per_page=100)) == 10
+
+
+def test_filter_by_attribute_bounds(project, dataset):
+    template = dataset.property_templates.register(
+        PropertyTemplate('density', bounds=RealBounds(0, 100, 'g/cm^3')))
+    for density in (1.0, 5.0, 50.0):
+        dataset.measurement_runs.register(MeasurementRun('density {}'.format(density), properties=[
+            Property('density', value=NominalReal(density, 'g/cm^3'), template=template)]))
+
+    found = dataset.measurement_runs.filter_by_attribute_bounds(
+        {template: RealBounds(0, 10, 'g/cm^3')})
+    assert sorted(run.name for run in found) == ['density 1.0', 'density 5.0']
+
+
+def test_material_history(dataset):
+    flour = dataset.material_runs.register(
+        MaterialRun('flour', process=dataset.process_runs.register(ProcessRun('milling'))))
+    baking = dataset.process_runs.register(ProcessRun('baking'))
+    dataset.ingredient_runs.register(IngredientRun('flour', material=flour, process=baking))
+    cake = dataset.material_runs.register(MaterialRun('cake', process=baking))
+    dataset.measurement_runs.register(MeasurementRun('tasting', material=cake))
+
+    history = dataset.material_runs.get_history('id', cake.uids['id'])
+    assert history.process.name == 'baking'
+    assert [measurement.name for measurement in history.measurements] == ['tasting']
+    [ingredient] = history.process.ingredients
+    assert ingredient.material.process.name == 'milling'
+
+
+def test_files_and_tables(server, project, dataset, tmp_path):
+    source = tmp_path / 'source.txt'
+    source.write_bytes(b'x' * 10000)
+    with server.fake_s3():
+        link = dataset.files.upload(str(source), 'uploaded.txt')
+    assert [file.filename for file in dataset.files.list()] == ['uploaded.txt']
+
+    dataset.files.download(link, str(tmp_path / 'downloaded.txt'))
+    assert (tmp_path / 'downloaded.txt').read_bytes() == b'x' * 10000
+
+    table_id = server.add_table(str(project.uid), b'a,b\n1,2\n')
+    project.tables.get(table_id, 1).read(str(tmp_path / 'table.csv'))
+    assert (tmp_path / 'table.csv').read_bytes() == b'a,b\n1,2\n'
+
+
+def test_modules_workflows_and_executions(server, project):
+    server.execution_polls = 1
+    design_space = project.design_spaces.register(
+        ProductDesignSpace('design space', 'for testing', dimensions=[]))
+    assert project.design_spaces.get(design_space.uid).name == 'design space'
+
+    workflow = project.workflows.register(DesignWorkflow(
+        'workflow', design_space.uid, uuid4(), uuid4(), project_id=project.uid))
+    assert [w.uid for w in project.workflows.list()] == [workflow.uid]
+
+    execution = workflow.executions.trigger(MLIScoreFactory())
+    assert execution.status().in_progress
+    assert execution.status().succeeded
+    assert execution.results()['execution_id'] == str(execution.uid)
+
+
+def test_errors_are_retried(server, client, project):
+    server.fail_next(2)
+    assert client.projects.get(project.uid).uid == project.uid
+
+    stats = client.session.stats()
+    assert stats['retries'] == 2
+    assert stats['statuses'] == {200: 2, 503: 2}
+    assert server.requests['GET /projects/{id}'] == 3
+
+    server.fail_next(4, status=502)
+    with pytest.raises(ServiceUnavailable):
+        client.projects.get(project.uid)
+
+
+def test_random_errors_are_reproducible():
+    def failures(seed):
+        with FakeCitrineServer(error_rate=0.5, seed=seed) as server:
+            client = server.client(retry_policy=RetryPolicy.none())
+            outcomes = []
+            for _ in range(10):
+                try:
+                    client.projects.register('project')
+                    outcomes.append(True)
+                except ServiceUnavailable:
+                    outcomes.append(False)
+            client.session.close()
+            return outcomes
+
+    assert failures(7) == failures(7)
+    assert not all(failures(7))
+
+
+def test_rejected_tokens_are_refreshed(server, client, project):
+    server.expire_tokens()
+    assert client.projects.get(project.uid).uid == project.uid
+    assert client.session.stats()['token_refreshes']['count'] == 2
+
+
+def test_latency(client, server, project):
+    server.latency = 0.05
+    client.projects.get(project.uid)
+    assert client.session.stats()['routes']['GET /projects/{id}']['latency']['min'] >= 0.05
@@ -0,0 +1,50 @@
+"""Guards on what importing the package costs, measured in a fresh interpreter."""
+import json
+import os
+import subprocess
+import sys
+
+from citrine._session import Session, default_session
+
+# Dependencies that are only needed once a request is made, a token is issued, a datetime
+# is (de)serialized or a file is uploaded.
+DEFERRED_MODULES = ('boto3', 'botocore', 'arrow', 'jwt')
+
+_PROBE = """
+import json, sys
+import requests
+sessions = []
+original_init = requests.Session.__init__
+def counting_init(self, *args, **kwargs):
+    sessions.append(type(self).__name__)
+    original_init(self, *args, **kwargs)
+requests.Session.__init__ = counting_init
+import citrine
+print(json.dumps({'sessions': sessions, 'modules': sorted(sys.modules)}))
+"""
+
+
+def _import_in_fresh_interpreter() -> dict:
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    output = subprocess.check_output([sys.executable, '-c', _PROBE], env=env)
+    return json.loads(output.decode())
+
+
+def test_import_is_cheap():
+    """Importing citrine makes no sessions and does not import heavy dependencies."""
+    probe = _import_in_fresh_interpreter()
+    assert probe['sessions'] == []
+    imported = {name.split('.')[0] for name in probe['modules']}
+    assert imported.isdisjoint(DEFERRED_MODULES)
+
+
+def test_default_session_is_made_once():
+    """Objects made without a session share one that is made on first use."""
+    from citrine.resources.project import Project, ProjectCollection
+    project = Project('a project')
+    assert isinstance(project.session, Session)
+    assert project.session is default_session()
+    assert ProjectCollection().session is project.session
+
+    session = Session()
+    assert Project('another project', session=session).session is session
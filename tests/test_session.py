@@ -9,15 +9,23 @@ from citrine.exceptions import (
     WorkflowConflictException,
     WorkflowNotReadyException,
     RetryableException,
+    ServiceUnavailable,
+    TooManyRequests,
     BadRequest)
 
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
 import pytz
 import mock
 import requests
 import requests_mock
+from citrine import _session
 from citrine._session import Session
+from citrine._rest.metrics import RequestHook
+from citrine._rest.retry import RetryPolicy
 from citrine.exceptions import UnauthorizedRefreshToken, Unauthorized, NotFound
+from tests.utils.wait import wait_until
 
 
 def refresh_token(expiration: datetime = None) -> dict:
@@ -93,9 +101,10 @@ class SessionTests(unittest.TestCase):
         with pytest.raises(WorkflowConflictException):
             Session().checked_request('method', 'path')
 
+    @mock.patch('citrine._session.sleep')
     @mock.patch.object(Session, '_refresh_access_token')
     @mock.patch.object(requests.Session, 'request')
-    def test_status_code_425(self, mock_request, _):
+    def test_status_code_425(self, mock_request, _, __):
         resp = mock.Mock()
         resp.status_code = 425
         mock_request.return_value = resp
@@ -183,3 +192,276 @@ def test_failed_put_with_stacktrace(session: Session):
             session.put_resource('/bad-endpoint', json={})
 
     assert '{"debug_stacktrace": "blew up!"}' == str(e.value)
+
+
+@mock.patch('citrine._session.sleep')
+def test_retries_throttled_request(mock_sleep, session: Session):
+    with requests_mock.Mocker() as m:
+        m.register_uri('POST', 'http://citrine-testing.fake/api/v1/foo', [
+            {'status_code': 429, 'headers': {'Retry-After': '2'}},
+            {'status_code': 503},
+            {'json': {'foo': 'bar'}}
+        ])
+
+        resp = session.post_resource('/foo', json={'data': 'hi'})
+
+    assert {'foo': 'bar'} == resp
+    assert m.call_count == 3
+    assert mock_sleep.call_count == 2
+    assert mock_sleep.call_args_list[0][0][0] >= 2
+    assert session.retry_stats.as_dict() == {
+        'retries': 2,
+        'retries_by_reason': {'429': 1, '503': 1},
+        'succeeded_after_retry': 1,
+        'failed_after_retry': 0
+    }
+
+
+@mock.patch('citrine._session.sleep')
+def test_retries_exhausted(mock_sleep, session: Session):
+    session.retry_policy = RetryPolicy(max_retries=2)
+    with requests_mock.Mocker() as m:
+        m.get('http://citrine-testing.fake/api/v1/foo', status_code=429)
+        with pytest.raises(TooManyRequests) as einfo:
+            session.get_resource('/foo')
+
+    assert isinstance(einfo.value, RetryableException)
+    assert einfo.value.code == 429
+    assert m.call_count == 3
+    assert session.retry_stats.failed_after_retry == 1
+
+
+@mock.patch('citrine._session.sleep')
+def test_ambiguous_failure_not_retried_for_post(mock_sleep, session: Session):
+    with requests_mock.Mocker() as m:
+        m.post('http://citrine-testing.fake/api/v1/foo', status_code=502, text='bad gateway')
+        with pytest.raises(ServiceUnavailable):
+            session.post_resource('/foo', json={})
+
+    assert m.call_count == 1
+    assert mock_sleep.call_count == 0
+
+
+@mock.patch('citrine._session.sleep')
+def test_retries_connection_errors(mock_sleep, session: Session):
+    with requests_mock.Mocker() as m:
+        m.register_uri('GET', 'http://citrine-testing.fake/api/v1/foo', [
+            {'exc': requests.exceptions.ConnectionError('connection reset')},
+            {'json': {'foo': 'bar'}}
+        ])
+        assert {'foo': 'bar'} == session.get_resource('/foo')
+
+    assert session.retry_stats.retries_by_reason == {'ConnectionError': 1}
+
+    with requests_mock.Mocker() as m:
+        m.get('http://citrine-testing.fake/api/v1/foo',
+              exc=requests.exceptions.ConnectionError('connection reset'))
+        with pytest.raises(requests.exceptions.ConnectionError):
+            session.get_resource('/foo', retry_policy=RetryPolicy(max_retries=1))
+        assert m.call_count == 2
+
+
+@mock.patch('citrine._session.sleep')
+def test_per_call_retry_policy_override(mock_sleep, session: Session):
+    with requests_mock.Mocker() as m:
+        m.delete('http://citrine-testing.fake/api/v1/foo', status_code=503)
+        with pytest.raises(ServiceUnavailable):
+            session.delete_resource('/foo', retry_policy=RetryPolicy.none())
+
+    assert m.call_count == 1
+    assert session.retry_stats.retries == 0
+
+
+def test_refresh_is_single_flight(session: Session):
+    session.access_token_expiration = datetime.utcnow() - timedelta(minutes=1)
+    token_refresh_response = refresh_token(datetime.utcnow() + timedelta(hours=1))
+    num_threads = 16
+    barrier = Barrier(num_threads)
+
+    def get_foo(_):
+        barrier.wait()
+        return session.get_resource('/foo')
+
+    with requests_mock.Mocker() as m:
+        refresh = m.post('http://citrine-testing.fake/api/v1/tokens/refresh',
+                         json=token_refresh_response)
+        m.get('http://citrine-testing.fake/api/v1/foo', json={'foo': 'bar'})
+        with ThreadPoolExecutor(num_threads) as executor:
+            results = list(executor.map(get_foo, range(num_threads)))
+        foo_requests = [r for r in m.request_history if r.method == 'GET']
+
+    session.close()
+    assert results == [{'foo': 'bar'}] * num_threads
+    assert refresh.call_count == 1
+    expected_auth = 'Bearer {}'.format(token_refresh_response['access_token'])
+    assert all(r.headers['Authorization'] == expected_auth for r in foo_requests)
+
+
+def test_rejected_token_refreshed_once(session: Session):
+    session.access_token = 'stale'
+    token_refresh_response = refresh_token(datetime.utcnow() + timedelta(hours=1))
+
+    with requests_mock.Mocker() as m:
+        refresh = m.post('http://citrine-testing.fake/api/v1/tokens/refresh',
+                         json=token_refresh_response)
+        session._refresh_rejected_access_token('stale')
+        # A thread holding a token that has since been replaced must not refresh again
+        session._refresh_rejected_access_token('stale')
+
+    session.close()
+    assert refresh.call_count == 1
+    assert session.access_token == token_refresh_response['access_token']
+
+
+def test_proactive_refresh(session: Session):
+    session.access_token_expiration = datetime.utcnow() - timedelta(minutes=1)
+    lead = _session.EXPIRATION_BUFFER_MILLIS + _session.PROACTIVE_REFRESH_LEAD
+    first_token = refresh_token(datetime.utcnow() + lead + timedelta(seconds=1))
+    second_token = refresh_token(datetime.utcnow() + timedelta(hours=1))
+
+    with requests_mock.Mocker() as m:
+        refresh = m.register_uri('POST', 'http://citrine-testing.fake/api/v1/tokens/refresh', [
+            {'json': first_token},
+            {'json': second_token}
+        ])
+        m.get('http://citrine-testing.fake/api/v1/foo', json={'foo': 'bar'})
+        session.get_resource('/foo')
+        assert refresh.call_count == 1
+        # The token is refreshed in the background, without any request being made
+        assert wait_until(lambda: refresh.call_count == 2, timeout=5, interval=0.05)
+        assert wait_until(lambda: session.access_token == second_token['access_token'],
+                          timeout=5, interval=0.05)
+
+    session.close()
+    assert session._refresh_timer is None
+
+
+def test_no_proactive_refresh_when_disabled(session: Session):
+    session.proactive_refresh = False
+    session.access_token_expiration = datetime.utcnow() - timedelta(minutes=1)
+
+    with requests_mock.Mocker() as m:
+        m.post('http://citrine-testing.fake/api/v1/tokens/refresh',
+               json=refresh_token(datetime.utcnow() + timedelta(hours=1)))
+        m.get('http://citrine-testing.fake/api/v1/foo', json={'foo': 'bar'})
+        session.get_resource('/foo')
+
+    assert session._refresh_timer is None
+
+
+def test_failed_proactive_refresh_is_logged(session: Session):
+    session.access_token = 'token'
+    with mock.patch.object(Session, '_refresh_access_token',
+                           side_effect=UnauthorizedRefreshToken()):
+        with mock.patch.object(session.logger, 'warning') as warning:
+            session._proactive_refresh('token')
+    assert warning.call_count == 1
+
+
+class _RecordingHook(RequestHook):
+
+    def __init__(self):
+        self.events = []
+
+    def pre_request(self, request):
+        self.events.append(('pre_request', request.method, request.route, request.attempt))
+
+    def post_response(self, request, response):
+        self.events.append(('post_response', request.status_code, response.status_code))
+
+    def on_error(self, request, error):
+        self.events.append(('on_error', type(error).__name__))
+
+    def on_retry(self, request, reason, delay):
+        self.events.append(('on_retry', reason))
+
+    def on_token_refresh(self, elapsed, succeeded):
+        self.events.append(('on_token_refresh', succeeded))
+
+
+@mock.patch('citrine._session.sleep')
+def test_request_hooks(mock_sleep, session: Session):
+    hook = _RecordingHook()
+    session.request_hooks.append(hook)
+    session.access_token_expiration = datetime.utcnow() - timedelta(minutes=1)
+    project_id = '4bbe2b5d-1b2c-4b52-97f0-2e7a1e5ef3c5'
+
+    with requests_mock.Mocker() as m:
+        m.post('http://citrine-testing.fake/api/v1/tokens/refresh',
+               json=refresh_token(datetime.utcnow() + timedelta(hours=1)))
+        m.register_uri('GET', 'http://citrine-testing.fake/api/v1/projects/' + project_id, [
+            {'exc': requests.exceptions.ConnectionError('connection reset')},
+            {'status_code': 503},
+            {'json': {'foo': 'bar'}}
+        ])
+        session.get_resource('/projects/{}'.format(project_id))
+
+    session.close()
+    assert hook.events == [
+        ('pre_request', 'GET', '/projects/{id}', 0),
+        ('on_token_refresh', True),
+        ('on_error', 'ConnectionError'),
+        ('on_retry', 'ConnectionError'),
+        ('pre_request', 'GET', '/projects/{id}', 1),
+        ('post_response', 503, 503),
+        ('on_retry', '503'),
+        ('pre_request', 'GET', '/projects/{id}', 2),
+        ('post_response', 200, 200)
+    ]
+
+
+def test_failing_request_hook_is_logged(session: Session):
+    class FailingHook(RequestHook):
+        def post_response(self, request, response):
+            raise ValueError('bad hook')
+
+    session.request_hooks.append(FailingHook())
+    with requests_mock.Mocker() as m:
+        m.get('http://citrine-testing.fake/api/v1/foo', json={'foo': 'bar'})
+        with mock.patch.object(session.logger, 'warning') as warning:
+            assert session.get_resource('/foo') == {'foo': 'bar'}
+    assert warning.call_count == 1
+
+
+@mock.patch('citrine._session.sleep')
+def test_stats(mock_sleep, session: Session):
+    session.access_token_expiration = datetime.utcnow() - timedelta(minutes=1)
+    with requests_mock.Mocker() as m:
+        m.post('http://citrine-testing.fake/api/v1/tokens/refresh',
+               json=refresh_token(datetime.utcnow() + timedelta(hours=1)))
+        m.register_uri('POST', 'http://citrine-testing.fake/api/v1/projects/1/things', [
+            {'status_code': 429},
+            {'json': {'foo': 'bar'}}
+        ])
+        m.get('http://citrine-testing.fake/api/v1/projects/2/things', status_code=404)
+        session.post_resource('/projects/1/things', json={'data': 'hi'})
+        with pytest.raises(NotFound):
+            session.get_resource('/projects/2/things')
+
+    session.close()
+    stats = session.stats()
+    assert stats['requests'] == 3
+    assert stats['retries'] == 1
+    assert stats['statuses'] == {429: 1, 200: 1, 404: 1}
+    assert stats['token_refreshes']['count'] == 1
+    assert set(stats['routes']) == {'POST /projects/{id}/things', 'GET /projects/{id}/things'}
+
+    route = stats['routes']['POST /projects/{id}/things']
+    assert route['requests'] == 2
+    assert route['request_bytes'] == 2 * len(json.dumps({'data': 'hi'}))
+    assert route['response_bytes'] == len(json.dumps({'foo': 'bar'}))
+    assert route['latency']['count'] == 2
+    assert route['latency']['p50'] <= route['latency']['max']
+
+
+def test_stats_can_be_disabled():
+    session = Session(refresh_token='12345', scheme='http', host='citrine-testing.fake',
+                      collect_stats=False)
+    session.access_token_expiration = datetime.utcnow() + timedelta(minutes=3)
+    assert session.stats() == {}
+    assert session.request_hooks == []
+
+    with requests_mock.Mocker() as m:
+        m.get('http://citrine-testing.fake/api/v1/foo', json={'foo': 'bar'})
+        assert session.get_resource('/foo') == {'foo': 'bar'}
+    assert session.stats() == {}
@@ -5,12 +5,20 @@
 # <ModelName>Factory for the domain objects themselves
 
 import factory
+from taurus.entity.bounds.real_bounds import RealBounds
 from taurus.entity.link_by_uid import LinkByUID
+from taurus.entity.value.nominal_real import NominalReal
 
 from citrine.informatics.scores import MLIScore
 from citrine.resources.file_link import _Uploader
 from citrine.resources.dataset import Dataset
+from citrine.attributes.property import Property
+from citrine.resources.ingredient_run import IngredientRun
 from citrine.resources.material_run import MaterialRun
+from citrine.resources.measurement_run import MeasurementRun
+from citrine.resources.process_run import ProcessRun
+from citrine.resources.process_spec import ProcessSpec
+from citrine.resources.property_template import PropertyTemplate
 from random import randrange
 
 
@@ -134,3 +142,18 @@ class MLIScoreFactory(factory.Factory):
     baselines = []
     objectives = []
     constraints = []
+
+
+def make_history():
+    """Build the history of a cake and return the cake, from which the rest can be found."""
+    spec = ProcessSpec('mixing spec')
+    mixing = ProcessRun('mixing', spec=spec)
+    flour = MaterialRun('flour', process=mixing)
+    template = PropertyTemplate('density', bounds=RealBounds(0, 10, 'g/cm^3'))
+    MeasurementRun('weighing', material=flour,
+                   properties=[Property('density', value=NominalReal(1, 'g/cm^3'),
+                                        template=template)])
+    baking = ProcessRun('baking')
+    IngredientRun('flour ingredient', material=flour, process=baking)
+    cake = MaterialRun('cake', process=baking)
+    return cake
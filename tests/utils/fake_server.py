@@ -0,0 +1,733 @@
+"""
+A local stand-in for the Citrine API, for end-to-end tests and benchmarks.
+
+Unlike :class:`tests.utils.session.FakeSession`, the client talks to it over real HTTP,
+so requests, JSON decoding, retries, token refreshes and connection reuse are all
+exercised. It implements the routes the client uses for projects, datasets, every
+data concepts collection and its filters, material histories, file uploads and
+downloads, tables, modules, workflows and workflow executions, keeping everything in
+memory. Latency and errors can be injected into every response.
+
+Use it as a context manager::
+
+    with FakeCitrineServer(latency=0.01) as server:
+        citrine = server.client()
+        project = citrine.projects.register('benchmarks')
+
+or run it on its own from the repository root with::
+
+    PYTHONPATH=src python -m tests.utils.fake_server --port 8080 --latency 0.02
+
+File uploads go to S3 through boto3, so they only reach the server within
+:meth:`FakeCitrineServer.fake_s3`.
+"""
+import argparse
+import json
+import random
+import re
+from collections import Counter
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+from time import sleep, time
+from typing import Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+from uuid import uuid4
+
+import jwt
+import mock
+
+from citrine import Citrine
+from citrine._rest.metrics import route_template
+
+API_PREFIX = '/api/v1/'
+STORAGE_PREFIX = '/storage/'
+DEFAULT_PER_PAGE = 20
+DEFAULT_API_KEY = 'fake-refresh-token'
+
+DATA_CONCEPTS_KINDS = (
+    'property-templates', 'condition-templates', 'parameter-templates', 'material-templates',
+    'measurement-templates', 'process-templates', 'process-runs', 'measurement-runs',
+    'material-runs', 'ingredient-runs', 'process-specs', 'measurement-specs', 'material-specs',
+    'ingredient-specs'
+)
+
+# Links followed backwards when collecting a material history: a measurement points at the
+# material it measured, and an ingredient at the process it went into.
+_REVERSE_LINKS = {'measurement_run': 'material', 'ingredient_run': 'process'}
+
+_SEGMENT = r'[^/]+'
+_KIND = '(?P<kind>{})'.format('|'.join(DATA_CONCEPTS_KINDS))
+
+
+class HttpError(Exception):
+    """Answers a request with an error status and an API error body."""
+
+    def __init__(self, status: int, message: str, **extra):
+        super().__init__(message)
+        self.status = status
+        self.body = dict({'code': status, 'message': message, 'validation_errors': []}, **extra)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Headers and body are written separately, so without this every response waits for
+    # a delayed acknowledgement from the client
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.server.fake.handle(self)
+
+    do_POST = do_PUT = do_DELETE = do_GET
+
+    def log_message(self, *args):
+        pass
+
+
+class FakeS3Client:
+    """Stands in for the boto3 S3 client, putting objects in the storage of a server."""
+
+    def __init__(self, server: 'FakeCitrineServer'):
+        self.server = server
+
+    def put_object(self, Bucket: str, Key: str, Body, Metadata: Optional[dict] = None) -> dict:
+        content = Body.read() if hasattr(Body, 'read') else Body
+        with self.server.lock:
+            self.server.blobs[Key] = content
+        return {'VersionId': str(uuid4())}
+
+
+class FakeCitrineServer:
+    """
+    An in-memory Citrine API served over HTTP on localhost.
+
+    Parameters
+    ----------
+    latency: float
+        Seconds to wait before answering each request, including storage downloads.
+    error_rate: float
+        Fraction of API requests answered with `error_status` instead, at random.
+    error_status: int
+        Status code of the errors injected at random.
+    seed: int, optional
+        Seed of the random errors, to make a run reproducible.
+    api_key: str
+        The refresh token that the server accepts.
+    token_lifetime: float
+        Seconds for which the access tokens it issues are valid.
+    execution_polls: int
+        Number of times the status of a workflow execution is reported as in progress
+        before it succeeds.
+    max_per_page: int, optional
+        Largest page of a listing that the server returns, whatever the size requested.
+
+    Attributes
+    ----------
+    requests: Counter
+        Number of requests received, by method and route template such as
+        ``GET /projects/{id}/material-runs``, including those answered with errors.
+
+    """
+
+    def __init__(self,
+                 latency: float = 0.0,
+                 error_rate: float = 0.0,
+                 error_status: int = 503,
+                 seed: Optional[int] = None,
+                 api_key: str = DEFAULT_API_KEY,
+                 token_lifetime: float = 3600.0,
+                 execution_polls: int = 0,
+                 max_per_page: Optional[int] = None):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.api_key = api_key
+        self.token_lifetime = token_lifetime
+        self.execution_polls = execution_polls
+        self.max_per_page = max_per_page
+        self.lock = Lock()
+        self.requests: Counter = Counter()
+        self._random = random.Random(seed)
+        self._pending_errors: List[int] = []
+        self._tokens = set()
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[Thread] = None
+
+        self.projects: Dict[str, dict] = {}
+        self.datasets: Dict[str, Dict[str, dict]] = {}
+        # Data concepts objects of each project by kind and Citrine id, and by any of their uids
+        self.objects: Dict[str, Dict[str, Dict[str, dict]]] = {}
+        self._uids: Dict[str, Dict[Tuple[str, str], dict]] = {}
+        self._dataset_of: Dict[str, str] = {}
+        self._referrers: Dict[str, Dict[Tuple[str, str], Dict[str, dict]]] = {}
+        self.files: Dict[str, Dict[str, dict]] = {}
+        self._uploads: Dict[str, dict] = {}
+        self.blobs: Dict[str, bytes] = {}
+        self.tables: Dict[Tuple[str, str], dict] = {}
+        self.modules: Dict[str, Dict[str, dict]] = {}
+        self.workflows: Dict[str, Dict[str, dict]] = {}
+        self.executions: Dict[str, Dict[str, dict]] = {}
+        self._routes = self._make_routes()
+
+    def __enter__(self) -> 'FakeCitrineServer':
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def start(self):
+        """Listen on a free port of localhost, serving from a background thread."""
+        self._httpd = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.fake = self
+        self._thread = Thread(target=self._httpd.serve_forever, kwargs={'poll_interval': 0.05},
+                              daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop serving and close the socket."""
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    @property
+    def port(self) -> int:
+        """The port the server listens on."""
+        return self._httpd.server_address[1]
+
+    @property
+    def url(self) -> str:
+        """The root url of the server, such as ``http://127.0.0.1:54321``."""
+        return 'http://127.0.0.1:{}'.format(self.port)
+
+    def client(self, **kwargs) -> Citrine:
+        """Make a client that talks to this server. Keyword arguments go to :class:`Citrine`."""
+        return Citrine(self.api_key, scheme='http', host='127.0.0.1', port=str(self.port),
+                       **kwargs)
+
+    def fake_s3(self):
+        """Patch boto3 so that file uploads put their content in the storage of this server."""
+        return mock.patch('citrine.resources.file_link.boto3_client',
+                          lambda *args, **kwargs: FakeS3Client(self))
+
+    def fail_next(self, count: int = 1, status: Optional[int] = None):
+        """Answer the next `count` API requests with an error, `error_status` by default."""
+        with self.lock:
+            self._pending_errors.extend([status or self.error_status] * count)
+
+    def expire_tokens(self):
+        """Reject every access token issued so far, as if they had expired."""
+        with self.lock:
+            self._tokens.clear()
+
+    def add_table(self, project_id: str, content: bytes, version: int = 1) -> str:
+        """Store the content of a table, returning its id."""
+        table_id = str(uuid4())
+        key = 'tables/{}/{}'.format(table_id, version)
+        with self.lock:
+            self.blobs[key] = content
+            self.tables[(table_id, str(version))] = {
+                'id': table_id, 'version': version, 'project_id': project_id, 'storage_key': key}
+        return table_id
+
+    # Request handling
+
+    def handle(self, handler: BaseHTTPRequestHandler):
+        """Answer one request."""
+        url = urlsplit(handler.path)
+        length = int(handler.headers.get('Content-Length') or 0)
+        body = handler.rfile.read(length) if length else b''
+        if self.latency:
+            sleep(self.latency)
+        headers = {}
+        if url.path.startswith(STORAGE_PREFIX):
+            self._count(handler.command, url.path)
+            status, headers, content = self._storage(
+                handler.command, url.path[len(STORAGE_PREFIX):], handler.headers.get('Range'))
+        else:
+            status, payload = self._api(handler.command, url.path, url.query, body,
+                                        handler.headers.get('Authorization'))
+            content = json.dumps(payload).encode('utf-8')
+            headers['Content-Type'] = 'application/json'
+        handler.send_response(status)
+        for name, value in headers.items():
+            handler.send_header(name, value)
+        handler.send_header('Content-Length', str(len(content)))
+        handler.end_headers()
+        try:
+            handler.wfile.write(content)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # The client gave up
+
+    def _count(self, method: str, path: str):
+        with self.lock:
+            self.requests['{} {}'.format(method, route_template(path))] += 1
+
+    def _api(self, method: str, path: str, query: str, body: bytes,
+             authorization: Optional[str]) -> Tuple[int, object]:
+        """Route a request to the API, returning its status and JSON body."""
+        if not path.startswith(API_PREFIX):
+            return 404, HttpError(404, 'Not an API path: {}'.format(path)).body
+        route = path[len(API_PREFIX):].strip('/')
+        self._count(method, route)
+        try:
+            if route != 'tokens/refresh':
+                self._inject_error()
+                self._authorize(authorization)
+            params = {key: values if len(values) > 1 or key == 'tags' else values[0]
+                      for key, values in parse_qs(query).items()}
+            data = json.loads(body.decode('utf-8')) if body else None
+            action, groups = self._match(method, route)
+            with self.lock:
+                return 200, action(params=params, json=data, **groups)
+        except HttpError as e:
+            return e.status, e.body
+        except (KeyError, TypeError, ValueError) as e:
+            return 400, HttpError(400, 'Malformed request: {!r}'.format(e)).body
+
+    def _inject_error(self):
+        with self.lock:
+            if self._pending_errors:
+                status = self._pending_errors.pop(0)
+            elif self.error_rate and self._random.random() < self.error_rate:
+                status = self.error_status
+            else:
+                return
+        raise HttpError(status, 'Injected error')
+
+    def _authorize(self, authorization: Optional[str]):
+        token = (authorization or '').replace('Bearer ', '', 1)
+        with self.lock:
+            if token not in self._tokens:
+                raise HttpError(401, 'Invalid access token', reason='invalid-token')
+
+    def _page(self, items: list, params: dict) -> list:
+        """Select the page of items that the ``page`` and ``per_page`` parameters ask for."""
+        page = int(params.get('page', 1))
+        per_page = int(params.get('per_page', DEFAULT_PER_PAGE))
+        if self.max_per_page is not None:
+            per_page = min(per_page, self.max_per_page)
+        return items[(page - 1) * per_page:page * per_page]
+
+    def _match(self, method: str, route: str):
+        allowed = False
+        for verb, pattern, action in self._routes:
+            match = pattern.fullmatch(route)
+            if match is not None:
+                if verb == method:
+                    return action, match.groupdict()
+                allowed = True
+        if allowed:
+            raise HttpError(405, '{} is not allowed on {}'.format(method, route))
+        raise HttpError(404, 'No route for {}'.format(route))
+
+    def _make_routes(self) -> list:
+        project = 'projects/(?P<project_id>{})'.format(_SEGMENT)
+        dataset = project + '/datasets/(?P<dataset_id>{})'.format(_SEGMENT)
+        scoped = '/(?P<scope>{0})/(?P<uid>{0})'.format(_SEGMENT)
+        workflow = project + '/workflows/(?P<workflow_id>{})'.format(_SEGMENT)
+        execution = workflow + '/executions/(?P<execution_id>{})'.format(_SEGMENT)
+        file = dataset + '/files/(?P<file_id>{})'.format(_SEGMENT)
+        routes = [
+            ('POST', 'tokens/refresh', self._refresh_token),
+            ('GET', 'projects', self._list_projects),
+            ('POST', 'projects', self._create_project),
+            ('GET', project, self._get_project),
+            ('GET', project + '/datasets', self._list_datasets),
+            ('POST', project + '/datasets', self._create_dataset),
+            ('GET', dataset, self._get_dataset),
+            ('DELETE', dataset, self._delete_dataset),
+            ('GET', dataset + '/files', self._list_files),
+            ('POST', dataset + '/files/uploads', self._start_upload),
+            ('PUT', dataset + '/files/uploads/(?P<upload_id>[^/]+)/complete',
+             self._complete_upload),
+            ('GET', file + '/versions/(?P<version>[^/]+)/content-link', self._content_link),
+            ('DELETE', file, self._delete_file),
+            ('POST', dataset + '/' + _KIND, self._register_object),
+            ('GET', dataset + '/' + _KIND + scoped, self._get_object),
+            ('DELETE', dataset + '/' + _KIND + scoped, self._delete_object),
+            ('GET', project + '/' + _KIND, self._filter_by_tags),
+            ('GET', project + '/' + _KIND + '/filter-by-name', self._filter_by_name),
+            ('POST', project + '/' + _KIND + '/filter-by-attribute-bounds',
+             self._filter_by_attribute_bounds),
+            ('GET', project + '/material-history' + scoped, self._material_history),
+            ('GET', project + '/tables/(?P<table_id>[^/]+)/versions/(?P<version>[^/]+)',
+             self._get_table),
+            ('GET', workflow + '/executions', self._list_executions),
+            ('POST', workflow + '/executions', self._trigger_execution),
+            ('GET', execution + '/status', self._execution_status),
+            ('GET', execution + '/results', self._execution_results),
+        ]
+        for name in ('modules', 'workflows'):
+            store = getattr(self, name)
+            entity = project + '/{}/(?P<entity_id>[^/]+)'.format(name)
+            routes += [
+                ('GET', project + '/' + name, self._entity_action(store, self._list_entities)),
+                ('POST', project + '/' + name, self._entity_action(store, self._create_entity)),
+                ('GET', entity, self._entity_action(store, self._get_entity)),
+                ('PUT', entity, self._entity_action(store, self._update_entity)),
+                ('DELETE', entity, self._entity_action(store, self._delete_entity)),
+            ]
+        return [(verb, re.compile(pattern), action) for verb, pattern, action in routes]
+
+    # Authentication
+
+    def _refresh_token(self, json: dict, **kwargs) -> dict:
+        if json.get('refresh_token') != self.api_key:
+            raise HttpError(401, 'Invalid refresh token')
+        expiration = datetime.utcnow() + timedelta(seconds=self.token_lifetime)
+        token = jwt.encode({'exp': expiration, 'jti': str(uuid4())}, 'fake-secret')
+        token = token.decode('utf-8') if isinstance(token, bytes) else token
+        self._tokens.add(token)
+        return {'access_token': token}
+
+    # Projects and datasets
+
+    def _project(self, project_id: str) -> dict:
+        if project_id not in self.projects:
+            raise HttpError(404, 'Project {} not found'.format(project_id))
+        return self.projects[project_id]
+
+    def _list_projects(self, params: dict, **kwargs) -> dict:
+        return {'projects': self._page(list(self.projects.values()), params)}
+
+    def _create_project(self, json: dict, **kwargs) -> dict:
+        project = dict(_without_none(json), id=str(uuid4()), status='CREATED',
+                       created_at=_now_millis())
+        self.projects[project['id']] = project
+        for store in (self.datasets, self.objects, self._uids, self._referrers, self.modules,
+                      self.workflows):
+            store[project['id']] = {}
+        return {'project': project}
+
+    def _get_project(self, project_id: str, **kwargs) -> dict:
+        return {'project': self._project(project_id)}
+
+    def _dataset(self, project_id: str, dataset_id: str) -> dict:
+        datasets = self.datasets.get(project_id, {})
+        if dataset_id not in datasets:
+            raise HttpError(404, 'Dataset {} not found'.format(dataset_id))
+        return datasets[dataset_id]
+
+    def _list_datasets(self, project_id: str, params: dict, **kwargs) -> list:
+        self._project(project_id)
+        return self._page(list(self.datasets[project_id].values()), params)
+
+    def _create_dataset(self, project_id: str, json: dict, **kwargs) -> dict:
+        self._project(project_id)
+        now = _now_millis()
+        dataset = dict(json, id=json.get('id') or str(uuid4()), deleted=False,
+                       create_time=now, update_time=now)
+        self.datasets[project_id][dataset['id']] = dataset
+        self.files[dataset['id']] = {}
+        return dataset
+
+    def _get_dataset(self, project_id: str, dataset_id: str, **kwargs) -> dict:
+        return self._dataset(project_id, dataset_id)
+
+    def _delete_dataset(self, project_id: str, dataset_id: str, **kwargs) -> dict:
+        self._dataset(project_id, dataset_id)
+        del self.datasets[project_id][dataset_id]
+        return {}
+
+    # Data concepts
+
+    def _register_object(self, project_id: str, dataset_id: str, kind: str, json: dict,
+                         **kwargs) -> dict:
+        self._dataset(project_id, dataset_id)
+        uids = json.setdefault('uids', {})
+        index = self._uids[project_id]
+        existing = next((index[key] for key in uids.items() if key in index), None)
+        if existing is not None:
+            self._forget(project_id, existing)
+            uids.setdefault('id', existing['uids']['id'])
+        uids.setdefault('id', str(uuid4()))
+        self._dataset_of[uids['id']] = dataset_id
+        self.objects[project_id].setdefault(kind, {})[uids['id']] = json
+        for key in uids.items():
+            index[key] = json
+        field = _REVERSE_LINKS.get(json.get('type'))
+        link = json.get(field) if field else None
+        if isinstance(link, dict) and 'scope' in link:
+            referrers = self._referrers[project_id].setdefault((link['scope'], link['id']), {})
+            referrers[uids['id']] = json
+        return json
+
+    def _forget(self, project_id: str, obj: dict):
+        """Remove an object from every index of a project."""
+        for kind in self.objects[project_id].values():
+            kind.pop(obj['uids']['id'], None)
+        for key in obj['uids'].items():
+            self._uids[project_id].pop(key, None)
+        for referrers in self._referrers[project_id].values():
+            referrers.pop(obj['uids']['id'], None)
+
+    def _object(self, project_id: str, scope: str, uid: str) -> dict:
+        self._project(project_id)
+        obj = self._uids[project_id].get((scope, uid))
+        if obj is None:
+            raise HttpError(404, 'No object with uid {}:{}'.format(scope, uid))
+        return obj
+
+    def _get_object(self, project_id: str, scope: str, uid: str, **kwargs) -> dict:
+        return self._object(project_id, scope, uid)
+
+    def _delete_object(self, project_id: str, scope: str, uid: str, **kwargs) -> dict:
+        self._forget(project_id, self._object(project_id, scope, uid))
+        return {}
+
+    def _objects(self, project_id: str, kind: str, params: dict) -> List[dict]:
+        self._project(project_id)
+        objects = list(self.objects[project_id].get(kind, {}).values())
+        dataset_id = params.get('dataset_id')
+        if dataset_id is not None:
+            objects = [obj for obj in objects
+                       if self._dataset_of[obj['uids']['id']] == dataset_id]
+        return objects
+
+    def _filter_by_tags(self, project_id: str, kind: str, params: dict, **kwargs) -> dict:
+        tags = set(params.get('tags', []))
+        objects = [obj for obj in self._objects(project_id, kind, params)
+                   if not tags or tags.intersection(obj.get('tags') or [])]
+        return {'contents': self._page(objects, params)}
+
+    def _filter_by_name(self, project_id: str, kind: str, params: dict, **kwargs) -> dict:
+        name = params['name'].lower()
+        exact = params.get('exact') == 'True'
+        objects = [obj for obj in self._objects(project_id, kind, params)
+                   if (obj.get('name') or '').lower() == name
+                   or not exact and (obj.get('name') or '').lower().startswith(name)]
+        return {'contents': self._page(objects, params)}
+
+    def _filter_by_attribute_bounds(self, project_id: str, kind: str, params: dict, json: dict,
+                                    **kwargs) -> dict:
+        [(template_id, bounds)] = json['attribute_bounds'].items()
+        objects = [obj for obj in self._objects(project_id, kind, params)
+                   if _has_attribute_within(obj, template_id, bounds)]
+        return {'contents': self._page(objects, params)}
+
+    def _material_history(self, project_id: str, scope: str, uid: str, **kwargs) -> dict:
+        root = self._object(project_id, scope, uid)
+        index = self._uids[project_id]
+        referrers = self._referrers[project_id]
+        seen = {}
+        pending = [root]
+        while pending:
+            obj = pending.pop()
+            if obj['uids']['id'] in seen:
+                continue
+            seen[obj['uids']['id']] = obj
+            for link in _links(obj):
+                if (link['scope'], link['id']) in index:
+                    pending.append(index[(link['scope'], link['id'])])
+            for key in obj['uids'].items():
+                pending.extend(referrers.get(key, {}).values())
+        del seen[root['uids']['id']]
+        return {'context': list(seen.values()), 'root': root}
+
+    # Files and tables
+
+    def _list_files(self, project_id: str, dataset_id: str, params: dict, **kwargs) -> dict:
+        self._dataset(project_id, dataset_id)
+        return {'files': self._page(list(self.files[dataset_id].values()), params)}
+
+    def _start_upload(self, project_id: str, dataset_id: str, json: dict, **kwargs) -> dict:
+        self._dataset(project_id, dataset_id)
+        [file] = json['files']
+        upload_id = str(uuid4())
+        key = 'files/{}'.format(upload_id)
+        self._uploads[upload_id] = {'dataset_id': dataset_id, 'filename': file['file_name'],
+                                    'storage_key': key}
+        return {
+            's3_region': 'us-east-1',
+            's3_bucket': 'fake-bucket',
+            'temporary_credentials': {'access_key_id': 'fake', 'secret_access_key': 'fake',
+                                      'session_token': 'fake'},
+            'uploads': [{'s3_key': key, 'upload_id': upload_id}]
+        }
+
+    def _complete_upload(self, project_id: str, dataset_id: str, upload_id: str, **kwargs):
+        upload = self._uploads.pop(upload_id, None)
+        if upload is None or upload['storage_key'] not in self.blobs:
+            raise HttpError(400, 'Upload {} has no content'.format(upload_id))
+        file_id = str(uuid4())
+        self.files[dataset_id][file_id] = {
+            'id': file_id,
+            'filename': upload['filename'],
+            'versioned_url': 'projects/{}/datasets/{}/files/{}/versions/1'.format(
+                project_id, dataset_id, file_id),
+            'storage_key': upload['storage_key'],
+            'size': len(self.blobs[upload['storage_key']])
+        }
+        return {'file_info': {'file_id': file_id, 'version': 1}}
+
+    def _file(self, project_id: str, dataset_id: str, file_id: str) -> dict:
+        self._dataset(project_id, dataset_id)
+        if file_id not in self.files[dataset_id]:
+            raise HttpError(404, 'File {} not found'.format(file_id))
+        return self.files[dataset_id][file_id]
+
+    def _content_link(self, project_id: str, dataset_id: str, file_id: str, **kwargs) -> dict:
+        file = self._file(project_id, dataset_id, file_id)
+        return {'pre_signed_read_link': self._signed_url(file['storage_key'])}
+
+    def _delete_file(self, project_id: str, dataset_id: str, file_id: str, **kwargs) -> dict:
+        file = self._file(project_id, dataset_id, file_id)
+        del self.files[dataset_id][file_id]
+        self.blobs.pop(file['storage_key'], None)
+        return {}
+
+    def _get_table(self, project_id: str, table_id: str, version: str, **kwargs) -> dict:
+        table = self.tables.get((table_id, version))
+        if table is None or table['project_id'] != project_id:
+            raise HttpError(404, 'Table {} version {} not found'.format(table_id, version))
+        return {'id': table_id, 'version': table['version'],
+                'signed_download_url': self._signed_url(table['storage_key'])}
+
+    def _signed_url(self, key: str) -> str:
+        return '{}{}{}?signature={}'.format(self.url, STORAGE_PREFIX, key, uuid4().hex)
+
+    def _storage(self, method: str, key: str, range_header: Optional[str]):
+        """Serve stored content, honouring ``Range: bytes=<start>-`` headers."""
+        with self.lock:
+            content = self.blobs.get(key)
+        if method != 'GET' or content is None:
+            return 404, {}, b''
+        match = re.fullmatch(r'bytes=(\d+)-', range_header or '')
+        if match is None:
+            return 200, {'Accept-Ranges': 'bytes'}, content
+        start = int(match.group(1))
+        headers = {'Content-Range': 'bytes {}-{}/{}'.format(start, len(content) - 1,
+                                                             len(content))}
+        return 206, headers, content[start:]
+
+    # Modules and workflows, which share their routes
+
+    def _entity_action(self, store: Dict[str, Dict[str, dict]], action):
+        def scoped_action(project_id: str, **kwargs):
+            self._project(project_id)
+            return action(store[project_id], **kwargs)
+        return scoped_action
+
+    @staticmethod
+    def _entity(entities: Dict[str, dict], entity_id: str) -> dict:
+        if entity_id not in entities:
+            raise HttpError(404, 'No entity with id {}'.format(entity_id))
+        return entities[entity_id]
+
+    def _list_entities(self, entities: Dict[str, dict], params: dict, **kwargs) -> dict:
+        return {'entries': self._page(list(entities.values()), params)}
+
+    @staticmethod
+    def _create_entity(entities: Dict[str, dict], json: dict, **kwargs) -> dict:
+        entity = dict(json, id=str(uuid4()), status='READY', status_info=[])
+        entities[entity['id']] = entity
+        return entity
+
+    def _get_entity(self, entities: Dict[str, dict], entity_id: str, **kwargs) -> dict:
+        return self._entity(entities, entity_id)
+
+    def _update_entity(self, entities: Dict[str, dict], entity_id: str, json: dict,
+                       **kwargs) -> dict:
+        entity = self._entity(entities, entity_id)
+        entity.update(json, id=entity_id)
+        return entity
+
+    def _delete_entity(self, entities: Dict[str, dict], entity_id: str, **kwargs) -> dict:
+        del entities[self._entity(entities, entity_id)['id']]
+        return {}
+
+    # Workflow executions
+
+    def _execution(self, workflow_id: str, execution_id: str) -> dict:
+        execution = self.executions.get(workflow_id, {}).get(execution_id)
+        if execution is None:
+            raise HttpError(404, 'Execution {} not found'.format(execution_id))
+        return execution
+
+    def _list_executions(self, project_id: str, workflow_id: str, params: dict,
+                         **kwargs) -> dict:
+        executions = list(self.executions.get(workflow_id, {}).values())
+        return {'executions': self._page([{'id': e['id']} for e in executions], params)}
+
+    def _trigger_execution(self, project_id: str, workflow_id: str, json: dict, **kwargs):
+        self._entity(self.workflows.get(project_id, {}), workflow_id)
+        execution = {'id': str(uuid4()), 'score': json, 'polls': 0}
+        self.executions.setdefault(workflow_id, {})[execution['id']] = execution
+        return {'id': execution['id']}
+
+    def _execution_status(self, workflow_id: str, execution_id: str, **kwargs) -> dict:
+        execution = self._execution(workflow_id, execution_id)
+        execution['polls'] += 1
+        done = execution['polls'] > self.execution_polls
+        return {'status': 'Succeeded' if done else 'InProgress'}
+
+    def _execution_results(self, workflow_id: str, execution_id: str, **kwargs) -> dict:
+        execution = self._execution(workflow_id, execution_id)
+        return {'execution_id': execution['id'], 'candidates': []}
+
+
+def _now_millis() -> int:
+    return int(time() * 1000)
+
+
+def _without_none(data: dict) -> dict:
+    return {key: value for key, value in data.items() if value is not None}
+
+
+def _links(value) -> Iterator[dict]:
+    """Find every link by uid nested in a serialized object."""
+    if isinstance(value, dict):
+        if value.get('type') == 'link_by_uid':
+            yield value
+            return
+        for nested in value.values():
+            yield from _links(nested)
+    elif isinstance(value, list):
+        for nested in value:
+            yield from _links(nested)
+
+
+def _has_attribute_within(obj: dict, template_id: str, bounds: dict) -> bool:
+    """Whether an object has an attribute of a template with a nominal value within bounds."""
+    for field in ('properties', 'conditions', 'parameters'):
+        for attribute in obj.get(field) or []:
+            if attribute.get('type') == 'property_and_conditions':
+                attribute = attribute['property']
+            template = attribute.get('template') or {}
+            if template_id not in (template.get('id'), (template.get('uids') or {}).get('id')):
+                continue
+            value = (attribute.get('value') or {}).get('nominal')
+            if value is not None and bounds['lower_bound'] <= value <= bounds['upper_bound']:
+                return True
+    return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--error-status', type=int, default=503)
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+    server = FakeCitrineServer(latency=args.latency, error_rate=args.error_rate,
+                               error_status=args.error_status, seed=args.seed)
+    httpd = ThreadingHTTPServer(('127.0.0.1', args.port), _Handler)
+    httpd.daemon_threads = True
+    httpd.fake = server
+    server._httpd = httpd
+    print('Serving a fake Citrine API at {} with refresh token {!r}'.format(
+        server.url, server.api_key))
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.server_close()
+
+
+if __name__ == '__main__':
+    main()